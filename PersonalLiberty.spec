@@ -60,6 +60,24 @@ a = Analysis(
         'bypass_logger',
         'weight_control_tips',
         'app_utils',
+        'schedule_timeline',
+        'backup_store',
+        'session_rewards',
+        'startup_profiler',
+        'tts_cache',
+        'audio_mixer',
+        'undo_log',
+        'session_journal',
+        'hotkey_matcher',
+        'challenge_events',
+        'chart_lod',
+        'animation_timeline',
+        'story_render',
+        'theme',
+        'reward_queue',
+        'progress_ring',
+        'telemetry',
+        'telemetry_panel',
         'item_drop_dialog',
         'level_up_dialog',
         'styled_dialog',
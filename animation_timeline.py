@@ -0,0 +1,209 @@
+"""
+Keyframe tracks and a shared wall-clock frame scheduler for slider animations.
+
+The lottery dialogs all roll a slider along the same kind of path: start in
+the middle, bounce off the walls a few times, settle on the rolled value,
+decelerating with an ease-out curve. KeyframeTrack precomputes the
+cumulative length of such a path once so each frame is a bisect instead of
+a walk over every segment:
+
+    track = KeyframeTrack.bounce(target)
+    pos = track.at_progress(elapsed / duration)
+
+FrameScheduler drives every running animation from one timer and passes
+each callback the real time since its previous frame, so a busy event loop
+makes the animation skip frames rather than run long:
+
+    def _anim_tick(self, dt):
+        self._elapsed += dt
+        ...
+        return self._elapsed < self._duration   # False unregisters
+
+    frame_scheduler().add(self._anim_tick, owner=self)
+
+The timer is created on the first add() and stopped when nothing is left
+registered. Only the timer needs Qt, so tracks and the scheduler's tick()
+can be tested without a display.
+"""
+
+import logging
+import random
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def ease_out_quart(t: float) -> float:
+    """1 - (1 - t)^4: fast start, long friction-like slowdown."""
+    return 1.0 - (1.0 - t) ** 4
+
+
+def bounce_path(target: float, min_bounces: int = 4, max_bounces: int = 6,
+                start: float = 50.0, rng=random) -> List[float]:
+    """Points of a ping-pong roll: start, wall-to-wall sweeps in a random direction, target."""
+    going_up = rng.choice([True, False])
+    points = [start]
+    for _ in range(rng.randint(min_bounces, max_bounces)):
+        points.extend([100.0, 0.0] if going_up else [0.0, 100.0])
+    points.append(target)
+    return points
+
+
+class KeyframeTrack:
+    """Piecewise-linear path parametrised by distance travelled."""
+
+    def __init__(self, points: Sequence[float]):
+        if not points:
+            raise ValueError("KeyframeTrack needs at least one point")
+        self.points = list(points)
+        self._starts: List[float] = []
+        self._ends: List[float] = []
+        self._cum_ends: List[float] = []
+        total = 0.0
+        for start, end in zip(self.points, self.points[1:]):
+            dist = abs(end - start)
+            if dist > 0.001:  # Skip zero-length segments
+                total += dist
+                self._starts.append(start)
+                self._ends.append(end)
+                self._cum_ends.append(total)
+        self.total_distance = total
+
+    @classmethod
+    def bounce(cls, target: float, min_bounces: int = 4, max_bounces: int = 6,
+               start: float = 50.0, rng=random) -> 'KeyframeTrack':
+        """
+        Track over a fresh bounce_path() to target.
+
+        Dialogs build this once when an animation starts; the frame callbacks
+        then only call at_progress(), so the segment lengths are never
+        recomputed while the slider moves.
+        """
+        return cls(bounce_path(target, min_bounces, max_bounces, start, rng))
+
+    @property
+    def end(self) -> float:
+        return self.points[-1]
+
+    def position_at(self, travel: float) -> float:
+        """Position after travelling `travel` along the path (clamped to the path)."""
+        i = bisect_left(self._cum_ends, travel)
+        if i >= len(self._cum_ends):
+            return self.end
+        if travel <= 0:
+            return self._starts[0]
+        start, end = self._starts[i], self._ends[i]
+        seg_start = self._cum_ends[i - 1] if i else 0.0
+        local = (travel - seg_start) / (self._cum_ends[i] - seg_start)
+        return start + (end - start) * local
+
+    def at_progress(self, t: float, easing: Callable[[float], float] = ease_out_quart) -> float:
+        """Position at normalised time t (0-1) with easing applied."""
+        t = min(1.0, max(0.0, t))
+        return self.position_at(easing(t) * self.total_distance)
+
+
+class FrameScheduler:
+    """One timer calling every registered animation with the real elapsed dt."""
+
+    def __init__(self, interval_ms: int = 16, clock: Callable[[], float] = time.monotonic,
+                 start_timer: bool = True):
+        self.interval_ms = interval_ms
+        self._clock = clock
+        self._use_timer = start_timer
+        self._timer = None
+        self._running = False
+        # callback -> [time of its previous frame]
+        self._entries: Dict[Callable, list] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, callback: Callable) -> bool:
+        return callback in self._entries
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def add(self, callback: Callable[[float], Optional[bool]], owner=None) -> None:
+        """
+        Call callback(dt) every frame until it returns False or is removed.
+
+        dt is measured from this call, so the first frame gets the time
+        since registration. If owner is a QObject the callback is dropped
+        when the owner is destroyed.
+        """
+        self._entries[callback] = [self._clock()]
+        if owner is not None and hasattr(owner, "destroyed"):
+            owner.destroyed.connect(lambda *_: self.remove(callback))
+        self._start()
+
+    def remove(self, callback: Callable) -> bool:
+        found = self._entries.pop(callback, None) is not None
+        if not self._entries:
+            self._stop()
+        return found
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._stop()
+
+    def tick(self) -> int:
+        """Advance every registered animation once. Returns how many were called."""
+        now = self._clock()
+        entries = list(self._entries.items())
+        for callback, entry in entries:
+            if self._entries.get(callback) is not entry:
+                continue  # Removed by an earlier callback this frame
+            dt = max(0.0, now - entry[0])
+            entry[0] = now
+            try:
+                keep = callback(dt)
+            except Exception as e:
+                # A dialog deleted mid-animation must not stop the others
+                logger.error(f"Animation frame failed, unregistering: {e}", exc_info=True)
+                keep = False
+            # Only drop this registration, not one the callback made for itself
+            if keep is False and self._entries.get(callback) is entry:
+                del self._entries[callback]
+        if not self._entries:
+            self._stop()
+        return len(entries)
+
+    def _start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        if not self._use_timer:
+            return
+        if self._timer is None:
+            from PySide6 import QtCore
+            self._timer = QtCore.QTimer()
+            self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+            self._timer.timeout.connect(self.tick)
+        self._timer.start(self.interval_ms)
+
+    def _stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        if self._timer is not None:
+            try:
+                self._timer.stop()
+            except RuntimeError:
+                # QTimer already deleted during application shutdown
+                self._timer = None
+
+
+_scheduler: Optional[FrameScheduler] = None
+
+
+def frame_scheduler() -> FrameScheduler:
+    """The process-wide scheduler shared by the lottery dialogs."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = FrameScheduler()
+    return _scheduler
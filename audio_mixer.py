@@ -0,0 +1,251 @@
+"""
+Polyphonic software mixer for synthesized app sounds.
+
+CelebrationAudioManager keeps one long-lived output sink open and lets it
+pull PCM from a SoftwareMixer, so lottery, city, level-up and voice sounds
+that overlap are summed instead of cutting each other off.
+
+- Up to `max_voices` voices play at once, each with its own gain.
+- When all voices are busy, a new sound steals the lowest-priority voice
+  (the oldest among equals), or is rejected if every active voice has a
+  higher priority.
+- The mix is rendered in fixed-size blocks into a ring buffer; reads drain
+  the ring and mix another block only when it runs dry.
+- Peaks above `clip_threshold` are soft-clipped (tanh knee) rather than
+  hard-clamped, so dense overlaps saturate smoothly instead of crackling.
+
+The mixer has no Qt dependency: render() produces the mix into an
+in-memory buffer, which is how the mixing math is tested headless.
+
+Audio format: mono, signed 16-bit little-endian PCM.
+"""
+
+import array
+import math
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+SAMPLE_MAX = 32767
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+DEFAULT_MAX_VOICES = 8
+DEFAULT_BLOCK_FRAMES = 512
+
+
+def pcm_to_samples(pcm: bytes) -> array.array:
+    """Little-endian int16 bytes -> native array('h'). A trailing odd byte is dropped."""
+    samples = array.array('h')
+    samples.frombytes(bytes(pcm[:len(pcm) - len(pcm) % 2]))
+    if sys.byteorder != 'little':
+        samples.byteswap()
+    return samples
+
+
+def samples_to_pcm(samples: array.array) -> bytes:
+    """Native array('h') -> little-endian int16 bytes."""
+    if sys.byteorder != 'little':
+        samples = array.array('h', samples)
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def soft_clip(value: float, threshold: float) -> float:
+    """
+    Compress a sample (in int16 units) above threshold * SAMPLE_MAX.
+
+    Linear below the knee; above it, tanh maps the overshoot into the
+    remaining headroom, so the output never exceeds SAMPLE_MAX and the
+    curve has no corner at the knee.
+    """
+    knee = threshold * SAMPLE_MAX
+    magnitude = abs(value)
+    if magnitude <= knee:
+        return value
+    headroom = SAMPLE_MAX - knee
+    clipped = knee + headroom * math.tanh((magnitude - knee) / headroom)
+    return clipped if value > 0 else -clipped
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO of int16 samples."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = array.array('h', bytes(2 * capacity))
+        self._start = 0
+        self._count = 0
+
+    @property
+    def available(self) -> int:
+        return self._count
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self._count
+
+    def write(self, samples: array.array) -> int:
+        """Append as many samples as fit. Returns the number written."""
+        n = min(len(samples), self.free)
+        end = (self._start + self._count) % self.capacity
+        first = min(n, self.capacity - end)
+        self._data[end:end + first] = samples[:first]
+        if n > first:
+            self._data[:n - first] = samples[first:n]
+        self._count += n
+        return n
+
+    def read(self, n: int) -> array.array:
+        """Remove and return up to n samples."""
+        n = min(n, self._count)
+        first = min(n, self.capacity - self._start)
+        out = self._data[self._start:self._start + first]
+        if n > first:
+            out.extend(self._data[:n - first])
+        self._start = (self._start + n) % self.capacity
+        self._count -= n
+        return out
+
+    def clear(self) -> None:
+        self._start = 0
+        self._count = 0
+
+
+@dataclass
+class Voice:
+    """One sound being played by the mixer."""
+    voice_id: int
+    samples: array.array
+    gain: float = 1.0
+    priority: int = PRIORITY_NORMAL
+    position: int = 0
+
+    @property
+    def remaining(self) -> int:
+        return len(self.samples) - self.position
+
+
+class SoftwareMixer:
+    """Sums active voices into blocks of int16 PCM on demand."""
+
+    def __init__(self, max_voices: int = DEFAULT_MAX_VOICES,
+                 block_frames: int = DEFAULT_BLOCK_FRAMES,
+                 master_gain: float = 1.0, clip_threshold: float = 0.8):
+        self.max_voices = max_voices
+        self.block_frames = block_frames
+        self.master_gain = master_gain
+        self.clip_threshold = clip_threshold
+        self._voices: List[Voice] = []
+        self._ring = RingBuffer(block_frames)
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self.stolen = 0   # voices cut short to make room
+        self.rejected = 0  # sounds dropped because every voice outranked them
+
+    # === Voices ===
+
+    def play(self, pcm: Union[bytes, bytearray, memoryview], gain: float = 1.0,
+             priority: int = PRIORITY_NORMAL) -> Optional[int]:
+        """
+        Start a sound. Returns its voice id, or None if it was rejected.
+        """
+        samples = pcm_to_samples(pcm)
+        if not samples:
+            return None
+        with self._lock:
+            if len(self._voices) >= self.max_voices:
+                victim = min(self._voices, key=lambda v: (v.priority, v.voice_id))
+                if victim.priority > priority:
+                    self.rejected += 1
+                    return None
+                self._voices.remove(victim)
+                self.stolen += 1
+            voice = Voice(self._next_id, samples, gain, priority)
+            self._next_id += 1
+            self._voices.append(voice)
+            return voice.voice_id
+
+    def stop_voice(self, voice_id: int) -> bool:
+        """Stop one voice. Returns True if it was playing."""
+        with self._lock:
+            for voice in self._voices:
+                if voice.voice_id == voice_id:
+                    self._voices.remove(voice)
+                    return True
+        return False
+
+    def stop_all(self) -> None:
+        """Silence everything, including already-mixed samples."""
+        with self._lock:
+            self._voices.clear()
+            self._ring.clear()
+
+    @property
+    def active_voices(self) -> int:
+        with self._lock:
+            return len(self._voices)
+
+    @property
+    def idle(self) -> bool:
+        """True when nothing is playing or waiting in the ring buffer."""
+        with self._lock:
+            return not self._voices and self._ring.available == 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"active": len(self._voices), "stolen": self.stolen, "rejected": self.rejected}
+
+    # === Mixing ===
+
+    def _mix_block(self, frames: int) -> array.array:
+        """Mix the next `frames` samples of every voice (caller holds the lock)."""
+        acc = [0.0] * frames
+        finished = []
+        for voice in self._voices:
+            segment = voice.samples[voice.position:voice.position + frames]
+            gain = voice.gain * self.master_gain
+            n = len(segment)
+            acc[:n] = [a + s * gain for a, s in zip(acc, segment)]
+            voice.position += n
+            if voice.remaining <= 0:
+                finished.append(voice)
+        for voice in finished:
+            self._voices.remove(voice)
+
+        knee = self.clip_threshold * SAMPLE_MAX
+        if acc and max(map(abs, acc)) > knee:
+            threshold = self.clip_threshold
+            acc = [soft_clip(x, threshold) for x in acc]
+        return array.array('h', [int(round(x)) for x in acc])
+
+    def read(self, max_bytes: int) -> bytes:
+        """
+        Pull up to max_bytes of mixed PCM (always a whole number of samples).
+
+        Silence is returned while no voices are active, so a pull-mode sink
+        never underruns.
+        """
+        frames = max_bytes // 2
+        if frames <= 0:
+            return b''
+        with self._lock:
+            if not self._voices and self._ring.available == 0:
+                return bytes(2 * frames)
+            out = array.array('h')
+            while len(out) < frames:
+                if self._ring.available == 0:
+                    if not self._voices:
+                        break
+                    self._ring.write(self._mix_block(self.block_frames))
+                out.extend(self._ring.read(frames - len(out)))
+        if len(out) < frames:
+            out.extend(array.array('h', bytes(2 * (frames - len(out)))))
+        return samples_to_pcm(out)
+
+    def render(self, frames: int) -> bytes:
+        """Headless mode: mix `frames` samples into an in-memory buffer."""
+        return self.read(2 * frames)
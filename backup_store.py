@@ -0,0 +1,243 @@
+"""
+Content-addressed backup store for Personal Liberty.
+
+Config snapshots are split into content-defined chunks (boundaries chosen by
+a hash of each JSON line, so an edit only changes the chunks around it).
+Each chunk is stored once, zlib-compressed, under objects/<sha256>. A small
+manifest.json lists snapshots and the chunk hashes that make them up, so
+listing and pruning never touch the object files, and a long backup history
+costs little more than the changes between snapshots.
+
+Layout inside a backup directory:
+    manifest.json
+    objects/ab/abcdef0123...   (zlib-compressed chunk, named by sha256 of raw bytes)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+OBJECTS_DIR = "objects"
+
+# Content-defined chunking parameters (in bytes)
+MIN_CHUNK_SIZE = 2 * 1024
+MAX_CHUNK_SIZE = 64 * 1024
+BOUNDARY_MASK = 0x3F  # ~1 in 64 lines ends a chunk once MIN_CHUNK_SIZE is reached
+
+COMPRESSION_LEVEL = 6
+
+
+def split_chunks(data: bytes) -> List[bytes]:
+    """
+    Split data into content-defined chunks on line boundaries.
+
+    A chunk ends after a line whose CRC matches BOUNDARY_MASK (once the
+    chunk is at least MIN_CHUNK_SIZE), or when it reaches MAX_CHUNK_SIZE.
+    Because boundaries depend only on nearby content, inserting or removing
+    data leaves the chunks elsewhere in the file unchanged.
+    """
+    chunks: List[bytes] = []
+    current: List[bytes] = []
+    current_size = 0
+    for line in data.splitlines(keepends=True):
+        current.append(line)
+        current_size += len(line)
+        if current_size >= MAX_CHUNK_SIZE or (
+            current_size >= MIN_CHUNK_SIZE and (zlib.crc32(line) & BOUNDARY_MASK) == 0
+        ):
+            chunks.append(b"".join(current))
+            current = []
+            current_size = 0
+    if current:
+        chunks.append(b"".join(current))
+    return chunks
+
+
+class BackupStore:
+    """Chunk-deduplicated, compressed snapshot store with a manifest index."""
+
+    def __init__(self, backup_dir: Path):
+        self.backup_dir = Path(backup_dir)
+        self.objects_dir = self.backup_dir / OBJECTS_DIR
+        self.manifest_path = self.backup_dir / MANIFEST_NAME
+        self._snapshots: List[Dict] = self._load_manifest()
+
+    # === Manifest ===
+
+    def _load_manifest(self) -> List[Dict]:
+        if not self.manifest_path.exists():
+            return []
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            snapshots = manifest.get("snapshots", [])
+            return [s for s in snapshots if isinstance(s, dict) and s.get("id") and isinstance(s.get("chunks"), list)]
+        except (json.JSONDecodeError, IOError, OSError, AttributeError) as e:
+            logger.warning(f"Backup manifest unreadable, starting a new index: {e}")
+            return []
+
+    def _save_manifest(self) -> None:
+        from core_logic import atomic_write_json
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self.manifest_path, {
+            "version": MANIFEST_VERSION,
+            "snapshots": self._snapshots,
+        })
+
+    # === Objects ===
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _put_object(self, chunk: bytes) -> str:
+        """Store a chunk if not already present; return its hash."""
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(chunk, COMPRESSION_LEVEL))
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        return digest
+
+    def _get_object(self, digest: str) -> bytes:
+        with open(self._object_path(digest), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    # === Snapshots ===
+
+    def add_snapshot(self, data: bytes, prefix: str = "auto",
+                     created: Optional[datetime] = None) -> str:
+        """
+        Store data as a new snapshot and return its id.
+
+        Only chunks not already in the store are written.
+        """
+        created = created or datetime.now()
+        base_id = f"{prefix}_config_{created.strftime('%Y%m%d_%H%M%S')}"
+        snapshot_id = base_id
+        existing = {s["id"] for s in self._snapshots}
+        counter = 1
+        while snapshot_id in existing:
+            snapshot_id = f"{base_id}_{counter}"
+            counter += 1
+
+        chunk_ids = [self._put_object(chunk) for chunk in split_chunks(data)]
+        self._snapshots.append({
+            "id": snapshot_id,
+            "prefix": prefix,
+            "created": created.isoformat(),
+            "size": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "chunks": chunk_ids,
+        })
+        self._save_manifest()
+        return snapshot_id
+
+    def list_snapshots(self, prefix: Optional[str] = None) -> List[Dict]:
+        """List snapshot entries (newest first), optionally filtered by prefix."""
+        snapshots = [s for s in self._snapshots if prefix is None or s.get("prefix") == prefix]
+        return sorted(snapshots, key=lambda s: s.get("created", ""), reverse=True)
+
+    def get_snapshot(self, snapshot_id: str) -> Optional[Dict]:
+        for snapshot in self._snapshots:
+            if snapshot["id"] == snapshot_id:
+                return snapshot
+        return None
+
+    def iter_snapshot(self, snapshot_id: str) -> Iterator[bytes]:
+        """Yield a snapshot's raw bytes chunk by chunk (for streaming exports)."""
+        snapshot = self.get_snapshot(snapshot_id)
+        if snapshot is None:
+            raise KeyError(snapshot_id)
+        for digest in snapshot["chunks"]:
+            yield self._get_object(digest)
+
+    def read_snapshot(self, snapshot_id: str) -> bytes:
+        """Reassemble and verify a snapshot's full contents."""
+        data = b"".join(self.iter_snapshot(snapshot_id))
+        expected = self.get_snapshot(snapshot_id).get("sha256")
+        if expected and hashlib.sha256(data).hexdigest() != expected:
+            raise ValueError(f"Backup snapshot {snapshot_id} failed integrity check")
+        return data
+
+    def restore(self, snapshot_id: str, target_path: Path) -> None:
+        """Atomically write a snapshot back to target_path."""
+        data = self.read_snapshot(snapshot_id)
+        target_path = Path(target_path)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', prefix=target_path.stem + '_', dir=target_path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, target_path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def prune(self, keep: int, prefix: Optional[str] = None) -> int:
+        """
+        Keep only the newest `keep` snapshots (per prefix if given).
+
+        Unreferenced chunks are deleted. Returns the number of snapshots removed.
+        """
+        candidates = self.list_snapshots(prefix)
+        doomed = {s["id"] for s in candidates[keep:]}
+        if not doomed:
+            return 0
+        removed_chunks = set()
+        for snapshot in self._snapshots:
+            if snapshot["id"] in doomed:
+                removed_chunks.update(snapshot["chunks"])
+        self._snapshots = [s for s in self._snapshots if s["id"] not in doomed]
+        self._save_manifest()
+
+        still_referenced = set()
+        for snapshot in self._snapshots:
+            still_referenced.update(snapshot["chunks"])
+        for digest in removed_chunks - still_referenced:
+            try:
+                self._object_path(digest).unlink()
+            except OSError:
+                pass
+        return len(doomed)
+
+    def import_legacy_backups(self) -> int:
+        """
+        Move loose *_config_*.json backups (pre-store format) into the store.
+
+        Each file becomes a snapshot named after it, then the loose file is
+        removed. Returns the number of files imported.
+        """
+        imported = 0
+        for legacy in sorted(self.backup_dir.glob("*_config_*.json"), key=lambda p: p.stat().st_mtime):
+            try:
+                prefix = legacy.name.split("_config_", 1)[0]
+                created = datetime.fromtimestamp(legacy.stat().st_mtime)
+                self.add_snapshot(legacy.read_bytes(), prefix=prefix, created=created)
+                legacy.unlink()
+                imported += 1
+            except (IOError, OSError) as e:
+                logger.warning(f"Could not import legacy backup {legacy.name}: {e}")
+        return imported
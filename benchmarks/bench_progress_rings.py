@@ -0,0 +1,90 @@
+"""
+Benchmark for the daily timeline's progress rings.
+
+For each ring, offscreen:
+
+- full_ms: repaint with the static layer (track, labels) redrawn every
+  time, which is what every paint used to cost
+- cached_ms: repaint drawing only the value arc over the cached layer
+- ticks that repaint: how many of N update ticks feeding unchanged or
+  sub-threshold values still asked for a repaint (was: all of them)
+
+Usage:
+    python benchmarks/bench_progress_rings.py [--repaints 1000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Ring class name, then set_progress arguments for tick i (values creep by
+# less than one arc step, labels stay put)
+RINGS = {
+    "WaterRingWidget": lambda i: (3, 8),
+    "ChapterRingWidget": lambda i: (3, 45.0 + (i % 10) * 0.01, 7, False),
+    "EyeRingWidget": lambda i: (9, 20),
+    "XPRingWidget": lambda i: (5, 300, 100000 + i % 3, 5000),
+    "FocusRingWidget": lambda i: (5400 + i % 10, 14400),
+    "EntitiesRingWidget": lambda i: (4, 2, 45),
+}
+
+
+def benchmark_progress_rings(repaints: int = 1000) -> dict:
+    from PySide6 import QtGui, QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    import progress_ring
+
+    results = {}
+    for name, args in RINGS.items():
+        ring = getattr(progress_ring, name)()
+        ring.resize(70, 70)
+        ring.set_progress(*args(0))
+        image = QtGui.QImage(70, 70, QtGui.QImage.Format_ARGB32_Premultiplied)
+
+        start = time.perf_counter()
+        for _ in range(repaints):
+            ring._layer = None  # Redraw everything, as before
+            ring.render(image)
+        full_ms = (time.perf_counter() - start) * 1000 / repaints
+
+        renders = ring.layer_renders
+        start = time.perf_counter()
+        for _ in range(repaints):
+            ring.render(image)
+        cached_ms = (time.perf_counter() - start) * 1000 / repaints
+
+        ticks_repainting = sum(1 for i in range(repaints) if _tick_repaints(ring, args(i)))
+        results[name] = {
+            "full_ms": round(full_ms, 4),
+            "cached_ms": round(cached_ms, 4),
+            "speedup": round(full_ms / cached_ms, 1) if cached_ms else None,
+            "layer_renders_while_cached": ring.layer_renders - renders,
+            "ticks_that_repaint": ticks_repainting,
+        }
+    app.processEvents()
+    return {"repaints": repaints, "rings": results}
+
+
+def _tick_repaints(ring, args) -> bool:
+    """Feed one tick; True if the ring asked for a repaint."""
+    before = ring._display_key
+    ring.set_progress(*args)
+    return ring._display_key != before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repaints", type=int, default=1000)
+    args = parser.parse_args()
+    print(json.dumps(benchmark_progress_rings(args.repaints), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark for repeatedly opening story chapters.
+
+Replays what the Story tab does when a chapter is opened: read the story
+progress, personalise the chapter text and convert it to HTML.
+
+- cold: template, chapter-index and render caches cleared before every open
+- warm: the same opens served from the caches (power passed in, as the
+  power_changed handler does)
+
+Usage:
+    python benchmarks/bench_story_chapters.py [--opens 2000] [--story warrior]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def make_hero(story_id: str) -> dict:
+    """A late-game hero: every chapter unlocked, all decisions made, full gear."""
+    from gamification import STORY_DATA, ensure_hero_structure
+
+    adhd_buster = {}
+    ensure_hero_structure(adhd_buster)
+    adhd_buster["active_story"] = story_id
+    adhd_buster["max_power_reached"] = 2000
+    for chapter_num, choice in ((2, "A"), (4, "B"), (6, "A")):
+        decision = STORY_DATA[story_id]["decisions"][chapter_num]
+        adhd_buster["story_decisions"][decision["id"]] = choice
+    for slot in ("Helmet", "Weapon", "Chestplate", "Shield", "Gauntlets", "Boots", "Cloak", "Amulet"):
+        adhd_buster["equipped"][slot] = {
+            "name": f"Legendary {slot}", "slot": slot, "power": 150, "rarity": "Legendary",
+        }
+    return adhd_buster
+
+
+def benchmark_story_chapters(opens: int = 2000, story_id: str = "warrior") -> dict:
+    import gamification
+    from gamification import calculate_character_power, get_story_progress
+    from story_render import ChapterRenderCache
+
+    adhd_buster = make_hero(story_id)
+    power = calculate_character_power(adhd_buster)
+
+    cache = ChapterRenderCache()
+    start = time.perf_counter()
+    for i in range(opens):
+        gamification.compile_story_template.cache_clear()
+        gamification._story_chapter_index.cache_clear()
+        cache.clear()
+        get_story_progress(adhd_buster)
+        cache.get(i % 7 + 1, adhd_buster)
+    cold_ms = (time.perf_counter() - start) * 1000 / max(1, opens)
+
+    start = time.perf_counter()
+    for i in range(opens):
+        get_story_progress(adhd_buster, power=power)
+        cache.get(i % 7 + 1, adhd_buster, power)
+    warm_ms = (time.perf_counter() - start) * 1000 / max(1, opens)
+
+    return {
+        "story": story_id,
+        "opens": opens,
+        "cold_open_ms": round(cold_ms, 4),
+        "warm_open_ms": round(warm_ms, 4),
+        "speedup": round(cold_ms / warm_ms, 1) if warm_ms else None,
+        "cache_hits": cache.hits,
+        "cache_misses": cache.misses,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--opens", type=int, default=2000)
+    parser.add_argument("--story", default="warrior")
+    args = parser.parse_args()
+    print(json.dumps(benchmark_story_chapters(args.opens, args.story), indent=2))
+
+
+if __name__ == "__main__":
+    main()
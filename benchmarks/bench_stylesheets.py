@@ -0,0 +1,116 @@
+"""
+Benchmark for stylesheet work during a hero tab refresh.
+
+Builds ADHDBusterTab offscreen for a fixed hero (seeded gear and inventory)
+and counts, for one full refresh_all():
+
+- stylesheet_parses: QWidget.setStyleSheet() calls, each of which makes Qt
+  parse CSS and re-polish the widget subtree
+- state_repolishes: theme.set_style_state() calls that changed a widget's
+  state and re-polished it (no parse; the application rules are reused)
+
+Usage:
+    python benchmarks/bench_stylesheets.py [--items 12] [--refreshes 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def make_hero(items: int, seed: int = 7) -> dict:
+    """A hero with a seeded inventory, first item of each slot equipped."""
+    from gamification import ensure_hero_structure, generate_item
+
+    random.seed(seed)
+    rarities = ["Common", "Uncommon", "Rare", "Epic", "Legendary"]
+    adhd_buster = {}
+    ensure_hero_structure(adhd_buster)
+    for i in range(items):
+        item = generate_item(rarity=rarities[i % len(rarities)])
+        adhd_buster["inventory"].append(item)
+        if not adhd_buster["equipped"].get(item["slot"]):
+            adhd_buster["equipped"][item["slot"]] = item
+    return adhd_buster
+
+
+def bind_app_modules(fb) -> None:
+    """
+    Bind the gamification names load_heavy_modules() would, without the
+    optional tabs (and audio libraries) it also imports.
+    """
+    import game_state
+    import gamification
+
+    for name in dir(gamification):
+        if not name.startswith("_") and getattr(fb, name, 0) is None:
+            setattr(fb, name, getattr(gamification, name))
+    fb.get_game_state = game_state.get_game_state
+    fb.GAMIFICATION_AVAILABLE = True
+
+
+def benchmark_stylesheets(items: int = 12, refreshes: int = 5) -> dict:
+    from PySide6 import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    import focus_blocker_qt as fb
+    bind_app_modules(fb)
+
+    counts = {"parses": 0, "repolishes": 0}
+    set_stylesheet = QtWidgets.QWidget.setStyleSheet
+    set_style_state = fb.set_style_state
+
+    def counting_set_stylesheet(widget, sheet):
+        counts["parses"] += 1
+        return set_stylesheet(widget, sheet)
+
+    def counting_set_style_state(widget, role, **properties):
+        changed = set_style_state(widget, role, **properties)
+        counts["repolishes"] += changed
+        return changed
+
+    blocker = types.SimpleNamespace(adhd_buster=make_hero(items), save_config=lambda: None, stats={})
+    QtWidgets.QWidget.setStyleSheet = counting_set_stylesheet
+    fb.set_style_state = counting_set_style_state
+    try:
+        tab = fb.ADHDBusterTab(blocker)
+        build = dict(counts)
+        app.processEvents()
+
+        counts.update(parses=0, repolishes=0)
+        start = time.perf_counter()
+        for _ in range(refreshes):
+            tab.refresh_all()
+        refresh_ms = (time.perf_counter() - start) * 1000 / max(1, refreshes)
+    finally:
+        QtWidgets.QWidget.setStyleSheet = set_stylesheet
+        fb.set_style_state = set_style_state
+
+    return {
+        "inventory_items": items,
+        "refreshes": refreshes,
+        "build_stylesheet_parses": build["parses"],
+        "stylesheet_parses_per_refresh": counts["parses"] / max(1, refreshes),
+        "state_repolishes_per_refresh": counts["repolishes"] / max(1, refreshes),
+        "refresh_ms": round(refresh_ms, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=12)
+    parser.add_argument("--refreshes", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(benchmark_stylesheets(args.items, args.refreshes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
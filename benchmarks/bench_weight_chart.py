@@ -0,0 +1,94 @@
+"""
+Paint benchmark for WeightChartWidget with a long weight history.
+
+Renders the chart offscreen (QT_QPA_PLATFORM=offscreen) into a QImage:
+
+- first paint: lays out the chart and builds the cached display list
+- cached paint: replays the display list (hover, expose, tab switches)
+- resize paint: size changed, so the layout is rebuilt
+
+Usage:
+    python benchmarks/bench_weight_chart.py [--entries 5000] [--paints 10]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def make_history(entries: int, seed: int = 1) -> list:
+    """Daily weigh-ins with a slow drift, noise and a few missed days."""
+    rng = random.Random(seed)
+    day = date(2012, 1, 1)
+    weight = 92.0
+    history = []
+    while len(history) < entries:
+        weight += rng.uniform(-0.35, 0.3)
+        history.append({
+            "date": day.isoformat(),
+            "weight": round(weight, 1),
+            "note": rng.choice(["", "", "morning", "evening"]),
+        })
+        day += timedelta(days=rng.choice([1, 1, 1, 2]))
+    return history
+
+
+def benchmark_weight_chart(entries: int = 5000, paints: int = 10,
+                           width: int = 900, height: int = 320) -> dict:
+    from PySide6 import QtGui, QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from focus_blocker_qt import WeightChartWidget
+
+    history = make_history(entries)
+    chart = WeightChartWidget()
+    chart.resize(width, height)
+    image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_ARGB32)
+
+    start = time.perf_counter()
+    chart.set_data(history, goal=80.0)
+    set_data_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    chart.render(image)
+    first_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(paints):
+        chart.render(image)
+    cached_ms = (time.perf_counter() - start) * 1000 / max(1, paints)
+
+    start = time.perf_counter()
+    for i in range(paints):
+        chart.resize(width - (i % 2) * 50, height)
+        chart.render(image)
+    resize_ms = (time.perf_counter() - start) * 1000 / max(1, paints)
+
+    app.processEvents()
+    return {
+        "entries": entries,
+        "set_data_ms": round(set_data_ms, 2),
+        "first_paint_ms": round(first_ms, 2),
+        "cached_paint_ms": round(cached_ms, 2),
+        "resize_paint_ms": round(resize_ms, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--paints", type=int, default=10)
+    args = parser.parse_args()
+    print(json.dumps(benchmark_weight_chart(args.entries, args.paints), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Benchmark suite for the gamification and persistence hot paths.
+
+Times each case against the small, median and whale synthetic profiles
+(see synthetic_profiles.py) and reports throughput (ops/sec, from the
+best of several repeats) and the peak memory allocated by one call
+(tracemalloc). Results can be saved as a baseline and later runs
+compared against it: a case whose ops/sec drops, or whose peak memory
+grows, by more than --threshold percent is a regression and the run
+exits with status 1.
+
+Baselines are machine-specific; record one on the machine that will do
+the comparing.
+
+Usage:
+    python benchmarks/run_suite.py [--profiles small,median,whale] [--only NAME,...]
+                                   [--min-time 0.5] [--repeats 3]
+                                   [--baseline benchmarks/baseline.json] [--save-baseline]
+                                   [--threshold 25]
+"""
+
+import argparse
+import atexit
+import copy
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_profiles import DEFAULT_SEED, PROFILE_SIZES, build_profile  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 25.0
+
+# Peak memory differences below this are allocator noise, not regressions
+MEMORY_NOISE_KIB = 16.0
+
+
+# === Cases ===
+# Each case takes a profile and returns the zero-argument callable to time.
+# Setup work (copies, temp files) happens here, outside the timed calls.
+
+def _calculate_character_power(profile: Dict) -> Callable[[], object]:
+    from gamification import calculate_character_power
+    adhd_buster = profile["adhd_buster"]
+    return lambda: calculate_character_power(adhd_buster)
+
+
+def _optimize_equipped_gear(profile: Dict) -> Callable[[], object]:
+    from gamification import optimize_equipped_gear
+    adhd_buster = copy.deepcopy(profile["adhd_buster"])
+    return lambda: optimize_equipped_gear(adhd_buster)
+
+
+def _generate_item(profile: Dict) -> Callable[[], object]:
+    from gamification import generate_item
+    adhd_buster = profile["adhd_buster"]
+    random.seed(DEFAULT_SEED)
+    return lambda: generate_item(session_minutes=45, streak_days=5, story_id="warrior",
+                                 adhd_buster=adhd_buster)
+
+
+def _perform_lucky_merge(profile: Dict) -> Callable[[], object]:
+    from gamification import perform_lucky_merge
+    items = copy.deepcopy(profile["adhd_buster"]["inventory"][:5])
+    random.seed(DEFAULT_SEED)
+    return lambda: perform_lucky_merge(items, story_id="warrior")
+
+
+def _get_all_perk_bonuses(profile: Dict) -> Callable[[], object]:
+    from gamification import get_all_perk_bonuses
+    adhd_buster = profile["adhd_buster"]
+    return lambda: get_all_perk_bonuses(adhd_buster)
+
+
+def _get_city_bonuses(profile: Dict) -> Callable[[], object]:
+    from city import get_city_bonuses
+    adhd_buster = profile["adhd_buster"]
+    return lambda: get_city_bonuses(adhd_buster)
+
+
+def _save_config(profile: Dict) -> Callable[[], object]:
+    """BlockerCore.save_config with the profile loaded, writing to a temp directory."""
+    import core_logic
+
+    tmp = Path(tempfile.mkdtemp(prefix="pl_bench_"))
+    atexit.register(shutil.rmtree, tmp, True)
+    paths = {
+        "CONFIG_PATH": tmp / "config.json",
+        "STATS_PATH": tmp / "stats.json",
+        "GOALS_PATH": tmp / "goals.json",
+        "SESSION_STATE_PATH": tmp / ".session_state.json",
+    }
+    saved = {name: getattr(core_logic, name) for name in paths}
+    for name, path in paths.items():
+        setattr(core_logic, name, path)
+    try:
+        core = core_logic.BlockerCore()
+    finally:
+        for name, path in saved.items():
+            setattr(core_logic, name, path)
+    core.adhd_buster = copy.deepcopy(profile["adhd_buster"])
+    for key, entries in profile["config"].items():
+        setattr(core, key, copy.deepcopy(entries))
+    core.stats = copy.deepcopy(profile["stats"])
+    return core.save_config
+
+
+CASES: Dict[str, Callable[[Dict], Callable[[], object]]] = {
+    "calculate_character_power": _calculate_character_power,
+    "optimize_equipped_gear": _optimize_equipped_gear,
+    "generate_item": _generate_item,
+    "perform_lucky_merge": _perform_lucky_merge,
+    "get_all_perk_bonuses": _get_all_perk_bonuses,
+    "get_city_bonuses": _get_city_bonuses,
+    "BlockerCore.save_config": _save_config,
+}
+
+
+# === Measurement ===
+
+def measure(fn: Callable[[], object], min_time: float = 0.5, repeats: int = 3) -> Dict:
+    """
+    Time fn and measure its peak allocation.
+
+    After one warm-up call, each repeat calls fn until it has run for
+    min_time / repeats seconds (at least once); the fastest repeat gives
+    ops_per_sec. The peak is taken from one more call under tracemalloc.
+    """
+    fn()
+    budget = min_time / repeats
+    best = float("inf")
+    calls = 0
+    for _ in range(repeats):
+        count = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= budget:
+                break
+        calls += count
+        best = min(best, elapsed / count)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(1.0 / best, 2) if best > 0 else None,
+        "ms_per_op": round(best * 1000, 4),
+        "peak_kib": round(peak / 1024, 1),
+        "calls": calls,
+    }
+
+
+def result_key(case: str, profile: str) -> str:
+    return f"{case}[{profile}]"
+
+
+def run_suite(profiles: Optional[List[str]] = None, cases: Optional[List[str]] = None,
+              min_time: float = 0.5, repeats: int = 3, seed: int = DEFAULT_SEED,
+              progress: Optional[Callable[[str], None]] = None) -> Dict:
+    """Run every case against every profile. Returns {"meta": ..., "results": {key: measurement}}."""
+    profiles = profiles or list(PROFILE_SIZES)
+    cases = cases or list(CASES)
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}")
+
+    results = {}
+    for profile_name in profiles:
+        profile = build_profile(profile_name, seed)
+        for case in cases:
+            key = result_key(case, profile_name)
+            if progress:
+                progress(key)
+            results[key] = measure(CASES[case](profile), min_time, repeats)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Regressions of current against baseline (both run_suite() results).
+
+    A case regresses when its ops/sec fell by more than threshold percent,
+    or its peak memory grew by more than threshold percent (and by more
+    than MEMORY_NOISE_KIB). Cases missing from either side are skipped.
+    """
+    regressions = []
+    base_results = baseline.get("results", {})
+    for key, cur in current.get("results", {}).items():
+        base = base_results.get(key)
+        if not base:
+            continue
+        base_ops, cur_ops = base.get("ops_per_sec"), cur.get("ops_per_sec")
+        if base_ops and cur_ops:
+            slowdown = (base_ops - cur_ops) / base_ops * 100
+            if slowdown > threshold:
+                regressions.append({"case": key, "metric": "ops_per_sec", "baseline": base_ops,
+                                    "current": cur_ops, "change_pct": round(-slowdown, 1)})
+        base_kib, cur_kib = base.get("peak_kib"), cur.get("peak_kib")
+        if base_kib is not None and cur_kib is not None and cur_kib - base_kib > MEMORY_NOISE_KIB:
+            growth = (cur_kib - base_kib) / base_kib * 100 if base_kib else float("inf")
+            if growth > threshold:
+                regressions.append({"case": key, "metric": "peak_kib", "baseline": base_kib,
+                                    "current": cur_kib, "change_pct": round(growth, 1)})
+    return regressions
+
+
+def format_table(current: Dict, baseline: Optional[Dict] = None) -> str:
+    """One line per case: ops/sec, ms/op, peak KiB and the change against the baseline."""
+    base_results = (baseline or {}).get("results", {})
+    lines = [f"{'case':<42} {'ops/sec':>12} {'ms/op':>10} {'peak KiB':>10} {'vs base':>9}"]
+    for key, res in current["results"].items():
+        change = ""
+        base = base_results.get(key)
+        if base and base.get("ops_per_sec") and res.get("ops_per_sec"):
+            change = f"{(res['ops_per_sec'] / base['ops_per_sec'] - 1) * 100:+.1f}%"
+        lines.append(f"{key:<42} {res['ops_per_sec']:>12,.1f} {res['ms_per_op']:>10.3f} "
+                     f"{res['peak_kib']:>10,.1f} {change:>9}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profiles", default=",".join(PROFILE_SIZES),
+                        help="comma-separated profile sizes")
+    parser.add_argument("--only", default="", help="comma-separated case names (default: all)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds spent timing each case")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write the results to --baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed regression in percent")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    current = run_suite(
+        profiles=[p for p in args.profiles.split(",") if p],
+        cases=[c for c in args.only.split(",") if c] or None,
+        min_time=args.min_time,
+        repeats=args.repeats,
+        seed=args.seed,
+        progress=lambda key: print(f"  {key}", file=sys.stderr),
+    )
+    if args.json:
+        args.json.write_text(json.dumps(current, indent=2), encoding="utf-8")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2), encoding="utf-8")
+        print(format_table(current))
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    print(format_table(current, baseline))
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+
+    regressions = compare(current, baseline, args.threshold)
+    if not regressions:
+        print(f"\nNo regressions beyond {args.threshold:g}%.")
+        return 0
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}%:")
+    for r in regressions:
+        print(f"  {r['case']}: {r['metric']} {r['baseline']} -> {r['current']} ({r['change_pct']:+}%)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Fixed-seed synthetic user profiles for the benchmark suite.
+
+Three sizes, each built the same way from its seed so that runs on
+different days and machines time the same data:
+
+- small: a new user (a month in, a few items, a couple of buildings)
+- median: about a year of regular use
+- whale: 500-item inventory, every entity collected, every city building
+  complete at its max level, 3 years of daily stats and tracker entries
+
+build_profile() returns {"adhd_buster": ..., "config": ..., "stats": ...}:
+the hero data, the BlockerCore tracker lists (weight, sleep, water,
+activity entries) and stats.json contents.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from typing import Dict
+
+PROFILE_SIZES: Dict[str, Dict] = {
+    "small": {"items": 20, "entity_fraction": 0.1, "buildings": 2, "days": 30},
+    "median": {"items": 120, "entity_fraction": 0.5, "buildings": 5, "days": 365},
+    "whale": {"items": 500, "entity_fraction": 1.0, "buildings": None, "days": 3 * 365},
+}
+
+DEFAULT_SEED = 20240101
+
+# Profiles end on a fixed day so dates don't drift between runs
+END_DATE = date(2026, 1, 1)
+
+RARITY_WEIGHTS = {"Common": 40, "Uncommon": 30, "Rare": 17, "Epic": 9, "Legendary": 4}
+
+
+def _items(rng: random.Random, count: int, story_id: str) -> list:
+    import gamification
+
+    items = []
+    for i in range(count):
+        rarity = rng.choices(list(RARITY_WEIGHTS), weights=list(RARITY_WEIGHTS.values()))[0]
+        # generate_item draws from the global random module
+        random.seed(rng.random())
+        item = gamification.generate_item(rarity=rarity, story_id=story_id)
+        item["item_id"] = f"bench-{i:04d}"
+        item["obtained_at"] = datetime(2025, 1, 1).isoformat()
+        items.append(item)
+    return items
+
+
+def _equip(inventory: list) -> dict:
+    """Strongest item per gear slot."""
+    import gamification
+
+    equipped = {}
+    for slot in gamification.GEAR_SLOTS:
+        candidates = [i for i in inventory if i.get("slot") == slot]
+        equipped[slot] = max(candidates, key=lambda i: i.get("power", 0)) if candidates else None
+    return equipped
+
+
+def _entitidex(rng: random.Random, fraction: float) -> dict:
+    from entitidex.entity_pools import get_all_entity_ids
+
+    entity_ids = get_all_entity_ids()
+    collected = entity_ids if fraction >= 1 else rng.sample(entity_ids, int(len(entity_ids) * fraction))
+    exceptional = {eid: {"caught_at": "2025-06-01T12:00:00"}
+                   for eid in collected if rng.random() < 0.2}
+    return {
+        "collected_entity_ids": sorted(collected),
+        "exceptional_entities": exceptional,
+        "encounters": {eid: rng.randint(1, 6) for eid in collected},
+        "total_encounters": len(collected) * 3,
+    }
+
+
+def _build_city(adhd_buster: dict, buildings) -> None:
+    from city import CellStatus, get_city_data
+    from city.city_buildings import CITY_BUILDINGS
+
+    city = get_city_data(adhd_buster)
+    city["last_collection_time"] = datetime.combine(END_DATE, datetime.min.time()).isoformat()
+    building_ids = list(CITY_BUILDINGS)
+    if buildings is not None:
+        building_ids = building_ids[:buildings]
+    row = city["grid"][0]
+    for col, building_id in enumerate(building_ids[:len(row)]):
+        row[col] = {
+            "building_id": building_id,
+            "status": CellStatus.COMPLETE.value,
+            "level": CITY_BUILDINGS[building_id]["max_level"],
+            "construction_progress": {},
+        }
+
+
+def _daily(rng: random.Random, days: int) -> Dict[str, list]:
+    """stats.json daily_stats plus weight/sleep/water/activity entries, one per day."""
+    daily_stats = {}
+    weight_entries, sleep_entries, water_entries, activity_entries = [], [], [], []
+    weight = 82.0
+    for offset in range(days, 0, -1):
+        day = (END_DATE - timedelta(days=offset)).isoformat()
+        sessions = rng.randint(0, 6)
+        hourly = {str(h): rng.randint(600, 3000) for h in rng.sample(range(8, 22), sessions)}
+        daily_stats[day] = {"focus_time": sum(hourly.values()), "sessions": sessions, "hourly": hourly}
+
+        weight += rng.uniform(-0.3, 0.28)
+        weight_entries.append({"date": day, "weight": round(weight, 1)})
+        sleep_entries.append({
+            "date": day, "sleep_hours": round(rng.uniform(5.5, 9), 2),
+            "bedtime": "23:00", "wake_time": "07:00", "quality": "good",
+            "disruptions": [], "score": rng.randint(50, 100), "note": "",
+        })
+        for glass in range(rng.randint(3, 9)):
+            water_entries.append({"date": day, "time": f"{8 + glass:02d}:00", "glasses": 1})
+        if rng.random() < 0.6:
+            activity_entries.append({
+                "date": day, "duration": rng.choice((20, 30, 45, 60)),
+                "activity_type": rng.choice(("walking", "running", "cycling", "yoga")),
+                "intensity": rng.choice(("light", "moderate", "vigorous")),
+            })
+    return {
+        "daily_stats": daily_stats,
+        "weight_entries": weight_entries,
+        "sleep_entries": sleep_entries,
+        "water_entries": water_entries,
+        "activity_entries": activity_entries,
+    }
+
+
+def build_profile(size: str, seed: int = DEFAULT_SEED) -> Dict:
+    """Build the named profile ("small", "median" or "whale")."""
+    spec = PROFILE_SIZES[size]
+    rng = random.Random(f"{seed}:{size}")
+    story_id = "warrior"
+
+    state = random.getstate()
+    try:
+        inventory = _items(rng, spec["items"], story_id)
+    finally:
+        random.setstate(state)
+    daily = _daily(rng, spec["days"])
+    total_focus = sum(d["focus_time"] for d in daily["daily_stats"].values())
+    adhd_buster = {
+        "inventory": inventory,
+        "equipped": _equip(inventory),
+        "coins": rng.randint(100, 50000),
+        "total_xp": spec["days"] * 400,
+        "total_collected": spec["items"],
+        "selected_story": story_id,
+        "entitidex": _entitidex(rng, spec["entity_fraction"]),
+    }
+    _build_city(adhd_buster, spec["buildings"])
+
+    stats = {
+        "total_focus_time": total_focus,
+        "sessions_completed": sum(d["sessions"] for d in daily["daily_stats"].values()),
+        "sessions_cancelled": spec["days"] // 10,
+        "daily_stats": daily["daily_stats"],
+        "streak_days": 12,
+        "last_session_date": (END_DATE - timedelta(days=1)).isoformat(),
+        "best_streak": 40,
+        "shutdown_times": [],
+        "startup_times": [],
+    }
+    config = {key: daily[key] for key in ("weight_entries", "sleep_entries", "water_entries", "activity_entries")}
+    return {"adhd_buster": adhd_buster, "config": config, "stats": stats}
@@ -18,6 +18,8 @@ import time
 from typing import Optional, Callable, List, Set, Tuple
 from datetime import datetime, timedelta
 
+from telemetry import timed
+
 
 # Windows API for getting active window title and process info
 try:
@@ -447,6 +449,7 @@ class BrowserMonitor:
             
             time.sleep(self.check_interval)
     
+    @timed("browser_monitor.poll")
     def _check_active_window(self) -> None:
         """
         Check if the active window is visiting a blocked site.
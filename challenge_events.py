@@ -0,0 +1,191 @@
+"""
+Domain event bus and incremental daily/weekly challenge progress.
+
+Actions publish what happened ("session_completed", "item_merged",
+"water_logged", ...) on an EventBus instead of each call site having to
+remember gamification.update_challenge_progress(). ChallengeTracker keeps
+an index from event to the active challenges that count it, so an event
+only touches its subscribers:
+
+    bus = EventBus()
+    tracker = ChallengeTracker(lambda: adhd_buster, bus)
+    bus.publish(SESSION_COMPLETED, minutes=25)
+
+Domain events expand into the legacy event names understood by
+gamification (a completed session counts as "session", "focus_minutes"
+and possibly "early_session"/"night_session"), and the per-challenge rule
+is gamification.apply_challenge_event(), shared with the full scan in
+update_challenge_progress(). Like the full scan, every event also
+refreshes the login streak challenges from adhd_buster["login_streak"],
+which is set at login rather than by an event. The index is rebuilt when the challenge lists
+roll over or the profile is replaced; call invalidate() after editing the
+lists some other way.
+"""
+
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SESSION_COMPLETED = "session_completed"  # minutes, hour (local hour it ended)
+WEIGHT_LOGGED = "weight_logged"
+SLEEP_LOGGED = "sleep_logged"
+ACTIVITY_LOGGED = "activity_logged"
+WATER_LOGGED = "water_logged"
+ITEM_MERGED = "item_merged"
+ENTITY_CAUGHT = "entity_caught"
+
+# Simple events -> the legacy challenge event they count as
+_SIMPLE_EVENTS = {
+    WEIGHT_LOGGED: "weight_log",
+    SLEEP_LOGGED: "sleep_log",
+    ACTIVITY_LOGGED: "activity_log",
+    WATER_LOGGED: "water_log",
+    ITEM_MERGED: "item_merge",
+    ENTITY_CAUGHT: "entity_catch",
+}
+
+DOMAIN_EVENTS = (SESSION_COMPLETED,) + tuple(_SIMPLE_EVENTS)
+
+# Same windows as the early bird / night owl achievements in BlockerCore.update_stats
+EARLY_HOURS = range(5, 9)
+NIGHT_HOURS = (21, 22, 23, 0)
+
+
+def expand_event(event: str, payload: dict) -> List[Tuple[str, int]]:
+    """Legacy (event_type, amount) pairs a domain event counts as."""
+    if event == SESSION_COMPLETED:
+        hour = payload.get("hour")
+        if hour is None:
+            hour = datetime.now().hour
+        expanded = [("session", 1)]
+        minutes = int(payload.get("minutes", 0))
+        if minutes > 0:
+            expanded.append(("focus_minutes", minutes))
+        if hour in EARLY_HOURS:
+            expanded.append(("early_session", 1))
+        elif hour in NIGHT_HOURS:
+            expanded.append(("night_session", 1))
+        return expanded
+    legacy = _SIMPLE_EVENTS.get(event)
+    if legacy is None:
+        return []
+    return [(legacy, int(payload.get("amount", 1)))]
+
+
+class EventBus:
+    """Synchronous publish/subscribe by event name."""
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Callable]] = {}
+
+    def subscribe(self, event: str, handler: Callable) -> Callable[[], None]:
+        """Call handler(**payload) on each publish of event. Returns an unsubscribe function."""
+        self._handlers.setdefault(event, []).append(handler)
+        return lambda: self.unsubscribe(event, handler)
+
+    def unsubscribe(self, event: str, handler: Callable) -> bool:
+        handlers = self._handlers.get(event, [])
+        if handler in handlers:
+            handlers.remove(handler)
+            return True
+        return False
+
+    def publish(self, event: str, **payload) -> int:
+        """Deliver an event to its subscribers. Returns how many were called."""
+        handlers = list(self._handlers.get(event, ()))
+        for handler in handlers:
+            try:
+                handler(**payload)
+            except Exception as e:
+                # One broken subscriber must not stop the others
+                logger.error(f"Error handling event {event}: {e}", exc_info=True)
+        return len(handlers)
+
+
+class ChallengeTracker:
+    """Applies events to the active challenges subscribed to them."""
+
+    def __init__(self, get_state: Callable[[], dict], bus: Optional[EventBus] = None,
+                 listener: Optional[Callable[[list], None]] = None,
+                 clock: Callable[[], datetime] = datetime.now):
+        self._get_state = get_state
+        self._clock = clock
+        self.listener = listener  # called with newly completed challenges after any progress
+        self._index: Dict[str, List[dict]] = {}
+        self._key: Optional[tuple] = None
+        self._unsubscribers: List[Callable[[], None]] = []
+        if bus is not None:
+            self.attach(bus)
+
+    def attach(self, bus: EventBus) -> None:
+        self.detach()
+        for event in DOMAIN_EVENTS:
+            self._unsubscribers.append(
+                bus.subscribe(event, lambda _event=event, **payload: self.handle(_event, **payload))
+            )
+
+    def detach(self) -> None:
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers.clear()
+
+    def invalidate(self) -> None:
+        """Rebuild the index on the next event."""
+        self._key = None
+
+    def handle(self, event: str, **payload) -> list:
+        """Apply a domain event. Returns the challenges it completed."""
+        completed = []
+        for event_type, amount in expand_event(event, payload):
+            completed.extend(self.apply(event_type, amount))
+        return completed
+
+    def apply(self, event_type: str, amount: int = 1) -> list:
+        """Incremental equivalent of gamification.update_challenge_progress()."""
+        from gamification import CHALLENGE_EVENT_REQUIREMENTS, apply_challenge_event
+
+        state = self._get_state()
+        if state is None:
+            return []
+        self._sync(state)
+        if event_type not in CHALLENGE_EVENT_REQUIREMENTS:
+            return []
+        completed = []
+        subscribers = self._index.get(event_type, ())
+        for challenge in subscribers:
+            if apply_challenge_event(state, challenge, event_type, amount):
+                completed.append(challenge)
+        if event_type != "login":
+            # The streak may have changed since the last event
+            completed.extend(challenge for challenge in self._index.get("login", ())
+                             if apply_challenge_event(state, challenge, "login"))
+        if (subscribers or completed) and self.listener is not None:
+            self.listener(completed)
+        return completed
+
+    def _sync(self, state: dict) -> None:
+        """Roll the challenge lists over if needed and rebuild the index for new lists."""
+        from gamification import ensure_active_challenges
+
+        ensure_active_challenges(state, self._clock())
+        key = (id(state), id(state["daily_challenges"]), id(state["weekly_challenges"]))
+        if key == self._key:
+            return
+        self._key = key
+        self._index = build_challenge_index(state["daily_challenges"] + state["weekly_challenges"])
+
+
+def build_challenge_index(challenges: List[dict]) -> Dict[str, List[dict]]:
+    """Map each legacy event type to the open challenges that count it."""
+    from gamification import CHALLENGE_EVENT_REQUIREMENTS, challenge_counts_event
+
+    index: Dict[str, List[dict]] = {}
+    for challenge in challenges:
+        if challenge.get("completed"):
+            continue
+        for event_type in CHALLENGE_EVENT_REQUIREMENTS:
+            if challenge_counts_event(challenge, event_type):
+                index.setdefault(event_type, []).append(challenge)
+    return index
@@ -0,0 +1,66 @@
+"""
+Level-of-detail helpers for the hand-painted charts.
+
+Charts paint in widget pixels, so a series with more points than the chart
+is wide only adds overdraw. minmax_downsample() keeps, for every column
+of two pixels, the lowest and highest point in their original order (plus
+the first and last point), so spikes and dips survive while the painted
+point count stays around the chart width. nearest_index() is the hover
+lookup over the same sorted x values.
+
+Everything here works on plain numbers so it can be tested without Qt.
+"""
+
+from bisect import bisect_left
+from typing import List, Sequence
+
+
+def minmax_downsample(xs: Sequence[float], ys: Sequence[float], max_points: int) -> List[int]:
+    """
+    Indices of the points to draw when a sorted series has more than max_points points.
+
+    The x range is split into max_points // 2 columns and each column keeps
+    its lowest and highest point, so at most max_points + 2 indices are
+    returned. A series that already fits is returned whole.
+    """
+    n = len(xs)
+    buckets = max_points // 2
+    if n <= max_points or buckets < 1:
+        return list(range(n))
+    x0, x1 = xs[0], xs[-1]
+    span = x1 - x0
+    if span <= 0:
+        low = min(range(n), key=ys.__getitem__)
+        high = max(range(n), key=ys.__getitem__)
+        return sorted({0, low, high, n - 1})
+
+    keep = [0]
+    bucket = -1
+    low = high = -1
+    for i in range(1, n - 1):
+        b = min(buckets - 1, int((xs[i] - x0) * buckets / span))
+        if b != bucket:
+            if bucket >= 0:
+                keep.extend(sorted({low, high}))
+            bucket, low, high = b, i, i
+        else:
+            if ys[i] < ys[low]:
+                low = i
+            if ys[i] > ys[high]:
+                high = i
+    if bucket >= 0:
+        keep.extend(sorted({low, high}))
+    keep.append(n - 1)
+    return keep
+
+
+def nearest_index(xs: Sequence[float], x: float) -> int:
+    """Index of the value in sorted `xs` closest to x (-1 if xs is empty)."""
+    if not xs:
+        return -1
+    i = bisect_left(xs, x)
+    if i <= 0:
+        return 0
+    if i >= len(xs):
+        return len(xs) - 1
+    return i if xs[i] - x < x - xs[i - 1] else i - 1
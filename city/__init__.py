@@ -68,6 +68,8 @@ from .city_manager import (
     initiate_construction,
     collect_city_income,
     get_pending_income,
+    compute_focus_session_income,
+    record_focus_session_income,
     award_focus_session_income,
     award_exercise_income,
     get_max_building_slots,
@@ -83,6 +85,13 @@ from .city_manager import (
     start_upgrade,
 )
 
+# Cached effects engine
+from .city_effects import (
+    CityEffects,
+    get_city_effects,
+    invalidate_city_effects,
+)
+
 # Synergy system
 from .city_synergies import (
     BUILDING_SYNERGIES,
@@ -144,6 +153,8 @@ __all__ = [
     "initiate_construction",
     "collect_city_income",
     "get_pending_income",
+    "compute_focus_session_income",
+    "record_focus_session_income",
     "award_focus_session_income",
     "award_exercise_income",
     "get_max_building_slots",
@@ -158,6 +169,11 @@ __all__ = [
     "initiate_upgrade",
     "start_upgrade",
     
+    # Effects engine
+    "CityEffects",
+    "get_city_effects",
+    "invalidate_city_effects",
+    
     # Synergy system
     "BUILDING_SYNERGIES",
     "SynergyMapping",
@@ -0,0 +1,324 @@
+"""
+City Building System - Effects Engine
+=====================================
+Cached, lazily-evaluated view of what a city's completed buildings do.
+
+The grid is compiled once into a per-effect-type building table, and the
+entity-tag x building-synergy matches are precomputed per entity. Bonuses,
+synergy multipliers and income rates are then derived lazily from that
+table and cached until the city or the entitidex collection changes.
+
+Invalidation:
+    - city_manager mutations (place, remove, complete, upgrade) call
+      invalidate_city_effects() explicitly.
+    - Every lookup also compares a cheap structural stamp (building id,
+      status and level per cell plus the entitidex collection) so direct
+      writes from dev tools or older code can never serve stale bonuses.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from .city_buildings import CITY_BUILDINGS
+from .city_state import CellStatus
+from .city_synergies import BUILDING_SYNERGIES, get_entity_synergy_tags
+
+_logger = logging.getLogger(__name__)
+
+# Keys of the bonuses dict returned by get_city_bonuses()
+CITY_BONUS_KEYS = (
+    "coins_per_hour",
+    "focus_session_coins",
+    "exercise_coins",
+    "merge_success_bonus",
+    "scrap_chance_bonus",  # Bonus chance for scrap from merges (Forge)
+    "rarity_bias_bonus",
+    "entity_catch_bonus",
+    "entity_encounter_bonus",
+    "power_bonus",
+    "xp_bonus",
+    "coin_discount",
+)
+
+# Keys that entity synergies can multiply (Wonder's "all" boosts each of these)
+SYNERGY_BONUS_KEYS = (
+    "coins_per_hour",
+    "merge_success_bonus",
+    "rarity_bias_bonus",
+    "entity_catch_bonus",
+    "entity_encounter_bonus",
+    "power_bonus",
+    "xp_bonus",
+    "coin_discount",
+)
+
+# Simple percentage effects: effect type -> (bonus key, effect/scaling field)
+_PERCENT_EFFECTS = {
+    "merge_success_bonus": ("merge_success_bonus", "bonus_percent"),
+    "rarity_bias_bonus": ("rarity_bias_bonus", "bonus_percent"),
+    "entity_catch_bonus": ("entity_catch_bonus", "bonus_percent"),
+    "entity_encounter_bonus": ("entity_encounter_bonus", "bonus_percent"),
+    "power_bonus": ("power_bonus", "power_percent"),
+    "xp_bonus": ("xp_bonus", "bonus_percent"),
+    "coin_discount": ("coin_discount", "discount_percent"),
+}
+
+# Small LRU of compiled engines, keyed by id(adhd_buster).
+# Entries hold a reference to their adhd_buster so ids cannot be reused.
+_MAX_CACHED_CITIES = 4
+_engine_cache: Dict[int, "CityEffects"] = {}
+
+
+@lru_cache(maxsize=None)
+def get_entity_synergy_matches(entity_id: str) -> FrozenSet[str]:
+    """
+    Get the synergy building ids whose tags overlap this entity's tags.
+
+    Entity definitions are static, so this is computed once per entity.
+    """
+    tags = get_entity_synergy_tags(entity_id)
+    if not tags:
+        return frozenset()
+    return frozenset(
+        building_id for building_id, synergy in BUILDING_SYNERGIES.items()
+        if tags & synergy.entity_tags
+    )
+
+
+def _scaled(effect: dict, scaling: dict, key: str, level: int):
+    """Base effect value plus per-level scaling."""
+    return effect.get(key, 0) + (level - 1) * scaling.get(key, 0)
+
+
+def _collection_sets(adhd_buster: dict) -> Tuple[set, set]:
+    """Get (collected, exceptional) entity id sets, handling old and new formats."""
+    entitidex_data = adhd_buster.get("entitidex", {}) or {}
+    collected = entitidex_data.get("collected_entity_ids",
+                entitidex_data.get("collected", set()))
+    if not isinstance(collected, set):
+        collected = set(collected or ())
+    exceptional = entitidex_data.get("exceptional_entities", {})
+    if isinstance(exceptional, dict):
+        exceptional = set(exceptional.keys())
+    elif not isinstance(exceptional, set):
+        exceptional = set(exceptional or ())
+    return collected, exceptional
+
+
+def _compute_stamp(adhd_buster: dict) -> tuple:
+    """Cheap structural fingerprint of everything the effects depend on."""
+    grid = adhd_buster.get("city", {}).get("grid", []) or []
+    cells = tuple(
+        (cell.get("building_id"), cell.get("status"), cell.get("level", 1)) if cell else None
+        for row in grid for cell in row
+    )
+    entitidex_data = adhd_buster.get("entitidex", {}) or {}
+    collected = entitidex_data.get("collected_entity_ids", entitidex_data.get("collected", ()))
+    exceptional = entitidex_data.get("exceptional_entities", ())
+    return (
+        cells,
+        len(collected) if collected is not None else 0,
+        len(exceptional) if exceptional is not None else 0,
+    )
+
+
+class CityEffects:
+    """Compiled, lazily-evaluated effects of one player's city."""
+
+    def __init__(self, adhd_buster: dict):
+        self.adhd_buster = adhd_buster
+        self.entitidex_ref = adhd_buster.get("entitidex")
+        self.stamp = _compute_stamp(adhd_buster)
+
+        # Completed buildings in grid order: (building_id, level, building_def)
+        self.completed: List[Tuple[str, int, dict]] = []
+        # Per-effect-type table of completed buildings, in grid order
+        self.by_effect: Dict[str, List[Tuple[str, int, dict]]] = {}
+
+        grid = adhd_buster.get("city", {}).get("grid", []) or []
+        for row in grid:
+            for cell in row:
+                if cell is None or cell.get("status") != CellStatus.COMPLETE.value:
+                    continue
+                building_id = cell.get("building_id")
+                building_def = CITY_BUILDINGS.get(building_id)
+                if not building_def:
+                    continue
+                entry = (building_id, cell.get("level", 1), building_def)
+                self.completed.append(entry)
+                effect_type = building_def.get("effect", {}).get("type")
+                self.by_effect.setdefault(effect_type, []).append(entry)
+
+        self._base_bonuses: Optional[Dict[str, int]] = None
+        self._building_synergies: Optional[Dict[str, Dict]] = None
+        self._synergy_bonuses: Optional[Dict[str, float]] = None
+        self._bonuses: Optional[Dict[str, int]] = None
+        self._income_rates: Optional[List[Tuple[dict, float]]] = None
+
+    def is_current(self, adhd_buster: dict) -> bool:
+        return (
+            adhd_buster.get("entitidex") is self.entitidex_ref
+            and _compute_stamp(adhd_buster) == self.stamp
+        )
+
+    # === Building bonuses ===
+
+    @property
+    def base_bonuses(self) -> Dict[str, int]:
+        """Bonuses from completed buildings before entity synergies."""
+        if self._base_bonuses is None:
+            bonuses = dict.fromkeys(CITY_BONUS_KEYS, 0)
+            for effect_type, entries in self.by_effect.items():
+                for _building_id, level, building_def in entries:
+                    effect = building_def.get("effect", {})
+                    scaling = building_def.get("level_scaling", {})
+                    if effect_type == "passive_income":
+                        bonuses["coins_per_hour"] += _scaled(effect, scaling, "coins_per_hour", level)
+                    elif effect_type == "activity_triggered_income":
+                        # Calculate the base coins for display purposes
+                        if effect.get("trigger") == "exercise":
+                            bonuses["exercise_coins"] += _scaled(effect, scaling, "base_coins", level)
+                    elif effect_type == "focus_session_income":
+                        bonuses["focus_session_coins"] += _scaled(effect, scaling, "base_coins", level)
+                    elif effect_type in _PERCENT_EFFECTS:
+                        key, field = _PERCENT_EFFECTS[effect_type]
+                        bonuses[key] += _scaled(effect, scaling, field, level)
+                    elif effect_type == "multi":
+                        # Multi-effect buildings (Forge, Wonder) with level scaling
+                        for bonus_key, base_value in effect.get("bonuses", {}).items():
+                            if bonus_key in bonuses:
+                                bonuses[bonus_key] += base_value + (level - 1) * scaling.get(bonus_key, 0)
+            self._base_bonuses = bonuses
+        return self._base_bonuses
+
+    # === Entity synergies ===
+
+    @property
+    def building_synergies(self) -> Dict[str, Dict]:
+        """
+        Synergy result per synergy building id, for the current collection.
+
+        Same structure as calculate_building_synergy_bonus(). Computed in one
+        pass over the collection using the precomputed entity matches.
+        """
+        if self._building_synergies is None:
+            collected, exceptional = _collection_sets(self.adhd_buster)
+            totals: Dict[str, float] = {}
+            contributors: Dict[str, List[Dict]] = {}
+            for entity_id in collected:
+                matches = get_entity_synergy_matches(entity_id)
+                if not matches:
+                    continue
+                is_exceptional = entity_id in exceptional
+                for building_id in matches:
+                    synergy = BUILDING_SYNERGIES[building_id]
+                    bonus = synergy.exceptional_bonus if is_exceptional else synergy.normal_bonus
+                    totals[building_id] = totals.get(building_id, 0.0) + bonus
+                    contributors.setdefault(building_id, []).append({
+                        "entity_id": entity_id,
+                        "is_exceptional": is_exceptional,
+                        "bonus": bonus,
+                    })
+            results = {}
+            for building_id, synergy in BUILDING_SYNERGIES.items():
+                total = totals.get(building_id, 0.0)
+                results[building_id] = {
+                    "bonus_type": synergy.bonus_type,
+                    "bonus_percent": min(total, synergy.max_bonus),
+                    "contributors": contributors.get(building_id, []),
+                    "capped": total > synergy.max_bonus,
+                }
+            self._building_synergies = results
+        return self._building_synergies
+
+    @property
+    def synergy_bonuses(self) -> Dict[str, float]:
+        """Synergy multipliers from collected entities for completed buildings."""
+        if self._synergy_bonuses is None:
+            synergy_bonuses = dict.fromkeys(SYNERGY_BONUS_KEYS, 0.0)
+            building_synergies = self.building_synergies
+            for building_id, _level, _building_def in self.completed:
+                synergy = building_synergies.get(building_id)
+                if not synergy or synergy["bonus_percent"] <= 0:
+                    continue
+                if synergy["bonus_type"] == "all":
+                    # Wonder: boost all bonuses
+                    for key in synergy_bonuses:
+                        synergy_bonuses[key] += synergy["bonus_percent"]
+                elif synergy["bonus_type"] in synergy_bonuses:
+                    synergy_bonuses[synergy["bonus_type"]] += synergy["bonus_percent"]
+            self._synergy_bonuses = synergy_bonuses
+        return self._synergy_bonuses
+
+    @property
+    def bonuses(self) -> Dict[str, int]:
+        """Final bonuses: building bonuses with entity synergies applied."""
+        if self._bonuses is None:
+            bonuses = dict(self.base_bonuses)
+            try:
+                # synergy_value is 0.0-0.5 (representing 0%-50% bonus multiplier)
+                # bonuses[key] is the base percentage (e.g., 10 means 10%)
+                # Result: 10 * (1 + 0.25) = 12 -> 12% total bonus
+                for key, synergy_value in self.synergy_bonuses.items():
+                    if key in bonuses and synergy_value > 0:
+                        bonuses[key] = int(bonuses[key] * (1 + synergy_value))
+            except Exception as e:
+                _logger.debug(f"Error applying synergy bonuses: {e}")
+            self._bonuses = bonuses
+        return self._bonuses
+
+    # === Income ===
+
+    @property
+    def income_rates(self) -> List[Tuple[dict, float]]:
+        """(building_def, coins_per_hour) for completed buildings with passive income."""
+        if self._income_rates is None:
+            rates = []
+            for _building_id, level, building_def in self.completed:
+                effect = building_def.get("effect", {})
+                coins_rate = 0
+                if effect.get("type") == "passive_income":
+                    coins_rate = _scaled(effect, building_def.get("level_scaling", {}), "coins_per_hour", level)
+                elif effect.get("type") == "multi":
+                    # Wonder has coins_per_hour in bonuses
+                    coins_rate = effect.get("bonuses", {}).get("coins_per_hour", 0)
+                if coins_rate > 0:
+                    rates.append((building_def, coins_rate))
+            self._income_rates = rates
+        return self._income_rates
+
+    def buildings_with_effect(self, *effect_types: str) -> List[Tuple[str, int, dict]]:
+        """Completed buildings having any of the given effect types, in grid order."""
+        wanted = set(effect_types)
+        return [
+            entry for entry in self.completed
+            if entry[2].get("effect", {}).get("type") in wanted
+        ]
+
+
+def get_city_effects(adhd_buster: dict) -> CityEffects:
+    """Get the compiled city effects for adhd_buster, rebuilding only when stale."""
+    key = id(adhd_buster)
+    engine = _engine_cache.get(key)
+    if engine is not None and engine.adhd_buster is adhd_buster and engine.is_current(adhd_buster):
+        return engine
+    engine = CityEffects(adhd_buster)
+    _engine_cache.pop(key, None)
+    _engine_cache[key] = engine
+    while len(_engine_cache) > _MAX_CACHED_CITIES:
+        _engine_cache.pop(next(iter(_engine_cache)))
+    return engine
+
+
+def invalidate_city_effects(adhd_buster: Optional[dict] = None) -> None:
+    """
+    Drop cached city effects.
+
+    Called by city mutations and entitidex collection changes.
+    With no argument, clears the cache for every player.
+    """
+    if adhd_buster is None:
+        _engine_cache.clear()
+    else:
+        _engine_cache.pop(id(adhd_buster), None)
@@ -30,6 +30,7 @@ from .city_state import (
     create_cell_state,
 )
 from .city_buildings import CITY_BUILDINGS
+from .city_effects import get_city_effects, invalidate_city_effects
 
 _logger = logging.getLogger(__name__)
 
@@ -404,6 +405,7 @@ def _complete_construction(
     
     cell["status"] = CellStatus.COMPLETE.value
     cell["completed_at"] = datetime.now().isoformat()
+    invalidate_city_effects(adhd_buster)
     
     # Clear active construction
     city["active_construction"] = None
@@ -523,6 +525,7 @@ def place_building(
     
     # Place the building
     grid[row][col] = create_cell_state(building_id)
+    invalidate_city_effects(adhd_buster)
     
     _logger.info(f"Placed {building_id} at ({row}, {col})")
     return True
@@ -636,6 +639,7 @@ def place_and_start_building(
     
     # Place the building
     grid[row][col] = cell
+    invalidate_city_effects(adhd_buster)
     
     # Set as active construction
     city["active_construction"] = [row, col]
@@ -712,6 +716,7 @@ def remove_building(
     
     # Remove building
     grid[row][col] = None
+    invalidate_city_effects(adhd_buster)
     
     _logger.info(f"Removed {building_id} from ({row}, {col})")
     return building_id
@@ -741,6 +746,7 @@ def move_building(
     # Simple swap
     grid[from_row][from_col], grid[to_row][to_col] = \
         grid[to_row][to_col], grid[from_row][from_col]
+    invalidate_city_effects(adhd_buster)
     
     return True
 
@@ -962,6 +968,7 @@ def initiate_construction(
     
     # Transition to BUILDING status
     cell["status"] = CellStatus.BUILDING.value
+    invalidate_city_effects(adhd_buster)
     
     # Set as active construction
     city["active_construction"] = [row, col]  # List for JSON serialization
@@ -1157,6 +1164,7 @@ def initiate_upgrade(
     cell["status"] = CellStatus.BUILDING.value
     cell["construction_progress"] = progress
     cell["completed_at"] = None
+    invalidate_city_effects(adhd_buster)
     
     # Set as active construction
     city["active_construction"] = [row, col]
@@ -1234,40 +1242,16 @@ def collect_city_income(adhd_buster: dict, game_state=None) -> dict:
     total_coins = 0
     breakdown = []
     
-    # Scan grid for completed buildings with passive income
-    grid = city.get("grid", [])
-    for row in grid:
-        for cell in row:
-            if cell is None:
-                continue
-            if cell.get("status") != CellStatus.COMPLETE.value:
-                continue
-            
-            building_def = CITY_BUILDINGS.get(cell.get("building_id"), {})
-            effect = building_def.get("effect", {})
-            
-            # Calculate coins per hour for this building
-            coins_rate = 0
-            
-            if effect.get("type") == "passive_income":
-                level = cell.get("level", 1)
-                base_rate = effect.get("coins_per_hour", 0)
-                scaling = building_def.get("level_scaling", {}).get("coins_per_hour", 0)
-                coins_rate = base_rate + (level - 1) * scaling
-            
-            elif effect.get("type") == "multi":
-                # Wonder has coins_per_hour in bonuses
-                coins_rate = effect.get("bonuses", {}).get("coins_per_hour", 0)
-            
-            if coins_rate > 0:
-                amount = int(coins_rate * hours_elapsed)
-                if amount > 0:
-                    total_coins += amount
-                    breakdown.append({
-                        "building": building_def.get("name", "Unknown"),
-                        "rate": coins_rate,
-                        "coins": amount,
-                    })
+    # Completed buildings with passive income (compiled, cached)
+    for building_def, coins_rate in get_city_effects(adhd_buster).income_rates:
+        amount = int(coins_rate * hours_elapsed)
+        if amount > 0:
+            total_coins += amount
+            breakdown.append({
+                "building": building_def.get("name", "Unknown"),
+                "rate": coins_rate,
+                "coins": amount,
+            })
     
     # Update collection time
     city["last_collection_time"] = now.isoformat()
@@ -1297,95 +1281,62 @@ def collect_city_income(adhd_buster: dict, game_state=None) -> dict:
 QUALIFYING_INTENSITIES = {"moderate", "vigorous", "intense"}
 
 
-def award_focus_session_income(
-    adhd_buster: dict,
-    session_minutes: int,
-    game_state=None
-) -> dict:
+def compute_focus_session_income(adhd_buster: dict, session_minutes: int) -> dict:
     """
-    Award income from Royal Mint and Wonder when a focus session is completed.
+    Income Royal Mint and Wonder would pay for a focus session, without awarding it.
     
     Args:
-        adhd_buster: Player data
+        adhd_buster: Player data (read only)
         session_minutes: Duration of the completed focus session in minutes
-        game_state: Optional game state for signal emission
     
     Returns:
         {
             "coins": int,
-            "breakdown": [{building, base_coins, time_bonus, total_coins}],
+            "breakdown": [{building, building_id, base_coins, time_bonus, total_coins}],
         }
     """
-    city = get_city_data(adhd_buster)
-    grid = city.get("grid", [])
-    
     total_coins = 0
     breakdown = []
     
-    # Scan grid for completed buildings that trigger on focus sessions
-    for row in grid:
-        for cell in row:
-            if cell is None:
-                continue
-            if cell.get("status") != CellStatus.COMPLETE.value:
-                continue
+    # Completed buildings that trigger on focus sessions
+    for building_id, level, building_def in get_city_effects(adhd_buster).buildings_with_effect(
+            "focus_session_income", "multi"):
+        effect = building_def.get("effect", {})
+        scaling = building_def.get("level_scaling", {})
+        
+        coins_earned = 0
+        base_coins = 0
+        time_bonus = 0
+        
+        # Royal Mint: focus_session_income type
+        if effect.get("type") == "focus_session_income":
             
-            building_id = cell.get("building_id")
-            building_def = CITY_BUILDINGS.get(building_id, {})
-            effect = building_def.get("effect", {})
-            level = cell.get("level", 1)
-            scaling = building_def.get("level_scaling", {})
+            base_coins = effect.get("base_coins", 0)
+            base_coins += (level - 1) * scaling.get("base_coins", 0)
             
-            coins_earned = 0
-            base_coins = 0
-            time_bonus = 0
+            coins_per_30min = effect.get("coins_per_30min", 0)
+            coins_per_30min += (level - 1) * scaling.get("coins_per_30min", 0)
             
-            # Royal Mint: focus_session_income type
-            if effect.get("type") == "focus_session_income":
-                
-                base_coins = effect.get("base_coins", 0)
-                base_coins += (level - 1) * scaling.get("base_coins", 0)
-                
-                coins_per_30min = effect.get("coins_per_30min", 0)
-                coins_per_30min += (level - 1) * scaling.get("coins_per_30min", 0)
-                
-                time_bonus = int((session_minutes / 30) * coins_per_30min)
-                coins_earned = base_coins + time_bonus
-                
-            # Wonder: multi effect with focus_session_coins bonus
-            elif effect.get("type") == "multi":
-                bonus_coins = effect.get("bonuses", {}).get("focus_session_coins", 0)
-                if bonus_coins > 0:
-                    base_coins = bonus_coins
-                    time_bonus = int((session_minutes / 30) * (bonus_coins // 2))
-                    coins_earned = base_coins + time_bonus
+            time_bonus = int((session_minutes / 30) * coins_per_30min)
+            coins_earned = base_coins + time_bonus
             
-            if coins_earned > 0:
-                total_coins += coins_earned
-                breakdown.append({
-                    "building": building_def.get("name", "Unknown"),
-                    "building_id": building_id,
-                    "base_coins": base_coins,
-                    "time_bonus": time_bonus,
-                    "total_coins": coins_earned,
-                })
-    
-    # Award coins to player
-    if total_coins > 0:
-        adhd_buster["coins"] = adhd_buster.get("coins", 0) + total_coins
-        
-        # Track in city stats
-        city["total_coins_generated"] = city.get("total_coins_generated", 0) + total_coins
-        city["focus_sessions_rewarded"] = city.get("focus_sessions_rewarded", 0) + 1
+        # Wonder: multi effect with focus_session_coins bonus
+        elif effect.get("type") == "multi":
+            bonus_coins = effect.get("bonuses", {}).get("focus_session_coins", 0)
+            if bonus_coins > 0:
+                base_coins = bonus_coins
+                time_bonus = int((session_minutes / 30) * (bonus_coins // 2))
+                coins_earned = base_coins + time_bonus
         
-        if game_state and hasattr(game_state, 'city_income_collected'):
-            try:
-                game_state._emit(
-                    game_state.city_income_collected,
-                    {"coins": total_coins, "source": "focus_session"}
-                )
-            except Exception:
-                pass
+        if coins_earned > 0:
+            total_coins += coins_earned
+            breakdown.append({
+                "building": building_def.get("name", "Unknown"),
+                "building_id": building_id,
+                "base_coins": base_coins,
+                "time_bonus": time_bonus,
+                "total_coins": coins_earned,
+            })
     
     return {
         "coins": total_coins,
@@ -1393,6 +1344,59 @@ def award_focus_session_income(
     }
 
 
+def record_focus_session_income(adhd_buster: dict, income: dict, game_state=None) -> None:
+    """
+    Track focus session income in the city stats and notify game_state.
+    
+    Does not add the coins themselves - award_focus_session_income() and
+    session_rewards.apply_ledger() credit them.
+    """
+    total_coins = income.get("coins", 0)
+    if total_coins <= 0:
+        return
+    city = get_city_data(adhd_buster)
+    city["total_coins_generated"] = city.get("total_coins_generated", 0) + total_coins
+    city["focus_sessions_rewarded"] = city.get("focus_sessions_rewarded", 0) + 1
+    
+    if game_state and hasattr(game_state, 'city_income_collected'):
+        try:
+            game_state._emit(
+                game_state.city_income_collected,
+                {"coins": total_coins, "source": "focus_session"}
+            )
+        except Exception:
+            pass
+
+
+def award_focus_session_income(
+    adhd_buster: dict,
+    session_minutes: int,
+    game_state=None
+) -> dict:
+    """
+    Award income from Royal Mint and Wonder when a focus session is completed.
+    
+    Args:
+        adhd_buster: Player data
+        session_minutes: Duration of the completed focus session in minutes
+        game_state: Optional game state for signal emission
+    
+    Returns:
+        {
+            "coins": int,
+            "breakdown": [{building, base_coins, time_bonus, total_coins}],
+        }
+    """
+    income = compute_focus_session_income(adhd_buster, session_minutes)
+    
+    # Award coins to player
+    if income["coins"] > 0:
+        adhd_buster["coins"] = adhd_buster.get("coins", 0) + income["coins"]
+        record_focus_session_income(adhd_buster, income, game_state)
+    
+    return income
+
+
 def award_exercise_income(
     adhd_buster: dict,
     duration_minutes: int,
@@ -1428,7 +1432,6 @@ def award_exercise_income(
         }
     
     city = get_city_data(adhd_buster)
-    grid = city.get("grid", [])
     
     # Use effective minutes if provided, otherwise use raw duration
     eff_mins = effective_minutes if effective_minutes is not None else duration_minutes
@@ -1436,58 +1439,50 @@ def award_exercise_income(
     total_coins = 0
     breakdown = []
     
-    # Scan grid for completed buildings that trigger on exercise
-    for row in grid:
-        for cell in row:
-            if cell is None:
-                continue
-            if cell.get("status") != CellStatus.COMPLETE.value:
-                continue
+    # Completed buildings that trigger on exercise
+    for building_id, level, building_def in get_city_effects(adhd_buster).buildings_with_effect(
+            "activity_triggered_income", "multi"):
+        effect = building_def.get("effect", {})
+        scaling = building_def.get("level_scaling", {})
+        
+        coins_earned = 0
+        base_coins = 0
+        effective_bonus = 0
+        
+        # Goldmine: activity_triggered_income with trigger=exercise
+        if (effect.get("type") == "activity_triggered_income" and 
+            effect.get("trigger") == "exercise"):
             
-            building_id = cell.get("building_id")
-            building_def = CITY_BUILDINGS.get(building_id, {})
-            effect = building_def.get("effect", {})
-            level = cell.get("level", 1)
-            scaling = building_def.get("level_scaling", {})
+            # Check minimum intensity requirement
+            min_intensity = effect.get("min_intensity", "moderate")
+            # All qualifying intensities meet moderate requirement
             
-            coins_earned = 0
-            base_coins = 0
-            effective_bonus = 0
+            base_coins = effect.get("base_coins", 0)
+            base_coins += (level - 1) * scaling.get("base_coins", 0)
             
-            # Goldmine: activity_triggered_income with trigger=exercise
-            if (effect.get("type") == "activity_triggered_income" and 
-                effect.get("trigger") == "exercise"):
-                
-                # Check minimum intensity requirement
-                min_intensity = effect.get("min_intensity", "moderate")
-                # All qualifying intensities meet moderate requirement
-                
-                base_coins = effect.get("base_coins", 0)
-                base_coins += (level - 1) * scaling.get("base_coins", 0)
-                
-                coins_per_30min = effect.get("coins_per_effective_30min", 0)
-                coins_per_30min += (level - 1) * scaling.get("coins_per_effective_30min", 0)
-                
-                effective_bonus = int((eff_mins / 30) * coins_per_30min)
-                coins_earned = base_coins + effective_bonus
-                
-            # Wonder: multi effect with exercise_coins bonus
-            elif effect.get("type") == "multi":
-                bonus_coins = effect.get("bonuses", {}).get("exercise_coins", 0)
-                if bonus_coins > 0:
-                    base_coins = bonus_coins
-                    effective_bonus = int((eff_mins / 30) * (bonus_coins // 2))
-                    coins_earned = base_coins + effective_bonus
+            coins_per_30min = effect.get("coins_per_effective_30min", 0)
+            coins_per_30min += (level - 1) * scaling.get("coins_per_effective_30min", 0)
+            
+            effective_bonus = int((eff_mins / 30) * coins_per_30min)
+            coins_earned = base_coins + effective_bonus
             
-            if coins_earned > 0:
-                total_coins += coins_earned
-                breakdown.append({
-                    "building": building_def.get("name", "Unknown"),
-                    "building_id": building_id,
-                    "base_coins": base_coins,
-                    "effective_bonus": effective_bonus,
-                    "total_coins": coins_earned,
-                })
+        # Wonder: multi effect with exercise_coins bonus
+        elif effect.get("type") == "multi":
+            bonus_coins = effect.get("bonuses", {}).get("exercise_coins", 0)
+            if bonus_coins > 0:
+                base_coins = bonus_coins
+                effective_bonus = int((eff_mins / 30) * (bonus_coins // 2))
+                coins_earned = base_coins + effective_bonus
+        
+        if coins_earned > 0:
+            total_coins += coins_earned
+            breakdown.append({
+                "building": building_def.get("name", "Unknown"),
+                "building_id": building_id,
+                "base_coins": base_coins,
+                "effective_bonus": effective_bonus,
+                "total_coins": coins_earned,
+            })
     
     # Award coins to player
     if total_coins > 0:
@@ -1537,29 +1532,8 @@ def get_pending_income(adhd_buster: dict) -> dict:
     hours_elapsed = min(hours_elapsed, MAX_OFFLINE_HOURS)
     
     total_coins = 0
-    
-    grid = city.get("grid", [])
-    for row in grid:
-        for cell in row:
-            if cell is None:
-                continue
-            if cell.get("status") != CellStatus.COMPLETE.value:
-                continue
-            
-            building_def = CITY_BUILDINGS.get(cell.get("building_id"), {})
-            effect = building_def.get("effect", {})
-            
-            coins_rate = 0
-            if effect.get("type") == "passive_income":
-                level = cell.get("level", 1)
-                base_rate = effect.get("coins_per_hour", 0)
-                scaling = building_def.get("level_scaling", {}).get("coins_per_hour", 0)
-                coins_rate = base_rate + (level - 1) * scaling
-            elif effect.get("type") == "multi":
-                coins_rate = effect.get("bonuses", {}).get("coins_per_hour", 0)
-            
-            if coins_rate > 0:
-                total_coins += int(coins_rate * hours_elapsed)
+    for _building_def, coins_rate in get_city_effects(adhd_buster).income_rates:
+        total_coins += int(coins_rate * hours_elapsed)
     
     return {
         "coins": total_coins,
@@ -1591,118 +1565,7 @@ def get_city_bonuses(adhd_buster: dict) -> dict:
             "coin_discount": int,
         }
     """
-    bonuses = {
-        "coins_per_hour": 0,
-        "focus_session_coins": 0,
-        "exercise_coins": 0,
-        "merge_success_bonus": 0,
-        "scrap_chance_bonus": 0,  # Bonus chance for scrap from merges (Forge)
-        "rarity_bias_bonus": 0,
-        "entity_catch_bonus": 0,
-        "entity_encounter_bonus": 0,
-        "power_bonus": 0,
-        "xp_bonus": 0,
-        "coin_discount": 0,
-    }
-    
-    city = get_city_data(adhd_buster)
-    grid = city.get("grid", [])
-    
-    # Scan grid for completed buildings
-    for row in grid:
-        for cell in row:
-            if cell is None:
-                continue
-            if cell.get("status") != CellStatus.COMPLETE.value:
-                continue
-            
-            building_id = cell.get("building_id")
-            building_def = CITY_BUILDINGS.get(building_id)
-            if not building_def:
-                continue
-            
-            level = cell.get("level", 1)
-            effect = building_def.get("effect", {})
-            scaling = building_def.get("level_scaling", {})
-            
-            effect_type = effect.get("type")
-            
-            if effect_type == "passive_income":
-                base = effect.get("coins_per_hour", 0)
-                per_level = scaling.get("coins_per_hour", 0)
-                bonuses["coins_per_hour"] += base + (level - 1) * per_level
-            
-            elif effect_type == "activity_triggered_income":
-                # Calculate the base coins for display purposes
-                trigger = effect.get("trigger")
-                if trigger == "exercise":
-                    base = effect.get("base_coins", 0)
-                    per_level = scaling.get("base_coins", 0)
-                    bonuses["exercise_coins"] += base + (level - 1) * per_level
-                    
-            elif effect_type == "focus_session_income":
-                # Focus session triggered income (Royal Mint)
-                base = effect.get("base_coins", 0)
-                per_level = scaling.get("base_coins", 0)
-                bonuses["focus_session_coins"] += base + (level - 1) * per_level
-                
-            elif effect_type == "merge_success_bonus":
-                base = effect.get("bonus_percent", 0)
-                per_level = scaling.get("bonus_percent", 0)
-                bonuses["merge_success_bonus"] += base + (level - 1) * per_level
-                
-            elif effect_type == "rarity_bias_bonus":
-                base = effect.get("bonus_percent", 0)
-                per_level = scaling.get("bonus_percent", 0)
-                bonuses["rarity_bias_bonus"] += base + (level - 1) * per_level
-                
-            elif effect_type == "entity_catch_bonus":
-                base = effect.get("bonus_percent", 0)
-                per_level = scaling.get("bonus_percent", 0)
-                bonuses["entity_catch_bonus"] += base + (level - 1) * per_level
-                
-            elif effect_type == "entity_encounter_bonus":
-                base = effect.get("bonus_percent", 0)
-                per_level = scaling.get("bonus_percent", 0)
-                bonuses["entity_encounter_bonus"] += base + (level - 1) * per_level
-                
-            elif effect_type == "power_bonus":
-                base = effect.get("power_percent", 0)
-                per_level = scaling.get("power_percent", 0)
-                bonuses["power_bonus"] += base + (level - 1) * per_level
-                
-            elif effect_type == "xp_bonus":
-                base = effect.get("bonus_percent", 0)
-                per_level = scaling.get("bonus_percent", 0)
-                bonuses["xp_bonus"] += base + (level - 1) * per_level
-                
-            elif effect_type == "coin_discount":
-                base = effect.get("discount_percent", 0)
-                per_level = scaling.get("discount_percent", 0)
-                bonuses["coin_discount"] += base + (level - 1) * per_level
-            
-            elif effect_type == "multi":
-                # Multi-effect buildings (Forge, Wonder) - adds multiple bonuses with level scaling
-                for bonus_key, base_value in effect.get("bonuses", {}).items():
-                    if bonus_key in bonuses:
-                        per_level = scaling.get(bonus_key, 0)
-                        bonuses[bonus_key] += base_value + (level - 1) * per_level
-    
-    # Apply entity synergy bonuses on top of building bonuses
-    try:
-        from .city_synergies import get_all_synergy_bonuses
-        synergy_bonuses = get_all_synergy_bonuses(adhd_buster)
-        
-        # synergy_value is 0.0-0.5 (representing 0%-50% bonus multiplier)
-        # bonuses[key] is the base percentage (e.g., 10 means 10%)
-        # Result: 10 * (1 + 0.25) = 12 → 12% total bonus
-        for key, synergy_value in synergy_bonuses.items():
-            if key in bonuses and synergy_value > 0:
-                bonuses[key] = int(bonuses[key] * (1 + synergy_value))
-    except ImportError:
-        # Synergy module not yet created
-        pass
-    except Exception as e:
-        _logger.debug(f"Error applying synergy bonuses: {e}")
-    
-    return bonuses
+    # Compiled per-effect-type building table with cached synergy vector;
+    # rebuilt only when buildings or the entitidex collection change.
+    get_city_data(adhd_buster)
+    return dict(get_city_effects(adhd_buster).bonuses)
@@ -11,8 +11,6 @@ import logging
 from typing import Dict, Set, List, Optional
 from dataclasses import dataclass
 
-from .city_state import CellStatus
-
 _logger = logging.getLogger(__name__)
 
 
@@ -221,51 +219,11 @@ def calculate_building_synergy_bonus(
             "capped": False,
         }
     
-    entitidex_data = adhd_buster.get("entitidex", {})
-    
-    # Get collected entities - handle both old and new data formats
-    collected = entitidex_data.get("collected_entity_ids", 
-                entitidex_data.get("collected", set()))
-    
-    # Convert to set if it's a list
-    if isinstance(collected, list):
-        collected = set(collected)
-    
-    # Get exceptional entities
-    exceptional = entitidex_data.get("exceptional_entities", {})
-    if isinstance(exceptional, list):
-        exceptional = set(exceptional)
-    elif isinstance(exceptional, dict):
-        exceptional = set(exceptional.keys())
-    
-    total_bonus = 0.0
-    contributors = []
-    
-    for entity_id in collected:
-        entity_tags = get_entity_synergy_tags(entity_id)
-        
-        # Check for tag overlap
-        if entity_tags & synergy.entity_tags:
-            is_exceptional = entity_id in exceptional
-            bonus = synergy.exceptional_bonus if is_exceptional else synergy.normal_bonus
-            total_bonus += bonus
-            
-            contributors.append({
-                "entity_id": entity_id,
-                "is_exceptional": is_exceptional,
-                "bonus": bonus,
-            })
-    
-    # Apply cap
-    capped = total_bonus > synergy.max_bonus
-    capped_bonus = min(total_bonus, synergy.max_bonus)
-    
-    return {
-        "bonus_type": synergy.bonus_type,
-        "bonus_percent": capped_bonus,
-        "contributors": contributors,
-        "capped": capped,
-    }
+    # Entity matches are precomputed and the per-building results cached
+    # by the city effects engine until the collection changes.
+    from .city_effects import get_city_effects
+    result = get_city_effects(adhd_buster).building_synergies[building_id]
+    return {**result, "contributors": list(result["contributors"])}
 
 
 def get_all_synergy_bonuses(adhd_buster: dict) -> Dict[str, float]:
@@ -276,45 +234,8 @@ def get_all_synergy_bonuses(adhd_buster: dict) -> Dict[str, float]:
     
     Returns dict matching get_city_bonuses() structure, to be multiplied on top.
     """
-    synergy_bonuses = {
-        "coins_per_hour": 0.0,
-        "merge_success_bonus": 0.0,
-        "rarity_bias_bonus": 0.0,
-        "entity_catch_bonus": 0.0,
-        "entity_encounter_bonus": 0.0,
-        "power_bonus": 0.0,
-        "xp_bonus": 0.0,
-        "coin_discount": 0.0,
-    }
-    
-    city_data = adhd_buster.get("city", {})
-    grid = city_data.get("grid", [])
-    
-    if not grid:
-        return synergy_bonuses
-    
-    # Only completed buildings get synergy bonuses
-    for row in grid:
-        for cell in row:
-            if cell is None:
-                continue
-            if cell.get("status") != CellStatus.COMPLETE.value:
-                continue
-            
-            building_id = cell.get("building_id")
-            synergy = calculate_building_synergy_bonus(building_id, adhd_buster)
-            
-            if synergy["bonus_percent"] <= 0:
-                continue
-            
-            if synergy["bonus_type"] == "all":
-                # Wonder: boost all bonuses
-                for key in synergy_bonuses:
-                    synergy_bonuses[key] += synergy["bonus_percent"]
-            elif synergy["bonus_type"] in synergy_bonuses:
-                synergy_bonuses[synergy["bonus_type"]] += synergy["bonus_percent"]
-    
-    return synergy_bonuses
+    from .city_effects import get_city_effects
+    return dict(get_city_effects(adhd_buster).synergy_bonuses)
 
 
 def get_synergy_display_info(building_id: str, adhd_buster: dict) -> dict:
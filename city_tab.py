@@ -10,6 +10,7 @@ Features:
 - Synergy bonus visualization
 """
 
+import json
 import logging
 import time
 from datetime import datetime
@@ -276,6 +277,51 @@ def _get_construction_composite_pixmap(building_id: str, size: int = 128, level:
 # SVG content cache for animated widgets (avoids redundant file I/O)
 _svg_content_cache: Dict[str, str] = {}
 
+# Page hosting a CityCell's animated SVG. The body is swapped in place when the
+# cell's building changes, so the styles cover both the single SVG and the
+# building + construction overlay layouts.
+# Use dark background to match theme (not transparent)
+_CELL_PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8"/>
+<style>
+    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+    html, body {{ 
+        width: 128px; 
+        height: 128px; 
+        overflow: hidden;
+        background: #2A2A2A;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        position: relative;
+    }}
+    svg {{
+        width: 128px;
+        height: 128px;
+        display: block;
+    }}
+    .svg-layer {{
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 128px;
+        height: 128px;
+    }}
+    .building-layer {{
+        z-index: 1;
+    }}
+    .construction-layer {{
+        z-index: 2;
+    }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>'''
+
 
 class AnimatedBuildingWidget(QtWidgets.QWidget):
     """
@@ -515,7 +561,12 @@ class CityCell(QtWidgets.QFrame):
         self._web_view = None  # Direct QWebEngineView for animated buildings
         self._current_svg_path = None  # Track which SVG is loaded
         self._pending_svg_path = None  # SVG to load when visible
+        self._page_body = None  # Body markup of the loaded page
+        self._page_base_dir = None  # Directory relative SVG references resolve against
+        self._page_ready = False  # True once the web view finished loading a page
         self._has_synergy = False  # Track if building has active synergy
+        self._fingerprint = None  # Everything the cell displays, see _state_fingerprint
+        self.render_count = 0  # Number of updates that changed the display
         
         # Fixed size like entitidex EntityCard (128 SVG + padding)
         self.setFixedSize(140, 140)
@@ -738,7 +789,39 @@ class CityCell(QtWidgets.QFrame):
                 }
             """)
     
-    def set_cell_state(self, cell_state: Optional[Dict], building_def: Optional[Dict] = None, adhd_buster: Optional[Dict] = None, locked: bool = False):
+    @staticmethod
+    def _state_fingerprint(cell_state: Optional[Dict], building_def: Optional[Dict],
+                           adhd_buster: Optional[Dict], locked: bool) -> tuple:
+        """Compact summary of everything the cell displays.
+        
+        (locked, building id, level, status, construction percent, synergy percent).
+        Two states with the same fingerprint look identical, so the widgets
+        only need touching when it changes.
+        """
+        if locked:
+            return (True, None, 1, None, None, 0)
+        if cell_state is None:
+            return (False, None, 1, None, None, 0)
+        
+        building_id = cell_state.get("building_id")
+        status = cell_state.get("status")
+        level = cell_state.get("level", 1)
+        
+        percent = None
+        if status == CellStatus.BUILDING.value and building_def and CITY_AVAILABLE:
+            reqs = get_level_requirements(building_def, level)
+            total_needed = sum(reqs.values())
+            total_invested = sum(cell_state.get("construction_progress", {}).values())
+            percent = int((total_invested / max(total_needed, 1)) * 100)
+        
+        synergy_percent = 0
+        if building_id and status == CellStatus.COMPLETE.value and CITY_AVAILABLE:
+            synergy_result = calculate_building_synergy_bonus(building_id, adhd_buster or {})
+            synergy_percent = round(synergy_result.get("bonus_percent", 0) * 100)
+        
+        return (False, building_id, level, status, percent, synergy_percent)
+    
+    def set_cell_state(self, cell_state: Optional[Dict], building_def: Optional[Dict] = None, adhd_buster: Optional[Dict] = None, locked: bool = False) -> bool:
         """Update cell to reflect current state.
         
         Args:
@@ -746,27 +829,28 @@ class CityCell(QtWidgets.QFrame):
             building_def: Building definition from CITY_BUILDINGS
             adhd_buster: Player data for synergy calculations
             locked: True if slot is locked (requires higher level)
-        """
-        # Check if the essential state has changed (building_id, status, level)
-        # to avoid recreating expensive WebEngine widgets on every refresh
-        old_building_id = self._cell_state.get("building_id") if self._cell_state else None
-        old_status = self._cell_state.get("status") if self._cell_state else None
-        old_level = self._cell_state.get("level", 1) if self._cell_state else 1
-        old_locked = getattr(self, '_is_locked', None)
-        
-        new_building_id = cell_state.get("building_id") if cell_state else None
-        new_status = cell_state.get("status") if cell_state else None
-        new_level = cell_state.get("level", 1) if cell_state else 1
         
-        # Track if we need to recreate the display (including level changes for upgraded buildings)
-        state_changed = (old_building_id != new_building_id or old_status != new_status or 
-                         old_level != new_level or old_locked != locked)
+        Returns:
+            True if the display changed, False if the update was skipped
+            because nothing the cell shows is different.
+        """
+        fingerprint = self._state_fingerprint(cell_state, building_def, adhd_buster, locked)
         
         self._cell_state = cell_state
         self._building_def = building_def
         self._adhd_buster = adhd_buster  # Store for synergy calculation
         self._is_locked = locked  # Track locked state
         
+        old_fingerprint = self._fingerprint
+        if fingerprint == old_fingerprint:
+            return False
+        self._fingerprint = fingerprint
+        self.render_count += 1
+        
+        # Rebuild the icon only when building, level, status or lock changed -
+        # progress and synergy changes just update the bar and badges
+        state_changed = old_fingerprint is None or old_fingerprint[:4] != fingerprint[:4]
+        
         # Default: show static label, hide webview
         if state_changed:
             self.icon_label.show()
@@ -779,12 +863,12 @@ class CityCell(QtWidgets.QFrame):
         if locked:
             if state_changed:
                 self._apply_locked_style()
-            return
+            return True
         
         if cell_state is None:
             if state_changed:
                 self._apply_empty_style()
-            return
+            return True
         
         status = cell_state.get("status", "")
         building_id = cell_state.get("building_id", "")
@@ -855,17 +939,12 @@ class CityCell(QtWidgets.QFrame):
         else:
             self.level_badge.hide()
         
-        # Check for synergy bonus and show indicator
-        self._has_synergy = False
-        if building_id and status == CellStatus.COMPLETE.value and CITY_AVAILABLE:
-            synergy_result = calculate_building_synergy_bonus(building_id, self._adhd_buster or {})
-            if synergy_result.get("bonus_percent", 0) > 0:
-                self._has_synergy = True
-                bonus_pct = synergy_result["bonus_percent"] * 100
-                self.synergy_badge.setToolTip(f"Entity Synergy: +{bonus_pct:.0f}%")
-                self.synergy_badge.show()
-            else:
-                self.synergy_badge.hide()
+        # Show synergy indicator when the building has an entity synergy bonus
+        synergy_percent = fingerprint[5]
+        self._has_synergy = synergy_percent > 0
+        if self._has_synergy:
+            self.synergy_badge.setToolTip(f"Entity Synergy: +{synergy_percent:.0f}%")
+            self.synergy_badge.show()
         else:
             self.synergy_badge.hide()
         
@@ -875,13 +954,9 @@ class CityCell(QtWidgets.QFrame):
         # Show progress bar for under-construction buildings
         if status == CellStatus.BUILDING.value:
             self.progress_bar.show()
-            progress = cell_state.get("construction_progress", {})
-            # Calculate completion percentage
-            if building_def and CITY_AVAILABLE:
-                reqs = get_level_requirements(building_def, level)
-                total_needed = sum(reqs.values())
-                total_invested = sum(progress.values())
-                percent = int((total_invested / max(total_needed, 1)) * 100)
+            # Completion percentage, computed with the fingerprint
+            percent = fingerprint[4]
+            if percent is not None:
                 self.progress_bar.setValue(percent)
                 self.progress_bar.setStyleSheet("""
                     QProgressBar {
@@ -912,6 +987,7 @@ class CityCell(QtWidgets.QFrame):
         
         # Update tooltip
         self.setToolTip(self.get_tooltip_text())
+        return True
     
     def _set_emoji_icon(self, building_def: Optional[Dict]):
         """Set emoji fallback icon when SVG not available."""
@@ -924,6 +1000,62 @@ class CityCell(QtWidgets.QFrame):
             self.icon_label.setText("🏛️")
             self.icon_label.setStyleSheet("font-size: 48px; background: transparent;")
     
+    def _ensure_web_view(self):
+        """Create the cell's QWebEngineView on first use; it is kept for the cell's lifetime."""
+        if self._web_view:
+            return
+        self._web_view = QWebEngineView()  # No parent - will be added to layout
+        self._web_view.setFixedSize(128, 128)
+        
+        # DON'T set transparent background - it breaks animations
+        # Just use dark background to match theme
+        # self._web_view.page().setBackgroundColor(QtCore.Qt.transparent)
+        # self._web_view.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        
+        # Allow mouse clicks to pass through to parent CityCell
+        self._web_view.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
+        
+        # Disable scrollbars
+        settings = self._web_view.settings()
+        settings.setAttribute(QWebEngineSettings.ShowScrollBars, False)
+        settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
+        
+        self._web_view.loadFinished.connect(self._on_page_loaded)
+        
+        # Add to layout at same position as icon_label
+        self.layout().insertWidget(0, self._web_view, 0, QtCore.Qt.AlignCenter)
+    
+    def _on_page_loaded(self, ok: bool):
+        self._page_ready = ok
+    
+    def _set_page_body(self, body: str, base_dir: str):
+        """Show body markup in the web view.
+        
+        Once a page has loaded, later content is swapped into the live
+        document instead of reloading the page, as long as relative
+        references still resolve against the same directory (with file://
+        base URL, required for SMIL).
+        """
+        self._ensure_web_view()
+        self._web_view.show()
+        self._page_body = body
+        if self._page_ready and base_dir == self._page_base_dir:
+            self._web_view.page().runJavaScript(f"document.body.innerHTML = {json.dumps(body)};")
+            return
+        self._page_base_dir = base_dir
+        self._load_page()
+    
+    def _load_page(self):
+        """(Re)load the full page around the current body."""
+        self._page_ready = False
+        base_url = QtCore.QUrl.fromLocalFile(self._page_base_dir + '/')
+        self._web_view.setHtml(_CELL_PAGE_TEMPLATE.format(body=self._page_body), base_url)
+    
+    def reload_svg(self):
+        """Reload the page showing the current SVG (restarts its animations)."""
+        if self._web_view and self._page_body is not None:
+            self._load_page()
+    
     def _show_animated_svg(self, svg_path: str):
         """Show animated SVG using direct QWebEngineView.
         
@@ -937,64 +1069,8 @@ class CityCell(QtWidgets.QFrame):
             return
         
         self._current_svg_path = svg_path
-        
-        # Create WebEngineView if it doesn't exist
-        if not self._web_view:
-            self._web_view = QWebEngineView()  # No parent - will be added to layout
-            self._web_view.setFixedSize(128, 128)
-            
-            # DON'T set transparent background - it breaks animations
-            # Just use dark background to match theme
-            # self._web_view.page().setBackgroundColor(QtCore.Qt.transparent)
-            # self._web_view.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-            
-            # Allow mouse clicks to pass through to parent CityCell
-            self._web_view.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
-            
-            # Disable scrollbars
-            settings = self._web_view.settings()
-            settings.setAttribute(QWebEngineSettings.ShowScrollBars, False)
-            settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
-            
-            # Add to layout at same position as icon_label
-            self.layout().insertWidget(0, self._web_view, 0, QtCore.Qt.AlignCenter)
-        
-        self._web_view.show()
-        
-        # Load SVG content immediately
         svg_content = self._get_cached_svg_content(svg_path)
-        
-        # Use dark background to match theme (not transparent)
-        html = f'''<!DOCTYPE html>
-<html>
-<head>
-<meta charset="utf-8"/>
-<style>
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    html, body {{ 
-        width: 128px; 
-        height: 128px; 
-        overflow: hidden;
-        background: #2A2A2A;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }}
-    svg {{
-        width: 128px;
-        height: 128px;
-        display: block;
-    }}
-</style>
-</head>
-<body>
-{svg_content}
-</body>
-</html>'''
-        
-        # Load with file:// base URL to allow relative references (required for SMIL)
-        base_url = QtCore.QUrl.fromLocalFile(str(Path(svg_path).parent) + '/')
-        self._web_view.setHtml(html, base_url)
+        self._set_page_body(svg_content, str(Path(svg_path).parent))
     
     def _show_construction_animated_svg(self, building_svg_path: str, construction_svg_path: str):
         """Show animated building SVG with animated construction overlay on top.
@@ -1012,72 +1088,16 @@ class CityCell(QtWidgets.QFrame):
         
         self._current_svg_path = combined_path
         
-        # Create WebEngineView if it doesn't exist
-        if not self._web_view:
-            self._web_view = QWebEngineView()
-            self._web_view.setFixedSize(128, 128)
-            
-            # Allow mouse clicks to pass through to parent CityCell
-            self._web_view.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
-            
-            settings = self._web_view.settings()
-            settings.setAttribute(QWebEngineSettings.ShowScrollBars, False)
-            settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
-            
-            self.layout().insertWidget(0, self._web_view, 0, QtCore.Qt.AlignCenter)
-        
-        self._web_view.show()
-        
         # Load both SVG contents
         building_svg = self._get_cached_svg_content(building_svg_path)
         construction_svg = self._get_cached_svg_content(construction_svg_path)
         
-        # Create HTML with layered SVGs - building at bottom, construction on top
-        html = f'''<!DOCTYPE html>
-<html>
-<head>
-<meta charset="utf-8"/>
-<style>
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    html, body {{ 
-        width: 128px; 
-        height: 128px; 
-        overflow: hidden;
-        background: #2A2A2A;
-        position: relative;
-    }}
-    .svg-layer {{
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 128px;
-        height: 128px;
-    }}
-    .svg-layer svg {{
-        width: 128px;
-        height: 128px;
-        display: block;
-    }}
-    .building-layer {{
-        z-index: 1;
-    }}
-    .construction-layer {{
-        z-index: 2;
-    }}
-</style>
-</head>
-<body>
-<div class="svg-layer building-layer">
-{building_svg}
-</div>
-<div class="svg-layer construction-layer">
-{construction_svg}
-</div>
-</body>
-</html>'''
-        
-        base_url = QtCore.QUrl.fromLocalFile(str(Path(building_svg_path).parent) + '/')
-        self._web_view.setHtml(html, base_url)
+        # Layered SVGs - building at bottom, construction on top
+        body = (
+            f'<div class="svg-layer building-layer">\n{building_svg}\n</div>\n'
+            f'<div class="svg-layer construction-layer">\n{construction_svg}\n</div>'
+        )
+        self._set_page_body(body, str(Path(building_svg_path).parent))
 
     @staticmethod
     def _get_cached_svg_content(svg_path: str) -> str:
@@ -1197,16 +1217,25 @@ class CityGrid(QtWidgets.QFrame):
     def _on_cell_clicked(self, row: int, col: int):
         self.cell_clicked.emit(row, col)
     
-    def update_grid(self, city_data: Dict, adhd_buster: Optional[Dict] = None):
-        """Update all cells from city data."""
+    def iter_cells(self):
+        """All cells, row by row."""
+        for row_cells in self.cells:
+            yield from row_cells
+    
+    def update_grid(self, city_data: Dict, adhd_buster: Optional[Dict] = None) -> int:
+        """Update all cells from city data.
+        
+        Returns the number of cells whose display changed; cells whose
+        state fingerprint is unchanged are not touched.
+        """
         if not CITY_AVAILABLE:
-            return
+            return 0
         
         self._adhd_buster = adhd_buster
         grid = city_data.get("grid", [])
+        changed = 0
         
         # Calculate max slots based on player level
-        from gamification import get_level_from_xp
         player_level = get_level_from_xp(adhd_buster.get("total_xp", 0))[0] if adhd_buster else 1
         max_slots = get_max_building_slots(player_level)
         
@@ -1219,20 +1248,22 @@ class CityGrid(QtWidgets.QFrame):
                 is_locked = slot_index >= max_slots
                 
                 # Hide locked cells completely (only show unlocked slots)
-                if is_locked:
-                    cell.hide()
-                else:
-                    cell.show()
+                if cell.isHidden() != is_locked:
+                    cell.setHidden(is_locked)
+                    changed += 1
+                if not is_locked:
                     if row < len(grid) and col < len(grid[row]):
                         cell_state = grid[row][col]
                         building_def = None
                         if cell_state and cell_state.get("building_id"):
                             building_def = CITY_BUILDINGS.get(cell_state["building_id"])
-                        cell.set_cell_state(cell_state, building_def, adhd_buster, locked=False)
+                        changed += cell.set_cell_state(cell_state, building_def, adhd_buster, locked=False)
                     else:
-                        cell.set_cell_state(None, locked=False)
+                        changed += cell.set_cell_state(None, locked=False)
                 
                 slot_index += 1
+        
+        return changed
 
 
 # ============================================================================
@@ -2696,16 +2727,16 @@ class BuildingCompleteDialog(StyledDialog):
             return "Building effect is now active!"
 
 
-def show_building_complete_dialog(
+def create_building_complete_dialog(
     building_id: str,
     level: int,
     is_upgrade: bool,
     parent: Optional[QtWidgets.QWidget] = None
-) -> None:
-    """Show celebration dialog when building completes."""
+) -> Optional[BuildingCompleteDialog]:
+    """Play the completion sound and build the celebration dialog (not shown yet)."""
     building_def = CITY_BUILDINGS.get(building_id, {})
     if not building_def:
-        return
+        return None
     
     # Play celebration sound
     try:
@@ -2713,13 +2744,25 @@ def show_building_complete_dialog(
     except Exception:
         pass
     
-    dialog = BuildingCompleteDialog(
+    return BuildingCompleteDialog(
         building_id=building_id,
         building_def=building_def,
         level=level,
         is_upgrade=is_upgrade,
         parent=parent
     )
+
+
+def show_building_complete_dialog(
+    building_id: str,
+    level: int,
+    is_upgrade: bool,
+    parent: Optional[QtWidgets.QWidget] = None
+) -> None:
+    """Show celebration dialog when building completes."""
+    dialog = create_building_complete_dialog(building_id, level, is_upgrade, parent)
+    if dialog is None:
+        return
     dialog.exec()
     dialog.hide()  # Explicitly hide before deletion
     dialog.deleteLater()
@@ -3291,13 +3334,9 @@ class CityTab(QtWidgets.QWidget):
     
     def _force_reload_all_svgs(self):
         """Force reload all SVGs in the grid after a delay."""
-        if hasattr(self, 'city_grid') and hasattr(self.city_grid, 'cells'):
-            for cell in self.city_grid.cells:
-                if hasattr(cell, '_current_svg_path') and cell._current_svg_path:
-                    # Force reload by clearing current path
-                    svg_path = cell._current_svg_path
-                    cell._current_svg_path = None
-                    cell._show_animated_svg(svg_path)
+        if hasattr(self, 'city_grid'):
+            for cell in self.city_grid.iter_cells():
+                cell.reload_svg()
     
     def _setup_ui(self):
         """Set up the main tab UI."""
@@ -3601,8 +3640,8 @@ class CityTab(QtWidgets.QWidget):
         WebEngineViews need their content reloaded when becoming visible.
         """
         try:
-            if hasattr(self, 'city_grid') and hasattr(self.city_grid, 'cells'):
-                for cell in self.city_grid.cells:
+            if hasattr(self, 'city_grid'):
+                for cell in self.city_grid.iter_cells():
                     if hasattr(cell, '_load_pending_svg'):
                         cell._load_pending_svg()
         except Exception as e:
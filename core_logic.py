@@ -13,7 +13,8 @@ import uuid
 import logging
 import tempfile
 import shutil
-from typing import Dict, Optional, Any
+import zlib
+from typing import Any, Callable, Dict, List, Optional
 
 try:
     import bcrypt
@@ -23,6 +24,18 @@ except ImportError:
 from pathlib import Path
 from datetime import datetime
 from user_manager import UserManager
+from backup_store import BackupStore
+from schedule_timeline import ScheduleTimeline
+from telemetry import timed
+from session_journal import (
+    ACTION_CLEANUP,
+    ACTION_CREDIT,
+    ACTION_NONE,
+    ACTION_RESUME,
+    MIN_CREDIT_SECONDS,
+    RecoveryPlan,
+    SessionJournal,
+)
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -85,7 +98,9 @@ SESSION_STATE_PATH = APP_DIR / ".session_state.json"  # Crash recovery file
 CONFIG_SCHEMA_VERSION = 1
 
 # Auto-backup settings
-MAX_AUTO_BACKUPS = 5  # Keep this many periodic backups
+# Snapshots are chunk-deduplicated and compressed (see backup_store.py), so a
+# long history costs little more than the changes between snapshots.
+MAX_AUTO_BACKUPS = 50  # Keep this many periodic backups
 
 
 def ensure_backup_dir(user_dir: Optional[Path] = None) -> Path:
@@ -96,35 +111,32 @@ def ensure_backup_dir(user_dir: Optional[Path] = None) -> Path:
     return backup_dir
 
 
-def create_auto_backup(config_path: Path, backup_dir: Path, prefix: str = "auto") -> Optional[Path]:
+def open_backup_store(backup_dir: Path) -> BackupStore:
+    """Open the backup store in backup_dir, migrating loose legacy backup files."""
+    store = BackupStore(backup_dir)
+    if not store.manifest_path.exists():
+        imported = store.import_legacy_backups()
+        if imported:
+            logger.info(f"Imported {imported} legacy backups into the backup store")
+    return store
+
+
+def create_auto_backup(config_path: Path, backup_dir: Path, prefix: str = "auto") -> Optional[str]:
     """
-    Create an automatic backup of the config file.
+    Create an automatic backup snapshot of the config file.
     
-    Returns the path to the backup file, or None if backup failed.
-    Automatically removes old backups to keep only MAX_AUTO_BACKUPS.
+    Returns the snapshot id, or None if backup failed.
+    Automatically prunes old snapshots to keep only MAX_AUTO_BACKUPS.
     """
     if not config_path.exists():
         return None
     
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = backup_dir / f"{prefix}_config_{timestamp}.json"
-        shutil.copy2(config_path, backup_path)
-        
-        # Cleanup old backups - keep only MAX_AUTO_BACKUPS
-        backups = sorted(
-            backup_dir.glob(f"{prefix}_config_*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
-        for old_backup in backups[MAX_AUTO_BACKUPS:]:
-            try:
-                old_backup.unlink()
-            except OSError:
-                pass
-        
-        logger.info(f"Created auto-backup: {backup_path.name}")
-        return backup_path
+        store = open_backup_store(backup_dir)
+        snapshot_id = store.add_snapshot(config_path.read_bytes(), prefix=prefix)
+        store.prune(MAX_AUTO_BACKUPS, prefix=prefix)
+        logger.info(f"Created auto-backup: {snapshot_id}")
+        return snapshot_id
     except (IOError, OSError) as e:
         logger.warning(f"Failed to create auto-backup: {e}")
         return None
@@ -134,23 +146,32 @@ def get_available_backups(backup_dir: Path) -> list:
     """Get list of available backups sorted by date (newest first)."""
     backups = []
     try:
-        for backup_file in backup_dir.glob("*_config_*.json"):
+        for snapshot in open_backup_store(backup_dir).list_snapshots():
             try:
-                stat = backup_file.stat()
-                backups.append({
-                    "path": backup_file,
-                    "name": backup_file.name,
-                    "date": datetime.fromtimestamp(stat.st_mtime),
-                    "size": stat.st_size,
-                })
-            except OSError:
+                date = datetime.fromisoformat(snapshot["created"])
+            except (KeyError, ValueError):
                 continue
-        backups.sort(key=lambda x: x["date"], reverse=True)
+            backups.append({
+                "id": snapshot["id"],
+                "name": f"{snapshot['id']}.json",
+                "date": date,
+                "size": snapshot.get("size", 0),
+            })
     except OSError:
         pass
     return backups
 
 
+def restore_auto_backup(backup_dir: Path, snapshot_id: str, config_path: Path) -> bool:
+    """Reassemble a backup snapshot and atomically write it to config_path."""
+    try:
+        open_backup_store(backup_dir).restore(snapshot_id, config_path)
+        return True
+    except (KeyError, ValueError, IOError, OSError, zlib.error) as e:
+        logger.warning(f"Failed to restore backup {snapshot_id}: {e}")
+        return False
+
+
 def atomic_write_json(filepath: Path, data: dict) -> None:
     """
     Atomically write JSON data to a file.
@@ -268,6 +289,10 @@ class BlockerCore:
             self.goals_path = GOALS_PATH
             self.session_state_path = SESSION_STATE_PATH
 
+        # Append-only session lifecycle journal, replayed once at startup
+        self.session_journal = SessionJournal(self.session_state_path.with_name(".session_journal.log"))
+        self._recovery_plan = self.session_journal.recover()
+
         self.blacklist = []
         self.whitelist = []
         self.categories_enabled = {}
@@ -285,7 +310,8 @@ class BlockerCore:
         self.pomodoro_current_session = 0
         self.is_break = False
 
-        # Schedule
+        # Schedule (compiled into a weekly timeline whenever it changes)
+        self.schedule_timeline = ScheduleTimeline()
         self.schedules = []
         
         # Priorities (My Priorities feature)
@@ -359,6 +385,9 @@ class BlockerCore:
 
         # Statistics
         self.stats = self._default_stats()
+        # Called as listener(stats, date_str) after stats change; date_str is
+        # the daily_stats entry that changed, or None for a wholesale reload
+        self._stats_listeners: List[Callable[[Dict[str, Any], Optional[str]], None]] = []
         
         # Bypass logger - use per-user storage for privacy
         self.bypass_logger = None
@@ -373,6 +402,16 @@ class BlockerCore:
         self.load_config()
         self.load_stats()
 
+    @property
+    def schedules(self) -> list:
+        """Blocking schedules; assigning a new list recompiles the timeline."""
+        return self._schedules
+
+    @schedules.setter
+    def schedules(self, value: list) -> None:
+        self._schedules = value if isinstance(value, list) else []
+        self.schedule_timeline.compile(self._schedules)
+
     def _default_stats(self) -> Dict[str, Any]:
         return {
             "total_focus_time": 0,
@@ -550,6 +589,72 @@ class BlockerCore:
             self.categories_enabled = {cat: True for cat in SITE_CATEGORIES}
             self.save_config()
 
+    def _build_config_dict(self) -> Dict[str, Any]:
+        """Build the serializable config dict from in-memory state."""
+        return {
+            # Schema metadata for future migrations
+            '_schema_version': CONFIG_SCHEMA_VERSION,
+            '_last_modified': datetime.now().isoformat(),
+            # Settings
+            'blacklist': self.blacklist,
+            'whitelist': self.whitelist,
+            'categories_enabled': self.categories_enabled,
+            'password_hash': self.password_hash,
+            'pomodoro_work': self.pomodoro_work,
+            'pomodoro_break': self.pomodoro_break,
+            'pomodoro_long_break': self.pomodoro_long_break,
+            'schedules': self.schedules,
+            'priorities': self.priorities,
+            'show_priorities_on_startup': self.show_priorities_on_startup,
+            'ask_priority_on_session_start': self.ask_priority_on_session_start,
+            'priority_checkin_enabled': self.priority_checkin_enabled,
+            'priority_checkin_interval': self.priority_checkin_interval,
+            'minimize_to_tray': self.minimize_to_tray,
+            'toggle_hotkey': self.toggle_hotkey,
+            'startup_sound_enabled': self.startup_sound_enabled,
+            'lottery_sound_enabled': self.lottery_sound_enabled,
+            'show_countdown_in_icon': self.show_countdown_in_icon,
+            'enforcement_mode': self.enforcement_mode,
+            'system_permissions': self.system_permissions,
+            'adhd_buster': self.adhd_buster,
+            'weight_entries': self.weight_entries,
+            'weight_unit': self.weight_unit,
+            'weight_goal': self.weight_goal,
+            'weight_milestones': self.weight_milestones,
+            'weight_height': self.weight_height,
+            'weight_reminder_enabled': self.weight_reminder_enabled,
+            'weight_reminder_time': self.weight_reminder_time,
+            'weight_last_reminder_date': self.weight_last_reminder_date,
+            'user_birth_year': self.user_birth_year,
+            'user_birth_month': self.user_birth_month,
+            'user_gender': self.user_gender,
+            'activity_entries': self.activity_entries,
+            'activity_milestones': self.activity_milestones,
+            'activity_reminder_enabled': self.activity_reminder_enabled,
+            'activity_reminder_time': self.activity_reminder_time,
+            'activity_last_reminder_date': self.activity_last_reminder_date,
+            'sleep_entries': self.sleep_entries,
+            'sleep_milestones': self.sleep_milestones,
+            'sleep_chronotype': self.sleep_chronotype,
+            'sleep_reminder_enabled': self.sleep_reminder_enabled,
+            'sleep_reminder_time': self.sleep_reminder_time,
+            'sleep_last_reminder_date': self.sleep_last_reminder_date,
+            'water_entries': self.water_entries,
+            'water_reminder_enabled': self.water_reminder_enabled,
+            'water_reminder_interval': self.water_reminder_interval,
+            'water_last_reminder_time': self.water_last_reminder_time,
+            'water_lottery_attempts': self.water_lottery_attempts,
+            'eye_reminder_enabled': self.eye_reminder_enabled,
+            'eye_reminder_interval': self.eye_reminder_interval,
+            'eye_last_reminder_time': self.eye_last_reminder_time,
+            'eye_reminder_notification_type': getattr(self, 'eye_reminder_notification_type', 'Toast'),
+            'eye_reminder_message_index': getattr(self, 'eye_reminder_message_index', 0),
+            'water_reminder_notification_type': getattr(self, 'water_reminder_notification_type', 'Toast'),
+            'water_reminder_message_index': getattr(self, 'water_reminder_message_index', 0),
+            'dev_mode_enabled': self.dev_mode_enabled,
+        }
+
+    @timed("save_config")
     def save_config(self, create_backup: bool = False) -> None:
         """Save configuration to file atomically (crash-safe)
         
@@ -565,72 +670,19 @@ class BlockerCore:
                 backup_dir = ensure_backup_dir(self.user_dir)
                 create_auto_backup(self.config_path, backup_dir)
             
-            config = {
-                # Schema metadata for future migrations
-                '_schema_version': CONFIG_SCHEMA_VERSION,
-                '_last_modified': datetime.now().isoformat(),
-                # Settings
-                'blacklist': self.blacklist,
-                'whitelist': self.whitelist,
-                'categories_enabled': self.categories_enabled,
-                'password_hash': self.password_hash,
-                'pomodoro_work': self.pomodoro_work,
-                'pomodoro_break': self.pomodoro_break,
-                'pomodoro_long_break': self.pomodoro_long_break,
-                'schedules': self.schedules,
-                'priorities': self.priorities,
-                'show_priorities_on_startup': self.show_priorities_on_startup,
-                'ask_priority_on_session_start': self.ask_priority_on_session_start,
-                'priority_checkin_enabled': self.priority_checkin_enabled,
-                'priority_checkin_interval': self.priority_checkin_interval,
-                'minimize_to_tray': self.minimize_to_tray,
-                'toggle_hotkey': self.toggle_hotkey,
-                'startup_sound_enabled': self.startup_sound_enabled,
-                'lottery_sound_enabled': self.lottery_sound_enabled,
-                'show_countdown_in_icon': self.show_countdown_in_icon,
-                'enforcement_mode': self.enforcement_mode,
-                'system_permissions': self.system_permissions,
-                'adhd_buster': self.adhd_buster,
-                'weight_entries': self.weight_entries,
-                'weight_unit': self.weight_unit,
-                'weight_goal': self.weight_goal,
-                'weight_milestones': self.weight_milestones,
-                'weight_height': self.weight_height,
-                'weight_reminder_enabled': self.weight_reminder_enabled,
-                'weight_reminder_time': self.weight_reminder_time,
-                'weight_last_reminder_date': self.weight_last_reminder_date,
-                'user_birth_year': self.user_birth_year,
-                'user_birth_month': self.user_birth_month,
-                'user_gender': self.user_gender,
-                'activity_entries': self.activity_entries,
-                'activity_milestones': self.activity_milestones,
-                'activity_reminder_enabled': self.activity_reminder_enabled,
-                'activity_reminder_time': self.activity_reminder_time,
-                'activity_last_reminder_date': self.activity_last_reminder_date,
-                'sleep_entries': self.sleep_entries,
-                'sleep_milestones': self.sleep_milestones,
-                'sleep_chronotype': self.sleep_chronotype,
-                'sleep_reminder_enabled': self.sleep_reminder_enabled,
-                'sleep_reminder_time': self.sleep_reminder_time,
-                'sleep_last_reminder_date': self.sleep_last_reminder_date,
-                'water_entries': self.water_entries,
-                'water_reminder_enabled': self.water_reminder_enabled,
-                'water_reminder_interval': self.water_reminder_interval,
-                'water_last_reminder_time': self.water_last_reminder_time,
-                'water_lottery_attempts': self.water_lottery_attempts,
-                'eye_reminder_enabled': self.eye_reminder_enabled,
-                'eye_reminder_interval': self.eye_reminder_interval,
-                'eye_last_reminder_time': self.eye_last_reminder_time,
-                'eye_reminder_notification_type': getattr(self, 'eye_reminder_notification_type', 'Toast'),
-                'eye_reminder_message_index': getattr(self, 'eye_reminder_message_index', 0),
-                'water_reminder_notification_type': getattr(self, 'water_reminder_notification_type', 'Toast'),
-                'water_reminder_message_index': getattr(self, 'water_reminder_message_index', 0),
-                'dev_mode_enabled': self.dev_mode_enabled,
-            }
+            config = self._build_config_dict()
             atomic_write_json(self.config_path, config)
         except (IOError, OSError) as e:
             logger.error(f"Could not save config: {e}")
 
+    def restore_backup(self, snapshot_id: str) -> bool:
+        """Restore config from an auto-backup snapshot and reload it."""
+        backup_dir = ensure_backup_dir(self.user_dir)
+        if not restore_auto_backup(backup_dir, snapshot_id, self.config_path):
+            return False
+        self.load_config()
+        return True
+
     def load_stats(self):
         """Load statistics from file"""
         if self.stats_path.exists():
@@ -640,6 +692,24 @@ class BlockerCore:
                     self.stats = {**self._default_stats(), **loaded}
             except (json.JSONDecodeError, IOError):
                 pass
+        self.notify_stats_changed()
+
+    def add_stats_listener(self, listener: Callable[[Dict[str, Any], Optional[str]], None]) -> None:
+        """Register a callback for stats changes (e.g. ProductivityAnalyzer.on_stats_changed)."""
+        if listener not in self._stats_listeners:
+            self._stats_listeners.append(listener)
+
+    def remove_stats_listener(self, listener: Callable[[Dict[str, Any], Optional[str]], None]) -> None:
+        if listener in self._stats_listeners:
+            self._stats_listeners.remove(listener)
+
+    def notify_stats_changed(self, date_str: Optional[str] = None) -> None:
+        """Tell listeners that stats changed (one day, or everything when date_str is None)."""
+        for listener in list(self._stats_listeners):
+            try:
+                listener(self.stats, date_str)
+            except Exception as e:
+                logger.warning(f"Stats listener failed: {e}")
 
     def save_stats(self):
         """Save statistics to file atomically (crash-safe)"""
@@ -675,16 +745,11 @@ class BlockerCore:
                 zf.writestr("_export_metadata.json", json.dumps(metadata, indent=2))
                 exported_files.append("_export_metadata.json")
                 
-                # Export config (remove password hash for privacy)
-                if self.config_path.exists():
-                    try:
-                        with open(self.config_path, 'r', encoding='utf-8') as f:
-                            config_data = json.load(f)
-                        config_data.pop('password_hash', None)
-                        zf.writestr("config.json", json.dumps(config_data, indent=2))
-                        exported_files.append("config.json")
-                    except Exception:
-                        pass
+                # Export config from in-memory state (remove password hash for privacy)
+                config_data = self._build_config_dict()
+                config_data.pop('password_hash', None)
+                zf.writestr("config.json", json.dumps(config_data, indent=2))
+                exported_files.append("config.json")
                 
                 # Export stats
                 if self.stats_path.exists():
@@ -696,13 +761,14 @@ class BlockerCore:
                     zf.write(self.goals_path, "goals.json")
                     exported_files.append("goals.json")
                 
-                # Export backups folder if exists
-                backup_dir = ensure_backup_dir(self.user_dir)
-                if backup_dir.exists():
-                    for backup_file in backup_dir.glob("*.json"):
-                        arcname = f"backups/{backup_file.name}"
-                        zf.write(backup_file, arcname)
-                        exported_files.append(arcname)
+                # Export backups, streamed chunk by chunk from the backup store
+                store = open_backup_store(ensure_backup_dir(self.user_dir))
+                for snapshot in store.list_snapshots():
+                    arcname = f"backups/{snapshot['id']}.json"
+                    with zf.open(arcname, 'w') as dest:
+                        for chunk in store.iter_snapshot(snapshot['id']):
+                            dest.write(chunk)
+                    exported_files.append(arcname)
                 
                 # Create human-readable summary
                 summary = self._create_export_summary()
@@ -821,7 +887,29 @@ class BlockerCore:
         """Check if there's an orphaned session from a crash.
         
         Returns session info if orphaned session found, None otherwise.
+        When the session journal has a record of the session, the info also
+        carries its RecoveryPlan under "recovery" (resume/credit/cleanup).
         """
+        plan = self._recovery_plan
+        if plan.action != ACTION_NONE:
+            if plan.pid and plan.pid != os.getpid() and self._is_process_running(plan.pid):
+                # Another instance still owns the session
+                return None
+            if plan.blocks_active and not self._has_active_blocks():
+                # Blocks were already removed (e.g. manually)
+                plan.blocks_active = False
+                if plan.action == ACTION_CLEANUP:
+                    self.resolve_orphaned_session()
+                    return None
+            return {
+                "session_id": plan.session_id,
+                "start_time": datetime.fromtimestamp(plan.started_at).isoformat(),
+                "planned_duration": plan.planned_duration,
+                "mode": plan.mode,
+                "pid": plan.pid,
+                "recovery": plan,
+            }
+
         if not self.session_state_path.exists():
             return None
 
@@ -878,13 +966,38 @@ class BlockerCore:
         except (IOError, OSError):
             return False
 
+    def get_recovery_plan(self) -> RecoveryPlan:
+        """How the previous run's journaled session should be recovered."""
+        return self._recovery_plan
+
+    def credit_orphaned_session(self) -> int:
+        """Credit the checkpointed time of a crashed session. Returns seconds credited."""
+        plan = self._recovery_plan
+        credited = 0
+        if plan.action in (ACTION_CREDIT, ACTION_RESUME) and plan.elapsed > MIN_CREDIT_SECONDS:
+            credited = plan.elapsed
+            self.update_stats(credited, completed=False)
+            self.save_stats()
+        self.resolve_orphaned_session()
+        return credited
+
+    def resolve_orphaned_session(self) -> None:
+        """Forget the previous run's session (recovered, credited or dismissed)."""
+        self._recovery_plan = RecoveryPlan()
+        self.session_journal.compact()
+        self.clear_session_state()
+
+    def journal_checkpoint(self, elapsed_seconds: int) -> None:
+        """Record session progress so a crash loses at most one checkpoint interval."""
+        self.session_journal.checkpoint(elapsed_seconds)
+
     def recover_from_crash(self) -> tuple:
         """Clean up after a crash - remove all blocks.
         
         Returns tuple (success, message)
         """
-        # Clear the session state file first
-        self.clear_session_state()
+        # Clear the session state file and journal first
+        self.resolve_orphaned_session()
         
         # Use emergency cleanup to remove blocks
         return self.emergency_cleanup()
@@ -895,6 +1008,7 @@ class BlockerCore:
         current_hour = datetime.now().hour
 
         self.stats["total_focus_time"] += focus_seconds
+        self.session_journal.complete(focus_seconds, completed)
 
         if completed:
             self.stats["sessions_completed"] += 1
@@ -942,6 +1056,8 @@ class BlockerCore:
             sorted_dates = sorted(self.stats["daily_stats"].keys())
             for old_date in sorted_dates[:-MAX_DAILY_STATS_DAYS]:
                 del self.stats["daily_stats"][old_date]
+                self.notify_stats_changed(old_date)
+        self.notify_stats_changed(today)
 
         # Update streak
         if self.stats.get("last_session_date"):
@@ -975,6 +1091,27 @@ class BlockerCore:
             "best_streak": self.stats.get("best_streak", 0),
         }
 
+    def get_profile_summary(self) -> Dict[str, Any]:
+        """Level, focus hours and avatar shown for this profile in the user picker."""
+        summary: Dict[str, Any] = {
+            "focus_hours": round(self.stats.get("total_focus_time", 0) / 3600, 1),
+        }
+        try:
+            from gamification import AVAILABLE_STORIES, get_level_from_xp
+            summary["level"] = get_level_from_xp(self.adhd_buster.get("total_xp", 0))[0]
+            story = AVAILABLE_STORIES.get(self.adhd_buster.get("active_story", "warrior"), {})
+            # Story titles start with their emoji, e.g. "⚔️ The Focus Warrior's Tale"
+            summary["avatar"] = story.get("title", "").split(" ", 1)[0]
+        except (ImportError, TypeError, ValueError) as e:
+            logger.debug(f"Could not compute profile summary: {e}")
+        return summary
+
+    def record_profile_summary(self) -> None:
+        """Store this profile's summary and last-active time in the user index."""
+        if not self.username:
+            return
+        self.user_manager.update_user(self.username, summary=self.get_profile_summary(), touch=True)
+
     def get_bypass_statistics(self):
         """Get bypass attempt statistics"""
         if self.bypass_logger:
@@ -1072,11 +1209,14 @@ class BlockerCore:
 
         return list(effective)
 
-    def block_sites(self, duration_seconds: int = 0):
+    @timed("block_sites")
+    def block_sites(self, duration_seconds: int = 0, started_at: Optional[float] = None):
         """Add blocked sites to hosts file (full mode) or start monitoring (light mode)
         
         Args:
             duration_seconds: Planned session duration for crash recovery
+            started_at: Epoch time the session started (defaults to now; set when
+                resuming a session recovered from the journal)
         """
         # State validation: prevent double-blocking
         if self.is_blocking:
@@ -1092,6 +1232,8 @@ class BlockerCore:
             self.session_id = str(uuid.uuid4())
             # Save session state for crash recovery
             self.save_session_state(duration_seconds)
+            self.session_journal.start(self.session_id, duration_seconds, self.mode,
+                                       started_at=started_at, enforcement=self.enforcement_mode)
             return True, f"🔔 Light Mode: Monitoring {len(sites_to_block)} sites (no blocking)"
         
         # Full mode: requires admin privileges to modify hosts file
@@ -1118,11 +1260,22 @@ class BlockerCore:
                     block_entries.append(f"{REDIRECT_IP} {clean_site}")
             block_entries.append(f"{MARKER_END}\n")
 
-            with open(HOSTS_PATH, 'w', encoding='utf-8') as f:
-                f.write(content.strip() + '\n' + '\n'.join(block_entries))
+            self.session_id = str(uuid.uuid4())
+            # Journal the intent before touching hosts, so a crash mid-write is cleaned up
+            self.session_journal.start(self.session_id, duration_seconds, self.mode,
+                                       started_at=started_at, enforcement=self.enforcement_mode)
+            self.session_journal.block(len(block_entries) - 2)
+
+            try:
+                with open(HOSTS_PATH, 'w', encoding='utf-8') as f:
+                    f.write(content.strip() + '\n' + '\n'.join(block_entries))
+            except Exception:
+                # Nothing was blocked: the journaled session never started
+                self.session_id = None
+                self.session_journal.compact()
+                raise
 
             self.is_blocking = True
-            self.session_id = str(uuid.uuid4())
             self._flush_dns()
             
             # Start bypass attempt logger
@@ -1156,6 +1309,7 @@ class BlockerCore:
             self.is_blocking = False
             self.session_id = None
             self.clear_session_state()
+            self.session_journal.unblock()
             return True, "Session ended!"
         
         # Full mode: requires admin privileges
@@ -1189,6 +1343,7 @@ class BlockerCore:
             
             # Clear session state (crash recovery no longer needed)
             self.clear_session_state()
+            self.session_journal.unblock()
             
             return True, "Sites unblocked!"
 
@@ -1295,6 +1450,7 @@ class BlockerCore:
 
             with open(HOSTS_PATH, 'w', encoding='utf-8') as f:
                 f.write(content.strip() + '\n')
+            self.session_journal.unblock()
 
         except Exception as e:
             errors.append(f"Hosts file: {str(e)}")
@@ -1389,6 +1545,7 @@ class BlockerCore:
             'enabled': True
         }
         self.schedules.append(schedule)
+        self.schedule_timeline.compile(self.schedules)
         self.save_config()
         return schedule['id']
 
@@ -1402,37 +1559,19 @@ class BlockerCore:
         for s in self.schedules:
             if s.get('id') == schedule_id:
                 s['enabled'] = not s.get('enabled', True)
+                self.schedule_timeline.compile(self.schedules)
                 self.save_config()
                 return s['enabled']
         return None
 
-    def is_scheduled_block_time(self):
-        """Check if current time is within any active schedule"""
-        now = datetime.now()
-        current_day = now.weekday()
-        yesterday = (current_day - 1) % 7  # Handle Sunday -> Saturday wrap
-        current_time = now.strftime("%H:%M")
+    def is_scheduled_block_time(self, now: Optional[datetime] = None) -> bool:
+        """Check if the given time (default: now) is within any active schedule.
 
-        for schedule in self.schedules:
-            if not schedule.get('enabled', True):
-                continue
-            
-            start = schedule.get('start_time', '00:00')
-            end = schedule.get('end_time', '23:59')
-            schedule_days = schedule.get('days', [])
-            
-            # Handle overnight schedules (e.g., 22:00 to 06:00)
-            if start <= end:
-                # Normal case: same day schedule
-                if current_day in schedule_days and start <= current_time <= end:
-                    return True
-            else:
-                # Overnight case: crosses midnight
-                # Two conditions to check:
-                # 1. Today is in schedule_days AND current_time >= start (pre-midnight portion)
-                # 2. Yesterday is in schedule_days AND current_time <= end (post-midnight portion)
-                if current_day in schedule_days and current_time >= start:
-                    return True
-                if yesterday in schedule_days and current_time <= end:
-                    return True
-        return False
+        Overnight schedules (e.g., 22:00 to 06:00) cover the post-midnight
+        portion on the following day; see ScheduleTimeline for details.
+        """
+        return self.schedule_timeline.is_active(now)
+
+    def next_schedule_transition(self, now: Optional[datetime] = None) -> Optional[tuple]:
+        """Get the next (datetime, becomes_active) schedule transition, or None."""
+        return self.schedule_timeline.next_transition(now)
@@ -7,7 +7,7 @@ Generates rich procedural audio (sine/triangle waves with envelopes) in real-tim
 Features:
 - Industry-standard PCM audio generation (44.1kHz, 16-bit).
 - Custom ADSR envelopes to prevent "clicking" and shape the sound.
-- Polyphonic mixing capabilities.
+- Polyphonic mixing: one long-lived sink pulls from a SoftwareMixer.
 - Cross-platform (uses PySide6 instead of Windows-specific APIs).
 - Caches generated waveforms for zero-latency playback.
 """
@@ -17,9 +17,11 @@ import math
 import struct
 from typing import Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject
+from PySide6.QtCore import QByteArray, QIODevice, QObject, QTimer
 from PySide6.QtMultimedia import QAudioDevice, QAudioFormat, QAudioSink, QMediaDevices
 
+from audio_mixer import PRIORITY_NORMAL, SoftwareMixer
+
 _logger = logging.getLogger(__name__)
 
 
@@ -336,19 +338,44 @@ _THEME_COMPOSERS = {
 }
 
 
+class _MixerDevice(QIODevice):
+    """Read-only sequential device that pulls mixed PCM from a SoftwareMixer."""
+    
+    def __init__(self, mixer: SoftwareMixer, parent=None):
+        super().__init__(parent)
+        self._mixer = mixer
+    
+    def isSequential(self) -> bool:
+        return True
+    
+    def bytesAvailable(self) -> int:
+        # Always ready: the mixer produces silence when nothing is playing
+        return self._mixer.block_frames * 2 + super().bytesAvailable()
+    
+    def readData(self, maxlen: int) -> bytes:
+        return self._mixer.read(maxlen)
+    
+    def writeData(self, data) -> int:
+        return -1
+
+
 class CelebrationAudioManager(QObject):
     """
     Singleton manager using QtMultimedia for low-latency synthesis.
     
-    Properly releases audio device after playback to prevent interference
-    with other Windows applications.
+    All sounds go through one SoftwareMixer feeding a single pull-mode
+    QAudioSink, so overlapping sounds are mixed rather than cut off. The
+    sink stays open while sounds play and is released after the mixer has
+    been idle for IDLE_RELEASE_MS, to avoid holding the device and
+    interfering with other Windows applications.
     """
     _instance = None
     
-    # Minimum time between plays to prevent audio thread exhaustion (ms)
-    MIN_PLAY_INTERVAL_MS = 150
-    # Time to wait after playback finishes before releasing device (ms)
-    RELEASE_DELAY_MS = 500
+    MAX_VOICES = 8
+    # Mixer idle time before the audio device is released (ms)
+    IDLE_RELEASE_MS = 5000
+    # How often the idle check runs (ms)
+    IDLE_CHECK_INTERVAL_MS = 1000
     
     def __init__(self):
         super().__init__()
@@ -357,12 +384,13 @@ class CelebrationAudioManager(QObject):
             
         CelebrationAudioManager._instance = self
         self._cache: Dict[str, QByteArray] = {}
+        self._mixer = SoftwareMixer(max_voices=self.MAX_VOICES)
         self._sink: Optional[QAudioSink] = None
-        self._current_buffer: Optional[QBuffer] = None
-        self._last_play_time: int = 0  # Track last play time
+        self._device: Optional[_MixerDevice] = None
         self._audio_format: Optional[QAudioFormat] = None
         self._audio_device: Optional[QAudioDevice] = None
-        self._release_timer: Optional[object] = None  # Timer for delayed release
+        self._idle_timer: Optional[QTimer] = None
+        self._idle_ms = 0
         self._prepare_audio_format()
         
     def _prepare_audio_format(self):
@@ -391,7 +419,7 @@ class CelebrationAudioManager(QObject):
             self._audio_format = None
     
     def _ensure_sink_ready(self) -> bool:
-        """Create audio sink on-demand for playback."""
+        """Open the sink on demand and start it pulling from the mixer."""
         if self._sink is not None:
             return True
         
@@ -401,52 +429,37 @@ class CelebrationAudioManager(QObject):
         try:
             self._sink = QAudioSink(self._audio_device, self._audio_format)
             self._sink.setVolume(0.4)  # Lower volume for comfortable listening
-            # Note: stateChanged signal has compatibility issues with PySide6
-            # We skip the connection to avoid TypeError with QAudio::State
-            # Instead, we'll use a timer-based approach to release the device
-            _logger.debug("Audio sink created for playback")
+            self._device = _MixerDevice(self._mixer, self)
+            self._device.open(QIODevice.OpenModeFlag.ReadOnly)
+            self._sink.start(self._device)
+            
+            self._idle_ms = 0
+            self._idle_timer = QTimer(self)
+            self._idle_timer.timeout.connect(self._check_idle)
+            self._idle_timer.start(self.IDLE_CHECK_INTERVAL_MS)
+            _logger.debug("Audio sink opened for mixer playback")
             return True
         except Exception as e:
             _logger.error(f"Failed to create audio sink: {e}")
-            self._sink = None
+            self._release_device()
             return False
     
-    def _on_state_changed(self, state) -> None:
-        """Handle audio sink state changes to release device when done.
-        
-        Note: This method is kept for compatibility but the signal connection
-        is disabled due to PySide6 QAudio::State conversion issues.
-        """
-        try:
-            from PySide6.QtMultimedia import QAudio
-            
-            if state == QAudio.State.IdleState:
-                # Playback finished - schedule device release
-                self._schedule_release()
-            elif state == QAudio.State.StoppedState:
-                # Explicitly stopped - also schedule release
-                self._schedule_release()
-        except Exception as e:
-            _logger.debug(f"State changed handler error: {e}")
-    
-    def _schedule_release(self) -> None:
-        """Schedule audio device release after a short delay."""
-        # Cancel any existing release timer
-        if self._release_timer is not None:
-            try:
-                self._release_timer.stop()
-            except Exception:
-                pass
-        
-        # Create a timer to release device after delay
-        from PySide6.QtCore import QTimer
-        self._release_timer = QTimer(self)
-        self._release_timer.setSingleShot(True)
-        self._release_timer.timeout.connect(self._release_device)
-        self._release_timer.start(self.RELEASE_DELAY_MS)
+    def _check_idle(self) -> None:
+        """Release the device once the mixer has been idle long enough."""
+        if not self._mixer.idle:
+            self._idle_ms = 0
+            return
+        self._idle_ms += self.IDLE_CHECK_INTERVAL_MS
+        if self._idle_ms >= self.IDLE_RELEASE_MS:
+            self._release_device()
     
     def _release_device(self) -> None:
         """Release the audio device to prevent interference with other apps."""
+        if self._idle_timer is not None:
+            self._idle_timer.stop()
+            self._idle_timer.deleteLater()
+            self._idle_timer = None
+        
         if self._sink is not None:
             try:
                 self._sink.stop()
@@ -455,15 +468,14 @@ class CelebrationAudioManager(QObject):
                 _logger.debug(f"Error releasing audio sink: {e}")
             self._sink = None
         
-        if self._current_buffer is not None:
+        if self._device is not None:
             try:
-                self._current_buffer.close()
-                self._current_buffer.deleteLater()
+                self._device.close()
+                self._device.deleteLater()
             except Exception:
                 pass
-            self._current_buffer = None
+            self._device = None
         
-        self._release_timer = None
         _logger.debug("Audio device released")
 
     @classmethod
@@ -482,53 +494,22 @@ class CelebrationAudioManager(QObject):
             except Exception as e:
                 _logger.error(f"Failed to render {theme_id}: {e}")
 
-    def play_buffer(self, data: QByteArray) -> bool:
-        """Play a raw audio buffer with rate limiting to prevent thread exhaustion."""
-        if data.isEmpty():
-            return False
+    def play_buffer(self, data, gain: float = 1.0, priority: int = PRIORITY_NORMAL) -> bool:
+        """
+        Mix a raw PCM buffer (QByteArray or bytes) into the output.
         
-        # Cancel any pending release since we're about to play
-        if self._release_timer is not None:
-            try:
-                self._release_timer.stop()
-                self._release_timer = None
-            except Exception:
-                pass
-
-        # Rate limit to prevent Windows MMCSS thread exhaustion
-        import time
-        current_time = int(time.time() * 1000)
-        if current_time - self._last_play_time < self.MIN_PLAY_INTERVAL_MS:
-            # Too soon, skip this play request
+        Returns False if the buffer is empty, no device is available, or the
+        mixer rejected it because every voice is busy with higher priority.
+        """
+        pcm = data.data() if isinstance(data, QByteArray) else data
+        if not pcm:
             return False
-        self._last_play_time = current_time
         
-        # Ensure audio sink is ready (creates on-demand)
         if not self._ensure_sink_ready():
             return False
-
-        # 1. Stop current playback strictly
-        self._sink.stop()
         
-        # 2. Clean up previous buffer
-        if self._current_buffer is not None:
-            try:
-                self._current_buffer.close()
-                self._current_buffer.deleteLater()
-            except Exception:
-                pass
-        
-        # 3. Keep the QByteArray alive as instance attribute (prevents use-after-free)
-        self._current_data = QByteArray(data)  # Make a copy we own
-        
-        # 4. Create QBuffer that owns its data via setData()
-        self._current_buffer = QBuffer(self)
-        self._current_buffer.setData(self._current_data)  # QBuffer now owns the bytes
-        self._current_buffer.open(QIODevice.OpenModeFlag.ReadOnly)
-        
-        # 5. Start playback
-        self._sink.start(self._current_buffer)
-        return True
+        self._idle_ms = 0
+        return self._mixer.play(pcm, gain=gain, priority=priority) is not None
 
     def play(self, theme_id: str = "default") -> bool:
         """Play the synthesized sound for the theme."""
@@ -544,9 +525,8 @@ class CelebrationAudioManager(QObject):
         return self.play_buffer(data)
 
     def stop(self):
-        """Stop current playback and release device."""
-        if self._sink:
-            self._sink.stop()
+        """Stop all playing sounds and release device."""
+        self._mixer.stop_all()
         self._release_device()
 
 
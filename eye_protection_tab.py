@@ -17,6 +17,8 @@ from game_state import get_game_state
 from entitidex.celebration_audio import CelebrationAudioManager, Synthesizer
 from styled_dialog import styled_info, styled_warning, add_tab_help_button
 from app_utils import get_app_dir
+from audio_mixer import PRIORITY_HIGH
+from tts_cache import PhraseCache, PhraseSynthesizer, model_cache_id
 
 # Try to import piper for offline TTS
 # Note: Import success doesn't guarantee runtime availability (espeak-ng dependencies)
@@ -101,6 +103,21 @@ class GuidanceManager(QtCore.QObject):
     }
     DEFAULT_VOICE = "Lessac (Female, US)"
     
+    # Playback rate of CelebrationAudioManager buffers
+    OUTPUT_SAMPLE_RATE = 44100
+    
+    # Every fixed phrase the routine speaks (synthesized ahead of time by prewarm_phrases)
+    ROUTINE_PHRASES = (
+        "Starting eye routine. Relax.",
+        "Close eyes.",
+        "Open.",
+        "Look far away. Relax focus.",
+        "Session complete. Great job.",
+        "Inhale deeply.",
+        "Exhale slowly.",
+        "Voice guidance enabled.",
+    )
+    
     def __init__(self):
         super().__init__()
         self.mode = EyeGuidanceSettings.get_mode()
@@ -118,9 +135,16 @@ class GuidanceManager(QtCore.QObject):
         # Lock to serialize Piper calls (espeak-ng has global state)
         self._tts_lock = threading.Lock()
         
+        # Synthesized phrases persist across runs in the user data directory
+        from core_logic import APP_DIR
+        self._phrase_cache = PhraseCache(APP_DIR / "cache" / "tts")
+        self._synth = None
+        
         # Initialize Piper TTS
         self.piper_voice = None
         self._init_piper()
+        if self.mode == EyeGuidanceSettings.MODE_VOICE:
+            self.prewarm_phrases()
     
     def _init_piper(self):
         """Initialize Piper voice for offline TTS."""
@@ -159,6 +183,10 @@ class GuidanceManager(QtCore.QObject):
             
             self.piper_voice = PiperVoice.load(str(model_path))
             self._voice_sample_rate = voice_config["sample_rate"]
+            self._synth = PhraseSynthesizer(
+                self.piper_voice, model_cache_id(model_path), self._voice_sample_rate,
+                self._phrase_cache, output_rate=self.OUTPUT_SAMPLE_RATE, lock=self._tts_lock,
+            )
             print(f"[GuidanceManager] Piper voice loaded: {model_path.name}")
             PIPER_WORKING = True
             
@@ -167,6 +195,7 @@ class GuidanceManager(QtCore.QObject):
             import traceback
             traceback.print_exc()
             self.piper_voice = None
+            self._synth = None
             PIPER_WORKING = False
     
     @classmethod
@@ -229,7 +258,10 @@ class GuidanceManager(QtCore.QObject):
             
             # Re-initialize with new voice
             self.piper_voice = None
+            self._synth = None
             self._init_piper()
+            if self.piper_voice is not None and self.mode == EyeGuidanceSettings.MODE_VOICE:
+                self.prewarm_phrases()
             
             return self.piper_voice is not None
         except Exception as e:
@@ -241,45 +273,34 @@ class GuidanceManager(QtCore.QObject):
         """Play TTS audio on the GUI thread (called via queued signal)."""
         from PySide6.QtCore import QByteArray
         qa = QByteArray(pcm_44100)
-        self.audio.play_buffer(qa)
+        # Speech outranks chimes when all mixer voices are busy
+        self.audio.play_buffer(qa, priority=PRIORITY_HIGH)
     
     def say(self, text: str):
-        """Speak text using Piper TTS (non-blocking)."""
-        if not PIPER_WORKING or not self.piper_voice:
+        """Speak text using Piper TTS (non-blocking).
+        
+        Cached phrases play immediately; others are synthesized on a worker
+        thread and added to the phrase cache.
+        """
+        synth = self._synth
+        if not PIPER_WORKING or not self.piper_voice or synth is None:
             print("[GuidanceManager] No piper voice available")
             return
         
+        cached = synth.cached(text)
+        if cached:
+            self.tts_ready.emit(cached)
+            return
+        
         # Run synthesis in a worker thread to avoid blocking UI
         def _synthesize_worker():
             try:
-                import array
-                
-                # Serialize Piper calls (espeak-ng phonemizer has global state)
-                with self._tts_lock:
-                    audio_chunks = [c.audio_int16_bytes for c in self.piper_voice.synthesize(text)]
-                
-                if not audio_chunks:
+                pcm = synth.synthesize(text)
+                if not pcm:
                     print("[GuidanceManager] No audio chunks generated")
                     return
-                
-                # Combine all chunks
-                pcm_22050 = b''.join(audio_chunks)
-                
-                # Upsample from 22050 to 44100 by duplicating each sample
-                samples = array.array('h')  # signed 16-bit
-                samples.frombytes(pcm_22050)
-                
-                # Create upsampled array (2x size) - more efficient pre-allocation
-                upsampled = array.array('h', [0]) * (2 * len(samples))
-                for i, s in enumerate(samples):
-                    upsampled[2*i] = s
-                    upsampled[2*i + 1] = s
-                
-                pcm_44100 = upsampled.tobytes()
-                
                 # Emit signal - thread-safe, will be delivered to GUI thread
-                self.tts_ready.emit(pcm_44100)
-                
+                self.tts_ready.emit(pcm)
             except Exception as e:
                 print(f"[GuidanceManager] TTS error: {e}")
                 import traceback
@@ -288,6 +309,20 @@ class GuidanceManager(QtCore.QObject):
         # Start synthesis thread
         threading.Thread(target=_synthesize_worker, daemon=True).start()
     
+    def prewarm_phrases(self):
+        """Synthesize any uncached routine phrases on a background thread."""
+        synth = self._synth
+        if not PIPER_WORKING or synth is None:
+            return
+        
+        def _prewarm_worker():
+            # Stop early if the voice is switched while warming
+            count = synth.prewarm(self.ROUTINE_PHRASES, should_stop=lambda: self._synth is not synth)
+            if count:
+                print(f"[GuidanceManager] Pre-warmed {count} voice phrases")
+        
+        threading.Thread(target=_prewarm_worker, daemon=True).start()
+    
     def set_mode(self, mode):
         # If trying to set Voice mode but Piper isn't working, fall back to Sound
         if mode == EyeGuidanceSettings.MODE_VOICE and not PIPER_WORKING:
@@ -300,6 +335,7 @@ class GuidanceManager(QtCore.QObject):
         # Test sound
         if mode == EyeGuidanceSettings.MODE_VOICE:
             self.say("Voice guidance enabled.")
+            self.prewarm_phrases()
         elif mode == EyeGuidanceSettings.MODE_SOUND:
             self.audio.play("eye_blink_open")
 
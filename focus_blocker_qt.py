@@ -5,11 +5,32 @@ import platform
 import copy
 import math
 import logging
+import queue
 import threading
 from pathlib import Path
 from typing import Optional, Dict, List, Any, Callable
 from datetime import datetime, timedelta
 
+from startup_profiler import get_startup_profiler
+from session_journal import ACTION_RESUME, CHECKPOINT_INTERVAL
+from hotkey_matcher import DEFAULT_CHORD_TIMEOUT, HotkeyMatcher, pynput_key_name
+from chart_lod import minmax_downsample, nearest_index
+from progress_ring import (
+    ChapterRingWidget, EntitiesRingWidget, EyeRingWidget, FocusRingWidget, WaterRingWidget, XPRingWidget,
+)
+from theme import install_app_stylesheet, set_style_state
+from telemetry import timed
+from reward_queue import (
+    BUILDING_COMPLETE, DIARY, ENTITY_ENCOUNTER, ITEM_DROP, LEVEL_UP, LOTTERY, PRIORITY_LOG,
+    SESSION_COMPLETE, XP_GAINED, RewardEvent, reward_queue,
+)
+from challenge_events import (
+    ACTIVITY_LOGGED, SESSION_COMPLETED, SLEEP_LOGGED, WATER_LOGGED, WEIGHT_LOGGED,
+)
+
+# Startup timing origin (see startup_profiler.py)
+_startup_profiler = get_startup_profiler()
+
 # Module logger
 logger = logging.getLogger(__name__)
 
@@ -491,6 +512,14 @@ def _fallback_get_work_day_date(dt=None):
         dt = dt - timedelta(days=1)
     return dt.strftime("%Y-%m-%d")
 
+
+
+def _publish_game_event(event: str, **payload) -> None:
+    """Publish a domain event (challenge progress etc.) once the game state exists."""
+    game_state = get_game_state() if get_game_state else None
+    if game_state is not None:
+        game_state.publish_event(event, **payload)
+
 get_work_day_date = _fallback_get_work_day_date
 AVAILABLE_STORIES = {}
 STORY_MODE_ACTIVE = "story"
@@ -566,6 +595,8 @@ HYDRATION_MAX_DAILY_GLASSES = 5
 CITY_AVAILABLE = False
 CityTab = None
 
+_startup_profiler.mark("module_imported")
+
 
 def load_heavy_modules():
     """Load heavy modules at startup."""
@@ -618,15 +649,18 @@ def load_heavy_modules():
     get_game_state = _get_game_state
     reset_game_state = _reset_game_state
     
-    from eye_protection_tab import EyeProtectionTab as _EyeProtectionTab
+    with _startup_profiler.phase("import:eye_protection_tab"):
+        from eye_protection_tab import EyeProtectionTab as _EyeProtectionTab
     EyeProtectionTab = _EyeProtectionTab
     
-    from entitidex_tab import EntitidexTab as _EntitidexTab
+    with _startup_profiler.phase("import:entitidex_tab"):
+        from entitidex_tab import EntitidexTab as _EntitidexTab
     EntitidexTab = _EntitidexTab
     
     # City Building System (optional feature)
     try:
-        from city_tab import CityTab as _CityTab, CITY_AVAILABLE as _CITY_AVAILABLE
+        with _startup_profiler.phase("import:city_tab"):
+            from city_tab import CityTab as _CityTab, CITY_AVAILABLE as _CITY_AVAILABLE
         CityTab = _CityTab
         CITY_AVAILABLE = _CITY_AVAILABLE
     except ImportError:
@@ -1752,7 +1786,6 @@ class TimerTab(QtWidgets.QWidget):
         self.timer_running = False
         self.remaining_seconds = 0
         self.session_start: Optional[float] = None
-        self._giving_rewards = False  # Re-entrancy guard for deferred rewards
         
         # Pomodoro state
         self.pomodoro_is_break = False
@@ -2687,6 +2720,43 @@ class TimerTab(QtWidgets.QWidget):
         if hasattr(main_window, '_update_tray_icon'):
             main_window._update_tray_icon(blocking=True)
 
+    def resume_session(self, remaining_seconds: int, total_seconds: int, mode: str,
+                       started_at: float) -> bool:
+        """Resume a session recovered from the session journal after a crash."""
+        if self.timer_running or remaining_seconds <= 0:
+            return False
+        self.timer_running = True
+        self.blocker.mode = mode
+        self.pomodoro_is_break = False
+        self.pomodoro_session_count = 0
+        self.pomodoro_total_work_time = 0
+        self.last_checkin_time = None
+        self._checkin_count = 0
+
+        success, message = self.blocker.block_sites(duration_seconds=total_seconds,
+                                                    started_at=started_at)
+        if not success:
+            self.timer_running = False
+            show_error(self, "Cannot Resume Session", message)
+            return False
+
+        self.remaining_seconds = remaining_seconds
+        self.session_total_seconds = total_seconds
+        self.session_start = int(started_at)
+        self.timer_label.setText(self._format_time(self.remaining_seconds))
+        self._set_action_btn_stop_style()
+        if self.blocker.enforcement_mode == EnforcementMode.LIGHT:
+            self.status_label.setText("🔔 MONITORING")
+        else:
+            self.status_label.setText("🔒 BLOCKING")
+        self.qt_timer.start()
+        self.session_started.emit()
+
+        main_window = self.window()
+        if hasattr(main_window, '_update_tray_icon'):
+            main_window._update_tray_icon(blocking=True)
+        return True
+
     def _stop_session(self) -> None:
         # Check password for Strict Mode
         if self.blocker.mode == BlockMode.STRICT and self.blocker.password_hash:
@@ -2748,6 +2818,12 @@ class TimerTab(QtWidgets.QWidget):
         self.remaining_seconds -= 1
         self.timer_label.setText(self._format_time(max(self.remaining_seconds, 0)))
         self.timer_tick.emit(max(self.remaining_seconds, 0))
+
+        # Journal progress so a crash can credit or resume the session
+        if not self.pomodoro_is_break:
+            elapsed = self.session_total_seconds - self.remaining_seconds
+            if elapsed > 0 and elapsed % CHECKPOINT_INTERVAL == 0:
+                self.blocker.journal_checkpoint(elapsed)
         
         # Update session progress bar and status
         self._update_session_progress()
@@ -2862,181 +2938,56 @@ class TimerTab(QtWidgets.QWidget):
         except Exception:
             return False  # Error getting stats, assume not perfect
 
-    def _give_session_rewards(self, session_minutes: int) -> None:
+    def _give_session_rewards(self, session_minutes: int, ledger=None) -> None:
         """Give item drop, XP, and diary entry rewards with lottery animation.
         
+        Rewards come from a session reward ledger
+        (session_rewards.compute_session_reward_ledger) - the one already
+        shown in the session complete dialog when given - and are applied
+        in a single GameState batch: one save (with auto-backup) and one
+        signal set.
+        
         Short session penalties (anti-exploitation):
         - < 5 min: No rewards at all
         - 5-19 min: Reduced rewards (25% item drop chance, 50% coins/XP)
         - 20+ min: Full rewards with normal scaling
         """
-        if not GAMIFICATION_AVAILABLE:
+        if ledger is None:
+            # Also None when gamification is unavailable or disabled
+            ledger = self._compute_session_ledger(session_minutes)
+        if ledger is None:
             return
-        # Skip if gamification mode is disabled
-        if not is_gamification_enabled(self.blocker.adhd_buster):
-            return
-        
-        # === ANTI-EXPLOITATION: Minimum session thresholds ===
-        MIN_SESSION_FOR_ANY_REWARD = 5      # < 5 min = nothing
-        MIN_SESSION_FOR_FULL_REWARD = 20    # < 20 min = reduced rewards
-        
-        if session_minutes < MIN_SESSION_FOR_ANY_REWARD:
+        if not ledger.eligible:
             # Too short - no rewards
             logger.info(f"Session too short ({session_minutes} min) - no rewards")
             return
         
-        # === CITY RESOURCES ===
-        # Award city Focus resource (1 per 30 min) - uses its own threshold
-        # This is separate from coins/XP since city has 30-min minimum built-in
-        main_window = self.window()
-        if CITY_AVAILABLE and hasattr(main_window, '_award_city_resources_for_session'):
-            main_window._award_city_resources_for_session(session_minutes * 60)
-        
-        # Calculate reward multiplier for short sessions
-        is_short_session = session_minutes < MIN_SESSION_FOR_FULL_REWARD
-        short_session_multiplier = 0.5 if is_short_session else 1.0
-
-        streak = self.blocker.stats.get("streak_days", 0)
-        
-        # Get active story for themed item generation
-        active_story = self.blocker.adhd_buster.get("active_story", "warrior")
-        
-        # Calculate coin earnings (reduced for short sessions)
-        session_hours = session_minutes / 60.0
-        base_coins_per_hour = 10
-        coins_earned = int(session_hours * base_coins_per_hour * short_session_multiplier)
-        
-        # 🚀 DEEP WORK BONUS: Apply multiplier for longer sessions
-        deep_work_multiplier = 1.0
-        deep_work_description = ""
-        try:
-            from gamification import get_deep_work_multiplier
-            deep_work_multiplier, deep_work_description = get_deep_work_multiplier(session_minutes)
-            if deep_work_multiplier > 1.0:
-                coins_earned = int(coins_earned * deep_work_multiplier)
-        except ImportError:
-            pass
-        
-        # Apply strategic priority bonus (+150% = 2.5x multiplier)
-        if self.session_is_strategic:
-            coins_earned = int(coins_earned * 2.5)
-        
-        # Apply lucky options coin bonus from equipped gear - REMOVED (now used for merge discount)
-        equipped = self.blocker.adhd_buster.get("equipped", {})
-        lucky_bonuses = {"coin_discount": 0, "xp_bonus": 0, "merge_luck": 0}
-        if calculate_total_lucky_bonuses:
-            lucky_bonuses = calculate_total_lucky_bonuses(equipped)
-        
-        # Add streak bonus coins (logarithmic scaling)
-        streak_bonus = 0
-        if streak >= 30:
-            streak_bonus = 100
-        elif streak >= 14:
-            streak_bonus = 50
-        elif streak >= 7:
-            streak_bonus = 25
-        elif streak >= 3:
-            streak_bonus = 10
-        
-        coins_earned += streak_bonus
-        
-        # ✨ ENTITY PERK BONUS: Apply coin perks from collected entities
-        entity_coin_bonus = 0
-        coin_perk_breakdown = []
-        try:
-            from gamification import get_entity_coin_perks
-            coin_perks = get_entity_coin_perks(self.blocker.adhd_buster, source="session")
-            
-            # Add flat coin bonus
-            if coin_perks["coin_flat"] > 0:
-                entity_coin_bonus += coin_perks["coin_flat"]
-                coin_perk_breakdown.append(f"+{coin_perks['coin_flat']} coins")
-            
-            # Apply percent bonus
-            if coin_perks["coin_percent"] > 0:
-                pct_bonus = int(coins_earned * (coin_perks["coin_percent"] / 100.0))
-                entity_coin_bonus += pct_bonus
-                coin_perk_breakdown.append(f"+{coin_perks['coin_percent']}% coins")
-            
-            coins_earned += entity_coin_bonus
-        except Exception as e:
-            print(f"[Entity Perks] Error applying coin perks: {e}")
-        
-        # ✨ PERFECT SESSION BONUS: Apply bonus if no distraction attempts
-        is_perfect = self._is_perfect_session()
-        perfect_session_bonus_pct = 0
-        if is_perfect:
-            try:
-                from gamification import get_entity_qol_perks
-                qol_perks = get_entity_qol_perks(self.blocker.adhd_buster)
-                perfect_session_bonus_pct = qol_perks.get("perfect_session_bonus", 0)
-                if perfect_session_bonus_pct > 0:
-                    perfect_coin_bonus = int(coins_earned * (perfect_session_bonus_pct / 100.0))
-                    coins_earned += perfect_coin_bonus
-                    coin_perk_breakdown.append(f"+{perfect_session_bonus_pct}% perfect session")
-            except Exception as e:
-                print(f"[Perfect Session] Error applying bonus: {e}")
-        
-        # Award XP for the focus session (with lucky XP bonus from gear AND entity perks)
-        xp_bonus_pct = lucky_bonuses.get("xp_bonus", 0)
-        # Add perfect session bonus to XP if applicable
-        if is_perfect and perfect_session_bonus_pct > 0:
-            xp_bonus_pct += perfect_session_bonus_pct
-        # Cap at 200% to prevent overflow
-        xp_bonus_pct = min(xp_bonus_pct, 200)
-        
-        # Calculate XP (reduced for short sessions)
-        xp_info = calculate_session_xp(
-            session_minutes, streak, lucky_xp_bonus=xp_bonus_pct,
-            adhd_buster=self.blocker.adhd_buster
-        )
-        # Apply short session penalty to XP
-        if is_short_session:
-            xp_info["total_xp"] = int(xp_info["total_xp"] * short_session_multiplier)
-
-        # === ITEM DROP LOGIC (with short session penalty) ===
-        # Short sessions (< 20 min): Only 25% chance for item drop
-        # Normal sessions (>= 20 min): 100% guaranteed drop
-        item = None
-        should_drop_item = True
-        
-        if is_short_session:
-            import random
-            item_drop_chance = 0.25  # 25% chance for short sessions
-            should_drop_item = random.random() < item_drop_chance
-            if not should_drop_item:
-                logger.info(f"Short session ({session_minutes} min) - no item drop (25% chance failed)")
+        from session_rewards import apply_ledger, format_timings
         
-        if should_drop_item:
-            # Generate item with entity rarity perks
-            item = generate_item(session_minutes=session_minutes, streak_days=streak,
-                                  story_id=active_story, adhd_buster=self.blocker.adhd_buster)
+        streak = ledger.streak
+        is_short_session = ledger.is_short_session
+        coins_earned = ledger.coins
+        item = ledger.item
 
         # Get currently equipped item BEFORE awarding the new one (for comparison dialog)
         equipped_item_before = None
-        if GAMIFICATION_AVAILABLE and item:
+        if item:
             try:
                 from gamification import get_equipped_item
                 equipped_item_before = get_equipped_item(self.blocker.adhd_buster, item.get("slot", "Unknown"))
             except ImportError:
                 pass
 
-        # Show lottery animation for tier reveal (only if item dropped)
+        # Queue the lottery animation for tier reveal (only if item dropped).
+        # Celebrations are queued (reward_queue) and shown in order once the
+        # rewards below have been applied.
+        queue = reward_queue()
         if item:
-            from lottery_animation import FocusTimerLotteryDialog
-            lottery_dialog = FocusTimerLotteryDialog(
-                session_minutes=session_minutes,
-                streak_days=streak,
-                item=item,
-                parent=self.window()
-            )
-            lottery_dialog.exec()
-            lottery_dialog.hide()  # Explicitly hide before deletion to prevent ghost boxes
-            lottery_dialog.deleteLater()  # Ensure dialog is cleaned up
-
-            # Ensure item has all required fields
-            if "obtained_at" not in item:
-                item["obtained_at"] = datetime.now().isoformat()
+            queue.push(RewardEvent(LOTTERY, {
+                "session_minutes": session_minutes,
+                "streak_days": streak,
+                "item": item,
+            }))
         
         # === Use GameState Manager for Atomic Updates ===
         # This ensures all UI components are notified of changes automatically
@@ -3046,50 +2997,22 @@ class TimerTab(QtWidgets.QWidget):
             logger.error("GameStateManager not available - cannot award session rewards")
             return
         
-        # Use award_items_batch for atomic rewards (handles add + auto-equip)
-        # This properly deep-copies items and uses the state manager throughout
-        game_state.begin_batch()
-        try:
-            # Award item with auto-equip to empty slots (only if item dropped)
-            if item:
-                game_state.award_items_batch([item], coins=coins_earned, auto_equip=True, source="session_completion")
-            else:
-                # No item drop - just award coins
-                game_state.add_coins(coins_earned, source="session_completion")
-            
-            # Award XP via state manager
-            xp_result_tuple = game_state.add_xp(xp_info["total_xp"])
-            xp_result = {
-                "new_xp": xp_result_tuple[0],
-                "new_level": xp_result_tuple[1],
-                "leveled_up": xp_result_tuple[2],
-            }
-            leveled_up = xp_result["leveled_up"]
-            
-        finally:
-            game_state.end_batch()
-
-        # Generate diary entry (once per day)
-        today = datetime.now().strftime("%Y-%m-%d")
-        diary = self.blocker.adhd_buster.get("diary", [])
-        today_entries = [e for e in diary if e.get("date") == today]
-
-        diary_entry = None
-        if not today_entries:
-            power = calculate_character_power(self.blocker.adhd_buster)
-            equipped = self.blocker.adhd_buster.get("equipped", {})
-            diary_entry = generate_diary_entry(power, session_minutes, equipped,
-                                               story_id=active_story)
-            if "diary" not in self.blocker.adhd_buster:
-                self.blocker.adhd_buster["diary"] = []
-            self.blocker.adhd_buster["diary"].append(diary_entry)
-            if len(self.blocker.adhd_buster["diary"]) > 100:
-                self.blocker.adhd_buster["diary"] = self.blocker.adhd_buster["diary"][-100:]
-
-        # Save diary entry (batch already saved game state, this saves the diary addition)
-        game_state.force_save()
-
-        # Show level-up celebration first (most exciting!)
+        # City resources, the ledger (item, coins incl. Royal Mint income, XP)
+        # and the diary all land in one batch. Periodic auto-backup after
+        # every 5+ minute session is taken with the same save.
+        with game_state.batch():
+            # Award city Focus resource (1 per 30 min) - uses its own threshold
+            if CITY_AVAILABLE and hasattr(main_window, '_award_city_resources_for_session'):
+                with ledger.plan.timed("city"):
+                    main_window._award_city_resources_for_session(session_minutes * 60)
+            xp_result = apply_ledger(game_state, ledger, create_backup=True)
+        leveled_up = xp_result.get("leveled_up", False)
+        diary_entry = xp_result.get("diary_entry")
+        item = xp_result.get("item") or item
+        logger.debug(f"Session rewards applied: {format_timings(ledger.plan.timings)}")
+
+        # Level-up celebration first (most exciting!) - the XP joins its panel
+        queue.push(RewardEvent(XP_GAINED, {"xp": ledger.xp}))
         if leveled_up:
             old_level = xp_result.get("old_level", 1)
             new_level = xp_result.get("new_level", 1)
@@ -3127,22 +3050,19 @@ class TimerTab(QtWidgets.QWidget):
                 "productivity_score": self.blocker.adhd_buster.get("productivity_score", 0),
                 "total_focus_minutes": self.blocker.adhd_buster.get("total_focus_time", 0) // 60,
                 "items_collected": len(self.blocker.adhd_buster.get("inventory", [])),
-                "unlocks": unlocks,
                 "rewards": None  # Could add level-up rewards
             }
-            # Use fullscreen mode for multi-level gains
-            fullscreen = (new_level - old_level) > 1
-            levelup_dialog = EnhancedLevelUpDialog(old_level, new_level, stats, fullscreen, self.window())
-            levelup_dialog.view_stats.connect(self._show_stats_dialog)
-            levelup_dialog.exec()
-            levelup_dialog.hide()  # Explicitly hide before deletion to prevent ghost boxes
-            levelup_dialog.deleteLater()  # Ensure dialog is cleaned up
+            queue.push(RewardEvent(LEVEL_UP, {
+                "old_level": old_level,
+                "new_level": new_level,
+                "stats": stats,
+                "unlocks": unlocks,
+                "on_view_stats": self._show_stats_dialog,
+            }))
 
         # Show unified item reward dialog with comparison (only if item dropped)
         # Use equipped_item_before which was captured before the item was auto-equipped
         if item:
-            from styled_dialog import ItemRewardDialog
-            
             # Build equipped dict for comparison
             equipped_before = {}
             if equipped_item_before:
@@ -3216,37 +3136,26 @@ class TimerTab(QtWidgets.QWidget):
                 # Clear the contribution info after showing
                 main_window._last_city_contribution = None
             
-            reward_dialog = ItemRewardDialog(
-                parent=self.window(),
-                source_label=f"Focus Session: {session_minutes} min" + (f" • {streak} day streak 🔥" if streak > 0 else ""),
-                items_earned=[item],
-                equipped=equipped_before,
-                coins_earned=coins_earned,
-                game_state=get_game_state(),
-                session_minutes=session_minutes,
-                streak_days=streak,
-                entity_perk_contributors=entity_perk_contributors,
-                extra_messages=extra_msgs,
-            )
-            reward_dialog.exec()
-            reward_dialog.hide()  # Explicitly hide before deletion to prevent ghost boxes
-            reward_dialog.deleteLater()  # Ensure dialog is cleaned up
-            
-            # 🎉 Show building complete celebration if construction just finished
+            queue.push(RewardEvent(ITEM_DROP, {
+                "source_label": f"Focus Session: {session_minutes} min" + (f" • {streak} day streak 🔥" if streak > 0 else ""),
+                "items": [item],
+                "equipped": equipped_before,
+                "coins": coins_earned,
+                "session_minutes": session_minutes,
+                "streak_days": streak,
+                "entity_perk_contributors": entity_perk_contributors,
+                "extra_messages": extra_msgs,
+            }))
+            
+            # 🎉 Building complete celebration if construction just finished
             if building_completed_info:
-                try:
-                    from city_tab import show_building_complete_dialog
-                    building_id = building_completed_info.get("building_id", "")
-                    level = building_completed_info.get("level", 1)
+                level = building_completed_info.get("level", 1)
+                queue.push(RewardEvent(BUILDING_COMPLETE, {
+                    "building_id": building_completed_info.get("building_id", ""),
+                    "level": level,
                     # If level > 1, this was an upgrade, not initial construction
-                    is_upgrade = level > 1
-                    show_building_complete_dialog(building_id, level, is_upgrade, parent=self.window())
-                    # Refresh city tab to show completed building (remove construction overlay)
-                    main_window = self.window()
-                    if hasattr(main_window, 'city_tab') and hasattr(main_window.city_tab, '_refresh_city'):
-                        main_window.city_tab._refresh_city()
-                except Exception as e:
-                    logger.debug(f"Could not show building complete dialog: {e}")
+                    "is_upgrade": level > 1,
+                }))
             
             # Refresh city tab if construction progress was tracked
             last_contribution = getattr(self.window(), '_last_city_contribution', None)
@@ -3256,30 +3165,21 @@ class TimerTab(QtWidgets.QWidget):
                     main_window.city_tab._refresh_city()
         else:
             # No item dropped (short session) - just show a simple notification
-            logger.info(f"Short session completed: {session_minutes} min - {coins_earned} coins, {xp_info['total_xp']} XP (no item)")
+            logger.info(f"Short session completed: {session_minutes} min - {coins_earned} coins, {ledger.xp} XP (no item)")
 
         # Note: UI updates are now handled automatically via GameState signals
         # The game_state.end_batch() above triggers power_changed, coins_changed,
         # and inventory_changed signals which update the UI reactively.
 
-        # === Auto-backup on significant session ===
-        # Create periodic backup after every 5+ minute session (captures item/XP gains)
-        if session_minutes >= 5:
-            try:
-                self.blocker.save_config(create_backup=True)
-            except Exception as e:
-                logger.debug(f"Auto-backup after session failed: {e}")
-
         # === Entitidex Encounter Check ===
         # After item rewards, check for entity encounter based on session
-        self._check_entitidex_encounter(session_minutes)
+        queue.push(RewardEvent(ENTITY_ENCOUNTER, {
+            "check": lambda: self._check_entitidex_encounter(session_minutes),
+        }))
 
-        # Show diary entry reveal
+        # Diary entry reveal
         if diary_entry:
-            diary_dialog = DiaryEntryRevealDialog(self.blocker, diary_entry, session_minutes, self.window())
-            diary_dialog.exec()
-            diary_dialog.hide()  # Explicitly hide before deletion to prevent ghost boxes
-            diary_dialog.deleteLater()  # Ensure dialog is cleaned up
+            queue.push(RewardEvent(DIARY, {"entry": diary_entry, "session_minutes": session_minutes}))
 
     def _get_notify_mode(self) -> str:
         """Get the current notification mode from dropdown."""
@@ -3792,6 +3692,7 @@ class TimerTab(QtWidgets.QWidget):
             return
 
         self.blocker.update_stats(elapsed, completed=True)
+        _publish_game_event(SESSION_COMPLETED, minutes=elapsed // 60)
         self.blocker.unblock_sites(force=True)
 
         # Get notification mode
@@ -3822,58 +3723,68 @@ class TimerTab(QtWidgets.QWidget):
 
         session_minutes = elapsed // 60
 
-        # Collect rewards first (needed for dialog display)
+        # Compute the reward ledger once: the dialog shows it and the
+        # deferred award applies the same ledger
         rewards_info = {}
+        ledger = None
         if session_minutes > 0:
-            rewards_info = self._collect_session_rewards(session_minutes)
+            ledger = self._compute_session_ledger(session_minutes)
+            rewards_info = self._collect_session_rewards(session_minutes, ledger)
         
         # Emit session_complete EARLY so stats refresh immediately
         # (will emit again after rewards to capture XP/item changes)
         self.session_complete.emit(elapsed)
         
-        # Show session complete dialog if enabled
+        # Queue session complete dialog if enabled (rewards follow it)
         if notify_mode in ("dialog", "both"):
-            from session_complete_dialog import SessionCompleteDialog
-            dialog = SessionCompleteDialog(elapsed, rewards_info, parent=self)
-            
-            # Connect quick action signals
-            dialog.start_another_session.connect(self._start_session)
-            dialog.view_stats.connect(lambda: self.window().tabs.setCurrentIndex(1))  # Switch to Stats tab
-            main_window = self.window()
-            if hasattr(main_window, 'show_priorities_dialog'):
-                dialog.view_priorities.connect(main_window.show_priorities_dialog)
-            
-            dialog.exec()
+            reward_queue().push(RewardEvent(SESSION_COMPLETE, {
+                "elapsed": elapsed,
+                "rewards_info": rewards_info,
+                # Quick actions
+                "on_start_another": self._start_session,
+                "on_view_stats": lambda: self.window().tabs.setCurrentIndex(1),  # Switch to Stats tab
+                "on_view_priorities": getattr(self.window(), 'show_priorities_dialog', None),
+            }))
         
         # Refresh quick stats
         self._refresh_quick_stats()
         
-        # Process rewards after dialog shown
+        # Process rewards once the queued dialog is on screen
         if session_minutes > 0:
-            QtCore.QTimer.singleShot(50, lambda: self._give_session_rewards_deferred(session_minutes))
+            QtCore.QTimer.singleShot(50, lambda: self._give_session_rewards_deferred(session_minutes, ledger))
 
-    def _give_session_rewards_deferred(self, session_minutes: int) -> None:
+    def _give_session_rewards_deferred(self, session_minutes: int, ledger=None) -> None:
         """Deferred session rewards to keep UI responsive.
         
-        Uses a re-entrancy guard to prevent multiple reward grants
-        if processEvents() triggers additional callbacks.
+        Rewards are applied right away and their dialogs queued on the
+        reward queue, so no nested event loop runs in here.
         """
-        if self._giving_rewards:
-            return  # Prevent re-entrancy from processEvents
-        self._giving_rewards = True
-        try:
-            QtWidgets.QApplication.processEvents()
-            self._give_session_rewards(session_minutes)
-            QtWidgets.QApplication.processEvents()
-            self._show_priority_time_log(session_minutes)
-            # Calculate elapsed for signal - approximate from session_minutes
-            self.session_complete.emit(session_minutes * 60)
-        finally:
-            self._giving_rewards = False
+        self._give_session_rewards(session_minutes, ledger)
+        self._show_priority_time_log(session_minutes)
+        # Calculate elapsed for signal - approximate from session_minutes
+        self.session_complete.emit(session_minutes * 60)
+    
+    def _compute_session_ledger(self, session_minutes: int):
+        """Compute the session reward ledger (None when gamification is off).
+        
+        The item is rolled here, so the same ledger can be shown in the
+        session complete dialog and then applied by _give_session_rewards.
+        """
+        if not GAMIFICATION_AVAILABLE:
+            return None
+        if not is_gamification_enabled(self.blocker.adhd_buster):
+            return None
+        from session_rewards import SessionFlags, compute_session_reward_ledger
+        flags = SessionFlags(strategic=self.session_is_strategic, perfect=self._is_perfect_session())
+        return compute_session_reward_ledger(self.blocker.adhd_buster, self.blocker.stats,
+                                             session_minutes, flags)
     
-    def _collect_session_rewards(self, session_minutes: int) -> dict:
+    def _collect_session_rewards(self, session_minutes: int, ledger=None) -> dict:
         """Collect reward information without actually awarding them yet.
         
+        Reads the numbers from the session reward ledger that
+        _give_session_rewards will apply.
+        
         Returns dict with reward details for display in session complete dialog.
         """
         rewards = {
@@ -3886,143 +3797,46 @@ class TimerTab(QtWidgets.QWidget):
             "city_construction": None,  # Preview of construction contribution
         }
         
-        if not GAMIFICATION_AVAILABLE:
-            return rewards
-        
-        if not is_gamification_enabled(self.blocker.adhd_buster):
+        if ledger is None:
+            ledger = self._compute_session_ledger(session_minutes)
+        if ledger is None:
             return rewards
         
-        streak = self.blocker.stats.get("streak_days", 0)
+        streak = ledger.streak
         rewards["current_streak"] = streak
         rewards["streak_maintained"] = streak > 0
         
-        # Calculate XP
-        equipped = self.blocker.adhd_buster.get("equipped", {})
-        lucky_bonuses = {"xp_bonus": 0}
-        if calculate_total_lucky_bonuses:
-            lucky_bonuses = calculate_total_lucky_bonuses(equipped)
-        xp_bonus_pct = min(lucky_bonuses.get("xp_bonus", 0), 200)
-        xp_info = calculate_session_xp(
-            session_minutes, streak, lucky_xp_bonus=xp_bonus_pct,
-            adhd_buster=self.blocker.adhd_buster
-        )
-        base_xp_total = xp_info["total_xp"]
-        
-        # 🏙️ CITY BONUS: Library XP bonus (preview what award_xp will apply)
-        city_xp_bonus = 0
-        try:
-            from city import get_city_bonuses
-            city_bonuses = get_city_bonuses(self.blocker.adhd_buster)
-            xp_bonus_pct_city = city_bonuses.get("xp_bonus", 0)
-            if xp_bonus_pct_city > 0 and base_xp_total > 0:
-                city_xp_bonus = int(base_xp_total * xp_bonus_pct_city / 100.0)
-        except Exception:
-            pass
+        if not ledger.eligible:
+            return rewards
         
-        rewards["xp"] = base_xp_total + city_xp_bonus
-        rewards["city_xp_bonus"] = city_xp_bonus  # Track for display
+        rewards["xp"] = ledger.xp
+        rewards["city_xp_bonus"] = ledger.total("xp", "city_library")  # Track for display
         
         # Track XP entity perks from xp_info if available
-        entity_xp_breakdown = xp_info.get("entity_xp_breakdown", [])
-        if entity_xp_breakdown:
-            for bonus_desc in entity_xp_breakdown:
-                # bonus_desc is a string like "+5% Focus XP"
-                rewards["entity_perks_applied"].append({
-                    "type": "xp",
-                    "description": f"{bonus_desc} (Entity Perk)",
-                    "value": 0,  # Value already included in total
-                })
-        
-        # Calculate coins
-        session_hours = session_minutes / 60.0
-        base_coins_per_hour = 10
-        coins_earned = int(session_hours * base_coins_per_hour)
-        
-        if self.session_is_strategic:
-            coins_earned = int(coins_earned * 2.5)
-        
-        # Streak bonus
-        if streak >= 30:
-            coins_earned += 100
-        elif streak >= 14:
-            coins_earned += 50
-        elif streak >= 7:
-            coins_earned += 25
-        elif streak >= 3:
-            coins_earned += 10
+        for bonus_desc in ledger.xp_info.get("entity_xp_breakdown", []):
+            # bonus_desc is a string like "+5% Focus XP"
+            rewards["entity_perks_applied"].append({
+                "type": "xp",
+                "description": f"{bonus_desc} (Entity Perk)",
+                "value": 0,  # Value already included in total
+            })
         
-        # ✨ ENTITY PERK BONUS: Apply coin perks from collected entities
-        try:
-            from gamification import get_entity_coin_perks
-            coin_perks = get_entity_coin_perks(self.blocker.adhd_buster, source="session")
-            if coin_perks["coin_flat"] > 0:
-                coins_earned += coin_perks["coin_flat"]
-                rewards["entity_perks_applied"].append({
-                    "type": "coins",
-                    "description": f"+{coin_perks['coin_flat']} Coins (Entity Perk)",
-                    "value": coin_perks["coin_flat"],
-                })
-            if coin_perks["coin_percent"] > 0:
-                percent_bonus = int(coins_earned * (coin_perks["coin_percent"] / 100.0))
-                coins_earned += percent_bonus
+        # ✨ ENTITY PERK BONUS: coin perks from collected entities
+        for line in ledger.lines:
+            if line.kind == "coins" and line.source == "entity_perk":
                 rewards["entity_perks_applied"].append({
                     "type": "coins",
-                    "description": f"+{coin_perks['coin_percent']}% Coins (Entity Perk)",
-                    "value": percent_bonus,
+                    "description": line.label,
+                    "value": line.amount,
                 })
-        except Exception:
-            pass
         
-        rewards["coins"] = coins_earned
-        
-        # 🏛️ Preview Royal Mint income (coins from focus sessions)
-        rewards["city_mint_coins"] = 0
-        if CITY_AVAILABLE:
-            try:
-                from city import get_city_bonuses
-                from city.city_buildings import CITY_BUILDINGS
-                
-                # Check if Royal Mint is built
-                city_data = self.blocker.adhd_buster.get("city", {})
-                grid = city_data.get("grid", [])
-                
-                for row in grid:
-                    for cell in row:
-                        if cell and cell.get("complete", False):
-                            building_id = cell.get("building_id")
-                            building_def = CITY_BUILDINGS.get(building_id, {})
-                            effect = building_def.get("effect", {})
-                            
-                            if effect.get("type") == "focus_session_income":
-                                level = cell.get("level", 1)
-                                scaling = building_def.get("level_scaling", {})
-                                
-                                base_coins = effect.get("base_coins", 0)
-                                base_coins += (level - 1) * scaling.get("base_coins", 0)
-                                
-                                coins_per_30min = effect.get("coins_per_30min", 0)
-                                coins_per_30min += (level - 1) * scaling.get("coins_per_30min", 0)
-                                
-                                time_bonus = int((session_minutes / 30) * coins_per_30min)
-                                mint_coins = base_coins + time_bonus
-                                
-                                rewards["city_mint_coins"] += mint_coins
-                                rewards["coins"] += mint_coins
-                                
-                            # Wonder building multi-effect with focus_session_coins
-                            elif effect.get("type") == "multi":
-                                bonus_coins = effect.get("bonuses", {}).get("focus_session_coins", 0)
-                                if bonus_coins > 0:
-                                    time_bonus = int((session_minutes / 30) * (bonus_coins // 2))
-                                    wonder_coins = bonus_coins + time_bonus
-                                    rewards["city_mint_coins"] += wonder_coins
-                                    rewards["coins"] += wonder_coins
-            except Exception:
-                pass
+        # Session coins plus 🏛️ Royal Mint income (coins from focus sessions)
+        rewards["coins"] = ledger.coins
+        rewards["city_mint_coins"] = ledger.city_mint_coins
         
-        # Mark that an item will be earned (actual item revealed via lottery animation)
-        # Don't generate preview - the lottery will generate the real item
-        rewards["items"] = [{"teaser": True}]  # Just a flag that item is coming
+        # Mark that an item will be earned (the rolled item is revealed via lottery animation)
+        if ledger.item:
+            rewards["items"] = [{"teaser": True}]  # Just a flag that item is coming
         
         # 🏙️ Preview city construction contribution (actual award happens later)
         if CITY_AVAILABLE:
@@ -4062,10 +3876,7 @@ class TimerTab(QtWidgets.QWidget):
             for p in self.blocker.priorities
         )
         if has_priorities:
-            priority_dialog = PriorityTimeLogDialog(self.blocker, session_minutes, self.window())
-            priority_dialog.exec()
-            priority_dialog.hide()  # Explicitly hide before deletion
-            priority_dialog.deleteLater()  # Ensure dialog is cleaned up
+            reward_queue().push(RewardEvent(PRIORITY_LOG, {"session_minutes": session_minutes}))
 
     def _show_log_past_session_dialog(self) -> None:
         """Show dialog to log a past focus session retroactively."""
@@ -4083,6 +3894,7 @@ class TimerTab(QtWidgets.QWidget):
             # Update stats for the past session
             self.blocker.update_stats(session_minutes * 60, completed=True)
             self.blocker.save_stats()
+            _publish_game_event(SESSION_COMPLETED, minutes=session_minutes)
             
             # Notify GameState of focus time change
             try:
@@ -4144,6 +3956,7 @@ class TimerTab(QtWidgets.QWidget):
             self.pomodoro_session_count += 1
             self.pomodoro_total_work_time += elapsed
             self.blocker.update_stats(elapsed, completed=True)
+            _publish_game_event(SESSION_COMPLETED, minutes=elapsed // 60)
             if notify_mode in ("sound", "both"):
                 self._play_notification_sound()
             
@@ -4291,8 +4104,8 @@ class SitesTab(QtWidgets.QWidget):
     def __init__(self, blocker: BlockerCore, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.blocker = blocker
-        self.analyzer = ProductivityAnalyzer(blocker.stats_path) if ProductivityAnalyzer else None
-        self.gamification = GamificationEngine(blocker.stats_path) if GamificationEngine else None
+        self.analyzer = ProductivityAnalyzer(blocker.stats_path, stats=blocker.stats) if ProductivityAnalyzer else None
+        self.gamification = GamificationEngine(blocker.stats_path, stats=blocker.stats) if GamificationEngine else None
         self.focus_goals = FocusGoals(blocker.goals_path, blocker.stats_path) if FocusGoals else None
         self._build_ui()
         self._refresh_lists()
@@ -4463,6 +4276,8 @@ class CategoriesTab(QtWidgets.QWidget):
 class ScheduleTab(QtWidgets.QWidget):
     """Schedule tab - automatic blocking schedules."""
 
+    schedules_changed = QtCore.Signal()  # emitted after add/toggle/delete
+
     def __init__(self, blocker: BlockerCore, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.blocker = blocker
@@ -4548,6 +4363,7 @@ class ScheduleTab(QtWidgets.QWidget):
         end = self.end_time.time().toString("HH:mm")
         self.blocker.add_schedule(days, start, end)
         self._refresh_table()
+        self.schedules_changed.emit()
 
     def _selected_id(self) -> Optional[str]:
         row = self.table.currentRow()
@@ -4561,12 +4377,14 @@ class ScheduleTab(QtWidgets.QWidget):
         if sid:
             self.blocker.toggle_schedule(sid)
             self._refresh_table()
+            self.schedules_changed.emit()
 
     def _delete_schedule(self) -> None:
         sid = self._selected_id()
         if sid:
             self.blocker.remove_schedule(sid)
             self._refresh_table()
+            self.schedules_changed.emit()
 
 
 # ============================================================================
@@ -6285,6 +6103,7 @@ class StatsTab(QtWidgets.QWidget):
         if show_question(self, "Reset Stats", "Reset all statistics?") == QtWidgets.QMessageBox.Yes:
             self.blocker.stats = self.blocker._default_stats()
             self.blocker.save_stats()
+            self.blocker.notify_stats_changed()
             self.refresh()
 
 
@@ -6696,7 +6515,7 @@ class SettingsTab(QtWidgets.QWidget):
                 
                 # Show user selection dialog
                 um = UserManager(APP_DIR)
-                selection_dialog = UserSelectionDialog(um, parent=main_window)
+                selection_dialog = UserSelectionDialog(um, parent=main_window, current_user=main_window.username)
                 
                 if selection_dialog.exec() == QtWidgets.QDialog.Accepted:
                     new_user = selection_dialog.selected_user
@@ -6815,6 +6634,7 @@ class SettingsTab(QtWidgets.QWidget):
             stats = data.get("stats", {})
             self.blocker.stats = {**self.blocker._default_stats(), **stats}
             self.blocker.save_stats()
+            self.blocker.notify_stats_changed()
 
             # Restore goals if present
             if FocusGoals and "goals" in data:
@@ -7019,6 +6839,7 @@ class SettingsTab(QtWidgets.QWidget):
                 "longest_session": 0,
                 "daily_stats": {},
             }
+            self.blocker.notify_stats_changed()
             
             # Reset tracking data
             self.blocker.weight_entries = []
@@ -7302,11 +7123,19 @@ class WeightChartWidget(QtWidgets.QWidget):
     - Weekly binning with min/max bands (for 30+ entries)
     - Trend direction indicator
     - Context-colored data points (morning, evening, etc.)
+    - Hover tooltip for the nearest entry
+    
+    The chart is built into a list of painter calls (paths, points, labels)
+    that is cached until the data or the widget size changes; paintEvent
+    only replays it. Weekly series wider than the chart are reduced with
+    chart_lod.minmax_downsample, which keeps each column's lows and highs.
     """
     
     # Mode thresholds
     WEEKLY_BIN_THRESHOLD = 30  # Switch to weekly binning after this many entries
     MOVING_AVG_WINDOW = 7     # 7-day moving average
+    DATE_LABEL_SPACING = 45   # Minimum pixels between date labels
+    HOVER_RADIUS = 20         # Max pixel distance for the hover tooltip
     
     # Context colors for different logging occasions
     CONTEXT_COLORS = {
@@ -7323,8 +7152,14 @@ class WeightChartWidget(QtWidgets.QWidget):
         self.weight_data = []  # List of (date_str, weight, context) tuples
         self.goal_weight = None
         self.unit = "kg"
+        self._dated = []  # (datetime, weight, context, date_str) for parseable dates
+        self._days = []   # Day offsets of _dated from the first entry (sorted)
+        self._display_list = None  # Cached painter calls
+        self._layout = None  # Cached coordinate mapping for hover
+        self._hover_index = -1
         self.setMinimumHeight(250)
         self.setMinimumWidth(400)
+        self.setMouseTracking(True)
     
     def set_data(self, entries: list, goal: float = None, unit: str = "kg") -> None:
         """Set the weight data to display."""
@@ -7334,8 +7169,31 @@ class WeightChartWidget(QtWidgets.QWidget):
         self.weight_data = sorted(valid_entries, key=lambda x: x[0])
         self.goal_weight = goal
         self.unit = unit
+        
+        # Parse every date once; painting and hover work from these
+        self._dated = []
+        for date_str, weight, context in self.weight_data:
+            d = self._parse_date(date_str)
+            if d:
+                self._dated.append((d, weight, context, date_str))
+        self._dated.sort(key=lambda x: x[0])
+        first = self._dated[0][0] if self._dated else None
+        self._days = [(d - first).days for d, _, _, _ in self._dated]
+        
+        self._hover_index = -1
+        self._invalidate()
+    
+    def _invalidate(self) -> None:
+        """Drop the cached geometry and repaint."""
+        self._display_list = None
+        self._layout = None
         self.update()
     
+    def resizeEvent(self, event) -> None:
+        self._display_list = None
+        self._layout = None
+        super().resizeEvent(event)
+    
     def _parse_date(self, date_str: str):
         """Parse date string to datetime object."""
         from datetime import datetime
@@ -7346,65 +7204,52 @@ class WeightChartWidget(QtWidgets.QWidget):
     
     def _calculate_weekly_bins(self) -> list:
         """Calculate weekly bins with avg, min, max for each week."""
-        from datetime import datetime, timedelta
+        from datetime import timedelta
         
         if not self.weight_data:
             return []
         
-        bins = []
         first_date = self._parse_date(self.weight_data[0][0])
         last_date = self._parse_date(self.weight_data[-1][0])
         
         if not first_date or not last_date:
             return []
         
-        # Group by week
-        current_week_start = first_date
-        while current_week_start <= last_date:
-            week_end = current_week_start + timedelta(days=6)
-            
-            # Find weights in this week
-            week_weights = []
-            for date_str, weight, context in self.weight_data:
-                d = self._parse_date(date_str)
-                if d and current_week_start <= d <= week_end:
-                    week_weights.append(weight)
-            
-            if week_weights:
-                bins.append({
-                    "date": current_week_start,
-                    "avg": sum(week_weights) / len(week_weights),
-                    "min": min(week_weights),
-                    "max": max(week_weights),
-                    "count": len(week_weights),
-                })
-            
-            current_week_start += timedelta(days=7)
+        # Group by week (weeks counted from the first entry)
+        weeks = {}
+        for d, weight, _, _ in self._dated:
+            if first_date <= d <= last_date:
+                weeks.setdefault((d - first_date).days // 7, []).append(weight)
+        
+        bins = []
+        for week in sorted(weeks):
+            week_weights = weeks[week]
+            bins.append({
+                "date": first_date + timedelta(days=7 * week),
+                "avg": sum(week_weights) / len(week_weights),
+                "min": min(week_weights),
+                "max": max(week_weights),
+                "count": len(week_weights),
+            })
         
         return bins
     
     def _calculate_moving_average(self) -> list:
         """Calculate 7-day moving average for each data point."""
-        from datetime import datetime, timedelta
+        from bisect import bisect_left, bisect_right
         
         if len(self.weight_data) < self.MOVING_AVG_WINDOW:
             return []
         
         ma_data = []
+        weights = [w for _, w, _, _ in self._dated]
         
-        for i, (date_str, weight, context) in enumerate(self.weight_data):
-            current_date = self._parse_date(date_str)
-            if not current_date:
-                continue
-            
-            # Get weights from past 7 days
-            window_start = current_date - timedelta(days=self.MOVING_AVG_WINDOW - 1)
-            window_weights = []
-            
-            for d_str, w, ctx in self.weight_data:
-                d = self._parse_date(d_str)
-                if d and window_start <= d <= current_date:
-                    window_weights.append(w)
+        for i, (current_date, weight, context, date_str) in enumerate(self._dated):
+            # Get weights from past 7 days (the day offsets are sorted)
+            day = self._days[i]
+            lo = bisect_left(self._days, day - (self.MOVING_AVG_WINDOW - 1))
+            hi = bisect_right(self._days, day)
+            window_weights = weights[lo:hi]
             
             if len(window_weights) >= 3:  # Need at least 3 points for meaningful average
                 ma_data.append((date_str, sum(window_weights) / len(window_weights)))
@@ -7423,19 +7268,13 @@ class WeightChartWidget(QtWidgets.QWidget):
         if len(self.weight_data) < 3:
             return ("stable", 0, 0)
         
-        from datetime import datetime
-        
         # Simple linear regression
-        dates = []
-        weights = []
         first_date = self._parse_date(self.weight_data[0][0])
+        if not first_date:
+            return ("stable", 0, 0)
         
-        for date_str, weight, context in self.weight_data:
-            d = self._parse_date(date_str)
-            if d and first_date:
-                days = (d - first_date).days
-                dates.append(days)
-                weights.append(weight)
+        dates = [(d - first_date).days for d, _, _, _ in self._dated]
+        weights = [w for _, w, _, _ in self._dated]
         
         if len(dates) < 3:
             return ("stable", 0, 0)
@@ -7445,7 +7284,6 @@ class WeightChartWidget(QtWidgets.QWidget):
         sum_y = sum(weights)
         sum_xy = sum(x * y for x, y in zip(dates, weights))
         sum_x2 = sum(x * x for x in dates)
-        sum_y2 = sum(y * y for y in weights)
         
         # Slope (rate per day)
         denom = n * sum_x2 - sum_x ** 2
@@ -7479,11 +7317,30 @@ class WeightChartWidget(QtWidgets.QWidget):
         return (direction, rate_per_week, max(0, r_squared))
     
     def paintEvent(self, event) -> None:
-        """Paint the weight chart."""
-        from datetime import datetime, timedelta
+        """Paint the weight chart from the cached display list."""
+        if self._display_list is None:
+            self._display_list = self._build_display_list()
         
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        for method, *args in self._display_list:
+            getattr(painter, method)(*args)
+        
+        # Hover highlight is the only per-frame drawing
+        if self._layout and 0 <= self._hover_index < len(self._dated):
+            _, weight, _, _ = self._dated[self._hover_index]
+            x = self._layout["day_to_x"](self._days[self._hover_index])
+            y = self._layout["weight_to_y"](weight)
+            painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+            painter.setPen(QtGui.QPen(QtGui.QColor("#ffffff"), 2))
+            painter.drawEllipse(QtCore.QPointF(x, y), 8, 8)
+        painter.end()
+    
+    def _build_display_list(self) -> list:
+        """Lay out the chart for the current data and size as (QPainter method, *args) calls."""
+        from datetime import timedelta
+        
+        ops = []
         
         rect = self.rect()
         margin_left = 55
@@ -7497,19 +7354,19 @@ class WeightChartWidget(QtWidgets.QWidget):
         )
         
         # Background
-        painter.fillRect(rect, QtGui.QColor("#1a1a2e"))
+        ops.append(("fillRect", rect, QtGui.QColor("#1a1a2e")))
         
         # Draw border
-        painter.setPen(QtGui.QPen(QtGui.QColor("#4a4a6a"), 1))
-        painter.drawRect(chart_rect)
+        ops.append(("setPen", QtGui.QPen(QtGui.QColor("#4a4a6a"), 1)))
+        ops.append(("drawRect", chart_rect))
         
         if len(self.weight_data) < 2:
             # Not enough data
-            painter.setPen(QtGui.QColor("#888888"))
-            painter.setFont(QtGui.QFont("Segoe UI", 12))
-            painter.drawText(chart_rect, QtCore.Qt.AlignmentFlag.AlignCenter, 
-                           "Enter at least 2 weight entries\nto see your progress chart")
-            return
+            ops.append(("setPen", QtGui.QColor("#888888")))
+            ops.append(("setFont", QtGui.QFont("Segoe UI", 12)))
+            ops.append(("drawText", chart_rect, QtCore.Qt.AlignmentFlag.AlignCenter, 
+                        "Enter at least 2 weight entries\nto see your progress chart"))
+            return ops
         
         # Determine if we should use weekly binning
         use_weekly_bins = len(self.weight_data) >= self.WEEKLY_BIN_THRESHOLD
@@ -7519,7 +7376,7 @@ class WeightChartWidget(QtWidgets.QWidget):
         last_date = self._parse_date(self.weight_data[-1][0])
         
         if not first_date or not last_date:
-            return
+            return ops
         
         total_days = max(1, (last_date - first_date).days)
         
@@ -7542,20 +7399,30 @@ class WeightChartWidget(QtWidgets.QWidget):
         weight_range = max_weight - min_weight
         
         # Helper functions
+        def day_to_x(days_from_start):
+            return chart_rect.left() + (chart_rect.width() * days_from_start / total_days)
+        
         def date_to_x(date):
             if isinstance(date, str):
                 date = self._parse_date(date)
             if not date:
                 return chart_rect.left()
-            days_from_start = (date - first_date).days
-            return chart_rect.left() + (chart_rect.width() * days_from_start / total_days)
+            return day_to_x((date - first_date).days)
         
         def weight_to_y(weight):
             return chart_rect.top() + chart_rect.height() * (max_weight - weight) / weight_range
         
+        # Hover maps through the same coordinates (day offsets start at the first parseable entry)
+        day_shift = (self._dated[0][0] - first_date).days if self._dated else 0
+        self._layout = {
+            "day_to_x": lambda days: day_to_x(days + day_shift),
+            "x_to_day": lambda x: (x - chart_rect.left()) * total_days / max(1, chart_rect.width()) - day_shift,
+            "weight_to_y": weight_to_y,
+        }
+        
         # Draw trend indicator at top
         direction, rate, r_sq = self._calculate_trend()
-        painter.setFont(QtGui.QFont("Segoe UI", 10))
+        ops.append(("setFont", QtGui.QFont("Segoe UI", 10)))
         if direction == "down":
             trend_color = QtGui.QColor("#00ff88")
             trend_text = f"↓ Losing {abs(rate)*1000:.0f}g/week"
@@ -7571,86 +7438,91 @@ class WeightChartWidget(QtWidgets.QWidget):
         elif r_sq > 0.2:
             trend_text += f" (moderate trend)"
         
-        painter.setPen(trend_color)
-        painter.drawText(margin_left, 20, trend_text)
+        ops.append(("setPen", trend_color))
+        ops.append(("drawText", margin_left, 20, trend_text))
         
         # Draw grid lines and labels
-        painter.setPen(QtGui.QPen(QtGui.QColor("#333355"), 1, QtCore.Qt.PenStyle.DashLine))
+        grid_pen = QtGui.QPen(QtGui.QColor("#333355"), 1, QtCore.Qt.PenStyle.DashLine)
         num_lines = 5
+        grid_lines = []
+        for i in range(num_lines + 1):
+            y = int(chart_rect.top() + (chart_rect.height() * i / num_lines))
+            grid_lines.append(QtCore.QLineF(chart_rect.left(), y, chart_rect.right(), y))
+        ops.append(("setPen", grid_pen))
+        ops.append(("setBrush", QtCore.Qt.BrushStyle.NoBrush))
+        ops.append(("drawLines", grid_lines))
+        
+        # Weight labels
+        ops.append(("setPen", QtGui.QColor("#888888")))
+        ops.append(("setFont", QtGui.QFont("Segoe UI", 9)))
         for i in range(num_lines + 1):
             y = chart_rect.top() + (chart_rect.height() * i / num_lines)
-            painter.drawLine(chart_rect.left(), int(y), chart_rect.right(), int(y))
-            
-            # Weight label
             weight_val = max_weight - (weight_range * i / num_lines)
-            painter.setPen(QtGui.QColor("#888888"))
-            painter.setFont(QtGui.QFont("Segoe UI", 9))
-            label = f"{weight_val:.1f}"
-            painter.drawText(5, int(y) + 4, label)
-            painter.setPen(QtGui.QPen(QtGui.QColor("#333355"), 1, QtCore.Qt.PenStyle.DashLine))
+            ops.append(("drawText", 5, int(y) + 4, f"{weight_val:.1f}"))
         
         # Draw goal line if set
         if self.goal_weight and min_weight <= self.goal_weight <= max_weight:
             goal_y = weight_to_y(self.goal_weight)
-            painter.setPen(QtGui.QPen(QtGui.QColor("#00ff88"), 2, QtCore.Qt.PenStyle.DashLine))
-            painter.drawLine(chart_rect.left(), int(goal_y), chart_rect.right(), int(goal_y))
-            painter.setPen(QtGui.QColor("#00ff88"))
+            ops.append(("setPen", QtGui.QPen(QtGui.QColor("#00ff88"), 2, QtCore.Qt.PenStyle.DashLine)))
+            ops.append(("drawLine", chart_rect.left(), int(goal_y), chart_rect.right(), int(goal_y)))
+            ops.append(("setPen", QtGui.QColor("#00ff88")))
             goal_display = self.goal_weight * 2.20462 if self.unit == "lbs" else self.goal_weight
-            painter.drawText(chart_rect.right() - 60, int(goal_y) - 5, f"Goal: {goal_display:.1f}")
+            ops.append(("drawText", chart_rect.right() - 60, int(goal_y) - 5, f"Goal: {goal_display:.1f}"))
         
         if use_weekly_bins:
             # ===== WEEKLY BINNING MODE =====
             bins = self._calculate_weekly_bins()
             
             if len(bins) >= 2:
-                # Draw min/max band
-                band_path = QtGui.QPainterPath()
+                xs = [date_to_x(b["date"]) for b in bins]
+                max_points = max(2, chart_rect.width())
                 
+                # Draw min/max band (each edge downsampled on its own values)
                 # Top edge (max values)
-                first_bin = bins[0]
-                band_path.moveTo(date_to_x(first_bin["date"]), weight_to_y(first_bin["max"]))
-                for bin_data in bins:
-                    x = date_to_x(bin_data["date"])
-                    band_path.lineTo(x, weight_to_y(bin_data["max"]))
+                top = minmax_downsample(xs, [b["max"] for b in bins], max_points)
+                band = [QtCore.QPointF(xs[i], weight_to_y(bins[i]["max"])) for i in top]
                 
                 # Bottom edge (min values, reversed)
-                for bin_data in reversed(bins):
-                    x = date_to_x(bin_data["date"])
-                    band_path.lineTo(x, weight_to_y(bin_data["min"]))
+                bottom = minmax_downsample(xs, [b["min"] for b in bins], max_points)
+                band += [QtCore.QPointF(xs[i], weight_to_y(bins[i]["min"])) for i in reversed(bottom)]
                 
+                band_path = QtGui.QPainterPath()
+                band_path.addPolygon(QtGui.QPolygonF(band))
                 band_path.closeSubpath()
                 
                 # Fill band
-                painter.setBrush(QtGui.QColor(100, 150, 255, 40))
-                painter.setPen(QtCore.Qt.PenStyle.NoPen)
-                painter.drawPath(band_path)
+                ops.append(("setBrush", QtGui.QColor(100, 150, 255, 40)))
+                ops.append(("setPen", QtCore.Qt.PenStyle.NoPen))
+                ops.append(("drawPath", band_path))
                 
                 # Draw average line
-                painter.setPen(QtGui.QPen(QtGui.QColor("#6496ff"), 3))
-                for i in range(len(bins) - 1):
-                    x1 = date_to_x(bins[i]["date"])
-                    y1 = weight_to_y(bins[i]["avg"])
-                    x2 = date_to_x(bins[i + 1]["date"])
-                    y2 = weight_to_y(bins[i + 1]["avg"])
-                    painter.drawLine(QtCore.QPointF(x1, y1), QtCore.QPointF(x2, y2))
+                shown = minmax_downsample(xs, [b["avg"] for b in bins], max_points)
+                avg_line = QtGui.QPolygonF([QtCore.QPointF(xs[i], weight_to_y(bins[i]["avg"])) for i in shown])
+                ops.append(("setBrush", QtCore.Qt.BrushStyle.NoBrush))
+                ops.append(("setPen", QtGui.QPen(QtGui.QColor("#6496ff"), 3)))
+                ops.append(("drawPolyline", avg_line))
                 
-                # Draw weekly points with count indicator
-                for bin_data in bins:
-                    x = date_to_x(bin_data["date"])
-                    y = weight_to_y(bin_data["avg"])
-                    
+                # Draw weekly points with count indicator. Dots of one size are
+                # drawn as round pen points in one call: a white outline pass, then the fill.
+                dots_by_size = {}
+                for i in shown:
                     # Size based on entry count
-                    size = min(8, 4 + bin_data["count"])
-                    
-                    painter.setBrush(QtGui.QColor("#6496ff"))
-                    painter.setPen(QtGui.QPen(QtGui.QColor("#ffffff"), 1))
-                    painter.drawEllipse(QtCore.QPointF(x, y), size, size)
+                    size = min(8, 4 + bins[i]["count"])
+                    dots_by_size.setdefault(size, []).append(
+                        QtCore.QPointF(xs[i], weight_to_y(bins[i]["avg"])))
+                for size, centers in sorted(dots_by_size.items()):
+                    dots = QtGui.QPolygonF(centers)
+                    for color, diameter in (("#ffffff", 2 * size + 1), ("#6496ff", 2 * size - 1)):
+                        ops.append(("setPen", QtGui.QPen(
+                            QtGui.QColor(color), diameter, QtCore.Qt.PenStyle.SolidLine,
+                            QtCore.Qt.PenCapStyle.RoundCap)))
+                        ops.append(("drawPoints", dots))
                 
                 # Legend for binned mode
-                painter.setPen(QtGui.QColor("#888888"))
-                painter.setFont(QtGui.QFont("Segoe UI", 8))
-                painter.drawText(chart_rect.right() - 100, chart_rect.top() + 15, 
-                               f"Weekly avg (n={len(self.weight_data)})")
+                ops.append(("setPen", QtGui.QColor("#888888")))
+                ops.append(("setFont", QtGui.QFont("Segoe UI", 8)))
+                ops.append(("drawText", chart_rect.right() - 100, chart_rect.top() + 15, 
+                            f"Weekly avg (n={len(self.weight_data)})"))
         
         else:
             # ===== DAILY MODE =====
@@ -7658,11 +7530,7 @@ class WeightChartWidget(QtWidgets.QWidget):
             points = []
             prev_date = None
             
-            for date_str, weight, context in self.weight_data:
-                current_date = self._parse_date(date_str)
-                if not current_date:
-                    continue
-                
+            for current_date, weight, context, date_str in self._dated:
                 x = date_to_x(current_date)
                 y = weight_to_y(weight)
                 
@@ -7685,53 +7553,43 @@ class WeightChartWidget(QtWidgets.QWidget):
             
             if len(points) >= 2:
                 # Draw gradient fill under line
+                outline = [QtCore.QPointF(points[0]["x"], chart_rect.bottom())]
+                outline += [QtCore.QPointF(p["x"], p["y"]) for p in points]
+                outline.append(QtCore.QPointF(points[-1]["x"], chart_rect.bottom()))
                 path = QtGui.QPainterPath()
-                path.moveTo(points[0]["x"], chart_rect.bottom())
-                for p in points:
-                    path.lineTo(p["x"], p["y"])
-                path.lineTo(points[-1]["x"], chart_rect.bottom())
+                path.addPolygon(QtGui.QPolygonF(outline))
                 path.closeSubpath()
                 
                 gradient = QtGui.QLinearGradient(0, chart_rect.top(), 0, chart_rect.bottom())
                 gradient.setColorAt(0, QtGui.QColor(100, 150, 255, 100))
                 gradient.setColorAt(1, QtGui.QColor(100, 150, 255, 20))
-                painter.fillPath(path, gradient)
+                ops.append(("fillPath", path, QtGui.QBrush(gradient)))
                 
-                # Draw connecting lines (dashed for gaps)
-                for i in range(len(points) - 1):
-                    p1 = points[i]
-                    p2 = points[i + 1]
-                    
-                    if p2["gap_before"] > 1:
-                        # Dashed line for gaps > 1 day
-                        painter.setPen(QtGui.QPen(
-                            QtGui.QColor("#6496ff"), 2, 
-                            QtCore.Qt.PenStyle.DashLine
-                        ))
-                    else:
-                        # Solid line for consecutive/near-consecutive days
-                        painter.setPen(QtGui.QPen(QtGui.QColor("#6496ff"), 3))
-                    
-                    painter.drawLine(
-                        QtCore.QPointF(p1["x"], p1["y"]), 
-                        QtCore.QPointF(p2["x"], p2["y"])
-                    )
+                # Connecting lines: solid for consecutive days, dashed for gaps > 1 day
+                solid_lines = []
+                dashed_lines = []
+                for p1, p2 in zip(points, points[1:]):
+                    segments = dashed_lines if p2["gap_before"] > 1 else solid_lines
+                    segments.append(QtCore.QLineF(p1["x"], p1["y"], p2["x"], p2["y"]))
+                if solid_lines:
+                    ops.append(("setPen", QtGui.QPen(QtGui.QColor("#6496ff"), 3)))
+                    ops.append(("drawLines", solid_lines))
+                if dashed_lines:
+                    ops.append(("setPen", QtGui.QPen(QtGui.QColor("#6496ff"), 2, QtCore.Qt.PenStyle.DashLine)))
+                    ops.append(("drawLines", dashed_lines))
                 
                 # Draw 7-day moving average if enough data
                 ma_data = self._calculate_moving_average()
                 if len(ma_data) >= 2:
-                    painter.setPen(QtGui.QPen(QtGui.QColor("#ffaa00"), 2))
-                    for i in range(len(ma_data) - 1):
-                        x1 = date_to_x(ma_data[i][0])
-                        y1 = weight_to_y(ma_data[i][1])
-                        x2 = date_to_x(ma_data[i + 1][0])
-                        y2 = weight_to_y(ma_data[i + 1][1])
-                        painter.drawLine(QtCore.QPointF(x1, y1), QtCore.QPointF(x2, y2))
+                    ma_line = QtGui.QPolygonF([QtCore.QPointF(date_to_x(date_str), weight_to_y(avg))
+                                               for date_str, avg in ma_data])
+                    ops.append(("setPen", QtGui.QPen(QtGui.QColor("#ffaa00"), 2)))
+                    ops.append(("drawPolyline", ma_line))
                     
                     # MA legend
-                    painter.setPen(QtGui.QColor("#ffaa00"))
-                    painter.setFont(QtGui.QFont("Segoe UI", 8))
-                    painter.drawText(chart_rect.right() - 80, chart_rect.top() + 15, "7-day avg")
+                    ops.append(("setPen", QtGui.QColor("#ffaa00")))
+                    ops.append(("setFont", QtGui.QFont("Segoe UI", 8)))
+                    ops.append(("drawText", chart_rect.right() - 80, chart_rect.top() + 15, "7-day avg"))
             
             # Draw data points with context coloring
             # First, collect unique contexts for legend
@@ -7761,41 +7619,33 @@ class WeightChartWidget(QtWidgets.QWidget):
                 # Hollow point for gap interpolation indicator
                 if p["gap_before"] > 2:
                     # Draw gap indicator - small triangle pointing to gap
-                    painter.setPen(QtGui.QPen(QtGui.QColor("#888888"), 1))
-                    painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+                    ops.append(("setPen", QtGui.QPen(QtGui.QColor("#888888"), 1)))
+                    ops.append(("setBrush", QtCore.Qt.BrushStyle.NoBrush))
                 else:
-                    painter.setBrush(base_color)
-                    painter.setPen(QtGui.QPen(border_color, 2))
+                    ops.append(("setBrush", base_color))
+                    ops.append(("setPen", QtGui.QPen(border_color, 2)))
                 
-                painter.drawEllipse(QtCore.QPointF(p["x"], p["y"]), 5, 5)
+                ops.append(("drawEllipse", QtCore.QPointF(p["x"], p["y"]), 5, 5))
             
             # Draw context legend if multiple contexts exist
             if has_multiple_contexts:
                 legend_y = chart_rect.bottom() + 30
                 legend_x = chart_rect.left()
-                painter.setFont(QtGui.QFont("Segoe UI", 7))
+                ops.append(("setFont", QtGui.QFont("Segoe UI", 7)))
                 
                 for ctx in sorted(unique_contexts):
                     color = QtGui.QColor(self.CONTEXT_COLORS.get(ctx, self.CONTEXT_COLORS[""]))
-                    painter.setBrush(color)
-                    painter.setPen(QtGui.QPen(QtGui.QColor("#ffffff"), 1))
-                    painter.drawEllipse(QtCore.QPointF(legend_x + 5, legend_y), 4, 4)
+                    ops.append(("setBrush", color))
+                    ops.append(("setPen", QtGui.QPen(QtGui.QColor("#ffffff"), 1)))
+                    ops.append(("drawEllipse", QtCore.QPointF(legend_x + 5, legend_y), 4, 4))
                     
-                    # Get display name for context
-                    if ctx and format_entry_note:
-                        ctx_label = format_entry_note(ctx)
-                    elif ctx:
-                        ctx_label = ctx.replace("_", " ").title()
-                    else:
-                        ctx_label = "No context"
-                    
-                    painter.setPen(QtGui.QColor("#aaaaaa"))
-                    painter.drawText(int(legend_x) + 12, int(legend_y) + 4, ctx_label)
+                    ops.append(("setPen", QtGui.QColor("#aaaaaa")))
+                    ops.append(("drawText", int(legend_x) + 12, int(legend_y) + 4, self._context_label(ctx)))
                     legend_x += 70
         
         # Draw date labels (smart distribution)
-        painter.setPen(QtGui.QColor("#888888"))
-        painter.setFont(QtGui.QFont("Segoe UI", 8))
+        ops.append(("setPen", QtGui.QColor("#888888")))
+        ops.append(("setFont", QtGui.QFont("Segoe UI", 8)))
         
         if total_days <= 14:
             # Show more dates for short ranges
@@ -7804,19 +7654,68 @@ class WeightChartWidget(QtWidgets.QWidget):
             date_step = 7  # Weekly
         else:
             date_step = 14  # Bi-weekly
+        # Long histories: keep labels from overlapping
+        if chart_rect.width() > 0:
+            min_step = math.ceil(self.DATE_LABEL_SPACING * total_days / chart_rect.width())
+            date_step = max(date_step, min_step)
         
         current_date = first_date
         while current_date <= last_date:
             x = date_to_x(current_date)
             date_label = current_date.strftime("%m/%d")
-            painter.drawText(int(x) - 15, chart_rect.bottom() + 15, date_label)
+            ops.append(("drawText", int(x) - 15, chart_rect.bottom() + 15, date_label))
             current_date += timedelta(days=date_step)
         
         # Always show last date if not too close to previous
         last_x = date_to_x(last_date)
         if last_x - date_to_x(current_date - timedelta(days=date_step)) > 30:
-            painter.drawText(int(last_x) - 15, chart_rect.bottom() + 15, 
-                           last_date.strftime("%m/%d"))
+            ops.append(("drawText", int(last_x) - 15, chart_rect.bottom() + 15, 
+                        last_date.strftime("%m/%d")))
+        
+        return ops
+    
+    @staticmethod
+    def _context_label(ctx: str) -> str:
+        """Display name for an entry context."""
+        if ctx and format_entry_note:
+            return format_entry_note(ctx)
+        if ctx:
+            return ctx.replace("_", " ").title()
+        return "No context"
+    
+    # === Hover ===
+    
+    def entry_at(self, x: float) -> int:
+        """Index into the dated entries nearest to widget x, or -1 if none is close."""
+        if self._layout is None or not self._days:
+            return -1
+        index = nearest_index(self._days, self._layout["x_to_day"](x))
+        if abs(self._layout["day_to_x"](self._days[index]) - x) > self.HOVER_RADIUS:
+            return -1
+        return index
+    
+    def mouseMoveEvent(self, event) -> None:
+        pos = event.position()
+        index = self.entry_at(pos.x())
+        if index != self._hover_index:
+            self._hover_index = index
+            self.update()
+            if index < 0:
+                QtWidgets.QToolTip.hideText()
+            else:
+                d, weight, context, _ = self._dated[index]
+                shown = weight * 2.20462 if self.unit == "lbs" else weight
+                text = f"{d.strftime('%Y-%m-%d')}: {shown:.1f} {self.unit}"
+                if context:
+                    text += f"\n{self._context_label(context)}"
+                QtWidgets.QToolTip.showText(event.globalPosition().toPoint(), text, self)
+        super().mouseMoveEvent(event)
+    
+    def leaveEvent(self, event) -> None:
+        if self._hover_index != -1:
+            self._hover_index = -1
+            self.update()
+        super().leaveEvent(event)
 
 
 class WeightTab(QtWidgets.QWidget):
@@ -8330,6 +8229,7 @@ class WeightTab(QtWidgets.QWidget):
             # Prune to last 365 entries to prevent unbounded growth
             if len(self.blocker.weight_entries) > 365:
                 self.blocker.weight_entries = self.blocker.weight_entries[-365:]
+            _publish_game_event(WEIGHT_LOGGED)
         
         self.blocker.save_config()
         
@@ -9869,6 +9769,7 @@ class ActivityTab(QtWidgets.QWidget):
         # rather than merging them. So we simply append the new entry.
         self.blocker.activity_entries.append(new_entry)
         self.blocker.activity_entries.sort(key=lambda x: x.get("date", ""), reverse=True)
+        _publish_game_event(ACTIVITY_LOGGED)
         
         self.blocker.save_config()
         
@@ -11325,6 +11226,7 @@ class SleepTab(QtWidgets.QWidget):
             # Prune to last 365 entries to prevent unbounded growth
             if len(self.blocker.sleep_entries) > 365:
                 self.blocker.sleep_entries = self.blocker.sleep_entries[:365]
+            _publish_game_event(SLEEP_LOGGED)
         
         # Track screen-off bonus outside the reward block
         screenoff_bonus_item = None
@@ -11695,16 +11597,25 @@ class AITab(QtWidgets.QWidget):
         super().__init__(parent)
         self.blocker = blocker
         # Initialize AI/gamification components
-        self.analyzer = ProductivityAnalyzer(blocker.stats_path) if ProductivityAnalyzer else None
-        self.gamification = GamificationEngine(blocker.stats_path) if GamificationEngine else None
+        self.analyzer = None
+        self._attach_analyzer(blocker)
+        self.gamification = GamificationEngine(blocker.stats_path, stats=blocker.stats) if GamificationEngine else None
         self.focus_goals = FocusGoals(blocker.goals_path, blocker.stats_path) if FocusGoals else None
         self._build_ui()
 
+    def _attach_analyzer(self, blocker: BlockerCore) -> None:
+        """Build the analyzer over the blocker's in-memory stats and keep it updated."""
+        if self.analyzer is not None:
+            self.blocker.remove_stats_listener(self.analyzer.on_stats_changed)
+        self.analyzer = ProductivityAnalyzer(blocker.stats_path, stats=blocker.stats) if ProductivityAnalyzer else None
+        if self.analyzer is not None:
+            blocker.add_stats_listener(self.analyzer.on_stats_changed)
+
     def reload_components(self, blocker: BlockerCore) -> None:
         """Reload AI components with new blocker paths (used when switching users)."""
+        self._attach_analyzer(blocker)
         self.blocker = blocker
-        self.analyzer = ProductivityAnalyzer(blocker.stats_path) if ProductivityAnalyzer else None
-        self.gamification = GamificationEngine(blocker.stats_path) if GamificationEngine else None
+        self.gamification = GamificationEngine(blocker.stats_path, stats=blocker.stats) if GamificationEngine else None
         self.focus_goals = FocusGoals(blocker.goals_path, blocker.stats_path) if FocusGoals else None
         # Clear cached insights
         if hasattr(self, 'insights_text'):
@@ -11822,6 +11733,8 @@ class AITab(QtWidgets.QWidget):
         self.unlocked_achievements_list.clear()
         
         if self.gamification:
+            # Stats may have been replaced (reset/import) since the engine was built
+            self.gamification.use_stats(self.blocker.stats)
             progress = self.gamification.check_achievements()
             achievements_def = self.gamification.get_achievements()
             
@@ -16348,6 +16261,7 @@ class HydrationTab(QtWidgets.QWidget):
             # Prune to last 2000 entries (~1 year at 5 glasses/day)
             if len(self.blocker.water_entries) > 2000:
                 self.blocker.water_entries = self.blocker.water_entries[-2000:]
+            _publish_game_event(WATER_LOGGED)
             
             # Emit water changed signal for timeline update
             main_window = self.window()
@@ -16374,20 +16288,17 @@ class HydrationTab(QtWidgets.QWidget):
                     if GAMIFICATION_AVAILABLE:
                         sync_hero_data(self.blocker.adhd_buster)
                     
-                    # Show ItemRewardDialog with comparison and proper auto-equip tracking
-                    from styled_dialog import ItemRewardDialog
-                    dialog = ItemRewardDialog(
-                        parent=self,
-                        title="💧 Hydration Reward!",
-                        header_emoji="💧",
-                        source_label=f"Glass #{glass_number} Lottery Win!",
-                        items_earned=[item],
-                        equipped=equipped_before,
-                        equipped_after=equipped_after,
-                        auto_equipped_slots=auto_equipped_slots,
-                        game_state=game_state
-                    )
-                    dialog.exec()
+                    # Queue the item card with comparison and proper auto-equip tracking
+                    # (a streak bonus below joins the same card)
+                    reward_queue().push(RewardEvent(ITEM_DROP, {
+                        "title": "💧 Hydration Reward!",
+                        "header_emoji": "💧",
+                        "source_label": f"Glass #{glass_number} Lottery Win!",
+                        "items": [item],
+                        "equipped": equipped_before,
+                        "equipped_after": equipped_after,
+                        "auto_equipped_slots": auto_equipped_slots,
+                    }))
             
             # Check streak bonus (when completing 5 glasses)
             if glass_number >= 5:
@@ -16411,20 +16322,16 @@ class HydrationTab(QtWidgets.QWidget):
                             equipped_after = game_state.adhd_buster.get("equipped", {})
                             auto_equipped_slots = [i.get("slot") for i in award_result.get("equipped", []) if i.get("slot")]
                             
-                            # Show ItemRewardDialog with comparison
-                            from styled_dialog import ItemRewardDialog
-                            dialog = ItemRewardDialog(
-                                parent=self,
-                                title="💧 Hydration Streak Bonus!",
-                                header_emoji="💧",
-                                source_label=f"🔥 {streak_days + 1}-day Hydration Streak!",
-                                items_earned=[streak_item],
-                                equipped=equipped_before,
-                                equipped_after=equipped_after,
-                                auto_equipped_slots=auto_equipped_slots,
-                                game_state=game_state
-                            )
-                            dialog.exec()
+                            # Queue the item card with comparison
+                            reward_queue().push(RewardEvent(ITEM_DROP, {
+                                "title": "💧 Hydration Streak Bonus!",
+                                "header_emoji": "💧",
+                                "source_label": f"🔥 {streak_days + 1}-day Hydration Streak!",
+                                "items": [streak_item],
+                                "equipped": equipped_before,
+                                "equipped_after": equipped_after,
+                                "auto_equipped_slots": auto_equipped_slots,
+                            }))
             
             self.blocker.save_config()
             
@@ -16464,6 +16371,7 @@ class HydrationTab(QtWidgets.QWidget):
             # Prune to last 2000 entries (~1 year at 5 glasses/day)
             if len(self.blocker.water_entries) > 2000:
                 self.blocker.water_entries = self.blocker.water_entries[-2000:]
+            _publish_game_event(WATER_LOGGED)
             self.blocker.save_config()
             show_info(self, "Water Logged! 💧", f"💧 Glass #{glass_number} logged!")
         
@@ -17399,6 +17307,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
             self._game_state.set_bonus_changed.connect(self._on_set_bonus_changed)
             self._game_state.story_changed.connect(self._on_story_changed)
         
+        install_app_stylesheet()  # Role rules for the refreshed widgets below
         self._build_ui()
         self.refresh_all()  # Initial data load
     
@@ -17485,6 +17394,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
         """Handle story change - full refresh needed for theme."""
         self.refresh_all()
 
+    @timed("ADHDBusterTab.refresh_all")
     def refresh_all(self) -> None:
         """Comprehensive refresh of all UI elements - call after any data change."""
         if self._refreshing:
@@ -17733,17 +17643,13 @@ class ADHDBusterTab(QtWidgets.QWidget):
                     if current_id and item_id and current_id == item_id:
                         combo.setCurrentIndex(i)
                         # Apply color to the combo box text for selected item
-                        curr_rarity = current.get("rarity", "Common")
-                        curr_color = rarity_colors.get(curr_rarity, "#9e9e9e")
-                        combo.setStyleSheet(f"QComboBox {{ color: {curr_color}; font-weight: bold; }}")
+                        set_style_state(combo, "heroSlotCombo", rarity=current.get("rarity", "Common"))
                         break
                     elif not current_id and not item_id:
                         # Fallback: match by timestamp + slot
                         if item_data.get("obtained_at") == current_ts and item_data.get("slot") == current_slot:
                             combo.setCurrentIndex(i)
-                            curr_rarity = current.get("rarity", "Common")
-                            curr_color = rarity_colors.get(curr_rarity, "#9e9e9e")
-                            combo.setStyleSheet(f"QComboBox {{ color: {curr_color}; font-weight: bold; }}")
+                            set_style_state(combo, "heroSlotCombo", rarity=current.get("rarity", "Common"))
                             break
             combo.currentIndexChanged.connect(lambda idx, s=slot, c=combo: self._on_equip_change(s, c))
             self.slot_combos[slot] = combo
@@ -18006,7 +17912,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
         merge_group = QtWidgets.QGroupBox("🎲 Lucky Merge")
         merge_layout = QtWidgets.QHBoxLayout(merge_group)
         self.merge_warn_lbl = QtWidgets.QLabel("⚠️ 25% base success (items lost on fail!) • Cost: 50🪙")
-        self.merge_warn_lbl.setStyleSheet("color: #d32f2f; font-size: 10px;")
+        self.merge_warn_lbl.setObjectName("mergeCostLabel")
         merge_layout.addWidget(self.merge_warn_lbl)
         self.merge_btn = QtWidgets.QPushButton("🎲 Merge Selected (0)")
         self.merge_btn.setEnabled(False)
@@ -18072,15 +17978,6 @@ class ADHDBusterTab(QtWidgets.QWidget):
         """Handle equipment slot change - use GameState for reactive updates."""
         idx = combo.currentIndex()
         
-        # Rarity colors for combo styling
-        rarity_colors = {
-            "Common": "#9e9e9e",
-            "Uncommon": "#4caf50",
-            "Rare": "#2196f3",
-            "Epic": "#9c27b0",
-            "Legendary": "#ff9800"
-        }
-        
         # Prepare item data
         new_item = None
         if idx > 0:
@@ -18091,12 +17988,9 @@ class ADHDBusterTab(QtWidgets.QWidget):
                 if "lucky_options" in item and isinstance(item["lucky_options"], dict):
                     new_item["lucky_options"] = item["lucky_options"].copy()
                 # Update combo color immediately for equipped item
-                item_rarity = item.get("rarity", "Common")
-                item_color = rarity_colors.get(item_rarity, "#9e9e9e")
-                combo.setStyleSheet(f"QComboBox {{ color: {item_color}; font-weight: bold; }}")
+                set_style_state(combo, "heroSlotCombo", rarity=item.get("rarity", "Common"))
         else:
-            # Empty selected - reset to white
-            combo.setStyleSheet("QComboBox { color: #ffffff; }")
+            set_style_state(combo, "heroSlotCombo", rarity="")  # White for empty slot
         
         # Use GameState manager for reactive updates
         if not self._game_state:
@@ -18130,7 +18024,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
                 # Main set bonus line
                 lbl = QtWidgets.QLabel(f"{s['emoji']} {s['name']} ({s['count']} items): <b>+{s['bonus']} power</b>")
                 lbl.setTextFormat(QtCore.Qt.RichText)
-                lbl.setStyleSheet("color: #4caf50; font-size: 11px; padding: 2px 0;")
+                lbl.setObjectName("heroSetBonus")
                 self.sets_section.add_widget(lbl)
                 
                 # Show which items belong to this set
@@ -18149,7 +18043,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
                     if item_names:
                         items_str = ", ".join(item_names)
                         items_lbl = QtWidgets.QLabel(f"    └ {items_str}")
-                        items_lbl.setStyleSheet("color: #888; font-size: 10px; padding-left: 15px;")
+                        items_lbl.setObjectName("heroSetItems")
                         self.sets_section.add_widget(items_lbl)
             
             # Update title with count
@@ -18196,32 +18090,8 @@ class ADHDBusterTab(QtWidgets.QWidget):
                 is_exceptional = entity_data.get("is_exceptional", False)
                 
                 # Style cards - exceptional gets slightly lighter border
-                if is_exceptional:
-                    card.setStyleSheet("""
-                        QFrame {
-                            background-color: #2a2a2a;
-                            border: 1px solid #555;
-                            border-radius: 6px;
-                            padding: 4px;
-                        }
-                        QFrame:hover {
-                            border-color: #666;
-                            background-color: #333;
-                        }
-                    """)
-                else:
-                    card.setStyleSheet("""
-                        QFrame {
-                            background-color: #2a2a2a;
-                            border: 1px solid #444;
-                            border-radius: 6px;
-                            padding: 4px;
-                        }
-                        QFrame:hover {
-                            border-color: #e65100;
-                            background-color: #333;
-                        }
-                    """)
+                card.setObjectName("heroPatronCard")
+                card.setProperty("exceptional", is_exceptional)
                 
                 card_layout = QtWidgets.QVBoxLayout(card)
                 card_layout.setContentsMargins(8, 6, 8, 6)
@@ -18264,15 +18134,11 @@ class ADHDBusterTab(QtWidgets.QWidget):
                 else:
                     display_name = name
                 
-                if is_exceptional:
-                    name_style = "color: #ffd700; font-weight: bold; font-size: 10px;"
-                    prefix = "⭐ " if not icon_loaded else ""
-                else:
-                    name_style = "color: #ccc; font-size: 10px;"
-                    prefix = ""
+                prefix = "⭐ " if is_exceptional and not icon_loaded else ""
                 
                 name_lbl = QtWidgets.QLabel(f"{prefix}{display_name}")
-                name_lbl.setStyleSheet(name_style)
+                name_lbl.setObjectName("heroPatronName")
+                name_lbl.setProperty("exceptional", is_exceptional)
                 name_lbl.setAlignment(QtCore.Qt.AlignCenter)
                 name_lbl.setToolTip(f"{name}\n{entity_data.get('description', '')}")
                 name_lbl.setWordWrap(True)
@@ -18281,7 +18147,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
                 # Power value
                 power_val = entity_data.get("power", 0)
                 power_lbl = QtWidgets.QLabel(f"<b>+{power_val}</b> ⚔")
-                power_lbl.setStyleSheet("color: #e65100; font-size: 12px;")
+                power_lbl.setObjectName("heroPatronPower")
                 power_lbl.setAlignment(QtCore.Qt.AlignCenter)
                 card_layout.addWidget(power_lbl)
                 
@@ -18292,7 +18158,8 @@ class ADHDBusterTab(QtWidgets.QWidget):
             
             # Add a tip
             tip_lbl = QtWidgets.QLabel("💡 Collect more Warrior entities in Entitidex to boost your hero's power!")
-            tip_lbl.setStyleSheet("color: #888; font-style: italic; font-size: 10px; padding-top: 4px;")
+            tip_lbl.setObjectName("heroTip")
+            tip_lbl.setProperty("spaced", True)
             self.entity_patrons_section.add_widget(tip_lbl)
         else:
             self.entity_patrons_section.setVisible(False)
@@ -18385,16 +18252,16 @@ class ADHDBusterTab(QtWidgets.QWidget):
             bonus_items = []
             
             if lucky_bonuses.get("xp_bonus", 0) > 0:
-                bonus_items.append(("⭐", f"+{lucky_bonuses['xp_bonus']}% XP", "#8b5cf6", "Level faster"))
+                bonus_items.append(("⭐", f"+{lucky_bonuses['xp_bonus']}% XP", "Level faster"))
             
             self.lucky_bonuses_section.setVisible(True)
             self.lucky_bonuses_section.set_title(f"✨ Gear Bonuses ({len(bonus_items)})")
             
             # Compact list with colored items
-            for icon, title, color, tooltip in bonus_items:
+            for icon, title, tooltip in bonus_items:
                 lbl = QtWidgets.QLabel(f"<b>{icon} {title}</b> <span style='color:#888;'>— {tooltip}</span>")
                 lbl.setTextFormat(QtCore.Qt.RichText)
-                lbl.setStyleSheet(f"color: {color}; font-size: 11px; padding: 2px 0;")
+                lbl.setObjectName("heroGearBonus")
                 self.lucky_bonuses_section.add_widget(lbl)
             
             # Compact summary
@@ -18405,7 +18272,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
             if summary_parts:
                 summary_lbl = QtWidgets.QLabel(f"📊 <b>Overall:</b> {' | '.join(summary_parts)}")
                 summary_lbl.setTextFormat(QtCore.Qt.RichText)
-                summary_lbl.setStyleSheet("color: #a78bfa; font-size: 11px; padding: 4px; background: rgba(139,92,246,0.1); border-radius: 4px;")
+                summary_lbl.setObjectName("heroGearBonusSummary")
                 self.lucky_bonuses_section.add_widget(summary_lbl)
         else:
             self.lucky_bonuses_section.setVisible(False)
@@ -18442,7 +18309,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
                         f"{s['inventory_count']} in bag → could be <b>+{s['potential_bonus']} power</b>"
                     )
                     lbl.setTextFormat(QtCore.Qt.RichText)
-                    lbl.setStyleSheet("color: #ff9800; font-size: 11px; padding: 2px 0;")
+                    lbl.setProperty("partial", True)
                 else:
                     # No items equipped yet
                     lbl = QtWidgets.QLabel(
@@ -18450,12 +18317,12 @@ class ADHDBusterTab(QtWidgets.QWidget):
                         f"could be <b>+{s['potential_bonus']} power</b> (need {s['max_equippable']} equipped)"
                     )
                     lbl.setTextFormat(QtCore.Qt.RichText)
-                    lbl.setStyleSheet("color: #2196f3; font-size: 11px; padding: 2px 0;")
                 
+                lbl.setObjectName("heroPotentialSet")
                 self.potential_sets_section.add_widget(lbl)
             
             tip_lbl = QtWidgets.QLabel("💡 Use 'Optimize Gear' to automatically equip the best items!")
-            tip_lbl.setStyleSheet("color: #888; font-style: italic; font-size: 10px;")
+            tip_lbl.setObjectName("heroTip")
             self.potential_sets_section.add_widget(tip_lbl)
         else:
             self.potential_sets_section.setVisible(False)
@@ -18636,15 +18503,13 @@ class ADHDBusterTab(QtWidgets.QWidget):
                     self.blocker.adhd_buster["equipped"] = equipped
                     self.blocker.save_config()
                     combo.setCurrentIndex(0)
-                    combo.setStyleSheet("QComboBox { color: #ffffff; }")
+                    set_style_state(combo, "heroSlotCombo", rarity="")
                 else:
                     # Apply color to the combo box text for selected item
-                    item_rarity = current.get("rarity", "Common")
-                    item_color = rarity_colors.get(item_rarity, "#9e9e9e")
-                    combo.setStyleSheet(f"QComboBox {{ color: {item_color}; font-weight: bold; }}")
+                    set_style_state(combo, "heroSlotCombo", rarity=current.get("rarity", "Common"))
             else:
                 combo.setCurrentIndex(0)
-                combo.setStyleSheet("QComboBox { color: #ffffff; }")  # White for empty slot
+                set_style_state(combo, "heroSlotCombo", rarity="")  # White for empty slot
             
             combo.blockSignals(False)
     
@@ -18726,14 +18591,12 @@ class ADHDBusterTab(QtWidgets.QWidget):
                 self.blocker.adhd_buster["equipped"] = equipped
                 self.blocker.save_config()
                 combo.setCurrentIndex(0)
-                combo.setStyleSheet("QComboBox { color: #ffffff; }")
+                set_style_state(combo, "heroSlotCombo", rarity="")
             else:
-                item_rarity = current.get("rarity", "Common")
-                item_color = rarity_colors.get(item_rarity, "#9e9e9e")
-                combo.setStyleSheet(f"QComboBox {{ color: {item_color}; font-weight: bold; }}")
+                set_style_state(combo, "heroSlotCombo", rarity=current.get("rarity", "Common"))
         else:
             combo.setCurrentIndex(0)
-            combo.setStyleSheet("QComboBox { color: #ffffff; }")  # White for empty slot
+            set_style_state(combo, "heroSlotCombo", rarity="")  # White for empty slot
         
         combo.blockSignals(False)
 
@@ -19190,10 +19053,10 @@ class ADHDBusterTab(QtWidgets.QWidget):
                 if discounted_cost < base_cost:
                     discount_info = f" (Base: {base_cost}🪙)"
                     self.merge_warn_lbl.setText(f"⚠️ 25% base success (items lost on fail!) • Cost: {discounted_cost}🪙{discount_info}")
-                    self.merge_warn_lbl.setStyleSheet("color: #4caf50; font-size: 10px;")  # Green for discount
+                    set_style_state(self.merge_warn_lbl, "mergeCostLabel", discounted=True)  # Green for discount
                 else:
                     self.merge_warn_lbl.setText(f"⚠️ 25% base success (items lost on fail!) • Cost: {discounted_cost}🪙")
-                    self.merge_warn_lbl.setStyleSheet("color: #d32f2f; font-size: 10px;")  # Red for regular
+                    set_style_state(self.merge_warn_lbl, "mergeCostLabel", discounted=False)  # Red for regular
                 
                 # Check if player can afford the merge
                 if current_coins < discounted_cost:
@@ -19244,7 +19107,7 @@ class ADHDBusterTab(QtWidgets.QWidget):
             self.merge_rate_lbl.setText("Select 2+ items to merge")
             # Reset cost label to base cost when no items selected
             self.merge_warn_lbl.setText("⚠️ 25% base success (items lost on fail!) • Cost: 50🪙")
-            self.merge_warn_lbl.setStyleSheet("color: #d32f2f; font-size: 10px;")
+            set_style_state(self.merge_warn_lbl, "mergeCostLabel", discounted=False)
 
     def _do_merge(self) -> None:
         if len(self.merge_selected) < 2:
@@ -21466,512 +21329,6 @@ class AISessionCompleteDialog(StyledDialog):
 # Daily Timeline Widgets
 # ============================================================================
 
-class WaterRingWidget(QtWidgets.QWidget):
-    """Circular progress bar for daily hydration goal."""
-    clicked = QtCore.Signal()
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.percentage = 0.0
-        self.current = 0
-        self.goal = 5
-        self.setMinimumSize(60, 60)
-        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-
-    def set_progress(self, current: int, goal: int = 5):
-        """Set water progress (glasses consumed / goal)."""
-        goal = max(1, goal)  # Avoid division by zero
-        self.percentage = min(current / goal, 1.0)
-        self.current = current
-        self.goal = goal
-        self.repaint()  # Force immediate repaint
-
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        
-        rect = self.rect().adjusted(5, 5, -5, -5)
-        
-        # Background Track
-        pen = QtGui.QPen(QtGui.QColor("#1a3a5c"), 6)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        painter.setPen(pen)
-        painter.drawEllipse(rect)
-        
-        # Progress Arc (cyan/blue for water)
-        pen.setColor(QtGui.QColor("#4fc3f7"))
-        painter.setPen(pen)
-        
-        start_angle = 90 * 16
-        span_angle = -int(self.percentage * 360 * 16)
-        painter.drawArc(rect, start_angle, span_angle)
-        
-        # Main text: glasses count with emoji
-        painter.setPen(QtGui.QColor("#ffffff"))
-        font = painter.font()
-        font.setPixelSize(14)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        main_rect = QtCore.QRectF(rect)
-        painter.drawText(main_rect, QtCore.Qt.AlignmentFlag.AlignCenter, f"💧{self.current}")
-        
-        # Subtext: "of 8" label
-        font.setPixelSize(10)
-        font.setBold(False)
-        painter.setFont(font)
-        sub_rect = QtCore.QRectF(rect.adjusted(0, 20, 0, 0))
-        painter.setPen(QtGui.QColor("#4fc3f7"))
-        painter.drawText(sub_rect, QtCore.Qt.AlignmentFlag.AlignCenter, f"of {self.goal}")
-
-    def mousePressEvent(self, event):
-        if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-
-
-class ChapterRingWidget(QtWidgets.QWidget):
-    """Circular progress bar for story chapter progress (power-based)."""
-    clicked = QtCore.Signal()
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.percentage = 0.0
-        self.unlocked = 0
-        self.total = 7
-        self.is_complete = False
-        self.setMinimumSize(60, 60)
-        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-
-    def set_progress(self, unlocked_chapters: int, progress_pct: float, total_chapters: int = 7, is_complete: bool = False):
-        """Set chapter progress.
-        
-        Args:
-            unlocked_chapters: Number of chapters currently unlocked
-            progress_pct: Progress percentage toward next chapter (0-100)
-            total_chapters: Total chapters in story
-            is_complete: Whether all chapters are unlocked
-        """
-        self.percentage = min(max(progress_pct / 100.0, 0.0), 1.0)
-        self.unlocked = unlocked_chapters
-        self.total = total_chapters
-        self.is_complete = is_complete
-        self.repaint()  # Force immediate repaint
-
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        
-        rect = self.rect().adjusted(5, 5, -5, -5)
-        
-        # Background Track
-        pen = QtGui.QPen(QtGui.QColor("#2a3a2a"), 6)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        painter.setPen(pen)
-        painter.drawEllipse(rect)
-        
-        # Progress Arc (green for story progress, gold if complete)
-        arc_color = "#ffd700" if self.is_complete else "#8bc34a"
-        pen.setColor(QtGui.QColor(arc_color))
-        painter.setPen(pen)
-        
-        start_angle = 90 * 16
-        span_angle = -int(self.percentage * 360 * 16)
-        painter.drawArc(rect, start_angle, span_angle)
-        
-        # Main text: "📖 X/Y" chapters
-        painter.setPen(QtGui.QColor("#ffffff"))
-        font = painter.font()
-        font.setPixelSize(13)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        main_rect = QtCore.QRectF(rect)
-        painter.drawText(main_rect, QtCore.Qt.AlignmentFlag.AlignCenter, f"📖{self.unlocked}/{self.total}")
-        
-        # Subtext: progress percentage or "Done!"
-        font.setPixelSize(10)
-        font.setBold(False)
-        painter.setFont(font)
-        sub_rect = QtCore.QRectF(rect.adjusted(0, 20, 0, 0))
-        painter.setPen(QtGui.QColor(arc_color))
-        
-        if self.is_complete:
-            painter.drawText(sub_rect, QtCore.Qt.AlignmentFlag.AlignCenter, "✨Done")
-        else:
-            pct = int(self.percentage * 100)
-            painter.drawText(sub_rect, QtCore.Qt.AlignmentFlag.AlignCenter, f"{pct}%")
-
-    def mousePressEvent(self, event):
-        if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-
-
-class EyeRingWidget(QtWidgets.QWidget):
-    """Circular progress bar for daily eye routines."""
-    clicked = QtCore.Signal()
-    
-    # Vision progression: blind animals → sharp-eyed predators
-    EYE_CATEGORIES = [
-        (0, "🦔 Mole", "#ff6b6b"),       # 0 routines - nearly blind
-        (1, "🦇 Bat", "#ff8c42"),        # 1 routine - uses echolocation
-        (3, "🐁 Mouse", "#ffa726"),      # 3+ routines - poor vision
-        (5, "🐶 Pup", "#ffca28"),        # 5+ routines - decent
-        (8, "🐱 Cat", "#9ccc65"),        # 8+ routines - good night vision
-        (12, "🦉 Owl", "#66bb6a"),       # 12+ routines - excellent
-        (16, "🦅 Eagle", "#26c6da"),     # 16+ routines - 8x human vision
-        (20, "🦅 Hawk", "#ab47bc"),      # 20+ routines - the best!
-    ]
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.percentage = 0.0
-        self.text = "0"
-        self.subtext = "👀 Screen Zombie"
-        self.ring_color = "#00bcd4"  # Cyan for eye theme
-        self.setMinimumSize(60, 60)
-        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-        self.setToolTip("Eyes Routine\nClick to open Eyes tab")
-
-    def set_progress(self, current: int, daily_cap: int):
-        """Set eye routine progress."""
-        daily_cap = max(1, daily_cap)  # Avoid division by zero
-        self.percentage = min(current / daily_cap, 1.0)
-        self.text = f"👁️{current}"
-        
-        # Find appropriate category
-        category_text = self.EYE_CATEGORIES[0][1]
-        self.ring_color = self.EYE_CATEGORIES[0][2]
-        
-        for threshold, label, color in self.EYE_CATEGORIES:
-            if current >= threshold:
-                category_text = label
-                self.ring_color = color
-        
-        self.subtext = category_text
-        self.repaint()  # Force immediate repaint
-
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        
-        # Adjust rect to ensure stroke doesn't clip
-        rect = self.rect().adjusted(5, 5, -5, -5)
-        
-        # Draw Background Track
-        pen = QtGui.QPen(QtGui.QColor("#2a2a4a"), 6)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        painter.setPen(pen)
-        painter.drawEllipse(rect)
-        
-        # Draw Progress Arc (dynamic color based on category)
-        pen.setColor(QtGui.QColor(self.ring_color))
-        painter.setPen(pen)
-        
-        start_angle = 90 * 16
-        span_angle = -int(self.percentage * 360 * 16)
-        painter.drawArc(rect, start_angle, span_angle)
-        
-        # Draw count text
-        painter.setPen(QtGui.QColor("#ffffff"))
-        font = painter.font()
-        font.setPixelSize(12)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        text_rect = QtCore.QRectF(rect)
-        painter.drawText(text_rect, QtCore.Qt.AlignmentFlag.AlignCenter, self.text)
-        
-        # Draw category subtext below
-        font.setPixelSize(8)
-        font.setBold(False)
-        painter.setFont(font)
-        sub_rect = QtCore.QRectF(rect.adjusted(-5, 22, 5, 0))
-        painter.setPen(QtGui.QColor(self.ring_color))
-        
-        # Truncate long labels
-        subtext = self.subtext
-        if len(subtext) > 14:
-            subtext = subtext[:12] + "…"
-        painter.drawText(sub_rect, QtCore.Qt.AlignmentFlag.AlignCenter, subtext)
-
-    def mousePressEvent(self, event):
-        if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-
-
-class XPRingWidget(QtWidgets.QWidget):
-    """Circular progress bar for XP to next level."""
-    clicked = QtCore.Signal()
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.percentage = 0.0
-        self.text = "Lv.1"
-        self.subtext = "Novice"
-        self.setMinimumSize(60, 60)
-        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-
-    def set_progress(self, level: int, xp_in_level: int, xp_needed: int, total_xp: int):
-        """Set XP progress toward next level."""
-        xp_needed = max(1, xp_needed)  # Avoid division by zero
-        self.percentage = min(xp_in_level / xp_needed, 1.0)
-        self.text = f"Lv.{level}"
-        
-        # Get level title name
-        try:
-            from gamification import get_level_title
-            title, emoji = get_level_title(level)
-            self.subtext = title
-        except Exception:
-            self.subtext = "Novice"
-        
-        # Force repaint to show new values
-        self.repaint()
-
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        
-        # Adjust rect to ensure stroke doesn't clip
-        rect = self.rect().adjusted(5, 5, -5, -5)
-        
-        # Draw Background Track
-        pen = QtGui.QPen(QtGui.QColor("#2a2a4a"), 6)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        painter.setPen(pen)
-        painter.drawEllipse(rect)
-        
-        # Draw Progress Arc (gold/yellow for XP)
-        pen.setColor(QtGui.QColor("#ffd700"))
-        painter.setPen(pen)
-        
-        start_angle = 90 * 16
-        span_angle = -int(self.percentage * 360 * 16)
-        painter.drawArc(rect, start_angle, span_angle)
-        
-        # Draw Level Text
-        painter.setPen(QtGui.QColor("#ffffff"))
-        font = painter.font()
-        font.setPixelSize(13)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        text_rect = QtCore.QRectF(rect)
-        painter.drawText(text_rect, QtCore.Qt.AlignmentFlag.AlignCenter, self.text)
-        
-        # Draw XP subtext below
-        font.setPixelSize(10)
-        font.setBold(False)
-        painter.setFont(font)
-        sub_rect = QtCore.QRectF(rect.adjusted(0, 20, 0, 0))
-        painter.setPen(QtGui.QColor("#ffd700"))
-        painter.drawText(sub_rect, QtCore.Qt.AlignmentFlag.AlignCenter, self.subtext)
-
-    def mousePressEvent(self, event):
-        if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-
-
-class FocusRingWidget(QtWidgets.QWidget):
-    """Circular progress bar for daily focus goal."""
-    clicked = QtCore.Signal()
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.percentage = 0.0
-        self.text = "0%"
-        self.subtext = "Focus"
-        self.setMinimumSize(60, 60)
-        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-
-    def set_progress(self, current_seconds, goal_seconds):
-        # Guard against negative values
-        current_seconds = max(0, current_seconds)
-        goal_seconds = max(1, goal_seconds)  # Minimum 1 to avoid division by zero
-        
-        self.percentage = min(current_seconds / goal_seconds, 1.0)
-            
-        hours = int(current_seconds // 3600)
-        mins = int((current_seconds % 3600) // 60)
-        
-        # If less than an hour, show minutes only or "0h 30m"
-        if hours > 0:
-            self.text = f"{hours}h {mins}m"
-        else:
-            self.text = f"{mins}m"
-            
-        self.repaint()  # Force immediate repaint
-
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        
-        # Adjust rect to ensure stroke doesn't clip
-        rect = self.rect().adjusted(5, 5, -5, -5)
-        
-        # Draw Background Track
-        pen = QtGui.QPen(QtGui.QColor("#2a2a4a"), 6)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        painter.setPen(pen)
-        painter.drawEllipse(rect)
-        
-        # Draw Progress Arc
-        # QPainter draws arcs in 1/16th of a degree
-        # 0 degrees is 3 o'clock. We want to start at 12 o'clock (90 degrees)
-        # Positive span is counter-clockwise? No, generic is counter-clockwise.
-        # But wait, 90 is 12 o'clock. 
-        # To draw clockwise, we need negative span.
-        
-        pen.setColor(QtGui.QColor("#6366f1"))
-        painter.setPen(pen)
-        
-        start_angle = 90 * 16
-        span_angle = -int(self.percentage * 360 * 16)
-        
-        # If full circle, draw ellipse to avoid artifact? Arc is fine.
-        painter.drawArc(rect, start_angle, span_angle)
-        
-        # Draw Text
-        painter.setPen(QtGui.QColor("#ffffff"))
-        
-        # Center Text
-        font = painter.font()
-        font.setPixelSize(13)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        # Draw main text in center
-        text_rect = QtCore.QRectF(rect)
-        painter.drawText(text_rect, QtCore.Qt.AlignmentFlag.AlignCenter, self.text)
-        
-        # Draw subtext below
-        font.setPixelSize(10)
-        font.setBold(False)
-        painter.setFont(font)
-        sub_rect = QtCore.QRectF(rect.adjusted(0, 20, 0, 0))
-        painter.setPen(QtGui.QColor("#aaaaaa"))
-        painter.drawText(sub_rect, QtCore.Qt.AlignmentFlag.AlignCenter, self.subtext)
-
-    def mousePressEvent(self, event):
-        if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-
-
-class EntitiesRingWidget(QtWidgets.QWidget):
-    """Circular progress bar for entities bonded (Entitidex collection)."""
-    clicked = QtCore.Signal()
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.percentage = 0.0
-        self.normal_count = 0
-        self.exceptional_count = 0
-        self.total_possible = 45  # 9 entities × 5 story pools
-        self.setMinimumSize(60, 60)
-        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-
-    def set_progress(self, normal_count: int, exceptional_count: int, total_possible: int = 45):
-        """Set entities bonded progress.
-        
-        Args:
-            normal_count: Number of normal entities collected
-            exceptional_count: Number of exceptional entities collected
-            total_possible: Total entities that can be collected
-        """
-        self.normal_count = normal_count
-        self.exceptional_count = exceptional_count
-        self.total_possible = max(1, total_possible)
-        total_bonded = normal_count + exceptional_count
-        self.percentage = min(total_bonded / self.total_possible, 1.0)
-        self.repaint()  # Force immediate repaint
-
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        
-        rect = self.rect().adjusted(5, 5, -5, -5)
-        
-        # Background Track
-        pen = QtGui.QPen(QtGui.QColor("#2a2a3a"), 6)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        painter.setPen(pen)
-        painter.drawEllipse(rect)
-        
-        # Progress Arc (purple/magenta for entities)
-        # Golden glow if we have any exceptional entities
-        if self.exceptional_count > 0:
-            arc_color = "#ba68c8"  # Purple for exceptional
-        else:
-            arc_color = "#9c27b0"  # Darker purple for normal only
-        
-        pen.setColor(QtGui.QColor(arc_color))
-        painter.setPen(pen)
-        
-        start_angle = 90 * 16
-        span_angle = -int(self.percentage * 360 * 16)
-        painter.drawArc(rect, start_angle, span_angle)
-        
-        # Main text: total count with star emoji, exceptional part in brighter color
-        total_bonded = self.normal_count + self.exceptional_count
-        font = painter.font()
-        font.setPixelSize(14)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        main_rect = QtCore.QRectF(rect)
-        
-        # Draw the count with exceptional part highlighted
-        if self.exceptional_count > 0 and self.normal_count > 0:
-            # Format: ⭐normal+exceptional where exceptional is brighter
-            text = f"⭐{self.normal_count}"
-            exc_text = f"+{self.exceptional_count}"
-            
-            # Calculate positions for centered text
-            fm = QtGui.QFontMetrics(font)
-            full_text = text + exc_text
-            total_width = fm.horizontalAdvance(full_text)
-            center_x = main_rect.center().x()
-            start_x = center_x - total_width / 2
-            text_y = main_rect.center().y() + fm.ascent() / 2 - 2
-            
-            # Draw normal part in white
-            painter.setPen(QtGui.QColor("#ffffff"))
-            painter.drawText(QtCore.QPointF(start_x, text_y), text)
-            
-            # Draw exceptional part in bright gold
-            painter.setPen(QtGui.QColor("#ffd700"))
-            painter.drawText(QtCore.QPointF(start_x + fm.horizontalAdvance(text), text_y), exc_text)
-        else:
-            # Just show total in appropriate color
-            if self.exceptional_count > 0:
-                painter.setPen(QtGui.QColor("#ffd700"))  # All exceptional - gold
-            else:
-                painter.setPen(QtGui.QColor("#ffffff"))  # Normal only - white
-            painter.drawText(main_rect, QtCore.Qt.AlignmentFlag.AlignCenter, f"⭐{total_bonded}")
-        
-        # Subtext: "Bonded" or show exceptional count if any
-        font.setPixelSize(10)
-        font.setBold(False)
-        painter.setFont(font)
-        sub_rect = QtCore.QRectF(rect.adjusted(0, 20, 0, 0))
-        painter.setPen(QtGui.QColor(arc_color))
-        
-        if self.exceptional_count > 0:
-            painter.drawText(sub_rect, QtCore.Qt.AlignmentFlag.AlignCenter, f"✨{self.exceptional_count}")
-        else:
-            painter.drawText(sub_rect, QtCore.Qt.AlignmentFlag.AlignCenter, "Bonded")
-
-    def mousePressEvent(self, event):
-        if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-
-
 class MiniHeroWidget(QtWidgets.QWidget):
     """Wrapper widget that renders CharacterCanvas at full size and scales it down.
     
@@ -22932,8 +22289,12 @@ class StoryTab(QtWidgets.QWidget):
     
     def _on_power_changed(self, new_power: int) -> None:
         """Handle power change - update progress labels."""
-        self._update_story_progress_labels()
-        self._refresh_story_chapter_list()
+        if not GAMIFICATION_AVAILABLE:
+            return
+        from gamification import get_story_progress
+        progress = get_story_progress(self.blocker.adhd_buster, power=new_power)
+        self._update_story_progress_labels(progress)
+        self._refresh_story_chapter_list(progress)
     
     # === UI Update Methods ===
     
@@ -22967,13 +22328,14 @@ class StoryTab(QtWidgets.QWidget):
         story_info = AVAILABLE_STORIES.get(story_id, {})
         self.story_desc_lbl.setText(f"📖 {story_info.get('description', '')}")
     
-    def _update_story_progress_labels(self) -> None:
+    def _update_story_progress_labels(self, progress: Optional[dict] = None) -> None:
         """Update story progress labels and progress bar."""
         if not GAMIFICATION_AVAILABLE:
             return
         
         from gamification import get_story_progress, get_selected_story
-        progress = get_story_progress(self.blocker.adhd_buster)
+        if progress is None:
+            progress = get_story_progress(self.blocker.adhd_buster)
         
         # Check if in preview mode (story not unlocked)
         story_id = get_selected_story(self.blocker.adhd_buster)
@@ -23024,13 +22386,14 @@ class StoryTab(QtWidgets.QWidget):
                 self.chapter_progress_bar.setValue(100)
                 self.chapter_progress_bar.setFormat("Complete!")
     
-    def _refresh_story_chapter_list(self) -> None:
+    def _refresh_story_chapter_list(self, progress: Optional[dict] = None) -> None:
         """Refresh the story chapter dropdown to reflect decisions made."""
         if not GAMIFICATION_AVAILABLE or not hasattr(self, 'chapter_combo'):
             return
         
         from gamification import get_story_progress
-        progress = get_story_progress(self.blocker.adhd_buster)
+        if progress is None:
+            progress = get_story_progress(self.blocker.adhd_buster)
         
         self.chapter_combo.clear()
         for ch in progress["chapters"]:
@@ -23264,11 +22627,12 @@ class StoryTab(QtWidgets.QWidget):
             return
         
         from gamification import (
-            get_story_progress, get_selected_story, AVAILABLE_STORIES, 
-            get_story_data, get_chapter_content, COIN_COSTS
+            calculate_character_power, get_selected_story, AVAILABLE_STORIES, 
+            get_story_data, COIN_COSTS
         )
+        from story_render import chapter_cache
         
-        progress = get_story_progress(self.blocker.adhd_buster)
+        power = calculate_character_power(self.blocker.adhd_buster)
         story_id = get_selected_story(self.blocker.adhd_buster)
         story_info = AVAILABLE_STORIES.get(story_id, {})
         
@@ -23328,35 +22692,25 @@ class StoryTab(QtWidgets.QWidget):
             self._refresh_story_combo()
             # Continue to show the chapter
         
-        # Get the full chapter data with content (personalized with gear and decisions)
-        chapter_data = get_chapter_content(chapter_num, self.blocker.adhd_buster)
+        # Get the full chapter data with content (personalized with gear and decisions),
+        # reusing the rendered HTML while story, decisions and gear names are unchanged
+        rendered = chapter_cache().get(chapter_num, self.blocker.adhd_buster, power)
         
-        if not chapter_data:
+        if not rendered:
             show_error(self, "Error", "Chapter not found!")
             return
+        chapter_data, html_content = rendered
         
         if not chapter_data.get("unlocked"):
             show_warning(
                 self, "Chapter Locked",
                 f"This chapter requires {chapter_data.get('threshold', 0)} power to unlock.\n\n"
-                f"Current power: {progress['power']}\n"
+                f"Current power: {power}\n"
                 f"Power needed: {chapter_data.get('power_needed', 0)} more\n"
                 f"Keep building your hero's power!"
             )
             return
         
-        # Convert markdown-style formatting to HTML
-        def markdown_to_html(text: str) -> str:
-            import re
-            # Convert **bold** to <b>bold</b>
-            text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-            # Convert *italic* to <i>italic</i>
-            text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-            # Convert line breaks to HTML
-            text = text.replace('\n\n', '</p><p style="margin-top: 12px;">')
-            text = text.replace('\n', '<br>')
-            return f'<p>{text}</p>'
-        
         # Use styled frameless dialog
         dialog = StyledDialog(self, f"📖 {story_info.get('title', 'Story')} - Chapter {chapter_num}")
         dialog.setMinimumSize(650, 550)
@@ -23389,9 +22743,7 @@ class StoryTab(QtWidgets.QWidget):
         content_layout = QtWidgets.QVBoxLayout(content_widget)
         content_layout.setContentsMargins(10, 10, 10, 10)
         
-        # Use personalized content from get_chapter_content (includes gear and decision variations)
-        raw_content = chapter_data.get("content", "No content available.")
-        html_content = markdown_to_html(raw_content)
+        # Personalized content (includes gear and decision variations), already rendered
         content_lbl = QtWidgets.QLabel(html_content)
         content_lbl.setWordWrap(True)
         content_lbl.setStyleSheet("""
@@ -23419,7 +22771,6 @@ class StoryTab(QtWidgets.QWidget):
         dialog._content_lbl = content_lbl
         dialog._content_scroll = content_scroll
         dialog._chapter_num = chapter_num
-        dialog._markdown_to_html = markdown_to_html
         
         # Use chapter_data.has_decision (from get_chapter_content) - already accounts for decision_made
         if chapter_data.get("has_decision"):
@@ -23532,7 +22883,7 @@ class StoryTab(QtWidgets.QWidget):
             return
         dialog._decision_in_progress = True
         
-        from gamification import make_story_decision, AVAILABLE_STORIES, get_selected_story, COIN_COSTS, get_chapter_content
+        from gamification import make_story_decision, AVAILABLE_STORIES, get_selected_story, COIN_COSTS
         
         # Check if story is unlocked (decisions require unlocked story)
         story_id = get_selected_story(self.blocker.adhd_buster)
@@ -23633,11 +22984,12 @@ class StoryTab(QtWidgets.QWidget):
                 dialog._decision_container_layout.addWidget(outcome_frame)
                 
                 # Get updated chapter content with continuation
-                updated_chapter = get_chapter_content(chapter_num, self.blocker.adhd_buster)
+                from story_render import chapter_cache
+                rendered = chapter_cache().get(chapter_num, self.blocker.adhd_buster)
+                updated_chapter, new_content = rendered if rendered else (None, "")
                 if updated_chapter and updated_chapter.get("content"):
                     # Update the main content with the new personalized content
-                    if hasattr(dialog, '_markdown_to_html') and hasattr(dialog, '_content_lbl'):
-                        new_content = dialog._markdown_to_html(updated_chapter.get("content", ""))
+                    if hasattr(dialog, '_content_lbl'):
                         dialog._content_lbl.setText(new_content)
                         
                         # Scroll to show the outcome
@@ -24040,6 +23392,11 @@ class DevTab(QtWidgets.QWidget):
         # Initialize city UI
         QtCore.QTimer.singleShot(150, self._refresh_city_display)
 
+        # Live timings from telemetry.py; the export includes the startup phases
+        from telemetry_panel import PerformancePanel
+        self.performance_panel = PerformancePanel(extra=lambda: {"startup": _startup_profiler.report()})
+        layout.addWidget(self.performance_panel)
+
         # Status display
         self.status_label = QtWidgets.QLabel("")
         self.status_label.setStyleSheet("color: #4caf50; padding: 10px;")
@@ -25428,39 +24785,42 @@ class DevTab(QtWidgets.QWidget):
 # Global Hotkey Listener using pynput (reliable even when window hidden)
 # ============================================================================
 
-class HotkeyListener:
+class HotkeyListener(QtCore.QObject):
     """
     Global hotkey listener using pynput.
     Unlike Windows RegisterHotKey, this works reliably even when the window is hidden.
+
+    Any number of bindings (including two-step chords like "Ctrl+K, B") are
+    compiled into a HotkeyMatcher. Matches found on the pynput thread are
+    queued and the callbacks run on the Qt thread.
     """
-    
-    def __init__(self, callback: Callable[[], None]):
+
+    TOGGLE_ACTION = "toggle"
+
+    _wake = QtCore.Signal()  # Emitted from the pynput thread; delivered queued
+
+    def __init__(self, callback: Optional[Callable[[], None]] = None,
+                 parent: Optional[QtCore.QObject] = None):
         """
         Initialize the hotkey listener.
         
         Args:
-            callback: Function to call when hotkey is pressed (must be thread-safe!)
+            callback: Function to call (on the Qt thread) when the hotkey set
+                with set_hotkey() is pressed
         """
+        super().__init__(parent)
         self._callback = callback
         self._listener: Optional[Any] = None
         self._running = False
-        
-        # Target key and modifiers
-        self._target_key: Optional[Any] = None
-        self._require_ctrl = False
-        self._require_shift = False
-        self._require_alt = False
-        
-        # Current modifier states
-        self._ctrl_pressed = False
-        self._shift_pressed = False
-        self._alt_pressed = False
-        
+        self._matcher = HotkeyMatcher()
+        self._actions: Dict[str, Callable[[], None]] = {}
+        self._pending: "queue.SimpleQueue[str]" = queue.SimpleQueue()
         self._lock = threading.Lock()
+        self._wake.connect(self._drain, QtCore.Qt.QueuedConnection)
     
     def set_hotkey(self, key_sequence: str) -> bool:
         """
-        Set the hotkey to listen for (e.g., "Ctrl+F11", "Ctrl+Shift+H").
+        Set the show/hide hotkey (e.g., "Ctrl+F11", "Ctrl+Shift+H", "Ctrl+K, B").
         
         Args:
             key_sequence: Qt-style key sequence string
@@ -25468,135 +24828,57 @@ class HotkeyListener:
         Returns:
             True if hotkey was parsed successfully
         """
-        if not PYNPUT_AVAILABLE or not pynput_keyboard:
-            logger.warning("pynput not available, hotkey disabled")
-            return False
-        
-        # Parse the key sequence
-        parts = key_sequence.replace("+", " ").split()
-        
-        self._require_ctrl = False
-        self._require_shift = False
-        self._require_alt = False
-        self._target_key = None
-        
-        for part in parts:
-            part_lower = part.lower()
-            if part_lower in ("ctrl", "control"):
-                self._require_ctrl = True
-            elif part_lower == "shift":
-                self._require_shift = True
-            elif part_lower in ("alt", "meta"):
-                self._require_alt = True
-            else:
-                # This is the main key
-                self._target_key = self._parse_key(part)
-        
-        if self._target_key is None:
-            logger.warning(f"Could not parse hotkey: {key_sequence}")
+        with self._lock:
+            self._matcher.clear()
+            self._actions.clear()
+        if not self._callback:
             return False
-        
-        logger.info(f"Hotkey set: {key_sequence} -> ctrl={self._require_ctrl}, "
-                   f"shift={self._require_shift}, alt={self._require_alt}, key={self._target_key}")
+        return self.add_binding(key_sequence, self._callback, action=self.TOGGLE_ACTION)
+
+    def add_binding(self, key_sequence: str, callback: Callable[[], None],
+                    action: Optional[str] = None,
+                    timeout: float = DEFAULT_CHORD_TIMEOUT) -> bool:
+        """Add a binding; chords wait up to `timeout` seconds for their second step."""
+        action = action or key_sequence
+        with self._lock:
+            if not self._matcher.bind(key_sequence, action, timeout=timeout):
+                return False
+            self._actions[action] = callback
+        logger.info(f"Hotkey bound: {key_sequence} -> {action}")
         return True
-    
-    def _parse_key(self, key_str: str) -> Optional[Any]:
-        """Parse a key string to pynput key."""
-        if not pynput_keyboard:
-            return None
-            
-        key_str = key_str.upper()
-        
-        # Function keys F1-F12
-        if key_str.startswith("F") and key_str[1:].isdigit():
-            fnum = int(key_str[1:])
-            if 1 <= fnum <= 12:
-                return getattr(pynput_keyboard.Key, f"f{fnum}", None)
-        
-        # Special keys
-        special_keys = {
-            "ESCAPE": pynput_keyboard.Key.esc,
-            "ESC": pynput_keyboard.Key.esc,
-            "SPACE": pynput_keyboard.Key.space,
-            "TAB": pynput_keyboard.Key.tab,
-            "ENTER": pynput_keyboard.Key.enter,
-            "RETURN": pynput_keyboard.Key.enter,
-            "BACKSPACE": pynput_keyboard.Key.backspace,
-            "DELETE": pynput_keyboard.Key.delete,
-            "HOME": pynput_keyboard.Key.home,
-            "END": pynput_keyboard.Key.end,
-            "PAGEUP": pynput_keyboard.Key.page_up,
-            "PAGEDOWN": pynput_keyboard.Key.page_down,
-            "UP": pynput_keyboard.Key.up,
-            "DOWN": pynput_keyboard.Key.down,
-            "LEFT": pynput_keyboard.Key.left,
-            "RIGHT": pynput_keyboard.Key.right,
-            "INSERT": pynput_keyboard.Key.insert,
-        }
-        
-        if key_str in special_keys:
-            return special_keys[key_str]
-        
-        # Single character (letter or number)
-        if len(key_str) == 1:
-            return pynput_keyboard.KeyCode.from_char(key_str.lower())
-        
-        return None
+
+    def clear_bindings(self) -> None:
+        with self._lock:
+            self._matcher.clear()
+            self._actions.clear()
     
     def _on_press(self, key) -> None:
-        """Handle key press event."""
-        if not pynput_keyboard:
-            return
-            
+        """Handle key press event (pynput thread)."""
         with self._lock:
-            # Track modifier states
-            if key in (pynput_keyboard.Key.ctrl_l, pynput_keyboard.Key.ctrl_r, pynput_keyboard.Key.ctrl):
-                self._ctrl_pressed = True
-            elif key in (pynput_keyboard.Key.shift_l, pynput_keyboard.Key.shift_r, pynput_keyboard.Key.shift):
-                self._shift_pressed = True
-            elif key in (pynput_keyboard.Key.alt_l, pynput_keyboard.Key.alt_r, pynput_keyboard.Key.alt,
-                        pynput_keyboard.Key.alt_gr):
-                self._alt_pressed = True
-            
-            # Check if this is our target key with correct modifiers
-            if self._target_key is not None:
-                key_matches = False
-                
-                # Compare keys
-                if isinstance(self._target_key, pynput_keyboard.Key):
-                    key_matches = (key == self._target_key)
-                elif isinstance(self._target_key, pynput_keyboard.KeyCode):
-                    if hasattr(key, 'char') and key.char:
-                        key_matches = (key.char.lower() == self._target_key.char.lower())
-                    elif hasattr(key, 'vk') and hasattr(self._target_key, 'vk'):
-                        key_matches = (key.vk == self._target_key.vk)
-                
-                if key_matches:
-                    # Check modifiers
-                    ctrl_ok = (self._ctrl_pressed == self._require_ctrl)
-                    shift_ok = (self._shift_pressed == self._require_shift)
-                    alt_ok = (self._alt_pressed == self._require_alt)
-                    
-                    if ctrl_ok and shift_ok and alt_ok:
-                        logger.debug("Hotkey triggered!")
-                        # Call callback (should emit a Qt signal for thread safety)
-                        if self._callback:
-                            self._callback()
+            action = self._matcher.press(pynput_key_name(key))
+        if action is not None:
+            logger.debug(f"Hotkey triggered: {action}")
+            self._pending.put(action)
+            self._wake.emit()
     
     def _on_release(self, key) -> None:
-        """Handle key release event."""
-        if not pynput_keyboard:
-            return
-            
+        """Handle key release event (pynput thread)."""
         with self._lock:
-            # Track modifier states
-            if key in (pynput_keyboard.Key.ctrl_l, pynput_keyboard.Key.ctrl_r, pynput_keyboard.Key.ctrl):
-                self._ctrl_pressed = False
-            elif key in (pynput_keyboard.Key.shift_l, pynput_keyboard.Key.shift_r, pynput_keyboard.Key.shift):
-                self._shift_pressed = False
-            elif key in (pynput_keyboard.Key.alt_l, pynput_keyboard.Key.alt_r, pynput_keyboard.Key.alt,
-                        pynput_keyboard.Key.alt_gr):
-                self._alt_pressed = False
+            self._matcher.release(pynput_key_name(key))
+
+    def _drain(self) -> None:
+        """Run queued hotkey callbacks (Qt thread)."""
+        while True:
+            try:
+                action = self._pending.get_nowait()
+            except queue.Empty:
+                return
+            callback = self._actions.get(action)
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Hotkey callback failed for {action}: {e}")
     
     def start(self) -> bool:
         """Start listening for hotkeys in a background thread."""
@@ -25608,6 +24890,8 @@ class HotkeyListener:
             return True
         
         try:
+            with self._lock:
+                self._matcher.reset()
             self._listener = pynput_keyboard.Listener(
                 on_press=self._on_press,
                 on_release=self._on_release
@@ -25679,6 +24963,9 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
             self.game_state.inventory_changed.connect(self._on_inventory_changed)
             self.game_state.full_refresh_required.connect(self._on_full_refresh_required)
 
+        # Reward celebrations are queued and shown one at a time from the main loop
+        self._install_reward_presenters()
+
         # Make window scrollable with scroll area
         scroll_area = QtWidgets.QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -25818,6 +25105,11 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
         # 10. Schedule tab
         self.schedule_tab = ScheduleTab(self.blocker, self)
         self.tabs.addTab(self.schedule_tab, "📅 Schedule")
+        # Single-shot timer armed for the next schedule start/end transition
+        self._schedule_timer = QtCore.QTimer(self)
+        self._schedule_timer.setSingleShot(True)
+        self._schedule_timer.timeout.connect(self._check_scheduled_blocking)
+        self.schedule_tab.schedules_changed.connect(self._check_scheduled_blocking)
 
         # 11. Categories tab
         self.categories_tab = CategoriesTab(self.blocker, self)
@@ -25860,7 +25152,7 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
         self._hotkey_listener: Optional[HotkeyListener] = None
         if PYNPUT_AVAILABLE:
             self._hotkey_listener = HotkeyListener(
-                callback=lambda: self.toggle_requested.emit()
+                callback=self.toggle_requested.emit, parent=self
             )
         
         self._setup_system_tray()
@@ -25872,24 +25164,138 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
         self._health_reminder_timer.timeout.connect(self._check_health_reminders)
         self._health_reminder_timer.start(60000)  # Check every 60 seconds
 
+        # Deferred startup steps (each is timed in the startup report)
         # Check for crash recovery on startup
-        QtCore.QTimer.singleShot(500, self._check_crash_recovery)
+        self._defer_startup_step(500, "crash_recovery", self._check_crash_recovery)
 
         # Check for first-run enforcement mode selection (before other prompts)
-        QtCore.QTimer.singleShot(550, self._check_enforcement_mode_first_run)
+        self._defer_startup_step(550, "enforcement_mode_check", self._check_enforcement_mode_first_run)
 
         # Check for scheduled blocking
-        QtCore.QTimer.singleShot(700, self._check_scheduled_blocking)
+        self._defer_startup_step(700, "schedule_check", self._check_scheduled_blocking)
 
         # Show priorities on startup if enabled
         if self.blocker.show_priorities_on_startup:
-            QtCore.QTimer.singleShot(600, self._check_priorities_on_startup)
+            self._defer_startup_step(600, "priorities", self._check_priorities_on_startup)
 
         # Check for daily gear reward (delayed until after onboarding so story is selected)
         if GAMIFICATION_AVAILABLE:
-            QtCore.QTimer.singleShot(900, self._show_onboarding_prompt)
+            self._defer_startup_step(900, "onboarding", self._show_onboarding_prompt)
             # Pre-load Entitidex tab in background for instant display when user clicks it
-            QtCore.QTimer.singleShot(2000, self._preload_entitidex_tab)
+            self._defer_startup_step(2000, "entitidex_preload", self._preload_entitidex_tab)
+
+    def _defer_startup_step(self, delay_ms: int, name: str, step: Callable[[], None]) -> None:
+        """Run a startup step after delay_ms, recording it as a startup phase."""
+        def run() -> None:
+            with _startup_profiler.phase(f"startup:{name}"):
+                step()
+        QtCore.QTimer.singleShot(delay_ms, run)
+
+    # === Reward Presentation ===
+
+    def _install_reward_presenters(self) -> None:
+        """Present reward_queue events with this window as the dialogs' parent."""
+        queue = reward_queue()
+        queue.set_scheduler(lambda fn: QtCore.QTimer.singleShot(0, fn))
+        queue.register(SESSION_COMPLETE, self._present_session_complete)
+        queue.register(LOTTERY, self._present_lottery)
+        queue.register(LEVEL_UP, self._present_level_up)
+        queue.register(ITEM_DROP, self._present_item_drop)
+        queue.register(BUILDING_COMPLETE, self._present_building_complete)
+        queue.register(ENTITY_ENCOUNTER, self._present_entity_encounter)
+        queue.register(DIARY, self._present_diary)
+        queue.register(PRIORITY_LOG, self._present_priority_log)
+
+    @staticmethod
+    def _show_queued_dialog(dialog: QtWidgets.QDialog, done: Callable[[], None]) -> None:
+        """Show dialog without a nested event loop; done() once it is closed."""
+        dialog.setWindowModality(QtCore.Qt.NonModal)
+        dialog.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.finished.connect(lambda _result: done())
+        dialog.destroyed.connect(lambda *_: done())
+        dialog.show()
+
+    def _present_session_complete(self, event: RewardEvent, done: Callable[[], None]) -> None:
+        from session_complete_dialog import SessionCompleteDialog
+        payload = event.payload
+        dialog = SessionCompleteDialog(payload["elapsed"], payload.get("rewards_info", {}), parent=self)
+        dialog.start_another_session.connect(payload["on_start_another"])
+        dialog.view_stats.connect(payload["on_view_stats"])
+        if payload.get("on_view_priorities"):
+            dialog.view_priorities.connect(payload["on_view_priorities"])
+        self._show_queued_dialog(dialog, done)
+
+    def _present_lottery(self, event: RewardEvent, done: Callable[[], None]) -> None:
+        from lottery_animation import FocusTimerLotteryDialog
+        payload = event.payload
+        dialog = FocusTimerLotteryDialog(
+            session_minutes=payload["session_minutes"],
+            streak_days=payload.get("streak_days", 0),
+            item=payload["item"],
+            parent=self,
+        )
+        self._show_queued_dialog(dialog, done)
+
+    def _present_level_up(self, event: RewardEvent, done: Callable[[], None]) -> None:
+        payload = event.payload
+        old_level, new_level = payload["old_level"], payload["new_level"]
+        stats = dict(payload.get("stats", {}))
+        stats["unlocks"] = payload.get("unlocks", [])
+        stats["xp_earned"] = payload.get("xp_earned", 0)
+        # Use fullscreen mode for multi-level gains
+        fullscreen = (new_level - old_level) > 1
+        dialog = EnhancedLevelUpDialog(old_level, new_level, stats, fullscreen, self)
+        if payload.get("on_view_stats"):
+            dialog.view_stats.connect(payload["on_view_stats"])
+        self._show_queued_dialog(dialog, done)
+
+    def _present_item_drop(self, event: RewardEvent, done: Callable[[], None]) -> None:
+        from styled_dialog import ItemRewardDialog
+        payload = event.payload
+        dialog = ItemRewardDialog(
+            parent=self,
+            title=payload.get("title", "🎁 Item Reward!"),
+            header_emoji=payload.get("header_emoji", "🎁"),
+            source_label=payload.get("source_label", ""),
+            items_earned=payload.get("items", []),
+            equipped=payload.get("equipped", {}),
+            equipped_after=payload.get("equipped_after"),
+            auto_equipped_slots=payload.get("auto_equipped_slots", []),
+            coins_earned=payload.get("coins", 0),
+            extra_messages=payload.get("extra_messages", []),
+            game_state=get_game_state(),
+            session_minutes=payload.get("session_minutes", 0),
+            streak_days=payload.get("streak_days", 0),
+            entity_perk_contributors=payload.get("entity_perk_contributors", []),
+        )
+        self._show_queued_dialog(dialog, done)
+
+    def _present_building_complete(self, event: RewardEvent, done: Callable[[], None]) -> None:
+        from city_tab import create_building_complete_dialog
+        payload = event.payload
+        dialog = create_building_complete_dialog(
+            payload["building_id"], payload.get("level", 1), payload.get("is_upgrade", False), parent=self
+        )
+        if dialog is None:
+            done()
+            return
+        self._show_queued_dialog(dialog, done)
+
+    def _present_entity_encounter(self, event: RewardEvent, done: Callable[[], None]) -> None:
+        # The encounter flow rolls and chains its own dialogs; it runs as one step
+        try:
+            event.payload["check"]()
+        finally:
+            done()
+
+    def _present_diary(self, event: RewardEvent, done: Callable[[], None]) -> None:
+        payload = event.payload
+        dialog = DiaryEntryRevealDialog(self.blocker, payload["entry"], payload.get("session_minutes", 0), self)
+        self._show_queued_dialog(dialog, done)
+
+    def _present_priority_log(self, event: RewardEvent, done: Callable[[], None]) -> None:
+        dialog = PriorityTimeLogDialog(self.blocker, event.payload["session_minutes"], self)
+        self._show_queued_dialog(dialog, done)
 
     def _preload_entitidex_tab(self) -> None:
         """Pre-load the Entitidex tab UI in background for instant display."""
@@ -25898,6 +25304,9 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
                 self.entitidex_tab.preload()
             except Exception as e:
                 logger.warning(f"Failed to preload Entitidex tab: {e}")
+        # Last deferred startup step: rewrite the report with the full cascade
+        from startup_profiler import write_report_if_requested
+        QtCore.QTimer.singleShot(0, lambda: write_report_if_requested(_startup_profiler))
 
     def _check_enforcement_mode_first_run(self) -> None:
         """
@@ -26033,6 +25442,11 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
         if orphaned is None:
             return
 
+        plan = orphaned.get("recovery")
+        if plan is not None and plan.action == ACTION_RESUME:
+            self._offer_session_resume(plan)
+            return
+
         # Format crash info
         if orphaned.get("unknown"):
             crash_info = "An unknown previous session"
@@ -26047,25 +25461,60 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
                 time_str = start_time
             crash_info = f"A session started at {time_str} (mode: {mode})"
 
+        credit_info = ""
+        if plan is not None and plan.elapsed > 60:
+            credit_info = f"The {plan.elapsed // 60} min you focused before the crash will be credited.\n\n"
+
+        if plan is not None and not plan.needs_unblock:
+            # Nothing left in the hosts file, just credit the partial session
+            credited = self.blocker.credit_orphaned_session()
+            if credited:
+                show_info(self, "Session Recovered",
+                          f"⚠️ {crash_info} did not shut down properly.\n\n{credit_info.strip()}")
+                self.timer_tab._refresh_quick_stats()
+            return
+
         # Ask user what to do - custom buttons
         result = styled_question(
             self,
             "Crash Recovery Detected",
             f"⚠️ {crash_info} did not shut down properly.\n\nSome websites may still be blocked.\n\n"
-            "Would you like to remove all blocks and clean up?",
+            f"{credit_info}Would you like to remove all blocks and clean up?",
             ["Remove Blocks", "Keep Blocks", "Decide Later"]
         )
 
         if result == "Remove Blocks":
+            self.blocker.credit_orphaned_session()
             success, message = self.blocker.recover_from_crash()
             if success:
                 show_info(self, "Recovery Complete", "✅ All blocks have been removed.\n\nYour browser should now be able to access all websites.")
             else:
                 show_error(self, "Recovery Failed", f"Could not clean up: {message}\n\nTry using 'Emergency Cleanup' in Settings tab.")
         elif result == "Keep Blocks":
-            self.blocker.clear_session_state()
+            self.blocker.credit_orphaned_session()
             show_info(self, "Blocks Retained", "The blocks have been kept.\n\nUse 'Emergency Cleanup' in Settings tab when you want to remove them.")
 
+    def _offer_session_resume(self, plan) -> None:
+        """Offer to resume a journaled session whose planned window is still open."""
+        minutes_left = max(1, plan.remaining // 60)
+        result = styled_question(
+            self,
+            "Resume Focus Session?",
+            f"⚠️ Your focus session was interrupted (the app closed unexpectedly).\n\n"
+            f"{plan.elapsed // 60} min focused, about {minutes_left} min left.\n\n"
+            "Would you like to resume it?",
+            ["Resume Session", "End Session", "Decide Later"]
+        )
+        if result == "Resume Session":
+            self.blocker.resolve_orphaned_session()
+            self.timer_tab.resume_session(plan.remaining, plan.planned_duration,
+                                          plan.mode or BlockMode.NORMAL, plan.started_at)
+        elif result == "End Session":
+            self.blocker.credit_orphaned_session()
+            if plan.blocks_active:
+                self.blocker.recover_from_crash()
+            self.timer_tab._refresh_quick_stats()
+
     def _switch_user(self) -> None:
         """Open user selection dialog to switch profiles without restarting."""
         # Check if a session is running - require stop first
@@ -26103,7 +25552,7 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
                 
                 # Show user selection dialog
                 um = UserManager(APP_DIR)
-                selection_dialog = UserSelectionDialog(um, parent=self)
+                selection_dialog = UserSelectionDialog(um, parent=self, current_user=self.username)
                 
                 if selection_dialog.exec() == QtWidgets.QDialog.Accepted:
                     new_user = selection_dialog.selected_user
@@ -26145,6 +25594,10 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
             
             # Create new blocker with new user's data
             old_blocker = self.blocker
+            try:
+                old_blocker.record_profile_summary()
+            except Exception:
+                pass  # The picker summary is cosmetic
             self.blocker = BlockerCore(username=new_username)
             
             # Reset session-specific flags for new user
@@ -26676,8 +26129,18 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
                 self.blocker.block_sites(duration_seconds=8 * 60 * 60)
                 self.timer_tab._update_timer_display()
 
-        # Check again in 60 seconds
-        QtCore.QTimer.singleShot(60000, self._check_scheduled_blocking)
+        self._arm_schedule_timer()
+
+    def _arm_schedule_timer(self) -> None:
+        """Arm the schedule timer for the next start/end transition (no polling)."""
+        self._schedule_timer.stop()
+        transition = self.blocker.next_schedule_transition()
+        if transition is None:
+            return
+        when, _becomes_active = transition
+        delay_ms = int((when - datetime.now()).total_seconds() * 1000)
+        # Small slack so the timer lands inside the new minute, not just before it
+        self._schedule_timer.start(max(1000, delay_ms + 500))
 
     def _check_daily_gear_reward(self) -> None:
         """Check if user should receive a daily gear reward.
@@ -27599,6 +27062,10 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
                 self.blocker.record_shutdown_time("app_close")
             except Exception:
                 pass  # Don't block close on error
+            try:
+                self.blocker.record_profile_summary()
+            except Exception:
+                pass
 
         self._unregister_hotkey()
 
@@ -27760,7 +27227,8 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
         Resource earning formula (per design doc):
         - 🎯 Focus: 1 per 30 minutes of focus time
         
-        Also awards Royal Mint income (coins for focus sessions).
+        Royal Mint income (coins for focus sessions) is part of the session
+        reward ledger and awarded with the session coins.
         
         Note: Materials come from weight management only, not focus sessions.
         
@@ -27772,7 +27240,7 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
             return
         
         try:
-            from city import add_city_resource, award_focus_session_income, get_active_construction_info
+            from city import add_city_resource, get_active_construction_info
             
             minutes = elapsed_seconds // 60
             
@@ -27844,30 +27312,12 @@ class FocusBlockerWindow(QtWidgets.QMainWindow):
                     }
                     logger.debug(f"Session too short for focus ({minutes} min, need {mins_needed} more)")
             
-            # Award Royal Mint income for focus session
+            # Save data (deferred to the end of the batch when called from session rewards)
             game_state = getattr(self, 'game_state', None)
-            income_result = award_focus_session_income(
-                self.blocker.adhd_buster,
-                minutes,
-                game_state
-            )
-            
-            # Show notification if coins were earned
-            if income_result.get("coins", 0) > 0:
-                coins = income_result["coins"]
-                # Build breakdown message
-                breakdown_parts = []
-                for item in income_result.get("breakdown", []):
-                    breakdown_parts.append(f"{item['building']}: +{item['total_coins']} coins")
-                breakdown_msg = ", ".join(breakdown_parts) if breakdown_parts else ""
-                
-                logger.info(f"Focus session awarded {coins} city coins: {breakdown_msg}")
-                
-                # Update coin display
-                self._update_coin_display()
-            
-            # Save data
-            self.blocker.save_config()
+            if game_state:
+                game_state.request_save()
+            else:
+                self.blocker.save_config()
             
         except Exception as e:
             logger.warning(f"Failed to award city resources: {e}")
@@ -28265,6 +27715,33 @@ def _remove_lock_file():
         pass
 
 
+class _FirstPaintWatcher(QtCore.QObject):
+    """Marks the main window's first paint in the startup profiler."""
+
+    def __init__(self, window: QtWidgets.QWidget) -> None:
+        super().__init__(window)
+        self._window = window
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:
+        if obj is self._window and event.type() == QtCore.QEvent.Paint:
+            obj.removeEventFilter(self)
+            # Record once the paint event has been handled
+            QtCore.QTimer.singleShot(0, lambda: _on_startup_ready("first_paint"))
+        return False
+
+
+def _on_startup_ready(mark: str) -> None:
+    """Record the end of startup, log the report and write it if requested."""
+    import os
+    from startup_profiler import EXIT_AFTER_PAINT_ENV_VAR, write_report_if_requested
+    _startup_profiler.mark(mark)
+    logger.debug(_startup_profiler.format_report())
+    write_report_if_requested(_startup_profiler)
+    if os.environ.get(EXIT_AFTER_PAINT_ENV_VAR):
+        QtWidgets.QApplication.quit()
+
+
 def main() -> None:
     # Handle startup delay for system boot (prevents race conditions)
     # Check for --startup-delay argument
@@ -28280,16 +27757,23 @@ def main() -> None:
         import time
         time.sleep(startup_delay)
     
-    # Set application attributes before creating QApplication
-    QtWidgets.QApplication.setHighDpiScaleFactorRoundingPolicy(
-        QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
+    # Import and warm widget-free modules on a worker thread while the GUI
+    # thread creates the application and checks for a running instance
+    from startup_profiler import start_background_preload
+    start_background_preload(profiler=_startup_profiler)
     
-    # Create application instance
-    app = QtWidgets.QApplication(sys.argv)
-    app.setApplicationName("Personal Liberty")
-    app.setOrganizationName("PersonalLiberty")
-    app.setApplicationVersion(APP_VERSION)
+    with _startup_profiler.phase("create_application"):
+        # Set application attributes before creating QApplication
+        QtWidgets.QApplication.setHighDpiScaleFactorRoundingPolicy(
+            QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
+        
+        # Create application instance
+        app = QtWidgets.QApplication(sys.argv)
+        app.setApplicationName("Personal Liberty")
+        app.setOrganizationName("PersonalLiberty")
+        app.setApplicationVersion(APP_VERSION)
+        install_app_stylesheet(app)
     
     # Check lock file first (faster, works better during startup)
     if not _check_and_create_lock_file():
@@ -28341,7 +27825,8 @@ def main() -> None:
     
     # Load heavy modules
     try:
-        load_heavy_modules()
+        with _startup_profiler.phase("load_heavy_modules"):
+            load_heavy_modules()
     except Exception as e:
         import traceback
         logger.error(f"Failed to load modules: {e}")
@@ -28350,69 +27835,73 @@ def main() -> None:
         sys.exit(1)
     
     # User Selection Logic
-    try:
-        from core_logic import APP_DIR
-        from user_manager import UserManager
-        from user_selection_dialog import UserSelectionDialog
+    with _startup_profiler.phase("user_selection"):
+        try:
+            from core_logic import APP_DIR
+            from user_manager import UserManager
+            from user_selection_dialog import UserSelectionDialog
         
-        user_manager = UserManager(APP_DIR)
-        user_manager.migrate_if_needed()
+            user_manager = UserManager(APP_DIR)
+            user_manager.migrate_if_needed()
         
-        # Check for auto-login
-        last_user = user_manager.get_last_user()
-        selected_user = None
+            # Check for auto-login
+            last_user = user_manager.get_last_user()
+            selected_user = None
 
-        if last_user:
-            # Validate that auto-login user still exists with proper directory
-            if user_manager.user_exists(last_user):
-                try:
-                    user_dir = user_manager.get_user_dir(last_user)
-                    if user_dir.exists() and user_dir.is_dir():
-                        selected_user = last_user
-                    else:
-                        # Directory was deleted - clear invalid last_user
+            if last_user:
+                # Validate that auto-login user still exists with proper directory
+                if user_manager.user_exists(last_user):
+                    try:
+                        user_dir = user_manager.get_user_dir(last_user)
+                        if user_dir.exists() and user_dir.is_dir():
+                            selected_user = last_user
+                            user_manager.update_user(last_user, touch=True)
+                        else:
+                            # Directory was deleted - clear invalid last_user
+                            user_manager.clear_last_user()
+                            last_user = None
+                    except (ValueError, OSError):
+                        # Invalid user - clear and prompt
                         user_manager.clear_last_user()
                         last_user = None
-                except (ValueError, OSError):
-                    # Invalid user - clear and prompt
+                else:
+                    # User no longer exists - clear invalid last_user
                     user_manager.clear_last_user()
                     last_user = None
-            else:
-                # User no longer exists - clear invalid last_user
-                user_manager.clear_last_user()
-                last_user = None
-        
-        if not selected_user:
-            selection_dialog = UserSelectionDialog(user_manager)
-            if selection_dialog.exec() == QtWidgets.QDialog.Accepted:
-                selected_user = selection_dialog.selected_user
-                if selected_user:  # Validate selection is not None
-                    user_manager.save_last_user(selected_user)
+        
+            if not selected_user:
+                selection_dialog = UserSelectionDialog(user_manager)
+                if selection_dialog.exec() == QtWidgets.QDialog.Accepted:
+                    selected_user = selection_dialog.selected_user
+                    if selected_user:  # Validate selection is not None
+                        user_manager.save_last_user(selected_user)
+                    else:
+                        show_error(None, "Selection Error", "No user profile was selected.")
+                        sys.exit(1)
                 else:
-                    show_error(None, "Selection Error", "No user profile was selected.")
-                    sys.exit(1)
-            else:
-                sys.exit(0)
-    except ImportError as e:
-        show_error(None, "Startup Error", f"Failed to import required modules:\n{e}")
-        sys.exit(1)
-    except KeyboardInterrupt:
-        sys.exit(0)
-    except Exception as e:
-        import traceback
-        with open("crash_log.txt", "w") as f:
-            traceback.print_exc(file=f)
-        show_error(
-            None, 
-            "Unexpected Error", 
-            f"An unexpected error occurred during user selection:\n{e}\n\nPlease report this issue."
-        )
-        traceback.print_exc()
-        sys.exit(1)
+                    sys.exit(0)
+        except ImportError as e:
+            show_error(None, "Startup Error", f"Failed to import required modules:\n{e}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            sys.exit(0)
+        except Exception as e:
+            import traceback
+            with open("crash_log.txt", "w") as f:
+                traceback.print_exc(file=f)
+            show_error(
+                None, 
+                "Unexpected Error", 
+                f"An unexpected error occurred during user selection:\n{e}\n\nPlease report this issue."
+            )
+            traceback.print_exc()
+            sys.exit(1)
+    
     
     # Create main window
     try:
-        window = FocusBlockerWindow(username=selected_user)
+        with _startup_profiler.phase("create_main_window"):
+            window = FocusBlockerWindow(username=selected_user)
     except Exception as e:
         import traceback
         logger.error(f"Failed to create main window: {e}")
@@ -28428,13 +27917,15 @@ def main() -> None:
     
     # Start silently in system tray by default, unless --show flag is passed
     if show_window or not window.tray_icon:
-        # Show the main window
+        # Show the main window (first paint completes the startup report)
+        _FirstPaintWatcher(window)
         window.show()
         window.raise_()
         window.activateWindow()
     else:
         # Start minimized to system tray (silent startup)
         window.hide()
+        QtCore.QTimer.singleShot(0, lambda: _on_startup_ready("event_loop_started"))
         
         # Play startup sound if enabled (after short delay for stability)
         if window.blocker.startup_sound_enabled:
@@ -16,15 +16,28 @@ Race Condition Prevention:
 - Batch mode defers saves until end_batch() for atomic multi-step operations
 - Exception-safe batch operations using try/finally patterns
 - Re-entrancy guard on singleton initialization
+
+Undo/Redo:
+- Each mutation (or outermost batch) is one transaction in an UndoLog
+  (see undo_log.py) that stores compact inverse diffs, not snapshots
+- undo()/redo() restore state, save, and emit the affected signals
+
+Domain Events:
+- publish_event() sends "session_completed", "item_merged", ... on an
+  EventBus (see challenge_events.py); challenge progress subscribes to it
 """
 
 from PySide6 import QtCore
 from typing import Optional, Dict, Any, List, Callable
 from contextlib import contextmanager
 import copy
+import functools
 import logging
 import uuid
 
+from challenge_events import ENTITY_CAUGHT, ITEM_MERGED, ChallengeTracker, EventBus
+from undo_log import UndoLog
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +53,20 @@ def deep_copy_item(item: dict) -> dict:
     return copy.deepcopy(item)
 
 
+def _undoable(label: str):
+    """Run a GameStateManager mutation as one undo transaction (nests into batches)."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self._undo_log.begin(self.adhd_buster, label)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._end_undo()
+        return wrapper
+    return decorator
+
+
 class _BatchContext:
     """Context manager for batch operations."""
     
@@ -118,6 +145,13 @@ class GameStateManager(QtCore.QObject):
     city_building_completed = QtCore.Signal(str)  # building_id that completed
     city_changed = QtCore.Signal()  # Any city state change
     
+    # Undo/redo signals
+    history_changed = QtCore.Signal(bool, bool)  # (can_undo, can_redo)
+    
+    # Challenge signals
+    challenges_changed = QtCore.Signal()  # Daily/weekly challenge progress moved
+    challenge_completed = QtCore.Signal(dict)  # Challenge data
+    
     # General refresh (fallback for complex multi-changes)
     full_refresh_required = QtCore.Signal()
     
@@ -132,7 +166,12 @@ class GameStateManager(QtCore.QObject):
         self._pending_signals: List[tuple] = []
         self._subscribers: Dict[str, List[Callable]] = {}
         self._save_pending = False  # Track if save is needed at end of batch
+        self._backup_pending = False  # Create an auto-backup with the end-of-batch save
         self._debug_mode = False
+        self._undo_log = UndoLog()
+        self.events = EventBus()
+        self._challenges = ChallengeTracker(lambda: self.adhd_buster, self.events,
+                                            listener=self._on_challenge_progress)
         logger.info("GameStateManager initialized")
         
     def enable_debug(self, enabled: bool = True):
@@ -186,6 +225,8 @@ class GameStateManager(QtCore.QObject):
             # First batch - clear pending signals
             self._pending_signals = []
             self._save_pending = False
+            self._backup_pending = False
+        self._undo_log.begin(self.adhd_buster)
         self._batch_depth += 1
     
     def end_batch(self):
@@ -201,6 +242,7 @@ class GameStateManager(QtCore.QObject):
             return
         
         self._batch_depth -= 1
+        self._end_undo()
         
         # Only process signals/save on outermost batch end
         if self._batch_depth > 0:
@@ -209,8 +251,9 @@ class GameStateManager(QtCore.QObject):
         try:
             # Save once at end if any operation requested it
             if self._save_pending:
-                self._sync_and_save()
+                self._sync_and_save(create_backup=self._backup_pending)
                 self._save_pending = False
+                self._backup_pending = False
             
             # Deduplicate signals (keep last occurrence for each signal type)
             seen = {}
@@ -243,7 +286,7 @@ class GameStateManager(QtCore.QObject):
         """
         return _BatchContext(self)
     
-    def _sync_and_save(self):
+    def _sync_and_save(self, create_backup: bool = False):
         """Sync gamification data and save to disk."""
         try:
             from gamification import sync_hero_data
@@ -254,7 +297,10 @@ class GameStateManager(QtCore.QObject):
             logger.error(f"Error syncing hero data: {e}")
         
         try:
-            self._blocker.save_config()
+            if create_backup:
+                self._blocker.save_config(create_backup=True)
+            else:
+                self._blocker.save_config()
         except Exception as e:
             logger.error(f"Error saving config: {e}")
             # Don't re-raise - log and continue to prevent cascading failures
@@ -266,6 +312,14 @@ class GameStateManager(QtCore.QObject):
         else:
             self._sync_and_save()
     
+    def request_save(self, create_backup: bool = False):
+        """Save config now, or once at the end of the current batch."""
+        if self._batch_mode:
+            self._save_pending = True
+            self._backup_pending = self._backup_pending or create_backup
+        else:
+            self._sync_and_save(create_backup=create_backup)
+
     def _emit(self, signal, *args):
         """Emit a signal, or queue it if in batch mode."""
         if self._batch_mode:
@@ -278,7 +332,79 @@ class GameStateManager(QtCore.QObject):
                     signal.emit()
             except Exception:
                 pass  # Silently handle signal emission errors
-    
+
+    # === Undo/Redo ===
+
+    def _end_undo(self):
+        """Close an undo transaction; announce the new history if one was recorded."""
+        if self._undo_log.end() is not None:
+            self._emit(self.history_changed, True, False)
+
+    def can_undo(self) -> bool:
+        return self._undo_log.can_undo()
+
+    def can_redo(self) -> bool:
+        return self._undo_log.can_redo()
+
+    def undo_label(self) -> Optional[str]:
+        """Description of the step undo() would revert (e.g. "merge")."""
+        return self._undo_log.undo_label()
+
+    def redo_label(self) -> Optional[str]:
+        return self._undo_log.redo_label()
+
+    def clear_history(self) -> None:
+        """Forget all undo/redo steps (e.g. after data was replaced wholesale)."""
+        self._undo_log.clear()
+        self._emit(self.history_changed, False, False)
+
+    def undo(self) -> bool:
+        """Revert the last mutation or batch. Returns True if something was undone."""
+        txn = self._undo_log.undo(self.adhd_buster)
+        if txn is None:
+            return False
+        self._log_change("undo", txn.label)
+        self._emit_restored(txn)
+        return True
+
+    def redo(self) -> bool:
+        """Re-apply the last undone step. Returns True if something was redone."""
+        txn = self._undo_log.redo(self.adhd_buster)
+        if txn is None:
+            return False
+        self._log_change("redo", txn.label)
+        self._emit_restored(txn)
+        return True
+
+    def _emit_restored(self, txn):
+        """Save and emit the signals for the keys an undo/redo step touched."""
+        keys = txn.keys
+        self.begin_batch()
+        try:
+            self.request_save()
+            if keys & {"inventory", "total_collected"}:
+                self._emit(self.inventory_changed)
+            for slot in txn.changed_slots():
+                self._emit(self.equipment_changed, slot)
+            if "coins" in keys:
+                self._emit(self.coins_changed, self.coins)
+            if "materials" in keys:
+                self._emit(self.materials_changed, self.materials)
+            if "luck_bonus" in keys:
+                self._emit(self.luck_bonus_changed, self.adhd_buster.get("luck_bonus", 0))
+            if keys & {"hero", "total_xp"}:
+                hero = self.adhd_buster.get("hero", {})
+                self._emit(self.xp_changed, hero.get("xp", 0), hero.get("level", 1))
+                self._emit(self.hero_changed)
+            if "selected_story" in keys:
+                self._emit(self.story_changed, self.adhd_buster.get("selected_story", ""))
+                self._emit(self.full_refresh_required)
+            if keys & {"inventory", "equipped"}:
+                self._emit_power_update()
+            self._emit(self.history_changed, self.can_undo(), self.can_redo())
+        finally:
+            self.end_batch()
+
     # === State Modification Methods ===
     
     # Base maximum inventory size to prevent unbounded growth
@@ -334,6 +460,7 @@ class GameStateManager(QtCore.QObject):
         
         return False
     
+    @_undoable("add item")
     def add_item(self, item: dict, track_collected: bool = True) -> None:
         """Add an item to inventory and emit appropriate signals.
         
@@ -370,6 +497,7 @@ class GameStateManager(QtCore.QObject):
         self._emit(self.item_added, item_copy)
         self._emit(self.inventory_changed)
     
+    @_undoable("remove item")
     def remove_item(self, item_id: str) -> bool:
         """Remove an item from inventory by ID.
         
@@ -389,6 +517,7 @@ class GameStateManager(QtCore.QObject):
                 return True
         return False
     
+    @_undoable("equip")
     def equip_item(self, slot: str, item: dict) -> bool:
         """Equip an item to a slot.
         
@@ -428,6 +557,7 @@ class GameStateManager(QtCore.QObject):
         self._emit_power_update()
         return True
     
+    @_undoable("unequip")
     def unequip_item(self, slot: str) -> Optional[dict]:
         """Unequip an item from a slot.
         
@@ -462,6 +592,7 @@ class GameStateManager(QtCore.QObject):
         # Return a copy for the caller (defensive programming)
         return deep_copy_item(item)
     
+    @_undoable("add coins")
     def add_coins(self, amount: int) -> int:
         """Add coins and emit signal. Returns new total.
         
@@ -481,6 +612,7 @@ class GameStateManager(QtCore.QObject):
         self._emit(self.coins_changed, new_total)
         return new_total
     
+    @_undoable("add materials")
     def add_materials(self, amount: int) -> int:
         """Add materials (merge leftovers) and emit signal. Returns new total.
         
@@ -504,6 +636,7 @@ class GameStateManager(QtCore.QObject):
         self._emit(self.materials_changed, new_total)
         return new_total
     
+    @_undoable("add scrap")
     def add_scrap(self, amount: int) -> int:
         """Add scrap (merge leftovers) to city resources. Returns new total.
         
@@ -532,6 +665,7 @@ class GameStateManager(QtCore.QObject):
             self._save_config()
             return new_total
     
+    @_undoable("add luck")
     def add_luck_bonus(self, amount: int) -> int:
         """Add luck bonus and return new total.
         
@@ -575,6 +709,7 @@ class GameStateManager(QtCore.QObject):
         logger.info(f"Luck bonus decayed: {current} -> {new_total} (-{amount})")
         return new_total
     
+    @_undoable("bulk remove")
     def bulk_remove_items(self, items: List[dict]) -> int:
         """Remove multiple items from inventory. Returns number removed.
         
@@ -640,6 +775,7 @@ class GameStateManager(QtCore.QObject):
         finally:
             self.end_batch()
     
+    @_undoable("spend coins")
     def spend_coins(self, amount: int) -> bool:
         """Spend coins if sufficient. Returns True if successful.
         
@@ -661,6 +797,7 @@ class GameStateManager(QtCore.QObject):
             return True
         return False
     
+    @_undoable("add XP")
     def add_xp(self, amount: int) -> tuple:
         """Add XP and emit signal. Returns (new_xp, new_level, leveled_up).
         
@@ -719,6 +856,7 @@ class GameStateManager(QtCore.QObject):
         
         return (new_xp, new_level, leveled_up)
     
+    @_undoable("merge")
     def merge_items(self, item_ids: List[str], result_item: dict) -> bool:
         """Merge items into a new item.
         
@@ -762,8 +900,10 @@ class GameStateManager(QtCore.QObject):
         self._emit(self.items_merged, result_copy)
         self._emit(self.inventory_changed)
         self._emit_power_update()  # In case merged item is equipped
+        self.publish_event(ITEM_MERGED)
         return True
     
+    @_undoable("merge")
     def perform_merge(self, items: List[dict], result_item: Optional[dict], 
                       success: bool) -> bool:
         """
@@ -847,11 +987,14 @@ class GameStateManager(QtCore.QObject):
             self._save_config()
             self._emit(self.inventory_changed)
             self._emit_power_update()
+            if success and result_item:
+                self.publish_event(ITEM_MERGED)
             
             return True
         finally:
             self.end_batch()
     
+    @_undoable("equip loadout")
     def set_all_equipped(self, new_equipped: Dict[str, dict]) -> None:
         """
         Replace all equipped items with a new configuration.
@@ -885,6 +1028,7 @@ class GameStateManager(QtCore.QObject):
         finally:
             self.end_batch()
     
+    @_undoable("change story")
     def set_story(self, story_id: str) -> None:
         """Change the active story theme."""
         self.adhd_buster["selected_story"] = story_id
@@ -954,12 +1098,26 @@ class GameStateManager(QtCore.QObject):
         self._log_change("entity_collected", entity_id)
         self._emit(self.entity_collected, entity_id)
         self._emit(self.entities_changed)
+        self.publish_event(ENTITY_CAUGHT, entity_id=entity_id)
     
     def notify_entities_changed(self) -> None:
         """Notify that the entitidex changed (any change)."""
         self._log_change("entities_changed", "")
         self._emit(self.entities_changed)
 
+    # === Domain Events ===
+    
+    def publish_event(self, event: str, **payload) -> None:
+        """Publish a domain event (see challenge_events) to its subscribers."""
+        self._log_change(event, str(payload) if payload else "")
+        self.events.publish(event, **payload)
+    
+    def _on_challenge_progress(self, completed: list) -> None:
+        self._save_config()
+        self._emit(self.challenges_changed)
+        for challenge in completed:
+            self._emit(self.challenge_completed, challenge)
+    
     def request_full_refresh(self):
         """Request all connected components to do a full refresh."""
         self._log_change("full_refresh_requested", "")
@@ -967,6 +1125,7 @@ class GameStateManager(QtCore.QObject):
     
     # === Convenience Methods for Complex Operations ===
     
+    @_undoable("session rewards")
     def award_session_rewards(self, item: dict, coins: int, xp: int, 
                                streak_bonus: int = 0, strategic_bonus: bool = False) -> dict:
         """
@@ -1008,6 +1167,80 @@ class GameStateManager(QtCore.QObject):
         finally:
             self.end_batch()
     
+    @_undoable("session rewards")
+    def apply_session_rewards(self, plan, create_backup: bool = False) -> dict:
+        """
+        Apply a SessionRewardPlan (see session_rewards.py) in a single batch.
+
+        Awards the item (auto-equipped to an empty slot), coins and XP, and
+        writes the daily diary entry if today has none yet. The config is
+        saved once at the end (optionally with an auto-backup) and the
+        batched signals are emitted once.
+
+        Returns:
+            dict with coins_earned, coin_total, xp_earned, old_level,
+            new_level, leveled_up, item and diary_entry
+        """
+        if plan.dry_run or not plan.eligible:
+            logger.warning("apply_session_rewards called with a dry-run or ineligible plan")
+            return {}
+
+        from datetime import datetime
+        old_level = self.adhd_buster.get("hero", {}).get("level", 1)
+        with plan.timed("apply"):
+            self.begin_batch()
+            try:
+                item = plan.item
+                coin_total = None
+                if item:
+                    item.setdefault("obtained_at", datetime.now().isoformat())
+                    awarded = self.award_items_batch([item], coins=plan.coins, auto_equip=True,
+                                                     source="session_completion")
+                    coin_total = awarded.get("coin_total")
+                elif plan.coins > 0:
+                    coin_total = self.add_coins(plan.coins)
+
+                new_xp, new_level, leveled_up = self.add_xp(plan.xp)
+                diary_entry = self._add_daily_diary_entry(plan)
+
+                self.request_save(create_backup=create_backup)
+            finally:
+                self.end_batch()
+
+        result = {
+            "coins_earned": plan.coins,
+            "coin_total": coin_total if coin_total is not None else self.coins,
+            "xp_earned": plan.xp,
+            "old_level": old_level,
+            "new_level": new_level,
+            "leveled_up": leveled_up,
+            "item": item,
+            "diary_entry": diary_entry,
+        }
+        self._log_change("apply_session_rewards", str(result))
+        return result
+
+    def _add_daily_diary_entry(self, plan) -> Optional[dict]:
+        """Append today's diary entry if there is none yet. Returns the new entry."""
+        from datetime import datetime
+        today = datetime.now().strftime("%Y-%m-%d")
+        diary = self.adhd_buster.setdefault("diary", [])
+        if any(e.get("date") == today for e in diary):
+            return None
+        try:
+            from gamification import calculate_character_power, generate_diary_entry
+        except ImportError:
+            return None
+        power = calculate_character_power(self.adhd_buster)
+        entry = generate_diary_entry(power, plan.session_minutes, self.equipped,
+                                     story_id=plan.story_id)
+        diary.append(entry)
+        if len(diary) > 100:
+            self.adhd_buster["diary"] = diary[-100:]
+        self._save_config()
+        return entry
+
+    @_undoable("equip")
     def swap_equipped_item(self, slot: str, new_item: Optional[dict]) -> Optional[dict]:
         """
         Swap equipped item in a slot. Returns the previously equipped item.
@@ -1055,6 +1288,7 @@ class GameStateManager(QtCore.QObject):
         finally:
             self.end_batch()
     
+    @_undoable("salvage")
     def sell_item(self, item_id: str, sell_value: int) -> bool:
         """Sell an item for coins.
         
@@ -1080,6 +1314,7 @@ class GameStateManager(QtCore.QObject):
         finally:
             self.end_batch()
     
+    @_undoable("salvage")
     def bulk_sell_items(self, item_ids: List[str], total_value: int) -> int:
         """Sell multiple items. Returns number of items successfully sold."""
         self.begin_batch()
@@ -1115,6 +1350,7 @@ class GameStateManager(QtCore.QObject):
         self._emit(self.config_saved)
         self._log_change("force_save", "config saved")
 
+    @_undoable("award items")
     def award_items_batch(self, items: List[dict], coins: int = 0, 
                            auto_equip: bool = True, source: str = "") -> dict:
         """
@@ -9,7 +9,10 @@ import random
 import re
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from telemetry import timed
 
 # Entity System Integration
 try:
@@ -1042,6 +1045,7 @@ def get_entity_perk_bonuses(adhd_buster: dict) -> dict:
     return result
 
 
+@timed("get_all_perk_bonuses")
 def get_all_perk_bonuses(adhd_buster: dict) -> dict:
     """
     Get combined bonuses from BOTH entity perks AND city buildings.
@@ -4813,6 +4817,7 @@ def generate_session_items(session_minutes: int = 0, streak_days: int = 0,
     return items
 
 
+@timed("calculate_character_power")
 def calculate_character_power(adhd_buster: dict, include_set_bonus: bool = True,
                               include_neighbor_effects: bool = True) -> int:
     """
@@ -10312,32 +10317,69 @@ def get_story_data(adhd_buster: dict) -> tuple:
     return data["decisions"], data["chapters"]
 
 
-def get_story_progress(adhd_buster: dict) -> dict:
+def story_decision_key(adhd_buster: dict) -> str:
+    """
+    The choice made at each decision chapter (2, 4, 6), "-" where none is made yet.
+
+    Unlike get_decision_path() this keeps the position of every choice, so it
+    identifies exactly which chapters have their decision recorded.
+    """
+    story_decisions, _ = get_story_data(adhd_buster)
+    decisions = adhd_buster.get("story_decisions", {})
+    key = ""
+    for chapter_num in [2, 4, 6]:
+        decision_info = story_decisions.get(chapter_num)
+        choice = decisions.get(decision_info["id"]) if decision_info else None
+        key += choice if choice else "-"
+    return key
+
+
+@lru_cache(maxsize=256)
+def _story_chapter_index(story_id: str, chapters_unlocked: int, decision_key: str) -> tuple:
+    """Chapter list for a story at an unlock level; the story data never changes at runtime."""
+    data = STORY_DATA.get(story_id, STORY_DATA["warrior"])
+    chapters = []
+    for i, chapter in enumerate(data["chapters"]):
+        chapter_num = i + 1
+        has_decision = chapter.get("has_decision", False)
+        decision_made = False
+        if has_decision and data["decisions"].get(chapter_num) and chapter_num in (2, 4, 6):
+            decision_made = decision_key[(chapter_num - 2) // 2] != "-"
+        chapters.append({
+            "number": chapter_num,
+            "title": chapter["title"],
+            "unlocked": chapter_num <= chapters_unlocked,
+            "has_decision": has_decision,
+            "decision_made": decision_made,
+        })
+    return tuple(chapters)
+
+
+def get_story_progress(adhd_buster: dict, power: Optional[int] = None) -> dict:
     """
     Get the user's story progress based on their power level.
     Chapters unlock based on max power ever reached (permanent unlock).
+
+    The chapter list is cached per (story, chapters unlocked, decisions made),
+    so only the power figures are recomputed on each call. Pass power when
+    it is already known (e.g. from the power_changed signal) to skip
+    recalculating it.
     
     Returns:
         dict with 'current_chapter', 'unlocked_chapters', 'chapters', 'next_threshold', 
         'power', 'decisions', 'selected_story', 'story_info'
     """
-    story_decisions, story_chapters = get_story_data(adhd_buster)
     story_id = get_selected_story(adhd_buster)
+    if story_id not in STORY_DATA:
+        story_id = "warrior"
     story_info = AVAILABLE_STORIES.get(story_id, AVAILABLE_STORIES["warrior"])
     
-    current_power = calculate_character_power(adhd_buster)
+    current_power = calculate_character_power(adhd_buster) if power is None else power
     max_power = adhd_buster.get("max_power_reached", 0)
     
     # Use max power for unlocking (chapters stay unlocked once reached)
     unlock_power = max(current_power, max_power)
-    
-    unlocked = []
-    current_chapter = 0
-    
-    for i, threshold in enumerate(STORY_THRESHOLDS):
-        if unlock_power >= threshold:
-            unlocked.append(i + 1)
-            current_chapter = i + 1
+    current_chapter = sum(1 for threshold in STORY_THRESHOLDS if unlock_power >= threshold)
     
     # Find next threshold based on current power (what you need now)
     next_threshold = None
@@ -10348,33 +10390,14 @@ def get_story_progress(adhd_buster: dict) -> dict:
     
     # Get stored decisions
     decisions = adhd_buster.get("story_decisions", {})
-    
-    # Build chapter details
-    chapters = []
-    for i, chapter in enumerate(story_chapters):
-        chapter_num = i + 1
-        is_unlocked = chapter_num in unlocked
-        has_decision = chapter.get("has_decision", False)
-        decision_made = False
-        if has_decision:
-            decision_info = story_decisions.get(chapter_num)
-            if decision_info:
-                decision_made = decision_info["id"] in decisions
-        
-        chapters.append({
-            "number": chapter_num,
-            "title": chapter["title"],
-            "unlocked": is_unlocked,
-            "has_decision": has_decision,
-            "decision_made": decision_made,
-        })
+    chapters = _story_chapter_index(story_id, current_chapter, story_decision_key(adhd_buster))
     
     return {
         "power": current_power,
         "current_chapter": current_chapter,
-        "unlocked_chapters": unlocked,
-        "chapters": chapters,
-        "total_chapters": len(story_chapters),
+        "unlocked_chapters": list(range(1, current_chapter + 1)),
+        "chapters": [dict(ch) for ch in chapters],
+        "total_chapters": len(chapters),
         "next_threshold": next_threshold,
         "prev_threshold": STORY_THRESHOLDS[current_chapter - 1] if current_chapter > 0 else 0,
         "power_to_next": next_threshold - current_power if next_threshold else 0,
@@ -10469,74 +10492,105 @@ def get_decision_path(adhd_buster: dict) -> str:
     return path
 
 
-def get_chapter_content(chapter_number: int, adhd_buster: dict) -> Optional[dict]:
+# Placeholders personalised in chapter texts, with the gear slot each one names
+STORY_GEAR_PLACEHOLDERS = {
+    "helmet": "Helmet",
+    "weapon": "Weapon",
+    "chestplate": "Chestplate",
+    "shield": "Shield",
+    "gauntlets": "Gauntlets",
+    "boots": "Boots",
+    "cloak": "Cloak",
+    "amulet": "Amulet",
+}
+
+# Default slot names for when no item is equipped
+# These work whether or not "Your" precedes them in the text
+STORY_DEFAULT_GEAR_NAMES = {
+    "Helmet": "trusty helmet",
+    "Weapon": "trusty weapon",
+    "Chestplate": "worn chestplate",
+    "Shield": "battered shield",
+    "Gauntlets": "old gauntlets",
+    "Boots": "reliable boots",
+    "Cloak": "faded cloak",
+    "Amulet": "simple amulet",
+}
+
+_STORY_PLACEHOLDER_RE = re.compile(
+    r"\{(" + "|".join(list(STORY_GEAR_PLACEHOLDERS) + ["current_power"]) + r")\}"
+)
+
+_INCOMPLETE_ENDING_TEMPLATE = """
+ THE FINAL CHAPTER AWAITS...
+
+But your story is not yet complete.
+You have not made all three critical decisions.
+
+Return to the chapters you've unlocked and face your choices.
+Only then will the Final Door reveal YOUR ending.
+
+Decisions made: {}/3
+"""
+
+
+@lru_cache(maxsize=None)
+def compile_story_template(text: str) -> Tuple[str, ...]:
     """
-    Get the content of a specific chapter, personalized with gear and decisions.
-    
-    Args:
-        chapter_number: 1-7
-        adhd_buster: The user's ADHD Buster data with equipped items and decisions
-    
-    Returns:
-        dict with 'title', 'content', 'unlocked', 'has_decision', 'decision', etc.
+    Split a chapter text into literal runs and placeholder names.
+
+    Even positions are literal text, odd positions are placeholder keys
+    ("helmet", "current_power", ...). Chapter texts are static, so each is
+    compiled once and personalising it is a single join.
+    """
+    return tuple(_STORY_PLACEHOLDER_RE.split(text))
+
+
+def render_story_template(segments: Tuple[str, ...], replacements: dict) -> str:
+    """Fill a compiled template's placeholders from replacements."""
+    parts = list(segments)
+    parts[1::2] = [replacements[key] for key in segments[1::2]]
+    return "".join(parts)
+
+
+def story_gear_names(adhd_buster: dict) -> Tuple[str, ...]:
     """
+    The gear names chapters are personalised with, in STORY_GEAR_PLACEHOLDERS order.
+
+    Equipped items are shown bold, empty slots fall back to an italic
+    default name. Two heroes with the same tuple read identical chapters.
+    """
+    equipped = adhd_buster.get("equipped", {}) or {}
+    names = []
+    for slot in STORY_GEAR_PLACEHOLDERS.values():
+        item = equipped.get(slot)
+        if item and item.get("name"):
+            names.append(f"**{item['name']}**")
+        else:
+            # A default name that reads naturally after "Your" or standalone
+            names.append(f"*{STORY_DEFAULT_GEAR_NAMES.get(slot, slot.lower())}*")
+    return tuple(names)
+
+
+def _resolve_chapter(chapter_number: int, adhd_buster: dict, power: Optional[int]) -> Optional[dict]:
+    """Pick the template a chapter shows for this hero, without personalising it."""
     story_decisions, story_chapters = get_story_data(adhd_buster)
     
     if chapter_number < 1 or chapter_number > len(story_chapters):
         return None
     
     chapter = story_chapters[chapter_number - 1]
-    current_power = calculate_character_power(adhd_buster)
+    current_power = calculate_character_power(adhd_buster) if power is None else power
     max_power = adhd_buster.get("max_power_reached", 0)
     # Use max power for unlocking - chapters stay unlocked once reached
     unlock_power = max(current_power, max_power)
-    unlocked = unlock_power >= chapter["threshold"]
-    
-    if not unlocked:
-        return {
-            "title": f"Chapter {chapter_number}: ???",
-            "content": f"🔒 Locked — Reach {chapter['threshold']} power to unlock.\nYour current power: {current_power}",
-            "unlocked": False,
-            "threshold": chapter["threshold"],
-            "power_needed": chapter["threshold"] - current_power,
-            "has_decision": False,
-        }
-    
-    # Get equipped items for personalization
-    equipped = adhd_buster.get("equipped", {})
-    
-    # Default slot names for when no item is equipped
-    # These work whether or not "Your" precedes them in the text
-    default_slot_names = {
-        "Helmet": "trusty helmet",
-        "Weapon": "trusty weapon",
-        "Chestplate": "worn chestplate",
-        "Shield": "battered shield",
-        "Gauntlets": "old gauntlets",
-        "Boots": "reliable boots",
-        "Cloak": "faded cloak",
-        "Amulet": "simple amulet",
-    }
-    
-    def get_item_name(slot: str) -> str:
-        item = equipped.get(slot)
-        if item and item.get("name"):
-            return f"**{item['name']}**"
-        # Return a default name that reads naturally after "Your" or standalone
-        return f"*{default_slot_names.get(slot, slot.lower())}*"
-    
-    # Build replacement dict
-    replacements = {
-        "helmet": get_item_name("Helmet"),
-        "weapon": get_item_name("Weapon"),
-        "chestplate": get_item_name("Chestplate"),
-        "shield": get_item_name("Shield"),
-        "gauntlets": get_item_name("Gauntlets"),
-        "boots": get_item_name("Boots"),
-        "cloak": get_item_name("Cloak"),
-        "amulet": get_item_name("Amulet"),
-        "current_power": str(current_power),
+    resolved = {
+        "chapter": chapter,
+        "power": current_power,
+        "unlocked": unlock_power >= chapter["threshold"],
     }
+    if not resolved["unlocked"]:
+        return resolved
     
     # Get decisions made so far
     decisions = adhd_buster.get("story_decisions", {})
@@ -10550,17 +10604,7 @@ def get_chapter_content(chapter_number: int, adhd_buster: dict) -> Optional[dict
     # Chapter 7 has multiple endings based on all 3 decisions
     if chapter_number == 7:
         if len(decision_path) < 3:
-            content = """
- THE FINAL CHAPTER AWAITS...
-
-But your story is not yet complete.
-You have not made all three critical decisions.
-
-Return to the chapters you've unlocked and face your choices.
-Only then will the Final Door reveal YOUR ending.
-
-Decisions made: {}/3
-""".format(len(decision_path))
+            content = _INCOMPLETE_ENDING_TEMPLATE.format(len(decision_path))
         else:
             endings = chapter.get("endings") or {}
             ending = endings.get(decision_path)
@@ -10599,10 +10643,76 @@ Decisions made: {}/3
     else:
         content = chapter["content"]
     
-    # Apply replacements
-    for key, value in replacements.items():
-        content = content.replace("{" + key + "}", value)
+    resolved.update(
+        segments=compile_story_template(content),
+        has_decision=has_decision,
+        decision_made=decision_made,
+        decision_info=decision_info,
+    )
+    return resolved
+
+
+def chapter_render_key(chapter_number: int, adhd_buster: dict, power: Optional[int] = None) -> Optional[tuple]:
+    """
+    Everything an unlocked chapter's personalised text depends on, as a hashable key.
+
+    (story, chapter, decisions made, gear names, power) - only the gear names
+    and power the chapter actually prints, so swapping gear it never mentions
+    or gaining power does not invalidate cached renders. Returns None for
+    missing or locked chapters.
+    """
+    resolved = _resolve_chapter(chapter_number, adhd_buster, power)
+    if not resolved or not resolved["unlocked"]:
+        return None
+    used = set(resolved["segments"][1::2])
+    gear_names = tuple(
+        name for key, name in zip(STORY_GEAR_PLACEHOLDERS, story_gear_names(adhd_buster))
+        if key in used
+    )
+    return (
+        get_selected_story(adhd_buster),
+        chapter_number,
+        story_decision_key(adhd_buster),
+        gear_names,
+        resolved["power"] if "current_power" in used else None,
+    )
+
+
+def get_chapter_content(chapter_number: int, adhd_buster: dict, power: Optional[int] = None) -> Optional[dict]:
+    """
+    Get the content of a specific chapter, personalized with gear and decisions.
+    
+    Args:
+        chapter_number: 1-7
+        adhd_buster: The user's ADHD Buster data with equipped items and decisions
+        power: Current character power if already known (recalculated otherwise)
+    
+    Returns:
+        dict with 'title', 'content', 'unlocked', 'has_decision', 'decision', etc.
+    """
+    resolved = _resolve_chapter(chapter_number, adhd_buster, power)
+    if resolved is None:
+        return None
+    
+    chapter = resolved["chapter"]
+    current_power = resolved["power"]
+    if not resolved["unlocked"]:
+        return {
+            "title": f"Chapter {chapter_number}: ???",
+            "content": f"🔒 Locked — Reach {chapter['threshold']} power to unlock.\nYour current power: {current_power}",
+            "unlocked": False,
+            "threshold": chapter["threshold"],
+            "power_needed": chapter["threshold"] - current_power,
+            "has_decision": False,
+        }
+    
+    # Build replacement dict
+    replacements = dict(zip(STORY_GEAR_PLACEHOLDERS, story_gear_names(adhd_buster)))
+    replacements["current_power"] = str(current_power)
+    content = render_story_template(resolved["segments"], replacements)
     
+    has_decision = resolved["has_decision"]
+    decision_made = resolved["decision_made"]
     result = {
         "title": chapter["title"],
         "content": content,
@@ -10613,7 +10723,7 @@ Decisions made: {}/3
     }
     
     if has_decision and not decision_made:
-        result["decision"] = decision_info
+        result["decision"] = resolved["decision_info"]
     
     return result
 
@@ -15753,88 +15863,118 @@ def generate_weekly_challenges(week_start: str = None) -> list:
     return challenges
 
 
-def update_challenge_progress(adhd_buster: dict, event_type: str, amount: int = 1) -> list:
+# Legacy event names -> the requirement type they count
+CHALLENGE_EVENT_REQUIREMENTS = {
+    "session": "sessions",
+    "focus_minutes": "focus_minutes",
+    "early_session": "early_session",
+    "night_session": "night_session",
+    "weight_log": "weight_logs",
+    "sleep_log": "sleep_logs",
+    "activity_log": "activity_logs",
+    "water_log": "water_logs",
+    "item_merge": "merges",
+    "entity_catch": "entity_catches",
+    "login": "login_streak",
+}
+
+# Events counted by the "log_all" daily challenge
+LOG_ALL_EVENTS = ("weight_log", "sleep_log", "activity_log")
+
+
+def ensure_active_challenges(adhd_buster: dict, now: datetime = None) -> bool:
     """
-    Update progress on active challenges based on an event.
-    
-    event_type: "session", "focus_minutes", "early_session", "night_session", 
-                "weight_log", "sleep_log", "activity_log"
-    
-    Returns list of newly completed challenges.
+    Make sure today's daily and this week's weekly challenges exist.
+
+    Returns True if either list was (re)generated.
     """
-    today = datetime.now().strftime("%Y-%m-%d")
+    now = now or datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    regenerated = False
     
-    # Ensure challenges exist for today
     if "daily_challenges" not in adhd_buster or adhd_buster.get("daily_challenges_date") != today:
         adhd_buster["daily_challenges"] = generate_daily_challenges(today)
         adhd_buster["daily_challenges_date"] = today
+        regenerated = True
     
-    # Check weekly challenges
-    today_dt = datetime.now()
-    monday = today_dt - timedelta(days=today_dt.weekday())
+    # Get Monday of current week
+    monday = now - timedelta(days=now.weekday())
     week_start = monday.strftime("%Y-%m-%d")
     
     if "weekly_challenges" not in adhd_buster or adhd_buster.get("weekly_challenges_start") != week_start:
         adhd_buster["weekly_challenges"] = generate_weekly_challenges(week_start)
         adhd_buster["weekly_challenges_start"] = week_start
+        regenerated = True
     
-    newly_completed = []
+    return regenerated
+
+
+def challenge_counts_event(challenge: dict, event_type: str) -> bool:
+    """Whether an event can move this challenge's progress."""
+    req_type = challenge["requirement"]["type"]
+    if req_type == "log_all":
+        return event_type in LOG_ALL_EVENTS
+    return CHALLENGE_EVENT_REQUIREMENTS.get(event_type) == req_type
+
+
+def apply_challenge_event(adhd_buster: dict, challenge: dict, event_type: str,
+                          amount: int = 1) -> bool:
+    """
+    Apply one event to one challenge the event counts for.
+
+    Returns True if the challenge was completed by this event.
+    """
+    if challenge["completed"]:
+        return False
+    req_type = challenge["requirement"]["type"]
+    if req_type == "log_all":
+        # Track which logs done today - use list for JSON serialization
+        if "logs_today" not in challenge:
+            challenge["logs_today"] = []
+        if event_type not in challenge["logs_today"]:
+            challenge["logs_today"].append(event_type)
+        challenge["progress"] = len(challenge["logs_today"])
+    elif req_type == "login_streak":
+        challenge["progress"] = adhd_buster.get("login_streak", 0)
+    else:
+        challenge["progress"] += amount
+    if challenge["progress"] >= challenge["requirement"]["count"]:
+        challenge["completed"] = True
+        challenge["completed_at"] = datetime.now().isoformat()
+        return True
+    return False
+
+
+def update_challenge_progress(adhd_buster: dict, event_type: str, amount: int = 1) -> list:
+    """
+    Update progress on active challenges based on an event.
     
-    # Map event types to requirement types
-    event_to_req = {
-        "session": "sessions",
-        "focus_minutes": "focus_minutes",
-        "early_session": "early_session",
-        "night_session": "night_session",
-        "weight_log": "weight_logs",
-        "sleep_log": "sleep_logs",
-        "activity_log": "activity_logs",
-    }
+    event_type: any key of CHALLENGE_EVENT_REQUIREMENTS ("session",
+                "focus_minutes", "weight_log", "item_merge", ...)
     
-    req_type = event_to_req.get(event_type)
-    if not req_type:
-        return newly_completed
+    This scans every active challenge. Live progress goes through
+    challenge_events.ChallengeTracker, which only touches the challenges
+    subscribed to the event; this function is the fallback used for
+    migrations and repairs, and the reference the tracker is tested
+    against.
     
-    # Update daily challenges
-    for challenge in adhd_buster["daily_challenges"]:
-        if challenge["completed"]:
-            continue
-        if challenge["requirement"]["type"] == req_type:
-            challenge["progress"] += amount
-            if challenge["progress"] >= challenge["requirement"]["count"]:
-                challenge["completed"] = True
-                challenge["completed_at"] = datetime.now().isoformat()
-                newly_completed.append(challenge)
-        # Special case: log_all
-        elif challenge["requirement"]["type"] == "log_all" and event_type in ("weight_log", "sleep_log", "activity_log"):
-            # Track which logs done today - use list for JSON serialization
-            if "logs_today" not in challenge:
-                challenge["logs_today"] = []
-            if event_type not in challenge["logs_today"]:
-                challenge["logs_today"].append(event_type)
-            challenge["progress"] = len(challenge["logs_today"])
-            if challenge["progress"] >= 3:
-                challenge["completed"] = True
-                challenge["completed_at"] = datetime.now().isoformat()
-                newly_completed.append(challenge)
+    Returns list of newly completed challenges.
+    """
+    ensure_active_challenges(adhd_buster)
     
-    # Update weekly challenges
-    for challenge in adhd_buster["weekly_challenges"]:
+    newly_completed = []
+    if event_type not in CHALLENGE_EVENT_REQUIREMENTS:
+        return newly_completed
+    
+    for challenge in adhd_buster["daily_challenges"] + adhd_buster["weekly_challenges"]:
         if challenge["completed"]:
             continue
-        if challenge["requirement"]["type"] == req_type:
-            challenge["progress"] += amount
-            if challenge["progress"] >= challenge["requirement"]["count"]:
-                challenge["completed"] = True
-                challenge["completed_at"] = datetime.now().isoformat()
+        if challenge_counts_event(challenge, event_type):
+            if apply_challenge_event(adhd_buster, challenge, event_type, amount):
                 newly_completed.append(challenge)
-        # Login streak check
+        # Login streak is refreshed by any event (the streak is set at login)
         elif challenge["requirement"]["type"] == "login_streak":
-            current_streak = adhd_buster.get("login_streak", 0)
-            challenge["progress"] = current_streak
-            if current_streak >= challenge["requirement"]["count"]:
-                challenge["completed"] = True
-                challenge["completed_at"] = datetime.now().isoformat()
+            if apply_challenge_event(adhd_buster, challenge, "login"):
                 newly_completed.append(challenge)
     
     return newly_completed
@@ -16259,6 +16399,12 @@ def save_entitidex_progress(adhd_buster: dict, manager: "EntitidexManager") -> N
         manager: EntitidexManager with updated progress
     """
     adhd_buster["entitidex"] = manager.progress.to_dict()
+    # Collection changes affect city synergy bonuses
+    try:
+        from city import invalidate_city_effects
+        invalidate_city_effects(adhd_buster)
+    except ImportError:
+        pass
 
 
 def check_entitidex_encounter(adhd_buster: dict, session_minutes: int,
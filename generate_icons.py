@@ -13,17 +13,55 @@ Design: Dynamic exercising figure doing jumping jacks
 - 5 concentric rings with rarity color gradients
 - Industry-standard antialiasing via supersampling
 - Premium gradients and modern color palette
+
+Build: each icon set renders one supersampled master at MASTER_SIZE and
+derives every smaller size from it with a Lanczos downscale (small sizes
+get a light unsharp mask, see HINTING). Independent sets are built in a
+process pool, and a set is skipped when the hash of everything that shapes
+it (this file, its parameters) matches the one in the stamp file.
 """
 
 from PIL import Image, ImageDraw, ImageFilter, ImageChops
+import hashlib
+import json
 import math
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional
 
 
 # Supersampling factor for antialiasing (render at 8x, downsample for crisp edges)
 # Increased from 4 to 8 for sharper icons on high-DPI displays
 SUPERSAMPLE = 8
 
+# Largest size any output needs (ICO tops out at 256x256)
+MASTER_SIZE = 256
+APP_ICON_SIZES = [16, 24, 32, 48, 64, 128, 256]
+TRAY_ICON_SIZES = [16, 24, 32, 48, 64, 128, 256]
+TRAY_PNG_SIZE = 128  # Larger size for high-DPI displays (Windows scales down as needed)
+
+# Per-size hinting after the downscale: UnsharpMask(radius, percent, threshold)
+HINTING = {
+    16: (0.6, 80, 0),
+    24: (0.6, 60, 0),
+    32: (0.5, 40, 0),
+}
+
+# Icon sets: the design parameters and the files each one produces
+ICON_SETS = {
+    "app": {"blocking": True, "for_tray": False,
+            "ico": ("app.ico", APP_ICON_SIZES)},
+    "tray_ready": {"blocking": False, "for_tray": True,
+                   "png": ("tray_ready.png", TRAY_PNG_SIZE),
+                   "ico": ("tray_ready.ico", TRAY_ICON_SIZES)},
+    "tray_blocking": {"blocking": True, "for_tray": True,
+                      "png": ("tray_blocking.png", TRAY_PNG_SIZE),
+                      "ico": ("tray_blocking.ico", TRAY_ICON_SIZES)},
+}
+
+STAMP_FILE = ".icon_stamp.json"
+
 
 def hex_to_rgb(hex_color: str) -> tuple:
     """Convert hex color to RGB tuple."""
@@ -66,28 +104,40 @@ def darken(rgb: tuple, amount: float = 0.3) -> tuple:
 
 
 def draw_thick_line(draw, x1, y1, x2, y2, width, color):
-    """Draw a thick line with rounded ends using a series of ellipses."""
-    # Draw circles at start, middle, and end for smooth thick line
-    steps = max(8, int(((x2-x1)**2 + (y2-y1)**2)**0.5 / (width * 0.25)))
-    for i in range(steps + 1):
-        t = i / steps
-        x = x1 + (x2 - x1) * t
-        y = y1 + (y2 - y1) * t
-        draw.ellipse([x - width/2, y - width/2, x + width/2, y + width/2], fill=color)
+    """Draw a thick line with rounded ends: one polygon for the body, a circle per end."""
+    r = width / 2
+    length = math.hypot(x2 - x1, y2 - y1)
+    if length > 0:
+        # Offset perpendicular to the line by half the width
+        nx = -(y2 - y1) / length * r
+        ny = (x2 - x1) / length * r
+        draw.polygon([
+            (x1 + nx, y1 + ny), (x2 + nx, y2 + ny),
+            (x2 - nx, y2 - ny), (x1 - nx, y1 - ny),
+        ], fill=color)
+    for x, y in ((x1, y1), (x2, y2)):
+        draw.ellipse([x - r, y - r, x + r, y + r], fill=color)
 
 
-def create_focus_icon(size: int, blocking: bool = False, for_tray: bool = False) -> Image.Image:
+def create_focus_icon(size: int, blocking: bool = False, for_tray: bool = False,
+                      supersample: int = SUPERSAMPLE) -> Image.Image:
     """
     Create a modern, industry-standard app icon with an exercising figure.
     
     Features:
-    - 4x supersampling for smooth antialiasing
+    - Supersampling for smooth antialiasing
     - Gradient rings with highlight/shadow for 3D depth
     - Dynamic jumping jacks figure
     - 5 concentric rings: Legendary (orange) outside → Common (grey) inside
     """
-    # Render at higher resolution for antialiasing
-    render_size = size * SUPERSAMPLE
+    # Render at higher resolution for antialiasing, then downsample with
+    # high-quality antialiasing
+    img = render_focus_icon(size * supersample, blocking=blocking, for_tray=for_tray)
+    return img.resize((size, size), Image.Resampling.LANCZOS)
+
+
+def render_focus_icon(render_size: int, blocking: bool = False, for_tray: bool = False) -> Image.Image:
+    """Draw the icon at render_size, before any downsampling."""
     img = Image.new('RGBA', (render_size, render_size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     
@@ -164,7 +214,10 @@ def create_focus_icon(size: int, blocking: bool = False, for_tray: bool = False)
         light_rgb = hex_to_rgb(light)
         dark_rgb = hex_to_rgb(dark)
         
-        # Draw alternating light and dark radial segments
+        # Draw alternating light and dark radial segments. The segments of
+        # a ring don't overlap, so they share one layer and one ring mask.
+        ray_img = Image.new('RGBA', (render_size, render_size), (0, 0, 0, 0))
+        ray_draw = ImageDraw.Draw(ray_img)
         for ray in range(num_rays):
             angle1 = (ray / num_rays) * 2 * math.pi
             angle2 = ((ray + 0.5) / num_rays) * 2 * math.pi
@@ -174,27 +227,23 @@ def create_focus_icon(size: int, blocking: bool = False, for_tray: bool = False)
             else:
                 ray_color = (*dark_rgb, 35)
             
-            ray_img = Image.new('RGBA', (render_size, render_size), (0, 0, 0, 0))
-            ray_draw = ImageDraw.Draw(ray_img)
-            
             points = [
                 (center, center),
                 (center + outer_r * math.cos(angle1), center + outer_r * math.sin(angle1)),
                 (center + outer_r * math.cos(angle2), center + outer_r * math.sin(angle2)),
             ]
             ray_draw.polygon(points, fill=ray_color)
-            
-            ring_mask = Image.new('L', (render_size, render_size), 0)
-            ring_mask_draw = ImageDraw.Draw(ring_mask)
-            ring_mask_draw.ellipse([center - outer_r, center - outer_r, 
-                                    center + outer_r, center + outer_r], fill=255)
-            if inner_r > 0:
-                ring_mask_draw.ellipse([center - inner_r, center - inner_r,
-                                        center + inner_r, center + inner_r], fill=0)
-            
-            ray_img.putalpha(ImageChops.multiply(ray_img.split()[3], ring_mask))
-            img = Image.alpha_composite(img, ray_img)
         
+        ring_mask = Image.new('L', (render_size, render_size), 0)
+        ring_mask_draw = ImageDraw.Draw(ring_mask)
+        ring_mask_draw.ellipse([center - outer_r, center - outer_r, 
+                                center + outer_r, center + outer_r], fill=255)
+        if inner_r > 0:
+            ring_mask_draw.ellipse([center - inner_r, center - inner_r,
+                                    center + inner_r, center + inner_r], fill=0)
+        
+        ray_img.putalpha(ImageChops.multiply(ray_img.split()[3], ring_mask))
+        img = Image.alpha_composite(img, ray_img)
         draw = ImageDraw.Draw(img)
     
     # Add subtle edge highlights on each ring boundary
@@ -387,41 +436,114 @@ def create_focus_icon(size: int, blocking: bool = False, for_tray: bool = False)
     # === Add subtle drop shadow behind figure for depth ===
     # (Already have antialiasing from supersampling)
     
-    # === Downsample to target size with high-quality antialiasing ===
-    img = img.resize((size, size), Image.Resampling.LANCZOS)
-    
     return img
 
 
-def create_app_icon() -> list:
-    """Create main app icon with all required sizes for high-DPI displays."""
-    # Standard Windows ICO sizes + high-DPI sizes (512 for 4K displays)
-    # Windows uses the largest available size and scales down
-    sizes = [16, 24, 32, 48, 64, 128, 256, 512]
-    images = []
-    
+def derive_sizes(master: Image.Image, sizes: List[int], hinting: bool = True) -> Dict[int, Image.Image]:
+    """Downscale a master render to each size, hinting the small ones."""
+    images = {}
     for size in sizes:
-        # Use ready (green) state for main app icon for a calming appearance
-        # Or use blue which is more neutral and professional
-        img = create_focus_icon(size, blocking=True, for_tray=(size <= 32))
-        images.append(img)
-    
+        img = master if master.size == (size, size) else master.resize((size, size), Image.Resampling.LANCZOS)
+        if hinting and size in HINTING:
+            radius, percent, threshold = HINTING[size]
+            img = img.filter(ImageFilter.UnsharpMask(radius=radius, percent=percent, threshold=threshold))
+        images[size] = img
     return images
 
 
-def create_tray_icons():
+def create_app_icon(supersample: int = SUPERSAMPLE, hinting: bool = True) -> list:
+    """Create main app icon with all required sizes for high-DPI displays."""
+    spec = ICON_SETS["app"]
+    master = render_focus_icon(MASTER_SIZE * supersample, spec["blocking"], spec["for_tray"])
+    images = derive_sizes(master, APP_ICON_SIZES, hinting)
+    return [images[size] for size in APP_ICON_SIZES]
+
+
+def create_tray_icons(supersample: int = SUPERSAMPLE, hinting: bool = True):
     """Create system tray icons for ready and blocking states."""
-    # Larger size for high-DPI displays (Windows scales down as needed)
-    size = 128  # Doubled from 64 for crisp display on high-DPI
-    
-    ready_icon = create_focus_icon(size, blocking=False, for_tray=True)
-    blocking_icon = create_focus_icon(size, blocking=True, for_tray=True)
-    
-    return ready_icon, blocking_icon
+    icons = []
+    for name in ("tray_ready", "tray_blocking"):
+        spec = ICON_SETS[name]
+        master = render_focus_icon(MASTER_SIZE * supersample, spec["blocking"], spec["for_tray"])
+        icons.append(derive_sizes(master, [TRAY_PNG_SIZE], hinting)[TRAY_PNG_SIZE])
+    return tuple(icons)
+
+
+def save_ico(images: List[Image.Image], path: Path) -> None:
+    """
+    Save images as one multi-size ICO.
+
+    The largest image must be the one saved: Pillow drops every requested
+    size bigger than the image it is called on.
+    """
+    images = sorted(images, key=lambda img: img.size[0])
+    images[-1].save(
+        path,
+        format='ICO',
+        sizes=[img.size for img in images],
+        append_images=images[:-1]
+    )
+
+
+def icon_set_hash(name: str, supersample: int = SUPERSAMPLE, hinting: bool = True) -> str:
+    """Hash of everything an icon set's files depend on, including this generator."""
+    params = {
+        "set": ICON_SETS[name],
+        "master_size": MASTER_SIZE,
+        "supersample": supersample,
+        "hinting": HINTING if hinting else None,
+    }
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def icon_set_files(name: str) -> List[str]:
+    spec = ICON_SETS[name]
+    return [spec[kind][0] for kind in ("png", "ico") if kind in spec]
+
+
+def build_icon_set(output_dir: Path, name: str, supersample: int = SUPERSAMPLE,
+                   hinting: bool = True) -> List[Path]:
+    """Render one icon set's master and write all its files. Runs in a worker process."""
+    spec = ICON_SETS[name]
+    sizes = set()
+    if "png" in spec:
+        sizes.add(spec["png"][1])
+    if "ico" in spec:
+        sizes.update(spec["ico"][1])
+    master = render_focus_icon(MASTER_SIZE * supersample, spec["blocking"], spec["for_tray"])
+    images = derive_sizes(master, sorted(sizes), hinting)
+
+    written = []
+    if "png" in spec:
+        # PNG for pystray compatibility
+        filename, size = spec["png"]
+        images[size].save(output_dir / filename, format='PNG')
+        written.append(output_dir / filename)
+    if "ico" in spec:
+        # ICO for Windows compatibility
+        filename, ico_sizes = spec["ico"]
+        save_ico([images[size] for size in ico_sizes], output_dir / filename)
+        written.append(output_dir / filename)
+    return written
+
+
+def _read_stamps(output_dir: Path) -> dict:
+    try:
+        return json.loads((output_dir / STAMP_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
 
 
-def save_icons(output_dir: Path):
-    """Generate and save all icons."""
+def save_icons(output_dir: Path, force: bool = False, workers: Optional[int] = None,
+               supersample: int = SUPERSAMPLE, hinting: bool = True) -> List[Path]:
+    """
+    Generate and save all icons whose inputs changed since the last build.
+
+    Returns the files written. force ignores the stamp file; workers=1
+    builds in this process.
+    """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -429,71 +551,56 @@ def save_icons(output_dir: Path):
     print(f"Output directory: {output_dir}")
     print()
     
-    # Generate main app icon
-    print("Creating app.ico (main application icon)...")
-    app_images = create_app_icon()
-    
-    # Save as ICO with multiple sizes
-    ico_path = output_dir / "app.ico"
-    # Use the largest image as base, append smaller ones
-    app_images[0].save(
-        ico_path,
-        format='ICO',
-        sizes=[(img.size[0], img.size[1]) for img in app_images],
-        append_images=app_images[1:]
-    )
-    print(f"  ✓ Saved: {ico_path}")
-    print(f"    Sizes: {', '.join(f'{img.size[0]}x{img.size[1]}' for img in app_images)}")
-    
-    # Generate tray icons
-    print()
-    print("Creating system tray icons...")
-    ready_icon, blocking_icon = create_tray_icons()
-    
-    # Save as PNG (for pystray compatibility)
-    ready_png = output_dir / "tray_ready.png"
-    blocking_png = output_dir / "tray_blocking.png"
-    ready_icon.save(ready_png, format='PNG')
-    blocking_icon.save(blocking_png, format='PNG')
-    print(f"  ✓ Saved: {ready_png}")
-    print(f"  ✓ Saved: {blocking_png}")
-    
-    # Also save as ICO for Windows compatibility
-    ready_ico = output_dir / "tray_ready.ico"
-    blocking_ico = output_dir / "tray_blocking.ico"
-    
-    # Create multiple sizes for tray ICO (including high-DPI sizes)
-    tray_sizes = [16, 24, 32, 48, 64, 128, 256]
-    ready_images = [create_focus_icon(s, blocking=False, for_tray=True) for s in tray_sizes]
-    blocking_images = [create_focus_icon(s, blocking=True, for_tray=True) for s in tray_sizes]
-    
-    ready_images[0].save(
-        ready_ico, format='ICO',
-        sizes=[(s, s) for s in tray_sizes],
-        append_images=ready_images[1:]
-    )
-    blocking_images[0].save(
-        blocking_ico, format='ICO',
-        sizes=[(s, s) for s in tray_sizes],
-        append_images=blocking_images[1:]
-    )
-    print(f"  ✓ Saved: {ready_ico}")
-    print(f"  ✓ Saved: {blocking_ico}")
+    stamps = _read_stamps(output_dir)
+    hashes = {name: icon_set_hash(name, supersample, hinting) for name in ICON_SETS}
+    stale = [
+        name for name in ICON_SETS
+        if force or stamps.get(name) != hashes[name]
+        or not all((output_dir / f).exists() for f in icon_set_files(name))
+    ]
+    for name in ICON_SETS:
+        if name not in stale:
+            print(f"  • {name}: unchanged, skipped")
+    
+    start = time.perf_counter()
+    written = []
+    if len(stale) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {name: pool.submit(build_icon_set, output_dir, name, supersample, hinting)
+                       for name in stale}
+            for name, future in futures.items():
+                written += future.result()
+                stamps[name] = hashes[name]
+    else:
+        for name in stale:
+            written += build_icon_set(output_dir, name, supersample, hinting)
+            stamps[name] = hashes[name]
+    (output_dir / STAMP_FILE).write_text(json.dumps(stamps, indent=2, sort_keys=True), encoding="utf-8")
+    
+    for path in written:
+        print(f"  ✓ Saved: {path}")
     
     print()
     print("=" * 50)
-    print("Icon generation complete!")
+    print(f"Icon generation complete! ({len(stale)} set(s) built in {time.perf_counter() - start:.1f}s)")
     print()
-    print("Files created:")
+    print("Files:")
     print(f"  • app.ico          - Main app icon (Windows Explorer, taskbar)")
     print(f"  • tray_ready.png   - Tray icon (idle/ready state)")
     print(f"  • tray_ready.ico   - Tray icon ICO format")
     print(f"  • tray_blocking.png- Tray icon (active blocking state)")
     print(f"  • tray_blocking.ico- Tray icon ICO format")
+    return written
 
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate Personal Liberty icons")
+    parser.add_argument("--force", action="store_true", help="rebuild even if unchanged")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (1 = no pool)")
+    args = parser.parse_args()
+    
     # Output to icons folder
     script_dir = Path(__file__).parent
     icons_dir = script_dir / "icons"
-    save_icons(icons_dir)
+    save_icons(icons_dir, force=args.force, workers=args.workers)
@@ -0,0 +1,238 @@
+"""
+Precompiled global-hotkey matcher.
+
+Bindings such as "Ctrl+F11" or the two-step chord "Ctrl+K, B" (Qt's
+QKeySequence string format) are parsed once into steps of
+(modifier bitmask, key name). Single-step bindings live in one dict and
+chord bindings in a dict of dicts keyed by their first step, so each key
+press is a couple of dict lookups no matter how many bindings exist.
+
+The matcher only sees normalized key names ("ctrl_l", "f11", "k"), so it
+can be driven by synthetic events in tests. pynput_key_name() converts
+pynput's Key/KeyCode objects (duck-typed, pynput is not imported here).
+
+Behaviour:
+- Modifier state is a bitmask over the held modifier keys; left and right
+  variants are tracked separately, so releasing one Ctrl keeps the other.
+- Auto-repeat presses of a key that is already down are ignored.
+- After the first step of a chord, the second step must follow within
+  that binding's timeout; any other key cancels the pending chord and is
+  matched on its own.
+- A sequence can't be both a single binding and a chord prefix.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+MOD_CTRL = 1
+MOD_SHIFT = 2
+MOD_ALT = 4
+
+DEFAULT_CHORD_TIMEOUT = 1.5  # seconds between the two steps of a chord
+
+# Held-key names (pynput Key.name values) -> modifier bit
+MODIFIER_KEYS = {
+    "ctrl": MOD_CTRL, "ctrl_l": MOD_CTRL, "ctrl_r": MOD_CTRL,
+    "shift": MOD_SHIFT, "shift_l": MOD_SHIFT, "shift_r": MOD_SHIFT,
+    "alt": MOD_ALT, "alt_l": MOD_ALT, "alt_r": MOD_ALT, "alt_gr": MOD_ALT,
+}
+
+# Modifier words in a key sequence string ("meta" has always meant Alt here)
+_MODIFIER_WORDS = {
+    "ctrl": MOD_CTRL, "control": MOD_CTRL,
+    "shift": MOD_SHIFT,
+    "alt": MOD_ALT, "meta": MOD_ALT,
+}
+
+# Sequence-string key names -> canonical key names
+_KEY_ALIASES = {
+    "escape": "esc", "esc": "esc",
+    "space": "space", "tab": "tab",
+    "enter": "enter", "return": "enter",
+    "backspace": "backspace", "delete": "delete", "del": "delete",
+    "home": "home", "end": "end",
+    "pageup": "page_up", "pgup": "page_up",
+    "pagedown": "page_down", "pgdown": "page_down",
+    "up": "up", "down": "down", "left": "left", "right": "right",
+    "insert": "insert", "ins": "insert",
+}
+
+Step = Tuple[int, str]
+
+
+def parse_key(text: str) -> Optional[str]:
+    """Canonical name for a non-modifier key word, or None."""
+    word = text.strip().lower()
+    if len(word) == 1 and word.isprintable() and not word.isspace():
+        return word
+    if word.startswith("f") and word[1:].isdigit() and 1 <= int(word[1:]) <= 24:
+        return word
+    return _KEY_ALIASES.get(word)
+
+
+def parse_step(text: str) -> Optional[Step]:
+    """Parse one step such as "Ctrl+Shift+H" into (modifiers, key)."""
+    mods = 0
+    key = None
+    for part in text.replace("+", " ").split():
+        bit = _MODIFIER_WORDS.get(part.lower())
+        if bit is not None:
+            mods |= bit
+            continue
+        if key is not None:
+            return None  # two main keys in one step
+        key = parse_key(part)
+        if key is None:
+            return None
+    return (mods, key) if key else None
+
+
+def parse_sequence(sequence: str) -> Optional[Tuple[Step, ...]]:
+    """Parse "Ctrl+K, B" into one or two steps; None if unsupported."""
+    if not sequence or not sequence.strip():
+        return None
+    steps = []
+    for chunk in sequence.split(","):
+        step = parse_step(chunk)
+        if step is None:
+            return None
+        steps.append(step)
+    if len(steps) > 2:
+        return None
+    return tuple(steps)
+
+
+def pynput_key_name(key: Any) -> Optional[str]:
+    """
+    Normalized name for a pynput Key or KeyCode.
+
+    Letters and digits are taken from the virtual-key code when there is
+    one, because with Ctrl held Windows reports control characters
+    (Ctrl+K arrives as char '\\x0b').
+    """
+    if key is None:
+        return None
+    name = getattr(key, "name", None)
+    if name:
+        return name  # Key enum member: "ctrl_l", "f11", "esc", ...
+    vk = getattr(key, "vk", None)
+    if isinstance(vk, int) and (0x30 <= vk <= 0x39 or 0x41 <= vk <= 0x5A):
+        return chr(vk).lower()
+    char = getattr(key, "char", None)
+    if char and char.isprintable():
+        return char.lower()
+    return None
+
+
+class HotkeyMatcher:
+    """Lookup tables for any number of bindings plus the live key state."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._single: Dict[Step, Hashable] = {}
+        # first step -> {second step: (action, timeout)}
+        self._chords: Dict[Step, Dict[Step, Tuple[Hashable, float]]] = {}
+        self._held: Dict[str, int] = {}
+        self._down: Set[str] = set()
+        self._pending: Optional[Tuple[Step, float]] = None
+
+    # === Bindings ===
+
+    def bind(self, sequence: str, action: Hashable,
+             timeout: float = DEFAULT_CHORD_TIMEOUT) -> bool:
+        """Compile a binding. Returns False if it can't be parsed or conflicts."""
+        steps = parse_sequence(sequence)
+        if steps is None:
+            logger.warning(f"Could not parse hotkey: {sequence}")
+            return False
+        first = steps[0]
+        if len(steps) == 1:
+            if first in self._chords:
+                logger.warning(f"Hotkey {sequence} is already the start of a chord")
+                return False
+            self._single[first] = action
+        else:
+            if first in self._single:
+                logger.warning(f"Hotkey {sequence} starts with an existing single hotkey")
+                return False
+            self._chords.setdefault(first, {})[steps[1]] = (action, timeout)
+        return True
+
+    def unbind(self, sequence: str) -> bool:
+        steps = parse_sequence(sequence)
+        if steps is None:
+            return False
+        if len(steps) == 1:
+            return self._single.pop(steps[0], None) is not None
+        seconds = self._chords.get(steps[0], {})
+        removed = seconds.pop(steps[1], None) is not None
+        if not seconds:
+            self._chords.pop(steps[0], None)
+        return removed
+
+    def clear(self) -> None:
+        self._single.clear()
+        self._chords.clear()
+        self.reset()
+
+    @property
+    def binding_count(self) -> int:
+        return len(self._single) + sum(len(seconds) for seconds in self._chords.values())
+
+    # === Key state ===
+
+    @property
+    def modifiers(self) -> int:
+        mods = 0
+        for bit in self._held.values():
+            mods |= bit
+        return mods
+
+    @property
+    def chord_pending(self) -> bool:
+        return self._pending is not None
+
+    def reset(self) -> None:
+        """Forget held keys and any half-typed chord (e.g. after the listener restarts)."""
+        self._held.clear()
+        self._down.clear()
+        self._pending = None
+
+    def press(self, key: Optional[str], now: Optional[float] = None) -> Optional[Hashable]:
+        """Feed a key press. Returns the triggered action, if any."""
+        if not key:
+            return None
+        bit = MODIFIER_KEYS.get(key)
+        if bit is not None:
+            self._held[key] = bit
+            return None
+        if key in self._down:
+            return None  # auto-repeat
+        self._down.add(key)
+
+        now = self._clock() if now is None else now
+        step = (self.modifiers, key)
+
+        if self._pending is not None:
+            first, started = self._pending
+            self._pending = None
+            hit = self._chords.get(first, {}).get(step)
+            if hit is not None and now - started <= hit[1]:
+                return hit[0]
+
+        if step in self._chords:
+            self._pending = (step, now)
+            return None
+        return self._single.get(step)
+
+    def release(self, key: Optional[str]) -> None:
+        """Feed a key release."""
+        if not key:
+            return
+        if key in MODIFIER_KEYS:
+            self._held.pop(key, None)
+        else:
+            self._down.discard(key)
@@ -96,6 +96,8 @@ class StatShowcaseWidget(QtWidgets.QWidget):
             ("⏱️", "Focus Time", f"{self.stats.get('total_focus_minutes', 0)}min"),
             ("📦", "Items Collected", self.stats.get("items_collected", 0))
         ]
+        if self.stats.get("xp_earned"):
+            stat_items.insert(0, ("⚡", "XP Earned", f"+{self.stats['xp_earned']:,}"))
         
         row = 0
         col = 0
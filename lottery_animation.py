@@ -11,6 +11,9 @@ import time
 from typing import Optional, Callable
 from PySide6 import QtWidgets, QtCore, QtGui
 
+from animation_timeline import KeyframeTrack, frame_scheduler
+from theme import set_style_state
+
 
 # ============================================================================
 # Shared Paint Cache (avoids creating QColor/QFont/QPen in paintEvent)
@@ -368,8 +371,7 @@ class LotteryRollDialog(QtWidgets.QDialog):
         self.failure_text = failure_text
         
         # Animation settings
-        self.tick_interval = 16  # ~60 FPS (smoother animation)
-        self.elapsed_time = 0.0
+        self.elapsed_time = 0.0  # Advanced by the shared frame scheduler
         self.animation_duration = animation_duration
         
         # Style state tracking to avoid redundant setStyleSheet calls
@@ -383,46 +385,8 @@ class LotteryRollDialog(QtWidgets.QDialog):
     
     def _generate_bounce_path(self):
         """Generate the ping-pong bounce path for the animation."""
-        # Start at 50, visit walls (0/100) multiple times, end at target
-        self.path_points = [50.0]
-        
-        # Random start direction
-        going_up = random.choice([True, False])
-        
-        # Number of full bounces (wall-to-wall traversals)
-        # 4-6 bounces creates nice suspense
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                self.path_points.append(100.0)
-                self.path_points.append(0.0)
-            else:
-                self.path_points.append(0.0)
-                self.path_points.append(100.0)
-        
-        # Add final target
-        self.path_points.append(self.target_roll)
-        
-        # Pre-calculate distance segments for O(1) interpolation
-        self.segments = []
-        self.total_distance = 0.0
-        
-        for i in range(len(self.path_points) - 1):
-            start = self.path_points[i]
-            end = self.path_points[i+1]
-            dist = abs(end - start)
-            
-            # Skip zero-length segments
-            if dist > 0.001:
-                self.segments.append({
-                    "start": start,
-                    "end": end,
-                    "dist": dist,
-                    "cum_start": self.total_distance,
-                    "cum_end": self.total_distance + dist
-                })
-                self.total_distance += dist
+        # Start at 50, visit walls (0/100) 4-6 times, end at target
+        self.track = KeyframeTrack.bounce(self.target_roll)
     
     def _setup_ui(self):
         """Build the slider animation UI."""
@@ -462,12 +426,7 @@ class LotteryRollDialog(QtWidgets.QDialog):
         # Current roll display
         self.roll_label = QtWidgets.QLabel("0.0%")
         self.roll_label.setAlignment(QtCore.Qt.AlignCenter)
-        self.roll_label.setStyleSheet("""
-            font-size: 28px;
-            font-weight: bold;
-            color: #fff;
-            font-family: 'Consolas', 'Monaco', monospace;
-        """)
+        set_style_state(self.roll_label, "lotteryRollValue")
         container_layout.addWidget(self.roll_label)
         
         # Status
@@ -510,51 +469,26 @@ class LotteryRollDialog(QtWidgets.QDialog):
     
     def _start_animation(self):
         """Start the damped oscillation animation."""
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self._tick)
-        self.timer.start(self.tick_interval)
+        frame_scheduler().add(self._tick, owner=self)
     
-    def _tick(self):
+    def _tick(self, dt: float) -> bool:
         """Update animation by traversing the pre-calculated bounce path."""
-        # Update elapsed time
-        self.elapsed_time += 0.016  # 16ms interval for 60 FPS
+        # Update elapsed time with the real frame interval
+        self.elapsed_time += dt
         
         # Calculate normalized progress (0.0 to 1.0)
         t = min(1.0, self.elapsed_time / self.animation_duration)
         
-        # Apply easing function for realistic friction/deceleration
-        # EaseOutQuart: 1 - (1-t)^4
-        eased_progress = 1.0 - (1.0 - t) ** 4
-        
-        # Calculate current distance traveled along the path
-        current_travel = eased_progress * self.total_distance
-        
-        # Find which segment we are in
-        found_pos = self.target_roll  # Default fallback
-        
-        for seg in self.segments:
-            if current_travel >= seg["cum_start"] and current_travel <= seg["cum_end"]:
-                # Interpolate within this segment
-                local_dist = current_travel - seg["cum_start"]
-                local_progress = local_dist / seg["dist"]
-                found_pos = seg["start"] + (seg["end"] - seg["start"]) * local_progress
-                break
-            elif current_travel > seg["cum_end"]:
-                continue
-        else:
-            if current_travel >= self.total_distance:
-                found_pos = self.target_roll
-
-        self.current_position = found_pos
+        # Position along the path, EaseOutQuart for realistic friction/deceleration
+        self.current_position = self.track.at_progress(t)
         
         # End condition
         if t >= 1.0:
-            self.timer.stop()
             self.current_position = self.target_roll
             self.slider_widget.set_position(self.target_roll)
             self.roll_label.setText(f"{self.target_roll:.1f}%")
             self._show_final_result()
-            return
+            return False
             
         # Ensure bounds 0-100
         self.current_position = max(0.0, min(100.0, self.current_position))
@@ -565,16 +499,8 @@ class LotteryRollDialog(QtWidgets.QDialog):
         new_style = "success" if self.current_position < self.success_threshold else "fail"
         if new_style != self._last_roll_style:
             self._last_roll_style = new_style
-            if new_style == "success":
-                self.roll_label.setStyleSheet("""
-                    font-size: 28px; font-weight: bold; color: #4caf50;
-                    font-family: 'Consolas', 'Monaco', monospace;
-                """)
-            else:
-                self.roll_label.setStyleSheet("""
-                    font-size: 28px; font-weight: bold; color: #f44336;
-                    font-family: 'Consolas', 'Monaco', monospace;
-                """)
+            set_style_state(self.roll_label, "lotteryRollValue",
+                            tone="win" if new_style == "success" else "lose")
         
         # Update status based on speed (derivative of eased_progress) - only if changed
         speed = 4 * (1.0 - t) ** 3
@@ -590,24 +516,18 @@ class LotteryRollDialog(QtWidgets.QDialog):
         if new_status != self._last_status_text:
             self._last_status_text = new_status
             self.status_label.setText(new_status)
+        return True
     
     def _show_final_result(self):
         """Show the final result."""
         self.roll_label.setText(f"{self.target_roll:.1f}%")
         
+        set_style_state(self.roll_label, "lotteryRollValue", tone="win" if self.is_success else "lose")
         if self.is_success:
-            self.roll_label.setStyleSheet("""
-                font-size: 28px; font-weight: bold; color: #4caf50;
-                font-family: 'Consolas', 'Monaco', monospace;
-            """)
             self.status_label.setText(self.success_text)
             self.status_label.setStyleSheet("color: #4caf50; font-size: 16px; font-weight: bold;")
             self.slider_widget.set_result(True)
         else:
-            self.roll_label.setStyleSheet("""
-                font-size: 28px; font-weight: bold; color: #f44336;
-                font-family: 'Consolas', 'Monaco', monospace;
-            """)
             self.status_label.setText(self.failure_text)
             self.status_label.setStyleSheet("color: #f44336; font-size: 16px; font-weight: bold;")
             self.slider_widget.set_result(False)
@@ -622,8 +542,7 @@ class LotteryRollDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timer on close and save geometry."""
         save_dialog_geometry(self, "LotteryRollDialog")
-        if hasattr(self, 'timer'):
-            self.timer.stop()
+        frame_scheduler().remove(self._tick)
         super().closeEvent(event)
 
 
@@ -1132,31 +1051,7 @@ class TwoStageLotteryDialog(QtWidgets.QDialog):
         self._tier_anim_callback = on_complete
         
         # Generate bounce path
-        path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                path_points.append(100.0)
-                path_points.append(0.0)
-            else:
-                path_points.append(0.0)
-                path_points.append(100.0)
-        path_points.append(target_roll)
-        
-        self._tier_anim_segments = []
-        self._tier_anim_total_dist = 0.0
-        for i in range(len(path_points) - 1):
-            start, end = path_points[i], path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._tier_anim_segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._tier_anim_total_dist,
-                    "cum_end": self._tier_anim_total_dist + dist
-                })
-                self._tier_anim_total_dist += dist
+        self._tier_anim_track = KeyframeTrack.bounce(target_roll)
         
         self._tier_anim_elapsed = 0.0
         self._tier_anim_duration = 5.0  # Snappy dramatic effect
@@ -1164,28 +1059,13 @@ class TwoStageLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._tier_last_tier = None
         
-        self._tier_anim_timer = QtCore.QTimer(self)
-        self._tier_anim_timer.timeout.connect(self._tier_anim_tick)
-        self._tier_anim_timer.start(16)  # 60 FPS for smoother animation
+        frame_scheduler().add(self._tier_anim_tick, owner=self)
     
-    def _tier_anim_tick(self):
+    def _tier_anim_tick(self, dt: float) -> bool:
         """Animation tick for tier stage."""
-        # Cached tier colors (class constant would be better but works for this method)
-        TIER_COLORS = {"Common": "#9e9e9e", "Uncommon": "#4caf50", "Rare": "#2196f3", 
-                       "Epic": "#9c27b0", "Legendary": "#ff9800"}
-        
-        self._tier_anim_elapsed += 0.016  # Match 16ms timer interval
+        self._tier_anim_elapsed += dt
         t = min(1.0, self._tier_anim_elapsed / self._tier_anim_duration)
-        eased = 1.0 - (1.0 - t) ** 4
-        
-        current_travel = eased * self._tier_anim_total_dist
-        pos = self._tier_anim_target
-        
-        for seg in self._tier_anim_segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._tier_anim_track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self._tier_anim_slider.set_position(pos)
@@ -1194,14 +1074,14 @@ class TwoStageLotteryDialog(QtWidgets.QDialog):
         current_tier = self._tier_anim_slider.get_tier_at_position(pos)
         if current_tier != self._tier_last_tier:
             self._tier_last_tier = current_tier
-            color = TIER_COLORS.get(current_tier, "#aaa")
-            self._tier_anim_result.setStyleSheet(f"color: {color}; font-size: 14px;")
+            set_style_state(self._tier_anim_result, "lotteryReadout", tone=current_tier)
         self._tier_anim_result.setText(f"🎲 {pos:.1f}% → {current_tier}")
         
         if t >= 1.0:
-            self._tier_anim_timer.stop()
             self._tier_anim_slider.set_position(self._tier_anim_target)
             self._tier_anim_callback()
+            return False
+        return True
     
     def _animate_stage(self, slider: LotterySliderWidget, result_label: QtWidgets.QLabel,
                        target_roll: float, threshold: float, on_complete: Callable):
@@ -1215,32 +1095,7 @@ class TwoStageLotteryDialog(QtWidgets.QDialog):
         self._anim_success = target_roll < threshold
         
         # Generate bounce path
-        path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(3, 5)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                path_points.append(100.0)
-                path_points.append(0.0)
-            else:
-                path_points.append(0.0)
-                path_points.append(100.0)
-        path_points.append(self._anim_target)
-        
-        # Calculate segments
-        self._anim_segments = []
-        self._anim_total_dist = 0.0
-        for i in range(len(path_points) - 1):
-            start, end = path_points[i], path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._anim_segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._anim_total_dist,
-                    "cum_end": self._anim_total_dist + dist
-                })
-                self._anim_total_dist += dist
+        self._anim_track = KeyframeTrack.bounce(self._anim_target, 3, 5)
         
         self._anim_elapsed = 0.0
         self._anim_duration = 4.0  # Snappy animation
@@ -1248,24 +1103,13 @@ class TwoStageLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._anim_last_zone = None
         
-        self._anim_timer = QtCore.QTimer(self)
-        self._anim_timer.timeout.connect(self._anim_tick)
-        self._anim_timer.start(16)  # 60 FPS for smoother animation
+        frame_scheduler().add(self._anim_tick, owner=self)
     
-    def _anim_tick(self):
+    def _anim_tick(self, dt: float) -> bool:
         """Animation tick for current stage."""
-        self._anim_elapsed += 0.016  # Match 16ms timer interval
+        self._anim_elapsed += dt
         t = min(1.0, self._anim_elapsed / self._anim_duration)
-        eased = 1.0 - (1.0 - t) ** 4
-        
-        current_travel = eased * self._anim_total_dist
-        pos = self._anim_target
-        
-        for seg in self._anim_segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._anim_track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self._anim_slider.set_position(pos)
@@ -1274,17 +1118,15 @@ class TwoStageLotteryDialog(QtWidgets.QDialog):
         is_in_win_zone = pos < self._anim_threshold
         if is_in_win_zone != self._anim_last_zone:
             self._anim_last_zone = is_in_win_zone
-            if is_in_win_zone:
-                self._anim_result.setStyleSheet("color: #4caf50; font-size: 14px;")
-            else:
-                self._anim_result.setStyleSheet("color: #f44336; font-size: 14px;")
+            set_style_state(self._anim_result, "lotteryReadout", tone="win" if is_in_win_zone else "lose")
         self._anim_result.setText(f"🎲 {pos:.1f}%")
         
         if t >= 1.0:
-            self._anim_timer.stop()
             self._anim_slider.set_position(self._anim_target)
             self._anim_slider.set_result(self._anim_success)
             self._anim_callback(self._anim_success)
+            return False
+        return True
     
     def _finish(self):
         """Emit result and close."""
@@ -1294,10 +1136,8 @@ class TwoStageLotteryDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timers and save geometry."""
         save_dialog_geometry(self, "EyeProtectionLotteryDialog")
-        if hasattr(self, '_anim_timer'):
-            self._anim_timer.stop()
-        if hasattr(self, '_tier_anim_timer'):
-            self._tier_anim_timer.stop()
+        frame_scheduler().remove(self._anim_tick)
+        frame_scheduler().remove(self._tier_anim_tick)
         super().closeEvent(event)
 
     def get_results(self) -> tuple:
@@ -1858,31 +1698,7 @@ class PriorityLotteryDialog(QtWidgets.QDialog):
         self._anim_is_rarity = is_rarity
         
         # Generate bounce path
-        path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                path_points.append(100.0)
-                path_points.append(0.0)
-            else:
-                path_points.append(0.0)
-                path_points.append(100.0)
-        path_points.append(target_roll)
-        
-        self._anim_segments = []
-        self._anim_total_dist = 0.0
-        for i in range(len(path_points) - 1):
-            start, end = path_points[i], path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._anim_segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._anim_total_dist,
-                    "cum_end": self._anim_total_dist + dist
-                })
-                self._anim_total_dist += dist
+        self._anim_track = KeyframeTrack.bounce(target_roll)
         
         self._anim_elapsed = 0.0
         self._anim_duration = 5.0  # Snappy dramatic effect
@@ -1891,24 +1707,13 @@ class PriorityLotteryDialog(QtWidgets.QDialog):
         self._anim_last_rarity = None
         self._anim_last_zone = None
         
-        self._anim_timer = QtCore.QTimer(self)
-        self._anim_timer.timeout.connect(self._anim_tick)
-        self._anim_timer.start(16)  # 60 FPS for smooth performance
+        frame_scheduler().add(self._anim_tick, owner=self)
     
-    def _anim_tick(self):
+    def _anim_tick(self, dt: float) -> bool:
         """Animation tick."""
-        self._anim_elapsed += 0.016  # Match timer interval
+        self._anim_elapsed += dt
         t = min(1.0, self._anim_elapsed / self._anim_duration)
-        eased = 1.0 - (1.0 - t) ** 4
-        
-        current_travel = eased * self._anim_total_dist
-        pos = self._anim_target
-        
-        for seg in self._anim_segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._anim_track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self._anim_slider.set_position(pos)
@@ -1918,35 +1723,28 @@ class PriorityLotteryDialog(QtWidgets.QDialog):
             rarity = self._anim_slider.get_rarity_at_position(pos)
             if rarity != self._anim_last_rarity:
                 self._anim_last_rarity = rarity
-                rarity_colors = {
-                    "Common": "#9e9e9e", "Uncommon": "#4caf50", "Rare": "#2196f3",
-                    "Epic": "#9c27b0", "Legendary": "#ff9800"
-                }
-                color = rarity_colors.get(rarity, "#aaa")
-                self._anim_result.setStyleSheet(f"color: {color}; font-size: 14px;")
+                set_style_state(self._anim_result, "lotteryReadout", tone=rarity)
             self._anim_result.setText(f"🎲 {pos:.1f}% → {rarity}")
         else:
             threshold = self.win_chance * 100
             is_in_win_zone = pos < threshold
             if is_in_win_zone != self._anim_last_zone:
                 self._anim_last_zone = is_in_win_zone
-                if is_in_win_zone:
-                    self._anim_result.setStyleSheet("color: #4caf50; font-size: 14px;")
-                else:
-                    self._anim_result.setStyleSheet("color: #f44336; font-size: 14px;")
+                set_style_state(self._anim_result, "lotteryReadout", tone="win" if is_in_win_zone else "lose")
             if is_in_win_zone:
                 self._anim_result.setText(f"🎲 {pos:.1f}% (IN THE WIN ZONE!)")
             else:
                 self._anim_result.setText(f"🎲 {pos:.1f}%")
         
         if t >= 1.0:
-            self._anim_timer.stop()
             self._anim_slider.set_position(self._anim_target)
             
             if not self._anim_is_rarity:
                 self._anim_slider.set_result(self.won)
             
             self._anim_callback()
+            return False
+        return True
     
     def _finish(self):
         """Emit result and close."""
@@ -1964,8 +1762,7 @@ class PriorityLotteryDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timers and save geometry."""
         save_dialog_geometry(self, "PriorityLotteryDialog")
-        if hasattr(self, '_anim_timer'):
-            self._anim_timer.stop()
+        frame_scheduler().remove(self._anim_tick)
         super().closeEvent(event)
 
 
@@ -2887,29 +2684,7 @@ class MergeTwoStageLotteryDialog(QtWidgets.QDialog):
         self._anim_callback = on_complete
         
         # Generate bounce path
-        path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                path_points.extend([100.0, 0.0])
-            else:
-                path_points.extend([0.0, 100.0])
-        path_points.append(target_roll)
-        
-        self._anim_segments = []
-        self._anim_total_dist = 0.0
-        for i in range(len(path_points) - 1):
-            start, end = path_points[i], path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._anim_segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._anim_total_dist,
-                    "cum_end": self._anim_total_dist + dist
-                })
-                self._anim_total_dist += dist
+        self._anim_track = KeyframeTrack.bounce(target_roll)
         
         self._anim_elapsed = 0.0
         self._anim_duration = 5.0
@@ -2917,24 +2692,13 @@ class MergeTwoStageLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._tier_last_style = None
         
-        self._tier_anim_timer = QtCore.QTimer(self)
-        self._tier_anim_timer.timeout.connect(self._tier_anim_tick)
-        self._tier_anim_timer.start(16)  # 60 FPS for smoother animation
+        frame_scheduler().add(self._tier_anim_tick, owner=self)
     
-    def _tier_anim_tick(self):
+    def _tier_anim_tick(self, dt: float) -> bool:
         """Tier animation tick."""
-        self._anim_elapsed += 0.016  # Match 16ms timer interval
+        self._anim_elapsed += dt
         t = min(1.0, self._anim_elapsed / self._anim_duration)
-        eased = 1.0 - (1.0 - t) ** 4
-        
-        current_travel = eased * self._anim_total_dist
-        pos = self._anim_target
-        
-        for seg in self._anim_segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._anim_track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self._anim_slider.set_position(pos)
@@ -2943,14 +2707,14 @@ class MergeTwoStageLotteryDialog(QtWidgets.QDialog):
         tier = self._anim_slider.get_tier_at_position(pos)
         if tier != self._tier_last_style:
             self._tier_last_style = tier
-            color = self.TIER_COLORS.get(tier, "#aaa")
-            self._anim_result.setStyleSheet(f"color: {color}; font-size: 14px;")
+            set_style_state(self._anim_result, "lotteryReadout", tone=tier)
         self._anim_result.setText(f"🎲 {pos:.1f}% → {tier}")
         
         if t >= 1.0:
-            self._tier_anim_timer.stop()
             self._anim_slider.set_position(self._anim_target)
             self._anim_callback()
+            return False
+        return True
     
     def _animate_success_stage(self, slider, result_label, target_roll, on_complete):
         """Animate success/fail roll."""
@@ -2960,29 +2724,7 @@ class MergeTwoStageLotteryDialog(QtWidgets.QDialog):
         self._success_callback = on_complete
         
         # Generate bounce path
-        path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                path_points.extend([100.0, 0.0])
-            else:
-                path_points.extend([0.0, 100.0])
-        path_points.append(target_roll)
-        
-        self._success_segments = []
-        self._success_total_dist = 0.0
-        for i in range(len(path_points) - 1):
-            start, end = path_points[i], path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._success_segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._success_total_dist,
-                    "cum_end": self._success_total_dist + dist
-                })
-                self._success_total_dist += dist
+        self._success_track = KeyframeTrack.bounce(target_roll)
         
         self._success_elapsed = 0.0
         self._success_duration = 5.0
@@ -2990,24 +2732,13 @@ class MergeTwoStageLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._success_last_style = None
         
-        self._success_anim_timer = QtCore.QTimer(self)
-        self._success_anim_timer.timeout.connect(self._success_anim_tick)
-        self._success_anim_timer.start(16)  # 60 FPS for smoother animation
+        frame_scheduler().add(self._success_anim_tick, owner=self)
     
-    def _success_anim_tick(self):
+    def _success_anim_tick(self, dt: float) -> bool:
         """Success animation tick."""
-        self._success_elapsed += 0.016  # Match 16ms timer interval
+        self._success_elapsed += dt
         t = min(1.0, self._success_elapsed / self._success_duration)
-        eased = 1.0 - (1.0 - t) ** 4
-        
-        current_travel = eased * self._success_total_dist
-        pos = self._success_target
-        
-        for seg in self._success_segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._success_track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self._success_slider.set_position(pos)
@@ -3018,10 +2749,7 @@ class MergeTwoStageLotteryDialog(QtWidgets.QDialog):
         # Only update style if zone changed
         if is_in_success_zone != self._success_last_style:
             self._success_last_style = is_in_success_zone
-            if is_in_success_zone:
-                self._success_result.setStyleSheet("color: #4caf50; font-size: 14px;")
-            else:
-                self._success_result.setStyleSheet("color: #f44336; font-size: 14px;")
+            set_style_state(self._success_result, "lotteryReadout", tone="win" if is_in_success_zone else "lose")
         
         if is_in_success_zone:
             self._success_result.setText(f"🎲 {pos:.1f}% (SUCCESS ZONE!)")
@@ -3029,9 +2757,10 @@ class MergeTwoStageLotteryDialog(QtWidgets.QDialog):
             self._success_result.setText(f"🎲 {pos:.1f}%")
         
         if t >= 1.0:
-            self._success_anim_timer.stop()
             self._success_slider.set_position(self._success_target)
             self._success_callback()
+            return False
+        return True
     
     def _finish(self):
         """Emit result and close."""
@@ -3050,10 +2779,8 @@ class MergeTwoStageLotteryDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timers and save geometry."""
         save_dialog_geometry(self, "MergeLotteryDialog")
-        if hasattr(self, '_tier_anim_timer'):
-            self._tier_anim_timer.stop()
-        if hasattr(self, '_success_anim_timer'):
-            self._success_anim_timer.stop()
+        frame_scheduler().remove(self._tier_anim_tick)
+        frame_scheduler().remove(self._success_anim_tick)
         super().closeEvent(event)
 
 
@@ -3495,30 +3222,7 @@ class WaterLotteryDialog(QtWidgets.QDialog):
         self.stage1_frame.setStyleSheet("QFrame { border: 2px solid #ff9800; }")
         
         # Generate bounce path (same as merge dialog)
-        self._stage1_path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                self._stage1_path_points.extend([100.0, 0.0])
-            else:
-                self._stage1_path_points.extend([0.0, 100.0])
-        self._stage1_path_points.append(self.tier_roll)
-        
-        # Pre-compute segments for smoother animation
-        self._stage1_segments = []
-        self._stage1_total_dist = 0.0
-        for i in range(len(self._stage1_path_points) - 1):
-            start, end = self._stage1_path_points[i], self._stage1_path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._stage1_segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._stage1_total_dist,
-                    "cum_end": self._stage1_total_dist + dist
-                })
-                self._stage1_total_dist += dist
+        self._stage1_track = KeyframeTrack.bounce(self.tier_roll)
         
         self._stage1_elapsed = 0.0
         self._stage1_duration = 5.0
@@ -3526,30 +3230,13 @@ class WaterLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._stage1_last_tier = None
         
-        self._stage1_timer = QtCore.QTimer(self)
-        self._stage1_timer.timeout.connect(self._animate_stage1_tick)
-        self._stage1_timer.start(16)  # 60 FPS for smooth performance
+        frame_scheduler().add(self._animate_stage1_tick, owner=self)
     
-    def _animate_stage1_tick(self):
+    def _animate_stage1_tick(self, dt: float) -> bool:
         """Tier roll animation tick."""
-        # Cached tier colors for performance
-        TIER_COLORS = {
-            "Common": "#9e9e9e", "Uncommon": "#4caf50", "Rare": "#2196f3",
-            "Epic": "#9c27b0", "Legendary": "#ff9800"
-        }
-        
-        self._stage1_elapsed += 0.016  # Match timer interval
+        self._stage1_elapsed += dt
         t = min(1.0, self._stage1_elapsed / self._stage1_duration)
-        eased = 1.0 - (1.0 - t) ** 4  # EaseOutQuart
-        
-        current_travel = eased * self._stage1_total_dist
-        pos = self.tier_roll
-        
-        for seg in self._stage1_segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._stage1_track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self.tier_slider.set_position(pos)
@@ -3558,14 +3245,14 @@ class WaterLotteryDialog(QtWidgets.QDialog):
         tier = self.tier_slider.get_tier_at_position(pos)
         if tier != self._stage1_last_tier:
             self._stage1_last_tier = tier
-            color = TIER_COLORS.get(tier, "#fff")
-            self.stage1_result.setStyleSheet(f"color: {color}; font-size: 14px;")
+            set_style_state(self.stage1_result, "lotteryReadout", tone=tier)
         self.stage1_result.setText(f"🎲 {pos:.1f}% → {tier}")
         
         if t >= 1.0:
-            self._stage1_timer.stop()
             self.tier_slider.set_position(self.tier_roll)
             self._finish_stage_1()
+            return False
+        return True
     
     def _finish_stage_1(self):
         """Finish tier roll, show result and start stage 2."""
@@ -3592,31 +3279,7 @@ class WaterLotteryDialog(QtWidgets.QDialog):
         self.stage2_frame.setStyleSheet("QFrame { border: 2px solid #ff9800; }")
         
         # Generate bounce path (same as merge dialog)
-        self._stage2_path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                self._stage2_path_points.extend([100.0, 0.0])
-            else:
-                self._stage2_path_points.extend([0.0, 100.0])
-        # Convert 0-1 roll to 0-100 for slider position
-        self._stage2_path_points.append(self.win_roll * 100)
-        
-        # Pre-compute segments for smoother animation
-        self._stage2_segments = []
-        self._stage2_total_dist = 0.0
-        for i in range(len(self._stage2_path_points) - 1):
-            start, end = self._stage2_path_points[i], self._stage2_path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._stage2_segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._stage2_total_dist,
-                    "cum_end": self._stage2_total_dist + dist
-                })
-                self._stage2_total_dist += dist
+        self._stage2_track = KeyframeTrack.bounce(self.win_roll * 100)
         
         self._stage2_elapsed = 0.0
         self._stage2_duration = 5.0
@@ -3624,24 +3287,13 @@ class WaterLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._stage2_last_zone = None
         
-        self._stage2_timer = QtCore.QTimer(self)
-        self._stage2_timer.timeout.connect(self._animate_stage2_tick)
-        self._stage2_timer.start(16)  # 60 FPS for smooth performance
+        frame_scheduler().add(self._animate_stage2_tick, owner=self)
     
-    def _animate_stage2_tick(self):
+    def _animate_stage2_tick(self, dt: float) -> bool:
         """Win/lose animation tick."""
-        self._stage2_elapsed += 0.016  # Match timer interval
+        self._stage2_elapsed += dt
         t = min(1.0, self._stage2_elapsed / self._stage2_duration)
-        eased = 1.0 - (1.0 - t) ** 4  # EaseOutQuart
-        
-        current_travel = eased * self._stage2_total_dist
-        pos = self.win_roll * 100  # Convert to 0-100 for display
-        
-        for seg in self._stage2_segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._stage2_track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self.win_slider.set_position(pos)
@@ -3651,10 +3303,7 @@ class WaterLotteryDialog(QtWidgets.QDialog):
         is_in_win_zone = pos < success_pct
         if is_in_win_zone != self._stage2_last_zone:
             self._stage2_last_zone = is_in_win_zone
-            if is_in_win_zone:
-                self.stage2_result.setStyleSheet("color: #4caf50; font-size: 14px;")
-            else:
-                self.stage2_result.setStyleSheet("color: #f44336; font-size: 14px;")
+            set_style_state(self.stage2_result, "lotteryReadout", tone="win" if is_in_win_zone else "lose")
         
         if is_in_win_zone:
             self.stage2_result.setText(f"🎲 {pos:.1f}% (WIN ZONE!)")
@@ -3662,9 +3311,10 @@ class WaterLotteryDialog(QtWidgets.QDialog):
             self.stage2_result.setText(f"🎲 {pos:.1f}%")
         
         if t >= 1.0:
-            self._stage2_timer.stop()
             self.win_slider.set_position(self.win_roll * 100)
             self._finish_stage_2()
+            return False
+        return True
     
     def _finish_stage_2(self):
         """Finish win/lose roll, show final result."""
@@ -3727,10 +3377,8 @@ class WaterLotteryDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timers and save geometry."""
         # Stop timers first to prevent any callbacks during cleanup
-        if hasattr(self, '_stage1_timer') and self._stage1_timer:
-            self._stage1_timer.stop()
-        if hasattr(self, '_stage2_timer') and self._stage2_timer:
-            self._stage2_timer.stop()
+        frame_scheduler().remove(self._animate_stage1_tick)
+        frame_scheduler().remove(self._animate_stage2_tick)
         save_dialog_geometry(self, "WaterLotteryDialog")
         super().closeEvent(event)
 
@@ -4083,30 +3731,7 @@ class FocusTimerLotteryDialog(QtWidgets.QDialog):
     def _start_animation(self):
         """Start tier roll animation using bounce path (same as merge dialog)."""
         # Generate bounce path (same as merge dialog)
-        self._path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                self._path_points.extend([100.0, 0.0])
-            else:
-                self._path_points.extend([0.0, 100.0])
-        self._path_points.append(self.tier_roll)
-        
-        # Pre-compute segments for smoother animation
-        self._segments = []
-        self._total_dist = 0.0
-        for i in range(len(self._path_points) - 1):
-            start, end = self._path_points[i], self._path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._total_dist,
-                    "cum_end": self._total_dist + dist
-                })
-                self._total_dist += dist
+        self._track = KeyframeTrack.bounce(self.tier_roll)
         
         self._anim_elapsed = 0.0
         self._anim_duration = 4.0
@@ -4114,30 +3739,13 @@ class FocusTimerLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._anim_last_tier = None
         
-        self._anim_timer = QtCore.QTimer(self)
-        self._anim_timer.timeout.connect(self._animate_step)
-        self._anim_timer.start(16)  # 60 FPS for smooth performance
+        frame_scheduler().add(self._animate_step, owner=self)
     
-    def _animate_step(self):
+    def _animate_step(self, dt: float) -> bool:
         """Animation frame using bounce path."""
-        # Cached tier colors for performance
-        TIER_COLORS = {
-            "Common": "#9e9e9e", "Uncommon": "#4caf50", "Rare": "#2196f3",
-            "Epic": "#9c27b0", "Legendary": "#ff9800"
-        }
-        
-        self._anim_elapsed += 0.016  # Match timer interval
+        self._anim_elapsed += dt
         t = min(1.0, self._anim_elapsed / self._anim_duration)
-        eased = 1.0 - (1.0 - t) ** 4  # EaseOutQuart
-        
-        current_travel = eased * self._total_dist
-        pos = self.tier_roll
-        
-        for seg in self._segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self.tier_slider.set_position(pos)
@@ -4146,14 +3754,14 @@ class FocusTimerLotteryDialog(QtWidgets.QDialog):
         current_tier = self.tier_slider.get_tier_at_position(pos)
         if current_tier != self._anim_last_tier:
             self._anim_last_tier = current_tier
-            color = TIER_COLORS.get(current_tier, "#fff")
-            self.lottery_result.setStyleSheet(f"color: {color}; font-size: 14px;")
+            set_style_state(self.lottery_result, "lotteryReadout", tone=current_tier)
         self.lottery_result.setText(f"🎲 {pos:.1f}% → {current_tier}")
         
         if t >= 1.0:
-            self._anim_timer.stop()
             self.tier_slider.set_position(self.tier_roll)
             self._show_result()
+            return False
+        return True
     
     def _show_result(self):
         """Show the won item."""
@@ -4218,8 +3826,7 @@ class FocusTimerLotteryDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timers and save geometry."""
         save_dialog_geometry(self, "FocusTimerLotteryDialog")
-        if hasattr(self, '_anim_timer'):
-            self._anim_timer.stop()
+        frame_scheduler().remove(self._animate_step)
         super().closeEvent(event)
 
 
@@ -4382,21 +3989,7 @@ class ActivityLotteryDialog(QtWidgets.QDialog):
         
         # Final approach to target
         self._path_points.append(self.tier_roll)
-        
-        # Calculate segment distances
-        self._segments = []
-        self._total_dist = 0.0
-        
-        for i in range(len(self._path_points) - 1):
-            start, end = self._path_points[i], self._path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._total_dist,
-                    "cum_end": self._total_dist + dist
-                })
-                self._total_dist += dist
+        self._track = KeyframeTrack(self._path_points)
         
         self._elapsed = 0.0
         self._duration = 4.0
@@ -4404,30 +3997,13 @@ class ActivityLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._last_tier = None
         
-        self._anim_timer = QtCore.QTimer(self)
-        self._anim_timer.timeout.connect(self._anim_tick)
-        self._anim_timer.start(16)  # 60 FPS for smooth performance
+        frame_scheduler().add(self._anim_tick, owner=self)
     
-    def _anim_tick(self):
+    def _anim_tick(self, dt: float) -> bool:
         """Animation tick."""
-        # Cached tier colors for performance
-        TIER_COLORS = {
-            "Common": "#9e9e9e", "Uncommon": "#4caf50", "Rare": "#2196f3",
-            "Epic": "#9c27b0", "Legendary": "#ff9800"
-        }
-        
-        self._elapsed += 0.016  # Match timer interval
+        self._elapsed += dt
         t = min(1.0, self._elapsed / self._duration)
-        eased = 1.0 - (1.0 - t) ** 4  # EaseOutQuart
-        
-        current_travel = eased * self._total_dist
-        pos = self.tier_roll
-        
-        for seg in self._segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self.tier_slider.set_position(pos)
@@ -4436,14 +4012,14 @@ class ActivityLotteryDialog(QtWidgets.QDialog):
         tier = self.tier_slider.get_tier_at_position(pos)
         if tier != self._last_tier:
             self._last_tier = tier
-            color = TIER_COLORS.get(tier, "#fff")
-            self.result_label.setStyleSheet(f"color: {color}; font-size: 14px;")
+            set_style_state(self.result_label, "lotteryReadout", tone=tier)
         self.result_label.setText(f"🎲 {pos:.1f}% → {tier}")
         
         if t >= 1.0:
-            self._anim_timer.stop()
             self.tier_slider.set_position(self.tier_roll)
             self._finish_animation()
+            return False
+        return True
     
     def _finish_animation(self):
         """Show final result."""
@@ -4486,8 +4062,7 @@ class ActivityLotteryDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timers and save geometry."""
         save_dialog_geometry(self, "ActivityLotteryDialog")
-        if hasattr(self, '_anim_timer'):
-            self._anim_timer.stop()
+        frame_scheduler().remove(self._anim_tick)
         super().closeEvent(event)
 
 
@@ -4807,30 +4382,7 @@ class WeightLotteryDialog(QtWidgets.QDialog):
     def _start_animation(self):
         """Start tier roll animation using bounce path (same as FocusTimerLotteryDialog)."""
         # Generate bounce path with randomized direction (matches FocusTimerLotteryDialog)
-        self._path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                self._path_points.extend([100.0, 0.0])
-            else:
-                self._path_points.extend([0.0, 100.0])
-        self._path_points.append(self.tier_roll)
-        
-        # Pre-compute segments for smoother animation
-        self._segments = []
-        self._total_dist = 0.0
-        for i in range(len(self._path_points) - 1):
-            start, end = self._path_points[i], self._path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._total_dist,
-                    "cum_end": self._total_dist + dist
-                })
-                self._total_dist += dist
+        self._track = KeyframeTrack.bounce(self.tier_roll)
         
         self._anim_elapsed = 0.0
         self._anim_duration = 4.0
@@ -4838,24 +4390,13 @@ class WeightLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._anim_last_tier = None
         
-        self._anim_timer = QtCore.QTimer(self)
-        self._anim_timer.timeout.connect(self._animate_step)
-        self._anim_timer.start(16)  # 60 FPS
+        frame_scheduler().add(self._animate_step, owner=self)
     
-    def _animate_step(self):
+    def _animate_step(self, dt: float) -> bool:
         """Animation frame using bounce path."""
-        self._anim_elapsed += 0.016  # Match timer interval
+        self._anim_elapsed += dt
         t = min(1.0, self._anim_elapsed / self._anim_duration)
-        eased = 1.0 - (1.0 - t) ** 4  # EaseOutQuart
-        
-        current_travel = eased * self._total_dist
-        pos = self.tier_roll
-        
-        for seg in self._segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self.tier_slider.set_position(pos)
@@ -4864,14 +4405,14 @@ class WeightLotteryDialog(QtWidgets.QDialog):
         current_tier = self.tier_slider.get_tier_at_position(pos)
         if current_tier != self._anim_last_tier:
             self._anim_last_tier = current_tier
-            color = self.TIER_COLORS.get(current_tier, "#fff")
-            self.lottery_result.setStyleSheet(f"color: {color}; font-size: 14px;")
+            set_style_state(self.lottery_result, "lotteryReadout", tone=current_tier)
         self.lottery_result.setText(f"🎲 {pos:.1f}% → {current_tier}")
         
         if t >= 1.0:
-            self._anim_timer.stop()
             self.tier_slider.set_position(self.tier_roll)
             self._show_result()
+            return False
+        return True
     
     def _show_result(self):
         """Show the won item with polished reveal."""
@@ -4938,8 +4479,7 @@ class WeightLotteryDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timers and save geometry."""
         save_dialog_geometry(self, "WeightLotteryDialog")
-        if hasattr(self, '_anim_timer'):
-            self._anim_timer.stop()
+        frame_scheduler().remove(self._animate_step)
         super().closeEvent(event)
 
 
@@ -5122,30 +4662,7 @@ class SleepLotteryDialog(QtWidgets.QDialog):
     def _start_animation(self):
         """Start tier roll animation using bounce path (same as FocusTimerLotteryDialog)."""
         # Generate bounce path with randomized direction
-        self._path_points = [50.0]
-        going_up = random.choice([True, False])
-        num_bounces = random.randint(4, 6)
-        
-        for _ in range(num_bounces):
-            if going_up:
-                self._path_points.extend([100.0, 0.0])
-            else:
-                self._path_points.extend([0.0, 100.0])
-        self._path_points.append(self.tier_roll)
-        
-        # Pre-compute segments for smoother animation
-        self._segments = []
-        self._total_dist = 0.0
-        for i in range(len(self._path_points) - 1):
-            start, end = self._path_points[i], self._path_points[i+1]
-            dist = abs(end - start)
-            if dist > 0.001:
-                self._segments.append({
-                    "start": start, "end": end, "dist": dist,
-                    "cum_start": self._total_dist,
-                    "cum_end": self._total_dist + dist
-                })
-                self._total_dist += dist
+        self._track = KeyframeTrack.bounce(self.tier_roll)
         
         self._anim_elapsed = 0.0
         self._anim_duration = 4.0
@@ -5153,24 +4670,13 @@ class SleepLotteryDialog(QtWidgets.QDialog):
         # Style state tracking for performance
         self._anim_last_tier = None
         
-        self._anim_timer = QtCore.QTimer(self)
-        self._anim_timer.timeout.connect(self._animate_step)
-        self._anim_timer.start(16)  # 60 FPS
+        frame_scheduler().add(self._animate_step, owner=self)
     
-    def _animate_step(self):
+    def _animate_step(self, dt: float) -> bool:
         """Animation frame using bounce path."""
-        self._anim_elapsed += 0.016  # Match timer interval
+        self._anim_elapsed += dt
         t = min(1.0, self._anim_elapsed / self._anim_duration)
-        eased = 1.0 - (1.0 - t) ** 4  # EaseOutQuart
-        
-        current_travel = eased * self._total_dist
-        pos = self.tier_roll
-        
-        for seg in self._segments:
-            if seg["cum_start"] <= current_travel <= seg["cum_end"]:
-                local = (current_travel - seg["cum_start"]) / seg["dist"]
-                pos = seg["start"] + (seg["end"] - seg["start"]) * local
-                break
+        pos = self._track.at_progress(t)
         
         pos = max(0, min(100, pos))
         self.tier_slider.set_position(pos)
@@ -5179,14 +4685,14 @@ class SleepLotteryDialog(QtWidgets.QDialog):
         current_tier = self.tier_slider.get_tier_at_position(pos)
         if current_tier != self._anim_last_tier:
             self._anim_last_tier = current_tier
-            color = self.TIER_COLORS.get(current_tier, "#fff")
-            self.lottery_result.setStyleSheet(f"color: {color}; font-size: 14px;")
+            set_style_state(self.lottery_result, "lotteryReadout", tone=current_tier)
         self.lottery_result.setText(f"🎲 {pos:.1f}% → {current_tier}")
         
         if t >= 1.0:
-            self._anim_timer.stop()
             self.tier_slider.set_position(self.tier_roll)
             self._show_result()
+            return False
+        return True
     
     def _show_result(self):
         """Show the won item with polished reveal."""
@@ -5253,8 +4759,7 @@ class SleepLotteryDialog(QtWidgets.QDialog):
     def closeEvent(self, event):
         """Clean up timers and save geometry."""
         save_dialog_geometry(self, "SleepLotteryDialog")
-        if hasattr(self, '_anim_timer'):
-            self._anim_timer.stop()
+        frame_scheduler().remove(self._animate_step)
         super().closeEvent(event)
 
 
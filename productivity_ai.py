@@ -3,22 +3,140 @@ AI-Powered Productivity Analyzer
 Analyzes your blocking patterns and provides intelligent insights
 """
 
+import bisect
 import json
 import logging
 from datetime import datetime, timedelta
-from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 
+def _day_focus(data: Any) -> float:
+    """Focus seconds for one daily_stats entry (0 for corrupted entries)."""
+    if not isinstance(data, dict):
+        return 0
+    focus = data.get('focus_time', 0)
+    return focus if isinstance(focus, (int, float)) else 0
+
+
+class StatsAggregates:
+    """
+    Incrementally maintained aggregates over stats['daily_stats'].
+
+    Keeps per-hour-of-day and per-weekday focus totals plus the sorted list
+    of recorded dates. update_day() replaces one day's contribution in
+    O(24 + log n), and the rolling means over the most recent 7/30 recorded
+    days are cached until the next change, so every query is O(1).
+    """
+
+    WINDOWS = (7, 30)
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self.hourly_totals = [0.0] * 24
+        self.hourly_days = [0] * 24  # days with any focus in that hour
+        self.weekday_totals = [0.0] * 7
+        self._days: Dict[str, Tuple[Optional[int], float, Dict[int, float]]] = {}
+        self._dates: List[str] = []
+        self._windows: Dict[int, Tuple[float, float, int]] = {}
+
+    def rebuild(self, daily_stats: Any) -> None:
+        """Recompute everything from a daily_stats dict."""
+        self._reset()
+        if isinstance(daily_stats, dict):
+            for date_str, data in daily_stats.items():
+                self.update_day(date_str, data)
+
+    def update_day(self, date_str: str, data: Any) -> None:
+        """Replace one day's contribution; data=None removes the day."""
+        self._remove(date_str)
+        if data is None:
+            return
+        try:
+            weekday: Optional[int] = datetime.strptime(date_str, '%Y-%m-%d').weekday()
+        except (ValueError, TypeError):
+            weekday = None
+        focus = _day_focus(data)
+        hourly: Dict[int, float] = {}
+        raw_hourly = data.get('hourly') if isinstance(data, dict) else None
+        if isinstance(raw_hourly, dict):
+            for hour_key, seconds in raw_hourly.items():
+                try:
+                    hour = int(hour_key)
+                except (ValueError, TypeError):
+                    continue
+                if 0 <= hour < 24 and isinstance(seconds, (int, float)) and seconds > 0:
+                    hourly[hour] = seconds
+
+        self._days[date_str] = (weekday, focus, hourly)
+        bisect.insort(self._dates, date_str)
+        if weekday is not None:
+            self.weekday_totals[weekday] += focus
+        for hour, seconds in hourly.items():
+            self.hourly_totals[hour] += seconds
+            self.hourly_days[hour] += 1
+        self._windows.clear()
+
+    def _remove(self, date_str: str) -> None:
+        old = self._days.pop(date_str, None)
+        if old is None:
+            return
+        weekday, focus, hourly = old
+        del self._dates[bisect.bisect_left(self._dates, date_str)]
+        if weekday is not None:
+            self.weekday_totals[weekday] -= focus
+        for hour, seconds in hourly.items():
+            self.hourly_totals[hour] -= seconds
+            self.hourly_days[hour] -= 1
+        self._windows.clear()
+
+    @property
+    def day_count(self) -> int:
+        return len(self._dates)
+
+    def window(self, days: int) -> Tuple[float, float, int]:
+        """(mean, variance, count) of daily focus over the most recent `days` recorded days."""
+        cached = self._windows.get(days)
+        if cached is None:
+            values = [self._days[d][1] for d in self._dates[-days:]]
+            if values:
+                mean = sum(values) / len(values)
+                variance = sum((v - mean) ** 2 for v in values) / len(values)
+            else:
+                mean = variance = 0.0
+            cached = self._windows[days] = (mean, variance, len(values))
+        return cached
+
+    def rolling_mean(self, days: int) -> float:
+        return self.window(days)[0]
+
+    def weekday_weekend_totals(self) -> Tuple[float, float]:
+        return sum(self.weekday_totals[:5]), sum(self.weekday_totals[5:])
+
+    def peak_hour(self) -> Optional[int]:
+        """Hour of day with the most accumulated focus, or None without hourly data."""
+        best = max(range(24), key=lambda h: self.hourly_totals[h])
+        return best if self.hourly_totals[best] > 0 else None
+
+
 class ProductivityAnalyzer:
-    """AI-powered productivity insights"""
+    """
+    AI-powered productivity insights.
+
+    Pass BlockerCore's in-memory stats dict to share it instead of reading
+    stats.json again, and register on_stats_changed with
+    BlockerCore.add_stats_listener to keep the aggregates current.
+    """
 
-    def __init__(self, stats_path: Union[str, Path]) -> None:
+    def __init__(self, stats_path: Union[str, Path], stats: Optional[Dict[str, Any]] = None) -> None:
         self.stats_path = Path(stats_path)
-        self.stats: Dict[str, Any] = self._load_stats()
+        self.stats: Dict[str, Any] = stats if stats is not None else self._load_stats()
+        self.aggregates = StatsAggregates()
+        self.aggregates.rebuild(self.stats.get('daily_stats', {}))
 
     def _load_stats(self) -> Dict[str, Any]:
         if self.stats_path.exists():
@@ -29,25 +147,36 @@ class ProductivityAnalyzer:
                 return {}
         return {}
 
-    def get_peak_productivity_hours(self) -> Dict[str, Dict[str, int]]:
-        """Identify when user is most productive"""
-        hourly_data: Dict[str, Dict[str, int]] = defaultdict(lambda: {'count': 0, 'total_time': 0})
-
-        # Analyze session start times (would need to track this)
-        for date, data in self.stats.get('daily_stats', {}).items():
-            # Skip invalid data entries (corrupted config)
-            if not isinstance(data, dict):
-                continue
-            # Simplified - in real implementation, track session times
-            focus_time = data.get('focus_time', 0)
-            if focus_time > 0:
-                # Mock analysis - you'd track actual session start hours
-                morning = 9 <= datetime.now().hour < 12
-                if morning:
-                    hourly_data['morning']['count'] += 1
-                    hourly_data['morning']['total_time'] += focus_time
+    def use_stats(self, stats: Dict[str, Any]) -> None:
+        """Switch to a different stats dict, rebuilding the aggregates."""
+        if stats is self.stats:
+            return
+        self.stats = stats
+        self.aggregates.rebuild(self.stats.get('daily_stats', {}))
+
+    def on_stats_changed(self, stats: Dict[str, Any], date_str: Optional[str] = None) -> None:
+        """
+        BlockerCore stats listener.
+
+        date_str names the single daily_stats entry that changed (or was
+        removed); None means the stats may have changed wholesale.
+        """
+        if stats is not self.stats:
+            self.use_stats(stats)
+            return
+        if date_str is None:
+            self.aggregates.rebuild(self.stats.get('daily_stats', {}))
+            return
+        daily_stats = self.stats.get('daily_stats', {})
+        self.aggregates.update_day(date_str, daily_stats.get(date_str) if isinstance(daily_stats, dict) else None)
 
-        return dict(hourly_data)
+    def get_peak_productivity_hours(self) -> Dict[str, Dict[str, int]]:
+        """Focus per hour of day: {hour: {'count': days active, 'total_time': seconds}}"""
+        agg = self.aggregates
+        return {
+            str(hour): {'count': agg.hourly_days[hour], 'total_time': int(agg.hourly_totals[hour])}
+            for hour in range(24) if agg.hourly_totals[hour] > 0
+        }
 
     def predict_optimal_session_length(self) -> int:
         """ML-based prediction of optimal session duration"""
@@ -80,23 +209,7 @@ class ProductivityAnalyzer:
 
     def _analyze_weekday_weekend(self):
         """Compare weekday vs weekend productivity"""
-        weekday_total = 0
-        weekend_total = 0
-
-        for date_str, data in self.stats.get('daily_stats', {}).items():
-            try:
-                # Skip invalid data entries (corrupted config)
-                if not isinstance(data, dict):
-                    continue
-                date = datetime.strptime(date_str, '%Y-%m-%d')
-                time_spent = data.get('focus_time', 0)
-
-                if date.weekday() < 5:
-                    weekday_total += time_spent
-                else:
-                    weekend_total += time_spent
-            except (ValueError, TypeError, KeyError, AttributeError):
-                continue
+        weekday_total, weekend_total = self.aggregates.weekday_weekend_totals()
 
         if weekday_total > weekend_total * 1.5:
             return 'weekdays'
@@ -106,26 +219,10 @@ class ProductivityAnalyzer:
 
     def _calculate_consistency(self):
         """Calculate how consistent user's focus sessions are"""
-        daily_stats = self.stats.get('daily_stats', {})
-        if len(daily_stats) < 7:
+        if self.aggregates.day_count < 7:
             return 'building'
 
-        recent_days = sorted(daily_stats.keys())[-7:]
-        # Safely extract focus_times, handling corrupted data
-        focus_times = []
-        for d in recent_days:
-            day_data = daily_stats.get(d)
-            if isinstance(day_data, dict):
-                focus_times.append(day_data.get('focus_time', 0))
-            else:
-                focus_times.append(0)
-
-        # Guard against empty focus_times (shouldn't happen but defensive)
-        if not focus_times:
-            return 'building'
-        
-        avg = sum(focus_times) / len(focus_times)
-        variance = sum((t - avg) ** 2 for t in focus_times) / len(focus_times)
+        _, variance, _ = self.aggregates.window(7)
 
         if variance < 100:
             return 'very_consistent'
@@ -218,6 +315,16 @@ class ProductivityAnalyzer:
                 'confidence': 0.9
             })
 
+        # Suggest the hour the user focuses best in
+        peak_hour = self.aggregates.peak_hour()
+        if peak_hour is not None:
+            recommendations.append({
+                'category': 'timing',
+                'suggestion': f'Schedule focus sessions around {peak_hour:02d}:00',
+                'reason': 'You log the most focus time in that hour',
+                'confidence': 0.75
+            })
+
         # Check if using strict mode
         if self.stats.get('sessions_cancelled', 0) > self.stats.get('sessions_completed', 0):
             recommendations.append({
@@ -230,8 +337,43 @@ class ProductivityAnalyzer:
         return recommendations
 
 
+class AchievementTarget(NamedTuple):
+    """Progress metric for an achievement: stats[counter] // divisor towards target."""
+    counter: str
+    target: int
+    divisor: int = 1
+    extra_inputs: Tuple[str, ...] = ()  # other counters the requirement reads
+
+    @property
+    def inputs(self) -> Tuple[str, ...]:
+        return (self.counter,) + self.extra_inputs
+
+    def current(self, stats: Dict[str, Any]) -> int:
+        return stats.get(self.counter, 0) // self.divisor
+
+
+def _index_counter_dependents(targets: Dict[str, AchievementTarget]) -> Dict[str, Tuple[str, ...]]:
+    """Map each stats counter to the achievements that read it."""
+    dependents: Dict[str, Tuple[str, ...]] = {}
+    for ach_id, target in targets.items():
+        for counter in target.inputs:
+            dependents[counter] = dependents.get(counter, ()) + (ach_id,)
+    return dependents
+
+
+# Marks a counter that has not been evaluated yet
+_UNSEEN = object()
+
+
 class GamificationEngine:
-    """Gamification system with achievements and challenges"""
+    """
+    Gamification system with achievements and challenges.
+
+    The engine works on an in-memory stats dict, normally the one owned by
+    BlockerCore, so checking achievements never re-reads stats.json.
+    check_achievements() only evaluates achievements whose input counters
+    changed since the previous check (see COUNTER_DEPENDENTS).
+    """
 
     ACHIEVEMENTS = {
         'first_session': {
@@ -303,10 +445,42 @@ class GamificationEngine:
         },
     }
 
-    def __init__(self, stats_path):
+    ACHIEVEMENT_TARGETS = {
+        'first_session': AchievementTarget('sessions_completed', 1),
+        'dedicated': AchievementTarget('sessions_completed', 10),
+        'week_warrior': AchievementTarget('streak_days', 7),
+        'century_club': AchievementTarget('sessions_completed', 100),
+        'marathon': AchievementTarget('total_focus_time', 1000, divisor=60),  # minutes
+        'perfectionist': AchievementTarget('sessions_completed', 10, extra_inputs=('sessions_cancelled',)),
+        'early_bird': AchievementTarget('early_sessions', 10),
+        'night_owl': AchievementTarget('night_sessions', 10),
+        'fire_keeper': AchievementTarget('best_streak', 30),
+        'iron_will': AchievementTarget('strict_sessions', 10),
+        'pomodoro_pro': AchievementTarget('pomodoro_sessions', 25),
+    }
+
+    # Counter -> achievements whose requirement reads it
+    COUNTER_DEPENDENTS = _index_counter_dependents(ACHIEVEMENT_TARGETS)
+
+    def __init__(self, stats_path, stats: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            stats_path: stats.json, written atomically when achievements unlock
+            stats: Shared in-memory stats dict (loaded from stats_path if omitted)
+        """
         self.stats_path = Path(stats_path)
-        self.stats = self._load_stats()
+        self.stats = stats if stats is not None else self._load_stats()
         self.unlocked = self.stats.get('achievements_unlocked', [])
+        # Counter values at the previous check; missing = never evaluated
+        self._seen_counters: Dict[str, Any] = {}
+
+    def use_stats(self, stats: Dict[str, Any]) -> None:
+        """Switch to a different stats dict (e.g. after the owner reloaded it)."""
+        if stats is self.stats:
+            return
+        self.stats = stats
+        self.unlocked = self.stats.get('achievements_unlocked', [])
+        self._seen_counters.clear()
 
     def _load_stats(self):
         """Load statistics from file"""
@@ -319,29 +493,39 @@ class GamificationEngine:
         return {}
 
     def _save_stats(self):
-        """Save statistics to file"""
+        """Save statistics to file atomically (crash-safe)"""
+        from core_logic import atomic_write_json
         try:
-            with open(self.stats_path, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, indent=2)
+            atomic_write_json(self.stats_path, self.stats)
         except (IOError, OSError) as e:
             logger.warning(f"Failed to save stats: {e}")
 
+    def _changed_achievements(self):
+        """Locked achievements with an input counter that changed since the last check."""
+        candidates = set()
+        for counter, dependents in self.COUNTER_DEPENDENTS.items():
+            value = self.stats.get(counter, 0)
+            if self._seen_counters.get(counter, _UNSEEN) != value:
+                self._seen_counters[counter] = value
+                candidates.update(dependents)
+        return [ach_id for ach_id in self.ACHIEVEMENTS
+                if ach_id in candidates and ach_id not in self.unlocked]
+
     def check_achievements(self):
         """Check which achievements are newly unlocked"""
-        # Reload stats to get latest
-        self.stats = self._load_stats()
-        self.unlocked = self.stats.get('achievements_unlocked', [])
+        # Pick up a list replaced by whoever owns the stats
+        self.unlocked = self.stats.get('achievements_unlocked', self.unlocked)
         newly_unlocked = []
 
-        for ach_id, achievement in self.ACHIEVEMENTS.items():
-            if ach_id not in self.unlocked:
-                if achievement['requirement'](self.stats):
-                    newly_unlocked.append({
-                        'id': ach_id,
-                        'name': achievement['name'],
-                        'desc': achievement['desc']
-                    })
-                    self.unlocked.append(ach_id)
+        for ach_id in self._changed_achievements():
+            achievement = self.ACHIEVEMENTS[ach_id]
+            if achievement['requirement'](self.stats):
+                newly_unlocked.append({
+                    'id': ach_id,
+                    'name': achievement['name'],
+                    'desc': achievement['desc']
+                })
+                self.unlocked.append(ach_id)
 
         # Save updated unlocked achievements
         if newly_unlocked:
@@ -351,7 +535,6 @@ class GamificationEngine:
         # Return progress for all achievements
         progress = {}
         for ach_id, achievement in self.ACHIEVEMENTS.items():
-            # Get current progress based on achievement type
             current, target = self._get_achievement_progress(ach_id, achievement)
 
             progress[ach_id] = {
@@ -364,22 +547,10 @@ class GamificationEngine:
 
     def _get_achievement_progress(self, ach_id, achievement):
         """Get current and target values for an achievement"""
-        # Map achievement IDs to their progress metrics
-        progress_map = {
-            'first_session': (self.stats.get('sessions_completed', 0), 1),
-            'dedicated': (self.stats.get('sessions_completed', 0), 10),
-            'week_warrior': (self.stats.get('streak_days', 0), 7),
-            'century_club': (self.stats.get('sessions_completed', 0), 100),
-            'marathon': (self.stats.get('total_focus_time', 0) // 60, 1000),  # minutes
-            'perfectionist': (self.stats.get('sessions_completed', 0), 10),
-            'early_bird': (self.stats.get('early_sessions', 0), 10),
-            'night_owl': (self.stats.get('night_sessions', 0), 10),
-            'fire_keeper': (self.stats.get('best_streak', 0), 30),
-            'iron_will': (self.stats.get('strict_sessions', 0), 10),
-            'pomodoro_pro': (self.stats.get('pomodoro_sessions', 0), 25),
-        }
-
-        return progress_map.get(ach_id, (0, 1))
+        target = self.ACHIEVEMENT_TARGETS.get(ach_id)
+        if target is None:
+            return (0, 1)
+        return (target.current(self.stats), target.target)
 
     def get_progress(self):
         """Get progress towards locked achievements"""
@@ -387,20 +558,13 @@ class GamificationEngine:
 
         for ach_id, achievement in self.ACHIEVEMENTS.items():
             if ach_id not in self.unlocked:
-                # Calculate progress (simplified)
-                if 'sessions_completed' in achievement['desc']:
-                    current = self.stats.get('sessions_completed', 0)
-                    # Extract number from description
-                    import re
-                    match = re.search(r'\d+', achievement['desc'])
-                    if match:
-                        target = int(match.group())
-                        progress.append({
-                            'id': ach_id,
-                            'name': achievement['name'],
-                            'desc': achievement['desc'],
-                            'progress': min(100, int((current / target) * 100))
-                        })
+                current, target = self._get_achievement_progress(ach_id, achievement)
+                progress.append({
+                    'id': ach_id,
+                    'name': achievement['name'],
+                    'desc': achievement['desc'],
+                    'progress': min(100, int((current / target) * 100))
+                })
 
         return progress
 
@@ -649,3 +813,74 @@ class FocusGoals:
                 total += time
                 count += 1
         return total / count if count > 0 else 0
+
+
+def make_synthetic_stats(days: int = 3 * 365, seed: int = 0,
+                         end: Optional[datetime] = None) -> Dict[str, Any]:
+    """Synthetic stats with `days` of daily_stats (including hourly buckets), for benchmarks."""
+    import random
+    rng = random.Random(seed)
+    end = end or datetime(2025, 12, 31)
+    daily_stats = {}
+    for offset in range(days):
+        date = end - timedelta(days=days - 1 - offset)
+        hourly = {}
+        for _ in range(rng.randint(0, 4)):
+            hour = str(rng.choice((7, 8, 9, 10, 14, 15, 16, 21)))
+            hourly[hour] = hourly.get(hour, 0) + rng.randint(10, 60) * 60
+        daily_stats[date.strftime('%Y-%m-%d')] = {
+            'focus_time': sum(hourly.values()),
+            'sessions': len(hourly),
+            'hourly': hourly,
+        }
+    return {
+        'total_focus_time': sum(d['focus_time'] for d in daily_stats.values()),
+        'sessions_completed': sum(d['sessions'] for d in daily_stats.values()),
+        'sessions_cancelled': days // 10,
+        'streak_days': 5,
+        'daily_stats': daily_stats,
+    }
+
+
+def benchmark_analyzer(days: int = 3 * 365, queries: int = 200) -> Dict[str, float]:
+    """
+    Time insight queries over a synthetic history.
+
+    "full_pass" rebuilds the aggregates before every query, which is what
+    each query used to cost; "incremental" updates one day and then queries
+    the maintained aggregates, as the app does after a session.
+
+    Returns milliseconds per query for both.
+    """
+    import time
+
+    stats = make_synthetic_stats(days)
+    analyzer = ProductivityAnalyzer('', stats=stats)
+    last_day = max(stats['daily_stats'])
+
+    def query():
+        analyzer.get_recommendations()
+        analyzer.generate_insights()
+        analyzer.get_distraction_patterns()
+        analyzer.get_peak_productivity_hours()
+
+    start = time.perf_counter()
+    for _ in range(queries):
+        analyzer.aggregates.rebuild(stats['daily_stats'])
+        query()
+    full_pass = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for _ in range(queries):
+        stats['daily_stats'][last_day]['focus_time'] += 60
+        analyzer.on_stats_changed(stats, last_day)
+        query()
+    incremental = (time.perf_counter() - start) / queries
+
+    return {'days': days, 'full_pass_ms': full_pass * 1000, 'incremental_ms': incremental * 1000}
+
+
+if __name__ == '__main__':
+    result = benchmark_analyzer()
+    print(f"{result['days']} days of stats: full pass {result['full_pass_ms']:.2f} ms/query, "
+          f"incremental {result['incremental_ms']:.3f} ms/query")
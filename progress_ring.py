@@ -0,0 +1,399 @@
+"""
+Progress rings for the daily timeline (water, chapters, focus, entities, XP, eyes).
+
+The timeline pushes fresh numbers into every ring on each update tick, and
+a ring used to repaint its track, arc and labels from scratch every time,
+even when the value it shows had not moved. ProgressRingWidget splits a
+ring into:
+
+- a static layer - track and labels - rendered once into a pixmap at the
+  screen's device pixel ratio and re-rendered only when the widget size,
+  the ratio or the label text/colours change
+- the value arc, the only thing drawn on every paint
+
+set_progress() only asks for a repaint when what the ring shows changes:
+the labels, or the arc by at least one ARC_RESOLUTION step (1 degree,
+under a pixel of arc length at the timeline's ring size).
+
+Subclasses describe themselves through static_state() (everything the
+labels show), arc_color() and paint_labels().
+"""
+
+from typing import Optional, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+# Arc span steps per full turn; value changes below one step don't repaint
+ARC_RESOLUTION = 360
+
+
+class ProgressRingWidget(QtWidgets.QWidget):
+    """Circular progress bar with a cached static layer."""
+    clicked = QtCore.Signal()
+
+    TRACK_COLOR = "#2a2a4a"
+    ARC_WIDTH = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.percentage = 0.0
+        self._layer: Optional[QtGui.QPixmap] = None
+        self._layer_key: Optional[tuple] = None
+        self._display_key: Optional[tuple] = None
+        self.paint_count = 0
+        self.layer_renders = 0
+        self.setMinimumSize(60, 60)
+        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+
+    # === Subclass hooks ===
+
+    def static_state(self) -> tuple:
+        """Everything paint_labels() shows; the static layer is keyed on it."""
+        return ()
+
+    def arc_color(self) -> str:
+        return "#6366f1"
+
+    def paint_labels(self, painter: QtGui.QPainter, rect: QtCore.QRect) -> None:
+        """Draw the ring's text inside rect (the ring's bounding box)."""
+
+    # === Update gating ===
+
+    def arc_steps(self) -> int:
+        return int(round(self.percentage * ARC_RESOLUTION))
+
+    def display_key(self) -> Tuple:
+        return self.arc_steps(), self.arc_color(), self.static_state()
+
+    def _changed(self) -> bool:
+        """Schedule a repaint if the displayed ring changed. Returns True if it did."""
+        key = self.display_key()
+        if key == self._display_key:
+            return False
+        self._display_key = key
+        self.update()
+        return True
+
+    # === Painting ===
+
+    def _ring_rect(self) -> QtCore.QRect:
+        # Inset so the stroke doesn't clip
+        return self.rect().adjusted(5, 5, -5, -5)
+
+    def _static_layer(self) -> QtGui.QPixmap:
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, self.static_state())
+        if self._layer is None or key != self._layer_key:
+            pixmap = QtGui.QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            rect = self._ring_rect()
+            # Background Track
+            pen = QtGui.QPen(QtGui.QColor(self.TRACK_COLOR), self.ARC_WIDTH)
+            pen.setCapStyle(QtCore.Qt.RoundCap)
+            painter.setPen(pen)
+            painter.drawEllipse(rect)
+            self.paint_labels(painter, rect)
+            painter.end()
+            self._layer = pixmap
+            self._layer_key = key
+            self.layer_renders += 1
+        return self._layer
+
+    def paintEvent(self, event):
+        self.paint_count += 1
+        self._display_key = self.display_key()
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._static_layer())
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        # Progress Arc: 90 degrees is 12 o'clock, a negative span runs clockwise
+        # (QPainter arcs are in 1/16th of a degree)
+        pen = QtGui.QPen(QtGui.QColor(self.arc_color()), self.ARC_WIDTH)
+        pen.setCapStyle(QtCore.Qt.RoundCap)
+        painter.setPen(pen)
+        painter.drawArc(self._ring_rect(), 90 * 16, -self.arc_steps() * 360 * 16 // ARC_RESOLUTION)
+
+    def mousePressEvent(self, event):
+        if event.button() == QtCore.Qt.MouseButton.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
+
+def _draw_label(painter: QtGui.QPainter, rect: QtCore.QRect, text: str, color: str,
+                pixel_size: int, bold: bool) -> None:
+    font = painter.font()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    painter.setFont(font)
+    painter.setPen(QtGui.QColor(color))
+    painter.drawText(QtCore.QRectF(rect), QtCore.Qt.AlignmentFlag.AlignCenter, text)
+
+
+class WaterRingWidget(ProgressRingWidget):
+    """Circular progress bar for daily hydration goal."""
+
+    TRACK_COLOR = "#1a3a5c"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.current = 0
+        self.goal = 5
+
+    def set_progress(self, current: int, goal: int = 5):
+        """Set water progress (glasses consumed / goal)."""
+        goal = max(1, goal)  # Avoid division by zero
+        self.percentage = min(current / goal, 1.0)
+        self.current = current
+        self.goal = goal
+        self._changed()
+
+    def static_state(self) -> tuple:
+        return self.current, self.goal
+
+    def arc_color(self) -> str:
+        return "#4fc3f7"  # Cyan/blue for water
+
+    def paint_labels(self, painter, rect):
+        # Main text: glasses count with emoji, "of 8" below
+        _draw_label(painter, rect, f"💧{self.current}", "#ffffff", 14, True)
+        _draw_label(painter, rect.adjusted(0, 20, 0, 0), f"of {self.goal}", "#4fc3f7", 10, False)
+
+
+class ChapterRingWidget(ProgressRingWidget):
+    """Circular progress bar for story chapter progress (power-based)."""
+
+    TRACK_COLOR = "#2a3a2a"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.unlocked = 0
+        self.total = 7
+        self.is_complete = False
+
+    def set_progress(self, unlocked_chapters: int, progress_pct: float, total_chapters: int = 7, is_complete: bool = False):
+        """Set chapter progress.
+
+        Args:
+            unlocked_chapters: Number of chapters currently unlocked
+            progress_pct: Progress percentage toward next chapter (0-100)
+            total_chapters: Total chapters in story
+            is_complete: Whether all chapters are unlocked
+        """
+        self.percentage = min(max(progress_pct / 100.0, 0.0), 1.0)
+        self.unlocked = unlocked_chapters
+        self.total = total_chapters
+        self.is_complete = is_complete
+        self._changed()
+
+    def static_state(self) -> tuple:
+        return self.unlocked, self.total, self.is_complete, int(self.percentage * 100)
+
+    def arc_color(self) -> str:
+        # Green for story progress, gold if complete
+        return "#ffd700" if self.is_complete else "#8bc34a"
+
+    def paint_labels(self, painter, rect):
+        # Main text: "📖 X/Y" chapters, progress percentage or "Done!" below
+        _draw_label(painter, rect, f"📖{self.unlocked}/{self.total}", "#ffffff", 13, True)
+        subtext = "✨Done" if self.is_complete else f"{int(self.percentage * 100)}%"
+        _draw_label(painter, rect.adjusted(0, 20, 0, 0), subtext, self.arc_color(), 10, False)
+
+
+class EyeRingWidget(ProgressRingWidget):
+    """Circular progress bar for daily eye routines."""
+
+    # Vision progression: blind animals → sharp-eyed predators
+    EYE_CATEGORIES = [
+        (0, "🦔 Mole", "#ff6b6b"),       # 0 routines - nearly blind
+        (1, "🦇 Bat", "#ff8c42"),        # 1 routine - uses echolocation
+        (3, "🐁 Mouse", "#ffa726"),      # 3+ routines - poor vision
+        (5, "🐶 Pup", "#ffca28"),        # 5+ routines - decent
+        (8, "🐱 Cat", "#9ccc65"),        # 8+ routines - good night vision
+        (12, "🦉 Owl", "#66bb6a"),       # 12+ routines - excellent
+        (16, "🦅 Eagle", "#26c6da"),     # 16+ routines - 8x human vision
+        (20, "🦅 Hawk", "#ab47bc"),      # 20+ routines - the best!
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.text = "0"
+        self.subtext = "👀 Screen Zombie"
+        self.ring_color = "#00bcd4"  # Cyan for eye theme
+        self.setToolTip("Eyes Routine\nClick to open Eyes tab")
+
+    def set_progress(self, current: int, daily_cap: int):
+        """Set eye routine progress."""
+        daily_cap = max(1, daily_cap)  # Avoid division by zero
+        self.percentage = min(current / daily_cap, 1.0)
+        self.text = f"👁️{current}"
+
+        # Find appropriate category
+        category_text = self.EYE_CATEGORIES[0][1]
+        self.ring_color = self.EYE_CATEGORIES[0][2]
+
+        for threshold, label, color in self.EYE_CATEGORIES:
+            if current >= threshold:
+                category_text = label
+                self.ring_color = color
+
+        self.subtext = category_text
+        self._changed()
+
+    def static_state(self) -> tuple:
+        return self.text, self.subtext, self.ring_color
+
+    def arc_color(self) -> str:
+        return self.ring_color  # Dynamic color based on category
+
+    def paint_labels(self, painter, rect):
+        # Count text, category subtext below
+        _draw_label(painter, rect, self.text, "#ffffff", 12, True)
+        # Truncate long labels
+        subtext = self.subtext
+        if len(subtext) > 14:
+            subtext = subtext[:12] + "…"
+        _draw_label(painter, rect.adjusted(-5, 22, 5, 0), subtext, self.ring_color, 8, False)
+
+
+class XPRingWidget(ProgressRingWidget):
+    """Circular progress bar for XP to next level."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.text = "Lv.1"
+        self.subtext = "Novice"
+
+    def set_progress(self, level: int, xp_in_level: int, xp_needed: int, total_xp: int):
+        """Set XP progress toward next level."""
+        xp_needed = max(1, xp_needed)  # Avoid division by zero
+        self.percentage = min(xp_in_level / xp_needed, 1.0)
+        self.text = f"Lv.{level}"
+
+        # Get level title name
+        try:
+            from gamification import get_level_title
+            title, emoji = get_level_title(level)
+            self.subtext = title
+        except Exception:
+            self.subtext = "Novice"
+
+        self._changed()
+
+    def static_state(self) -> tuple:
+        return self.text, self.subtext
+
+    def arc_color(self) -> str:
+        return "#ffd700"  # Gold/yellow for XP
+
+    def paint_labels(self, painter, rect):
+        # Level text, title below
+        _draw_label(painter, rect, self.text, "#ffffff", 13, True)
+        _draw_label(painter, rect.adjusted(0, 20, 0, 0), self.subtext, "#ffd700", 10, False)
+
+
+class FocusRingWidget(ProgressRingWidget):
+    """Circular progress bar for daily focus goal."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.text = "0%"
+        self.subtext = "Focus"
+
+    def set_progress(self, current_seconds, goal_seconds):
+        # Guard against negative values
+        current_seconds = max(0, current_seconds)
+        goal_seconds = max(1, goal_seconds)  # Minimum 1 to avoid division by zero
+
+        self.percentage = min(current_seconds / goal_seconds, 1.0)
+
+        hours = int(current_seconds // 3600)
+        mins = int((current_seconds % 3600) // 60)
+
+        # If less than an hour, show minutes only or "0h 30m"
+        if hours > 0:
+            self.text = f"{hours}h {mins}m"
+        else:
+            self.text = f"{mins}m"
+
+        self._changed()
+
+    def static_state(self) -> tuple:
+        return self.text, self.subtext
+
+    def arc_color(self) -> str:
+        return "#6366f1"
+
+    def paint_labels(self, painter, rect):
+        # Main text in center, subtext below
+        _draw_label(painter, rect, self.text, "#ffffff", 13, True)
+        _draw_label(painter, rect.adjusted(0, 20, 0, 0), self.subtext, "#aaaaaa", 10, False)
+
+
+class EntitiesRingWidget(ProgressRingWidget):
+    """Circular progress bar for entities bonded (Entitidex collection)."""
+
+    TRACK_COLOR = "#2a2a3a"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.normal_count = 0
+        self.exceptional_count = 0
+        self.total_possible = 45  # 9 entities × 5 story pools
+
+    def set_progress(self, normal_count: int, exceptional_count: int, total_possible: int = 45):
+        """Set entities bonded progress.
+
+        Args:
+            normal_count: Number of normal entities collected
+            exceptional_count: Number of exceptional entities collected
+            total_possible: Total entities that can be collected
+        """
+        self.normal_count = normal_count
+        self.exceptional_count = exceptional_count
+        self.total_possible = max(1, total_possible)
+        total_bonded = normal_count + exceptional_count
+        self.percentage = min(total_bonded / self.total_possible, 1.0)
+        self._changed()
+
+    def static_state(self) -> tuple:
+        return self.normal_count, self.exceptional_count
+
+    def arc_color(self) -> str:
+        # Lighter purple once we have any exceptional entities
+        return "#ba68c8" if self.exceptional_count > 0 else "#9c27b0"
+
+    def paint_labels(self, painter, rect):
+        # Main text: total count with star emoji, exceptional part in brighter color
+        total_bonded = self.normal_count + self.exceptional_count
+        main_rect = QtCore.QRectF(rect)
+        if self.exceptional_count > 0 and self.normal_count > 0:
+            # Format: ⭐normal+exceptional where exceptional is brighter
+            font = painter.font()
+            font.setPixelSize(14)
+            font.setBold(True)
+            painter.setFont(font)
+            text = f"⭐{self.normal_count}"
+            exc_text = f"+{self.exceptional_count}"
+
+            # Calculate positions for centered text
+            fm = QtGui.QFontMetrics(font)
+            total_width = fm.horizontalAdvance(text + exc_text)
+            start_x = main_rect.center().x() - total_width / 2
+            text_y = main_rect.center().y() + fm.ascent() / 2 - 2
+
+            # Normal part in white, exceptional part in bright gold
+            painter.setPen(QtGui.QColor("#ffffff"))
+            painter.drawText(QtCore.QPointF(start_x, text_y), text)
+            painter.setPen(QtGui.QColor("#ffd700"))
+            painter.drawText(QtCore.QPointF(start_x + fm.horizontalAdvance(text), text_y), exc_text)
+        else:
+            # All exceptional - gold, normal only - white
+            color = "#ffd700" if self.exceptional_count > 0 else "#ffffff"
+            _draw_label(painter, rect, f"⭐{total_bonded}", color, 14, True)
+
+        # Subtext: "Bonded" or the exceptional count if any
+        subtext = f"✨{self.exceptional_count}" if self.exceptional_count > 0 else "Bonded"
+        _draw_label(painter, rect.adjusted(0, 20, 0, 0), subtext, self.arc_color(), 10, False)
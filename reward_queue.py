@@ -0,0 +1,224 @@
+"""
+Presentation queue for reward celebrations.
+
+A completed session used to open its dialogs one after another with
+exec(): lottery, level-up, item reward, building complete, entity encounter,
+diary. Each exec() spins a nested event loop, so anything that fired during
+one (timers, signals, a second reward) ran inside it, and the user clicked
+through a stack of modals. Rewards are now pushed as typed events:
+
+    reward_queue().push(RewardEvent(ITEM_DROP, {"items": [item], "coins": 10}))
+
+Compatible pending events are merged as they arrive (several item drops
+become one summary card, XP folds into the level-up panel), and the queue
+shows one event at a time from the main loop. A presenter is registered per
+kind; it shows its widget and calls done() once the user dismissed it, which
+schedules the next event:
+
+    queue.register(LEVEL_UP, lambda event, done: ...)
+
+Nothing here imports Qt - the owner passes a scheduler (QTimer.singleShot)
+- so queueing and merging can be tested without widgets.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Event kinds, in the order a focus session presents them
+SESSION_COMPLETE = "session_complete"
+LOTTERY = "lottery"
+XP_GAINED = "xp_gained"
+LEVEL_UP = "level_up"
+ITEM_DROP = "item_drop"
+BUILDING_COMPLETE = "building_complete"
+ENTITY_ENCOUNTER = "entity_encounter"
+DIARY = "diary"
+PRIORITY_LOG = "priority_log"
+
+Presenter = Callable[["RewardEvent", Callable[[], None]], None]
+
+
+@dataclass
+class RewardEvent:
+    """One thing to celebrate. payload keys depend on kind (see the merge functions)."""
+    kind: str
+    payload: Dict = field(default_factory=dict)
+    merged: int = 1  # How many pushed events this one stands for
+
+
+def _merge_item_drops(first: RewardEvent, second: RewardEvent) -> RewardEvent:
+    """
+    Several drops -> one summary card.
+
+    Items, messages and perk contributors are concatenated and coins summed.
+    The comparison baseline (equipped) is the earliest one, the after state
+    and auto-equipped slots the latest. Differing titles or sources are
+    combined into a generic header.
+    """
+    a, b = first.payload, second.payload
+    payload = dict(a)
+    payload["items"] = list(a.get("items", [])) + list(b.get("items", []))
+    payload["coins"] = a.get("coins", 0) + b.get("coins", 0)
+    payload["extra_messages"] = list(a.get("extra_messages", [])) + list(b.get("extra_messages", []))
+    payload["equipped"] = {**b.get("equipped", {}), **a.get("equipped", {})}
+    if b.get("equipped_after") is not None:
+        payload["equipped_after"] = b["equipped_after"]
+    slots = list(a.get("auto_equipped_slots", []))
+    slots += [s for s in b.get("auto_equipped_slots", []) if s not in slots]
+    payload["auto_equipped_slots"] = slots
+
+    contributors = list(a.get("entity_perk_contributors", []))
+    seen = {c.get("entity_id") for c in contributors}
+    contributors += [c for c in b.get("entity_perk_contributors", []) if c.get("entity_id") not in seen]
+    payload["entity_perk_contributors"] = contributors
+
+    sources = [s for s in (a.get("source_label"), b.get("source_label")) if s]
+    payload["source_label"] = " • ".join(dict.fromkeys(sources))
+    if a.get("title") != b.get("title"):
+        payload["title"] = "🎁 Rewards!"
+        payload["header_emoji"] = "🎁"
+    for key in ("session_minutes", "streak_days"):
+        payload[key] = max(a.get(key, 0), b.get(key, 0))
+    return RewardEvent(ITEM_DROP, payload, first.merged + second.merged)
+
+
+def _merge_level_ups(first: RewardEvent, second: RewardEvent) -> RewardEvent:
+    """Level-ups -> one panel spanning the lowest old to the highest new level."""
+    a, b = first.payload, second.payload
+    payload = dict(b)
+    payload["old_level"] = min(a.get("old_level", 1), b.get("old_level", 1))
+    payload["new_level"] = max(a.get("new_level", 1), b.get("new_level", 1))
+    payload["xp_earned"] = a.get("xp_earned", 0) + b.get("xp_earned", 0)
+    payload["unlocks"] = list(a.get("unlocks", [])) + list(b.get("unlocks", []))
+    return RewardEvent(LEVEL_UP, payload, first.merged + second.merged)
+
+
+def _merge_xp(first: RewardEvent, second: RewardEvent) -> RewardEvent:
+    """XP joins a level-up (in either order) or adds to other XP."""
+    if first.kind == LEVEL_UP or second.kind == LEVEL_UP:
+        level_up, xp = (first, second) if first.kind == LEVEL_UP else (second, first)
+        payload = dict(level_up.payload)
+        payload["xp_earned"] = payload.get("xp_earned", 0) + xp.payload.get("xp", 0)
+        return RewardEvent(LEVEL_UP, payload, first.merged + second.merged)
+    payload = {"xp": first.payload.get("xp", 0) + second.payload.get("xp", 0)}
+    return RewardEvent(XP_GAINED, payload, first.merged + second.merged)
+
+
+_MERGERS: Dict[Tuple[str, str], Callable[[RewardEvent, RewardEvent], RewardEvent]] = {
+    (ITEM_DROP, ITEM_DROP): _merge_item_drops,
+    (LEVEL_UP, LEVEL_UP): _merge_level_ups,
+    (XP_GAINED, XP_GAINED): _merge_xp,
+    (XP_GAINED, LEVEL_UP): _merge_xp,
+    (LEVEL_UP, XP_GAINED): _merge_xp,
+}
+
+
+def merge_events(first: RewardEvent, second: RewardEvent) -> Optional[RewardEvent]:
+    """The event presenting both, or None if they are shown separately."""
+    merger = _MERGERS.get((first.kind, second.kind))
+    return merger(first, second) if merger else None
+
+
+class RewardQueue:
+    """
+    FIFO of pending RewardEvents, presented one at a time.
+
+    schedule(fn) must run fn later on the owner's loop (the app passes
+    QTimer.singleShot(0, fn)); the default runs it immediately, which is
+    what tests want. Events without a registered presenter are finished
+    straight away - e.g. XP on its own, which the session summary shows.
+    """
+
+    def __init__(self, schedule: Optional[Callable[[Callable[[], None]], None]] = None):
+        self._schedule = schedule or (lambda fn: fn())
+        self._presenters: Dict[str, Presenter] = {}
+        self._pending: List[RewardEvent] = []
+        self._current: Optional[RewardEvent] = None
+        self._scheduled = False
+        self.pushed = 0
+        self.presented = 0
+
+    def set_scheduler(self, schedule: Callable[[Callable[[], None]], None]) -> None:
+        self._schedule = schedule
+
+    def register(self, kind: str, presenter: Presenter) -> None:
+        self._presenters[kind] = presenter
+
+    @property
+    def pending(self) -> Tuple[RewardEvent, ...]:
+        return tuple(self._pending)
+
+    @property
+    def current(self) -> Optional[RewardEvent]:
+        """The event on screen, if any. It never absorbs newer pushes."""
+        return self._current
+
+    def is_idle(self) -> bool:
+        return self._current is None and not self._pending
+
+    def push(self, event: RewardEvent) -> RewardEvent:
+        """
+        Queue event, merging it into the first compatible pending one.
+
+        Returns the event that will be presented for it.
+        """
+        self.pushed += 1
+        for i, queued in enumerate(self._pending):
+            merged = merge_events(queued, event)
+            if merged is not None:
+                self._pending[i] = merged
+                break
+        else:
+            merged = event
+            self._pending.append(event)
+        self._kick()
+        return merged
+
+    def clear(self) -> None:
+        """Drop everything not yet on screen."""
+        self._pending.clear()
+
+    def _kick(self) -> None:
+        if self._current is None and self._pending and not self._scheduled:
+            self._scheduled = True
+            self._schedule(self._present_next)
+
+    def _present_next(self) -> None:
+        self._scheduled = False
+        if self._current is not None or not self._pending:
+            return
+        event = self._current = self._pending.pop(0)
+        self.presented += 1
+        finished = []
+
+        def done() -> None:
+            if finished:
+                return  # finished and closed signals may both fire
+            finished.append(True)
+            if self._current is event:
+                self._current = None
+            self._kick()
+
+        presenter = self._presenters.get(event.kind)
+        if presenter is None:
+            done()
+            return
+        try:
+            presenter(event, done)
+        except Exception:
+            logger.exception(f"Could not present {event.kind} reward")
+            done()
+
+
+_queue: Optional[RewardQueue] = None
+
+
+def reward_queue() -> RewardQueue:
+    """The process-wide queue the main window presents from."""
+    global _queue
+    if _queue is None:
+        _queue = RewardQueue()
+    return _queue
@@ -0,0 +1,150 @@
+"""
+Compiled weekly schedule timeline for Personal Liberty.
+
+Turns the user's blocking schedules (day list + "HH:MM" start/end, including
+overnight spans) into a sorted set of merged minute-of-week intervals.
+"Is a schedule active now?" becomes a bisect, and the exact next start/end
+transition can be computed so the UI arms one timer per transition instead
+of polling every minute.
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+
+def _parse_hhmm(value: str, default: str) -> int:
+    """Convert an "HH:MM" string to minutes after midnight."""
+    try:
+        hours, minutes = str(value).split(":")
+        result = int(hours) * 60 + int(minutes)
+    except (ValueError, AttributeError):
+        hours, minutes = default.split(":")
+        result = int(hours) * 60 + int(minutes)
+    return max(0, min(MINUTES_PER_DAY - 1, result))
+
+
+def _schedule_intervals(schedule: Dict) -> List[Tuple[int, int]]:
+    """
+    Expand one schedule into half-open [start, end) minute-of-week intervals.
+
+    The end minute is inclusive in the schedule ("09:00-17:00" still blocks
+    at 17:00), so intervals end one minute after it. Overnight schedules run
+    from the start on each listed day into the following day; a Sunday
+    overnight span wraps into Monday morning of the same week.
+    """
+    start = _parse_hhmm(schedule.get("start_time", "00:00"), "00:00")
+    end = _parse_hhmm(schedule.get("end_time", "23:59"), "23:59")
+    intervals = []
+    for day in schedule.get("days", []):
+        if not isinstance(day, int) or not 0 <= day <= 6:
+            continue
+        day_start = day * MINUTES_PER_DAY
+        if start <= end:
+            intervals.append((day_start + start, day_start + end + 1))
+        else:
+            span_start = day_start + start
+            span_end = day_start + MINUTES_PER_DAY + end + 1
+            if span_end <= MINUTES_PER_WEEK:
+                intervals.append((span_start, span_end))
+            else:
+                intervals.append((span_start, MINUTES_PER_WEEK))
+                intervals.append((0, span_end - MINUTES_PER_WEEK))
+    return intervals
+
+
+def _merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Sort intervals and merge overlapping or touching ones."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class ScheduleTimeline:
+    """Sorted, merged weekly interval set built from blocking schedules."""
+
+    def __init__(self, schedules: Optional[List[Dict]] = None,
+                 clock: Callable[[], datetime] = datetime.now):
+        self.clock = clock
+        self.compile(schedules or [])
+
+    def compile(self, schedules: List[Dict]) -> None:
+        """Rebuild the interval set from the given schedules (disabled ones are skipped)."""
+        intervals = []
+        for schedule in schedules:
+            if not isinstance(schedule, dict) or not schedule.get("enabled", True):
+                continue
+            intervals.extend(_schedule_intervals(schedule))
+        self.intervals = _merge_intervals(intervals)
+        self._starts = [start for start, _ in self.intervals]
+
+    @staticmethod
+    def _week_minute(now: datetime) -> int:
+        return now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+
+    @staticmethod
+    def _week_origin(now: datetime) -> datetime:
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight - timedelta(days=now.weekday())
+
+    def _find(self, minute: int) -> int:
+        """Index of the interval containing minute, or -1."""
+        idx = bisect_right(self._starts, minute) - 1
+        if idx >= 0 and minute < self.intervals[idx][1]:
+            return idx
+        return -1
+
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        """Check whether any enabled schedule covers the given time."""
+        if not self.intervals:
+            return False
+        now = now or self.clock()
+        return self._find(self._week_minute(now)) >= 0
+
+    def next_transition(self, now: Optional[datetime] = None) -> Optional[Tuple[datetime, bool]]:
+        """
+        Get the next moment the active state flips.
+
+        Returns:
+            (when, becomes_active) tuple, or None if the state never changes
+            (no enabled schedules, or the whole week is covered).
+        """
+        if not self.intervals:
+            return None
+        if self.intervals == [(0, MINUTES_PER_WEEK)]:
+            return None
+        now = now or self.clock()
+        minute = self._week_minute(now)
+        origin = self._week_origin(now)
+        idx = self._find(minute)
+
+        if idx >= 0:
+            end = self.intervals[idx][1]
+            # An interval running into the week boundary continues in the
+            # first interval of the next week if that one starts at minute 0.
+            if end == MINUTES_PER_WEEK and self.intervals[0][0] == 0:
+                end = MINUTES_PER_WEEK + self.intervals[0][1]
+            return origin + timedelta(minutes=end), False
+
+        idx = bisect_right(self._starts, minute)
+        if idx < len(self._starts):
+            start = self._starts[idx]
+        else:
+            start = MINUTES_PER_WEEK + self._starts[0]
+        return origin + timedelta(minutes=start), True
+
+    def seconds_until_next_transition(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Seconds from now until the next transition, or None if there is none."""
+        now = now or self.clock()
+        transition = self.next_transition(now)
+        if transition is None:
+            return None
+        return max(0.0, (transition[0] - now).total_seconds())
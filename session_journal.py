@@ -0,0 +1,268 @@
+"""
+Append-only write-ahead journal for active focus sessions.
+
+.session_state.json and the config are rewritten in place, so a hard
+power-off mid-session can lose the session or strand hosts entries with no
+record of them. The journal instead appends one small record per session
+lifecycle event and fsyncs it:
+
+    start -> block -> checkpoint (every CHECKPOINT_INTERVAL s) ... -> unblock / complete
+
+Each line is "<crc32 hex> <json>\\n". On startup, read_records() keeps the
+valid prefix of the file: a torn last write (no newline, bad JSON) or a
+checksum mismatch ends the readable log, and everything after it is
+ignored. replay() turns the records into a RecoveryPlan:
+
+- RESUME:  the session never ended and its planned window is still open
+- CREDIT:  the session never ended, its window has passed, and more than
+           MIN_CREDIT_SECONDS were checkpointed -> credit the partial time
+- CLEANUP: blocks were applied and never removed, nothing to credit
+- NONE:    the last session ended cleanly (or there was none)
+
+The journal holds at most one session: it is compacted (emptied) when a
+session starts and after each clean completion.
+"""
+
+import json
+import logging
+import os
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EVENT_START = "start"
+EVENT_BLOCK = "block"
+EVENT_CHECKPOINT = "checkpoint"
+EVENT_UNBLOCK = "unblock"
+EVENT_COMPLETE = "complete"
+
+ACTION_NONE = "none"
+ACTION_RESUME = "resume"
+ACTION_CREDIT = "credit"
+ACTION_CLEANUP = "cleanup"
+
+CHECKPOINT_INTERVAL = 30  # seconds between checkpoint records
+MIN_CREDIT_SECONDS = 60  # same threshold as stopping a session early
+MIN_RESUME_SECONDS = 60  # don't offer to resume a session that is about to end
+
+
+def encode_record(record: dict) -> bytes:
+    """One journal line: crc32 of the JSON payload, a space, the payload."""
+    payload = json.dumps(record, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def decode_line(line: bytes) -> Optional[dict]:
+    """Parse one journal line; None if it is torn or fails its checksum."""
+    if not line.endswith(b"\n"):
+        return None
+    crc, _, payload = line.rstrip(b"\n").partition(b" ")
+    try:
+        if int(crc, 16) != zlib.crc32(payload):
+            return None
+        record = json.loads(payload.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return record if isinstance(record, dict) and "ev" in record else None
+
+
+def read_records(path: Path) -> Tuple[List[dict], bool]:
+    """
+    Read the valid prefix of a journal.
+
+    Returns (records, tail_dropped). tail_dropped is True when a torn or
+    corrupt record (and anything after it) was ignored.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return [], False
+    records = []
+    expected_seq = None
+    for line in data.splitlines(keepends=True):
+        record = decode_line(line)
+        if record is None:
+            return records, True
+        seq = record.get("seq")
+        if expected_seq is not None and seq != expected_seq:
+            return records, True
+        expected_seq = (seq or 0) + 1
+        records.append(record)
+    return records, False
+
+
+@dataclass
+class RecoveryPlan:
+    """What to do about the last journaled session after a restart."""
+    action: str = ACTION_NONE
+    session_id: Optional[str] = None
+    mode: Optional[str] = None
+    pid: Optional[int] = None
+    started_at: float = 0.0
+    planned_duration: int = 0
+    elapsed: int = 0
+    remaining: int = 0
+    last_seen: float = 0.0
+    blocks_active: bool = False
+    tail_dropped: bool = False
+
+    @property
+    def needs_unblock(self) -> bool:
+        """Hosts entries were left behind and the session is not being resumed."""
+        return self.blocks_active and self.action != ACTION_RESUME
+
+
+def replay(records: List[dict], now: Optional[float] = None,
+           tail_dropped: bool = False) -> RecoveryPlan:
+    """Decide how to recover from the records of the last session."""
+    now = time.time() if now is None else now
+    start_idx = None
+    for i in range(len(records) - 1, -1, -1):
+        if records[i].get("ev") == EVENT_START:
+            start_idx = i
+            break
+    if start_idx is None:
+        return RecoveryPlan(tail_dropped=tail_dropped)
+
+    start = records[start_idx]
+    plan = RecoveryPlan(
+        session_id=start.get("session_id"),
+        mode=start.get("mode"),
+        pid=start.get("pid"),
+        started_at=float(start.get("started_at", start.get("t", 0))),
+        planned_duration=int(start.get("planned", 0)),
+        last_seen=float(start.get("t", 0)),
+        tail_dropped=tail_dropped,
+    )
+    ended = False
+    for record in records[start_idx + 1:]:
+        event = record.get("ev")
+        plan.last_seen = max(plan.last_seen, float(record.get("t", 0)))
+        if event == EVENT_BLOCK:
+            plan.blocks_active = True
+        elif event == EVENT_UNBLOCK:
+            plan.blocks_active = False
+            ended = True
+        elif event == EVENT_CHECKPOINT:
+            plan.elapsed = max(plan.elapsed, int(record.get("elapsed", 0)))
+        elif event == EVENT_COMPLETE:
+            plan.elapsed = max(plan.elapsed, int(record.get("elapsed", 0)))
+            ended = True
+
+    if ended:
+        # The app handled the session end; only stray blocks may be left
+        plan.action = ACTION_CLEANUP if plan.blocks_active else ACTION_NONE
+        return plan
+
+    plan.remaining = max(0, int(plan.started_at + plan.planned_duration - now))
+    if plan.remaining >= MIN_RESUME_SECONDS:
+        plan.action = ACTION_RESUME
+    elif plan.elapsed > MIN_CREDIT_SECONDS:
+        plan.action = ACTION_CREDIT
+    elif plan.blocks_active:
+        plan.action = ACTION_CLEANUP
+    return plan
+
+
+class SessionJournal:
+    """Appends fsynced lifecycle records for the current session."""
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time):
+        self.path = Path(path)
+        self._clock = clock
+        self._seq = 0
+        self._tail_checked = False
+        self._session_id: Optional[str] = None
+        self._blocked = False
+        self._completed = False
+
+    @property
+    def session_open(self) -> bool:
+        return self._session_id is not None
+
+    def _append(self, event: str, **fields) -> None:
+        record = {"seq": self._seq, "t": round(self._clock(), 3), "ev": event, **fields}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                if not self._tail_checked:
+                    self._tail_checked = True
+                    if f.tell() > 0:
+                        # Never glue a record onto a torn line from a previous run
+                        with open(self.path, "rb") as existing:
+                            existing.seek(-1, os.SEEK_END)
+                            if existing.read(1) != b"\n":
+                                f.write(b"\n")
+                f.write(encode_record(record))
+                f.flush()
+                os.fsync(f.fileno())
+            self._seq += 1
+        except OSError as e:
+            logger.warning(f"Could not append to session journal: {e}")
+
+    # === Lifecycle ===
+
+    def start(self, session_id: str, planned_duration: int, mode: str = "",
+              started_at: Optional[float] = None, **fields) -> None:
+        """Begin a session. Earlier sessions have been recovered by now, so drop them."""
+        self.compact()
+        self._session_id = session_id
+        self._blocked = False
+        self._completed = False
+        self._append(EVENT_START, session_id=session_id, planned=int(planned_duration),
+                     mode=mode, pid=os.getpid(),
+                     started_at=round(self._clock() if started_at is None else started_at, 3),
+                     **fields)
+
+    def block(self, sites: int = 0) -> None:
+        if self.session_open:
+            self._blocked = True
+            self._append(EVENT_BLOCK, sites=sites)
+
+    def checkpoint(self, elapsed: int) -> None:
+        if self.session_open and not self._completed:
+            self._append(EVENT_CHECKPOINT, elapsed=int(elapsed))
+
+    def unblock(self) -> None:
+        if self.session_open:
+            self._blocked = False
+            self._append(EVENT_UNBLOCK)
+            self._close_if_clean()
+
+    def complete(self, elapsed: int, completed: bool = True) -> None:
+        if self.session_open:
+            self._completed = True
+            self._append(EVENT_COMPLETE, elapsed=int(elapsed), completed=bool(completed))
+            self._close_if_clean()
+
+    def _close_if_clean(self) -> None:
+        if self._completed and not self._blocked:
+            self.compact()
+
+    # === Recovery ===
+
+    def recover(self, now: Optional[float] = None) -> RecoveryPlan:
+        """Replay the journal left by the previous run."""
+        records, tail_dropped = read_records(self.path)
+        if tail_dropped:
+            logger.warning("Session journal had a torn or corrupt tail; replaying the valid prefix")
+        return replay(records, now=now, tail_dropped=tail_dropped)
+
+    def compact(self) -> None:
+        """Drop all records (no session needs recovery)."""
+        self._session_id = None
+        self._blocked = False
+        self._completed = False
+        self._seq = 0
+        self._tail_checked = True
+        try:
+            if self.path.exists():
+                with open(self.path, "wb") as f:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except OSError as e:
+            logger.warning(f"Could not compact session journal: {e}")
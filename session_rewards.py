@@ -0,0 +1,388 @@
+"""
+Session reward pipeline for Personal Liberty.
+
+Completing a focus session awards coins, an item, XP and the daily diary
+entry. Computing and applying those used to be interleaved: every step
+re-read entity perks and city bonuses, and every award saved the config and
+emitted its own signals. The pipeline splits the work in two:
+
+- compute_session_rewards() reads all perks and bonuses once into a
+  RewardSnapshot and returns a SessionRewardPlan. It does not touch state.
+  With dry_run=True no item is rolled, so the same numbers back previews.
+- GameStateManager.apply_session_rewards() applies a plan inside a single
+  batch, so the session costs one save and one consolidated signal set.
+
+compute_session_reward_ledger() wraps a plan, plus the Royal Mint/Wonder
+income, in an immutable itemized SessionRewardLedger. The session complete
+dialog displays the ledger and apply_ledger() awards that same ledger, so
+the preview and the award can never disagree.
+
+Every stage records its wall time (seconds) in SessionRewardPlan.timings.
+"""
+
+import copy
+import logging
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Anti-exploitation thresholds (minutes)
+MIN_SESSION_FOR_ANY_REWARD = 5      # < 5 min = nothing
+MIN_SESSION_FOR_FULL_REWARD = 20    # < 20 min = reduced rewards
+SHORT_SESSION_MULTIPLIER = 0.5
+SHORT_SESSION_ITEM_CHANCE = 0.25
+
+BASE_COINS_PER_HOUR = 10
+STRATEGIC_COIN_MULTIPLIER = 2.5
+MAX_XP_BONUS_PERCENT = 200
+
+
+def get_streak_coin_bonus(streak: int) -> int:
+    """Flat coin bonus for the current streak (logarithmic scaling)."""
+    if streak >= 30:
+        return 100
+    if streak >= 14:
+        return 50
+    if streak >= 7:
+        return 25
+    if streak >= 3:
+        return 10
+    return 0
+
+
+@dataclass
+class RewardSnapshot:
+    """Perks and bonuses read once at the start of a reward computation."""
+    lucky_bonuses: Dict = field(default_factory=lambda: {"coin_discount": 0, "xp_bonus": 0, "merge_luck": 0})
+    coin_perks: Dict = field(default_factory=lambda: {"coin_flat": 0, "coin_percent": 0})
+    qol_perks: Dict = field(default_factory=dict)
+    city_bonuses: Dict = field(default_factory=dict)
+
+    @classmethod
+    def capture(cls, adhd_buster: dict) -> 'RewardSnapshot':
+        snapshot = cls()
+        try:
+            from gamification import calculate_total_lucky_bonuses
+            snapshot.lucky_bonuses = calculate_total_lucky_bonuses(adhd_buster.get("equipped", {}))
+        except Exception as e:
+            logger.debug(f"Could not read lucky bonuses: {e}")
+        try:
+            from gamification import get_entity_coin_perks
+            snapshot.coin_perks = get_entity_coin_perks(adhd_buster, source="session")
+        except Exception as e:
+            logger.debug(f"Could not read entity coin perks: {e}")
+        try:
+            from gamification import get_entity_qol_perks
+            snapshot.qol_perks = get_entity_qol_perks(adhd_buster)
+        except Exception as e:
+            logger.debug(f"Could not read entity QoL perks: {e}")
+        try:
+            from city import get_city_bonuses
+            snapshot.city_bonuses = get_city_bonuses(adhd_buster)
+        except Exception as e:
+            logger.debug(f"Could not read city bonuses: {e}")
+        return snapshot
+
+
+@dataclass
+class SessionRewardPlan:
+    """Everything a completed session will award, computed but not yet applied."""
+    session_minutes: int
+    streak: int
+    story_id: str = "warrior"
+    dry_run: bool = False
+    eligible: bool = True
+    is_short_session: bool = False
+    is_perfect: bool = False
+    coins: int = 0
+    streak_bonus: int = 0
+    entity_coin_bonus: int = 0
+    perfect_session_bonus_pct: int = 0
+    perfect_coin_bonus: int = 0
+    coin_breakdown: List[str] = field(default_factory=list)
+    deep_work_multiplier: float = 1.0
+    deep_work_description: str = ""
+    xp: int = 0
+    city_xp_bonus: int = 0
+    xp_info: Dict = field(default_factory=dict)
+    item_drop_chance: float = 0.0
+    item: Optional[dict] = None
+    snapshot: Optional[RewardSnapshot] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def timed(self, stage: str):
+        """Record the wall time of a pipeline stage in self.timings."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] = self.timings.get(stage, 0.0) + time.perf_counter() - start
+
+
+def compute_session_rewards(adhd_buster: dict, session_minutes: int, streak: int = 0,
+                            strategic: bool = False, perfect: bool = False,
+                            dry_run: bool = False,
+                            rng: Optional[random.Random] = None) -> SessionRewardPlan:
+    """
+    Compute the rewards for a completed focus session without applying them.
+
+    Short session penalties (anti-exploitation):
+    - < 5 min: No rewards at all (plan.eligible is False)
+    - 5-19 min: Reduced rewards (25% item drop chance, 50% coins/XP)
+    - 20+ min: Full rewards with normal scaling
+
+    Args:
+        adhd_buster: Hero data (read only)
+        session_minutes: Session length in minutes
+        streak: Current streak in days
+        strategic: Whether the session was on a strategic priority (2.5x coins)
+        perfect: Whether the session had no distraction attempts
+        dry_run: Skip the item roll so the plan can be shown as a preview
+        rng: Random source for the short-session drop roll (default: random module)
+
+    Returns:
+        SessionRewardPlan with coins, XP, the generated item and stage timings.
+    """
+    plan = SessionRewardPlan(
+        session_minutes=session_minutes,
+        streak=streak,
+        story_id=adhd_buster.get("active_story", "warrior"),
+        dry_run=dry_run,
+    )
+    if session_minutes < MIN_SESSION_FOR_ANY_REWARD:
+        plan.eligible = False
+        return plan
+
+    with plan.timed("snapshot"):
+        snapshot = plan.snapshot = RewardSnapshot.capture(adhd_buster)
+
+    plan.is_short_session = session_minutes < MIN_SESSION_FOR_FULL_REWARD
+    multiplier = SHORT_SESSION_MULTIPLIER if plan.is_short_session else 1.0
+
+    with plan.timed("coins"):
+        coins = int(session_minutes / 60.0 * BASE_COINS_PER_HOUR * multiplier)
+
+        # 🚀 DEEP WORK BONUS: Apply multiplier for longer sessions
+        try:
+            from gamification import get_deep_work_multiplier
+            plan.deep_work_multiplier, plan.deep_work_description = get_deep_work_multiplier(session_minutes)
+            if plan.deep_work_multiplier > 1.0:
+                coins = int(coins * plan.deep_work_multiplier)
+        except ImportError:
+            pass
+
+        if strategic:
+            coins = int(coins * STRATEGIC_COIN_MULTIPLIER)
+
+        plan.streak_bonus = get_streak_coin_bonus(streak)
+        coins += plan.streak_bonus
+
+        # ✨ ENTITY PERK BONUS: coin perks from collected entities
+        coin_flat = snapshot.coin_perks.get("coin_flat", 0)
+        coin_percent = snapshot.coin_perks.get("coin_percent", 0)
+        if coin_flat > 0:
+            plan.entity_coin_bonus += coin_flat
+            plan.coin_breakdown.append(f"+{coin_flat} coins")
+        if coin_percent > 0:
+            plan.entity_coin_bonus += int(coins * (coin_percent / 100.0))
+            plan.coin_breakdown.append(f"+{coin_percent}% coins")
+        coins += plan.entity_coin_bonus
+
+        # ✨ PERFECT SESSION BONUS: no distraction attempts
+        plan.is_perfect = perfect
+        if perfect:
+            plan.perfect_session_bonus_pct = snapshot.qol_perks.get("perfect_session_bonus", 0)
+            if plan.perfect_session_bonus_pct > 0:
+                plan.perfect_coin_bonus = int(coins * (plan.perfect_session_bonus_pct / 100.0))
+                coins += plan.perfect_coin_bonus
+                plan.coin_breakdown.append(f"+{plan.perfect_session_bonus_pct}% perfect session")
+        plan.coins = coins
+
+    with plan.timed("xp"):
+        xp_bonus_pct = snapshot.lucky_bonuses.get("xp_bonus", 0) + plan.perfect_session_bonus_pct
+        xp_bonus_pct = min(xp_bonus_pct, MAX_XP_BONUS_PERCENT)
+        from gamification import calculate_session_xp
+        plan.xp_info = calculate_session_xp(
+            session_minutes, streak, lucky_xp_bonus=xp_bonus_pct, adhd_buster=adhd_buster
+        )
+        xp = plan.xp_info["total_xp"]
+        if plan.is_short_session:
+            xp = int(xp * multiplier)
+        # 🏙️ CITY BONUS: Library XP bonus
+        city_xp_pct = snapshot.city_bonuses.get("xp_bonus", 0)
+        if city_xp_pct > 0 and xp > 0:
+            plan.city_xp_bonus = int(xp * city_xp_pct / 100.0)
+        plan.xp = xp + plan.city_xp_bonus
+
+    plan.item_drop_chance = SHORT_SESSION_ITEM_CHANCE if plan.is_short_session else 1.0
+    if not dry_run:
+        with plan.timed("item"):
+            roll = (rng or random).random()
+            if roll < plan.item_drop_chance:
+                from gamification import generate_item
+                plan.item = generate_item(session_minutes=session_minutes, streak_days=streak,
+                                          story_id=plan.story_id, adhd_buster=adhd_buster)
+            else:
+                logger.info(f"Short session ({session_minutes} min) - no item drop (25% chance failed)")
+
+    logger.debug(f"Session reward plan: coins={plan.coins}, xp={plan.xp}, "
+                 f"item={bool(plan.item)}, timings={format_timings(plan.timings)}")
+    return plan
+
+
+@dataclass(frozen=True)
+class SessionFlags:
+    """How the session went, as far as rewards care."""
+    strategic: bool = False  # On a strategic priority (2.5x coins)
+    perfect: bool = False    # No distraction attempts
+
+
+@dataclass(frozen=True)
+class LedgerLine:
+    """One itemized reward: kind is "coins" or "xp", source says where it came from."""
+    kind: str
+    source: str
+    amount: int
+    label: str = ""
+
+
+@dataclass(frozen=True)
+class SessionRewardLedger:
+    """Itemized, immutable result of compute_session_reward_ledger()."""
+    session_minutes: int
+    streak: int
+    eligible: bool
+    dry_run: bool = False
+    is_short_session: bool = False
+    is_perfect: bool = False
+    item_drop_chance: float = 0.0
+    lines: Tuple[LedgerLine, ...] = ()
+    item: Optional[dict] = None
+    city_income: Optional[dict] = None
+    plan: Optional[SessionRewardPlan] = field(default=None, compare=False, repr=False)
+
+    def total(self, kind: str, source: Optional[str] = None) -> int:
+        return sum(line.amount for line in self.lines
+                   if line.kind == kind and (source is None or line.source == source))
+
+    @property
+    def coins(self) -> int:
+        return self.total("coins")
+
+    @property
+    def xp(self) -> int:
+        return self.total("xp")
+
+    @property
+    def city_mint_coins(self) -> int:
+        return self.total("coins", "city_mint")
+
+    @property
+    def xp_info(self) -> Dict:
+        return self.plan.xp_info if self.plan else {}
+
+
+def compute_session_reward_ledger(adhd_buster: dict, stats: dict, session_minutes: int,
+                                  flags: Optional[SessionFlags] = None,
+                                  rng: Optional[random.Random] = None,
+                                  dry_run: bool = False) -> SessionRewardLedger:
+    """
+    Compute everything a completed session awards as an itemized ledger.
+
+    Covers the session coins (streak, entity perk and perfect session
+    bonuses included), Royal Mint/Wonder focus income, session XP with the
+    Library bonus, and the item roll. Nothing is applied; pass the ledger to
+    apply_ledger() to award exactly what was shown.
+
+    Args:
+        adhd_buster: Hero data (read only)
+        stats: Blocker stats (streak_days)
+        session_minutes: Session length in minutes
+        flags: Strategic / perfect session flags
+        rng: Random source for the item drop roll
+        dry_run: Skip the item roll (preview only, cannot be applied)
+    """
+    flags = flags or SessionFlags()
+    streak = stats.get("streak_days", 0)
+    plan = compute_session_rewards(adhd_buster, session_minutes, streak,
+                                   strategic=flags.strategic, perfect=flags.perfect,
+                                   dry_run=dry_run, rng=rng)
+    if not plan.eligible:
+        return SessionRewardLedger(session_minutes, streak, eligible=False, dry_run=dry_run, plan=plan)
+
+    lines = []
+
+    def add(kind: str, source: str, amount: int, label: str) -> None:
+        if amount:
+            lines.append(LedgerLine(kind, source, amount, label))
+
+    coin_perks = plan.snapshot.coin_perks
+    coin_flat = max(0, coin_perks.get("coin_flat", 0))
+    session_coins = (plan.coins - plan.streak_bonus - plan.entity_coin_bonus
+                     - plan.perfect_coin_bonus)
+    add("coins", "session", session_coins, f"{session_minutes} min focus")
+    add("coins", "streak", plan.streak_bonus, f"{streak} day streak")
+    add("coins", "entity_perk", coin_flat, f"+{coin_flat} Coins (Entity Perk)")
+    add("coins", "entity_perk", plan.entity_coin_bonus - coin_flat,
+        f"+{coin_perks.get('coin_percent', 0)}% Coins (Entity Perk)")
+    add("coins", "perfect_session", plan.perfect_coin_bonus,
+        f"+{plan.perfect_session_bonus_pct}% perfect session")
+
+    city_income = {"coins": 0, "breakdown": []}
+    with plan.timed("city_income"):
+        try:
+            from city import compute_focus_session_income
+            city_income = compute_focus_session_income(adhd_buster, session_minutes)
+        except Exception as e:
+            logger.debug(f"Could not compute focus session income: {e}")
+    for entry in city_income["breakdown"]:
+        add("coins", "city_mint", entry["total_coins"], entry["building"])
+
+    add("xp", "session", plan.xp - plan.city_xp_bonus, f"{session_minutes} min focus")
+    add("xp", "city_library", plan.city_xp_bonus,
+        f"+{plan.snapshot.city_bonuses.get('xp_bonus', 0)}% XP (City Bonus)")
+
+    return SessionRewardLedger(
+        session_minutes=session_minutes,
+        streak=streak,
+        eligible=True,
+        dry_run=dry_run,
+        is_short_session=plan.is_short_session,
+        is_perfect=plan.is_perfect,
+        item_drop_chance=plan.item_drop_chance,
+        lines=tuple(lines),
+        item=copy.deepcopy(plan.item),
+        city_income=city_income,
+        plan=plan,
+    )
+
+
+def apply_ledger(game_state, ledger: SessionRewardLedger, create_backup: bool = False) -> dict:
+    """
+    Award a ledger through game_state in one batch.
+
+    The item is copied, so the ledger stays as it was displayed. Returns
+    GameStateManager.apply_session_rewards()'s result, whose coins_earned
+    and xp_earned equal ledger.coins and ledger.xp.
+    """
+    if ledger.dry_run or not ledger.eligible or ledger.plan is None:
+        logger.warning("apply_ledger called with a dry-run or ineligible ledger")
+        return {}
+    plan = replace(ledger.plan, coins=ledger.coins, xp=ledger.xp,
+                   item=copy.deepcopy(ledger.item))
+    with game_state.batch():
+        result = game_state.apply_session_rewards(plan, create_backup=create_backup)
+        if ledger.city_mint_coins > 0:
+            from city import record_focus_session_income
+            record_focus_session_income(game_state.adhd_buster, ledger.city_income, game_state)
+    return result
+
+
+def format_timings(timings: Dict[str, float]) -> str:
+    """Format stage timings as 'stage=1.2ms' pairs for logging."""
+    return ", ".join(f"{stage}={seconds * 1000:.1f}ms" for stage, seconds in timings.items())
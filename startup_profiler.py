@@ -0,0 +1,263 @@
+"""
+Startup profiling and background module preloading for Personal Liberty.
+
+StartupProfiler records named phases (with the thread they ran on) and
+instantaneous marks such as "first_paint", relative to the moment
+focus_blocker_qt starts importing, and can dump them as a JSON report.
+
+BackgroundPreloader imports the widget-free modules (core logic, entity and
+city data, AI helpers) on a worker thread and warms their lazy tables and
+the synthesized sound buffers while the GUI thread creates the application
+and handles the single-instance check. Python's per-module import locks
+make a concurrent import on the GUI thread wait for the worker to finish
+that module instead of importing it twice.
+
+Set PERSONAL_LIBERTY_STARTUP_REPORT=<path> to write the report on startup,
+or run `python startup_profiler.py` for a headless cold-start benchmark
+(needs an auto-login profile; otherwise each run waits at profile selection
+until it times out).
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPORT_ENV_VAR = "PERSONAL_LIBERTY_STARTUP_REPORT"
+EXIT_AFTER_PAINT_ENV_VAR = "PERSONAL_LIBERTY_EXIT_AFTER_PAINT"
+
+# Modules with no widgets of their own; safe to import off the GUI thread.
+PRELOAD_MODULES = (
+    "user_manager",
+    "core_logic",
+    "entitidex",
+    "gamification",
+    "city",
+    "productivity_ai",
+    "session_rewards",
+    "lottery_sounds",
+)
+
+
+class StartupProfiler:
+    """Collects startup phase timings and marks relative to a fixed origin."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.origin = clock()
+        self.phases: List[Dict] = []
+        self.marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """Seconds since the profiler was created."""
+        return self._clock() - self.origin
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as a named phase."""
+        start = self.elapsed()
+        try:
+            yield
+        finally:
+            end = self.elapsed()
+            with self._lock:
+                self.phases.append({
+                    "name": name,
+                    "start": start,
+                    "duration": end - start,
+                    "thread": threading.current_thread().name,
+                })
+
+    def mark(self, name: str) -> None:
+        """Record an instant (first occurrence wins)."""
+        with self._lock:
+            self.marks.setdefault(name, self.elapsed())
+
+    def report(self) -> Dict:
+        """Phases sorted by start time plus marks, all in seconds."""
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p["start"])
+            marks = dict(self.marks)
+        return {"phases": phases, "marks": marks, "total": self.elapsed()}
+
+    def format_report(self) -> str:
+        """Human-readable report, one phase per line."""
+        report = self.report()
+        lines = [f"Startup report ({report['total'] * 1000:.0f} ms since launch)"]
+        for p in report["phases"]:
+            lines.append(f"  {p['start'] * 1000:8.1f} ms  {p['duration'] * 1000:8.1f} ms  "
+                         f"[{p['thread']}] {p['name']}")
+        for name, at in sorted(report["marks"].items(), key=lambda kv: kv[1]):
+            lines.append(f"  {at * 1000:8.1f} ms  mark: {name}")
+        return "\n".join(lines)
+
+    def dump(self, path: Path) -> None:
+        """Write the report as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get the process-wide startup profiler (created on first use)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+    return _profiler
+
+
+# === Warmers ===
+
+def _warm_perk_tables() -> None:
+    """Run the perk and power calculations once on empty data to pull in their lazy imports."""
+    from gamification import calculate_character_power, get_entity_qol_perks
+    calculate_character_power({})
+    get_entity_qol_perks({})
+
+
+def _warm_sound_buffers() -> None:
+    """Synthesize the lottery melodies so the first reveal plays instantly."""
+    from lottery_sounds import is_sound_available, preload_lottery_sounds
+    if is_sound_available():
+        preload_lottery_sounds()
+
+
+DEFAULT_WARMERS: Tuple[Tuple[str, Callable[[], None]], ...] = (
+    ("perk_tables", _warm_perk_tables),
+    ("sound_buffers", _warm_sound_buffers),
+)
+
+
+class BackgroundPreloader:
+    """Imports modules and runs warmers on a daemon thread, timing each step."""
+
+    def __init__(self, modules: Sequence[str] = PRELOAD_MODULES,
+                 warmers: Sequence[Tuple[str, Callable[[], None]]] = DEFAULT_WARMERS,
+                 profiler: Optional[StartupProfiler] = None):
+        self.modules = tuple(modules)
+        self.warmers = tuple(warmers)
+        self.profiler = profiler or get_startup_profiler()
+        self.errors: Dict[str, str] = {}
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="startup-preload", daemon=True)
+
+    def start(self) -> 'BackgroundPreloader':
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            for module in self.modules:
+                with self.profiler.phase(f"preload:{module}"):
+                    try:
+                        __import__(module)
+                    except Exception as e:
+                        self.errors[module] = str(e)
+            for name, warmer in self.warmers:
+                with self.profiler.phase(f"warm:{name}"):
+                    try:
+                        warmer()
+                    except Exception as e:
+                        self.errors[name] = str(e)
+        finally:
+            if self.errors:
+                logger.debug(f"Startup preload errors: {self.errors}")
+            self._done.set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until preloading finishes. Returns False on timeout."""
+        return self._done.wait(timeout)
+
+
+def start_background_preload(**kwargs) -> BackgroundPreloader:
+    """Create and start a BackgroundPreloader."""
+    return BackgroundPreloader(**kwargs).start()
+
+
+def write_report_if_requested(profiler: Optional[StartupProfiler] = None) -> Optional[Path]:
+    """Dump the report to $PERSONAL_LIBERTY_STARTUP_REPORT if set. Returns the path."""
+    target = os.environ.get(REPORT_ENV_VAR)
+    if not target:
+        return None
+    profiler = profiler or get_startup_profiler()
+    try:
+        profiler.dump(Path(target))
+    except OSError as e:
+        logger.warning(f"Could not write startup report: {e}")
+        return None
+    return Path(target)
+
+
+def benchmark_cold_start(runs: int = 3, timeout: float = 120.0) -> Dict:
+    """
+    Launch the app headless `runs` times and collect time to first paint.
+
+    Each run starts a fresh interpreter with the offscreen Qt platform and
+    exits right after the main window's first paint, writing its startup
+    report to a temporary file.
+
+    Returns:
+        dict with "runs" (list of reports) and "first_paint" min/median/max
+        in seconds.
+    """
+    import statistics
+    import subprocess
+    import tempfile
+
+    app_path = Path(__file__).resolve().parent / "focus_blocker_qt.py"
+    reports = []
+    for i in range(runs):
+        with tempfile.TemporaryDirectory() as tmp:
+            report_path = Path(tmp) / "startup_report.json"
+            env = dict(os.environ)
+            env.setdefault("QT_QPA_PLATFORM", "offscreen")
+            env[REPORT_ENV_VAR] = str(report_path)
+            env[EXIT_AFTER_PAINT_ENV_VAR] = "1"
+            subprocess.run([sys.executable, str(app_path), "--show"], env=env,
+                           timeout=timeout, capture_output=True)
+            if report_path.exists():
+                with open(report_path, "r", encoding="utf-8") as f:
+                    reports.append(json.load(f))
+            else:
+                logger.warning(f"Cold-start run {i + 1} produced no report")
+
+    paints = [r["marks"]["first_paint"] for r in reports if "first_paint" in r.get("marks", {})]
+    summary = {"runs": reports}
+    if paints:
+        summary["first_paint"] = {
+            "min": min(paints),
+            "median": statistics.median(paints),
+            "max": max(paints),
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure Personal Liberty cold-start time to first paint.")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    result = benchmark_cold_start(args.runs)
+    paint = result.get("first_paint")
+    if not paint:
+        print("No run reached first paint")
+        sys.exit(1)
+    print(f"first paint over {len(result['runs'])} runs: "
+          f"min {paint['min'] * 1000:.0f} ms, median {paint['median'] * 1000:.0f} ms, "
+          f"max {paint['max'] * 1000:.0f} ms")
@@ -0,0 +1,92 @@
+"""
+Rendered chapter cache for the Story tab.
+
+Opening a chapter personalises its text with the hero's gear and decisions
+and converts the story markdown (**bold**, *italic*, blank-line paragraphs)
+to the rich text the reader dialog shows. Both only depend on what
+gamification.chapter_render_key() captures - story, chapter, decisions
+made, equipped gear names and, for chapters that print it, power - so the
+HTML is kept per key and reopening a chapter skips straight to the dialog:
+
+    data, html = chapter_cache().get(chapter_number, adhd_buster, power)
+
+Everything here is plain Python so it can be tested without a display.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from gamification import chapter_render_key, get_chapter_content
+
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+
+
+def markdown_to_html(text: str) -> str:
+    """Convert the story markdown subset to QLabel rich text."""
+    # Convert **bold** to <b>bold</b>
+    text = _BOLD_RE.sub(r'<b>\1</b>', text)
+    # Convert *italic* to <i>italic</i>
+    text = _ITALIC_RE.sub(r'<i>\1</i>', text)
+    # Convert line breaks to HTML
+    text = text.replace('\n\n', '</p><p style="margin-top: 12px;">')
+    text = text.replace('\n', '<br>')
+    return f'<p>{text}</p>'
+
+
+class ChapterRenderCache:
+    """Least-recently-used map from chapter_render_key() to (chapter data, HTML)."""
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, Tuple[dict, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, chapter_number: int, adhd_buster: dict,
+            power: Optional[int] = None) -> Optional[Tuple[dict, str]]:
+        """
+        Chapter data and its rendered HTML.
+
+        Locked chapters are rendered every time (their text shows the live
+        power shortfall) and never cached. Returns None for chapters that do
+        not exist. Callers get a copy of the data dict so they can't alter
+        the cached one.
+        """
+        key = chapter_render_key(chapter_number, adhd_buster, power)
+        if key is not None:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(cached[0]), cached[1]
+
+        data = get_chapter_content(chapter_number, adhd_buster, power)
+        if data is None:
+            return None
+        html = markdown_to_html(data.get("content", "No content available."))
+        if key is not None:
+            self.misses += 1
+            self._entries[key] = (data, html)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            data = dict(data)
+        return data, html
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_cache: Optional[ChapterRenderCache] = None
+
+
+def chapter_cache() -> ChapterRenderCache:
+    """The process-wide cache used by the Story tab."""
+    global _cache
+    if _cache is None:
+        _cache = ChapterRenderCache()
+    return _cache
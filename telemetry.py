@@ -0,0 +1,214 @@
+"""
+Lightweight performance telemetry for Personal Liberty.
+
+Hot paths are wrapped with @timed("name") or `with span("name"):`. Each
+name gets a Histogram: a running count, total and max, plus the last
+WINDOW_SIZE durations in a fixed-size ring buffer from which p50/p95 are
+computed on demand. Recording is a perf_counter() pair and a short locked
+update, so it is safe from the browser monitor thread as well as the GUI
+thread.
+
+When telemetry is disabled (PERSONAL_LIBERTY_TELEMETRY=0, or
+set_enabled(False) from the Dev tab) a timed function costs one extra
+attribute check and span() hands back a shared no-op context manager.
+
+snapshot() returns everything as plain dicts (durations in milliseconds)
+and dump() writes it as JSON. The startup phases stay in startup_profiler;
+the Dev tab export bundles both.
+"""
+
+import functools
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ENABLED_ENV_VAR = "PERSONAL_LIBERTY_TELEMETRY"
+
+# Samples kept per name for the percentiles
+WINDOW_SIZE = 256
+
+
+def _nearest_rank(samples: List[float], p: float) -> float:
+    """The p-th percentile of already sorted samples (0.0 when empty)."""
+    if not samples:
+        return 0.0
+    rank = math.ceil(p / 100.0 * len(samples))
+    return samples[min(max(rank, 1), len(samples)) - 1]
+
+
+class Histogram:
+    """Duration statistics for one name: lifetime count/total/max, percentiles over a window."""
+
+    __slots__ = ("name", "count", "total", "max", "last", "_samples", "_next")
+
+    def __init__(self, name: str, window: int = WINDOW_SIZE):
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self._samples: List[float] = [0.0] * window
+        self._next = 0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self._samples[self._next] = seconds
+        self._next = (self._next + 1) % len(self._samples)
+
+    def window(self) -> List[float]:
+        """The retained samples, oldest first."""
+        if self.count < len(self._samples):
+            return self._samples[:self.count]
+        return self._samples[self._next:] + self._samples[:self._next]
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile (0-100) of the retained samples, in seconds."""
+        return _nearest_rank(sorted(self.window()), p)
+
+    def summary(self) -> Dict:
+        """count, total, mean, last, p50, p95 and max; durations in milliseconds."""
+        samples = sorted(self.window())
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "last_ms": self.last * 1000,
+            "p50_ms": _nearest_rank(samples, 50) * 1000,
+            "p95_ms": _nearest_rank(samples, 95) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class Telemetry:
+    """Registry of histograms keyed by name."""
+
+    def __init__(self, enabled: bool = True, window: int = WINDOW_SIZE,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self.window = window
+        self.started = time.time()
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one duration to the named histogram."""
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = Histogram(name, self.window)
+            hist.add(seconds)
+
+    def histogram(self, name: str) -> Optional[Histogram]:
+        return self._histograms.get(name)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._histograms)
+
+    def reset(self) -> None:
+        """Forget all recorded durations."""
+        with self._lock:
+            self._histograms.clear()
+            self.started = time.time()
+
+    def snapshot(self) -> Dict:
+        """All histograms as {"enabled", "since", "metrics": {name: summary}}."""
+        with self._lock:
+            metrics = {name: hist.summary() for name, hist in sorted(self._histograms.items())}
+        return {"enabled": self.enabled, "since": self.started, "metrics": metrics}
+
+    def dump(self, path: Path, extra: Optional[Dict] = None) -> None:
+        """Write snapshot() (plus any extra top-level keys) as JSON."""
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+class _Span:
+    """Times a with-block into a Telemetry registry."""
+
+    __slots__ = ("_telemetry", "_name", "_start")
+
+    def __init__(self, telemetry: Telemetry, name: str):
+        self._telemetry = telemetry
+        self._name = name
+
+    def __enter__(self) -> '_Span':
+        self._start = self._telemetry.clock()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self._telemetry.record(self._name, self._telemetry.clock() - self._start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+_telemetry = Telemetry(enabled=os.environ.get(ENABLED_ENV_VAR, "1").lower() not in ("0", "false", "off"))
+
+
+def get_telemetry() -> Telemetry:
+    """Get the process-wide telemetry registry."""
+    return _telemetry
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn recording on or off (histograms recorded so far are kept)."""
+    _telemetry.enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _telemetry.enabled
+
+
+def span(name: str):
+    """Context manager timing its block as `name` (a no-op when disabled)."""
+    if not _telemetry.enabled:
+        return _NULL_SPAN
+    return _Span(_telemetry, name)
+
+
+def timed(name: str):
+    """Decorator timing every call of the function as `name`. Exceptions are timed too."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            telemetry = _telemetry
+            if not telemetry.enabled:
+                return func(*args, **kwargs)
+            start = telemetry.clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                telemetry.record(name, telemetry.clock() - start)
+        return wrapper
+    return decorator
+
+
+def snapshot() -> Dict:
+    return _telemetry.snapshot()
+
+
+def reset() -> None:
+    _telemetry.reset()
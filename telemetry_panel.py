@@ -0,0 +1,132 @@
+"""
+Live view of the performance telemetry (see telemetry.py) for the Dev tab.
+
+PerformancePanel shows one row per timed name (calls, p50, p95, max, mean
+and total in milliseconds), refreshed once a second while it is visible,
+with controls to pause recording, reset the histograms and export a JSON
+snapshot.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from PySide6 import QtCore, QtWidgets
+
+import telemetry
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_MS = 1000
+
+COLUMNS = (
+    ("Name", None),
+    ("Calls", "count"),
+    ("p50 ms", "p50_ms"),
+    ("p95 ms", "p95_ms"),
+    ("Max ms", "max_ms"),
+    ("Mean ms", "mean_ms"),
+    ("Total ms", "total_ms"),
+)
+
+
+class PerformancePanel(QtWidgets.QGroupBox):
+    """Table of telemetry histograms with enable/reset/export controls."""
+
+    def __init__(self, extra: Optional[Callable[[], Dict]] = None,
+                 parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__("⏱️ Performance", parent)
+        self._extra = extra
+        self._build_ui()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+
+        controls = QtWidgets.QHBoxLayout()
+        self.enabled_check = QtWidgets.QCheckBox("Record timings")
+        self.enabled_check.setChecked(telemetry.is_enabled())
+        self.enabled_check.toggled.connect(telemetry.set_enabled)
+        controls.addWidget(self.enabled_check)
+        controls.addStretch()
+
+        reset_btn = QtWidgets.QPushButton("🔄 Reset")
+        reset_btn.clicked.connect(self._reset)
+        controls.addWidget(reset_btn)
+
+        export_btn = QtWidgets.QPushButton("💾 Export Snapshot…")
+        export_btn.clicked.connect(lambda: self.export_snapshot())
+        controls.addWidget(export_btn)
+        layout.addLayout(controls)
+
+        self.table = QtWidgets.QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, _ in COLUMNS])
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.table.setMinimumHeight(180)
+        layout.addWidget(self.table)
+
+        self.status_label = QtWidgets.QLabel("")
+        self.status_label.setStyleSheet("color: #888;")
+        layout.addWidget(self.status_label)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self) -> None:
+        """Reload the table from the current snapshot."""
+        metrics = telemetry.snapshot()["metrics"]
+        self.table.setRowCount(len(metrics))
+        for row, (name, summary) in enumerate(metrics.items()):
+            for col, (_, key) in enumerate(COLUMNS):
+                if key is None:
+                    text = name
+                elif key == "count":
+                    text = str(summary[key])
+                else:
+                    text = f"{summary[key]:.2f}"
+                item = self.table.item(row, col)
+                if item is None:
+                    item = QtWidgets.QTableWidgetItem()
+                    if key is not None:
+                        item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                    self.table.setItem(row, col, item)
+                if item.text() != text:
+                    item.setText(text)
+
+    def _reset(self) -> None:
+        telemetry.reset()
+        self.refresh()
+        self.status_label.setText("Timings reset")
+
+    def export_snapshot(self, path: Optional[str] = None) -> Optional[Path]:
+        """Write the snapshot (plus the extra data) as JSON. Asks for a path if none is given."""
+        if path is None:
+            default = f"performance_{datetime.now():%Y%m%d_%H%M%S}.json"
+            path, _ = QtWidgets.QFileDialog.getSaveFileName(
+                self, "Export Performance Snapshot", default, "JSON Files (*.json)")
+            if not path:
+                return None
+        extra = None
+        if self._extra is not None:
+            try:
+                extra = self._extra()
+            except Exception as e:
+                logger.warning(f"Could not collect extra snapshot data: {e}")
+        try:
+            telemetry.get_telemetry().dump(Path(path), extra)
+        except OSError as e:
+            self.status_label.setText(f"Export failed: {e}")
+            return None
+        self.status_label.setText(f"Snapshot saved to {path}")
+        return Path(path)
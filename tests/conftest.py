@@ -0,0 +1,19 @@
+"""
+Shared pytest fixtures.
+
+Widget tests run on the offscreen Qt platform unless QT_QPA_PLATFORM is
+already set; this has to happen before any test module imports PySide6.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication shared by all widget tests (skips when PySide6 is missing)."""
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
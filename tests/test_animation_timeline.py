@@ -0,0 +1,145 @@
+"""
+Tests for the keyframe track and shared frame scheduler (animation_timeline.py).
+"""
+
+import random
+import unittest
+
+from animation_timeline import FrameScheduler, KeyframeTrack, bounce_path, ease_out_quart
+
+
+def linear_walk(points, t):
+    """The per-frame segment walk the lottery dialogs used before KeyframeTrack."""
+    segments, total = [], 0.0
+    for start, end in zip(points, points[1:]):
+        dist = abs(end - start)
+        if dist > 0.001:
+            segments.append((start, end, dist, total, total + dist))
+            total += dist
+    travel = ease_out_quart(t) * total
+    for start, end, dist, cum_start, cum_end in segments:
+        if cum_start <= travel <= cum_end:
+            return start + (end - start) * (travel - cum_start) / dist
+    return points[-1]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestKeyframeTrack(unittest.TestCase):
+    """Bisect lookup matches the linear walk."""
+
+    def test_matches_linear_walk(self) -> None:
+        rng = random.Random(5)
+        for _ in range(200):
+            points = bounce_path(rng.uniform(0, 100), rng=rng)
+            if rng.random() < 0.3:
+                points.insert(rng.randrange(1, len(points)), points[-1])  # zero-length segment
+            track = KeyframeTrack(points)
+            for t in [0.0, 1.0] + [rng.random() for _ in range(50)]:
+                self.assertAlmostEqual(track.at_progress(t), linear_walk(points, t), places=9)
+
+    def test_endpoints_and_clamping(self) -> None:
+        track = KeyframeTrack([50.0, 100.0, 0.0, 37.5])
+        self.assertEqual(track.total_distance, 187.5)
+        self.assertEqual(track.position_at(-5), 50.0)
+        self.assertEqual(track.position_at(50), 100.0)
+        self.assertEqual(track.position_at(75), 75.0)
+        self.assertEqual(track.position_at(1000), 37.5)
+        self.assertEqual(track.at_progress(1.5), 37.5)
+        self.assertEqual(KeyframeTrack([42.0]).at_progress(0.5), 42.0)
+        with self.assertRaises(ValueError):
+            KeyframeTrack([])
+
+    def test_bounce_path_shape(self) -> None:
+        points = bounce_path(12.0, 3, 3, rng=random.Random(1))
+        self.assertEqual(len(points), 8)
+        self.assertEqual((points[0], points[-1]), (50.0, 12.0))
+        self.assertTrue(all(p in (0.0, 100.0) for p in points[1:-1]))
+
+    def test_bounce_track(self) -> None:
+        track = KeyframeTrack.bounce(12.0, 3, 3, rng=random.Random(1))
+        self.assertEqual(track.points, bounce_path(12.0, 3, 3, rng=random.Random(1)))
+        self.assertEqual(track.at_progress(1.0), 12.0)
+
+
+class TestFrameScheduler(unittest.TestCase):
+    """Real dt, catch-up after stalls, self-stop when idle."""
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.scheduler = FrameScheduler(clock=self.clock, start_timer=False)
+
+    def test_dt_is_wall_clock(self) -> None:
+        seen = []
+        self.scheduler.add(seen.append)
+        for step in (0.016, 0.016, 0.250, 0.001):
+            self.clock.now += step
+            self.scheduler.tick()
+        self.assertEqual([round(dt, 6) for dt in seen], [0.016, 0.016, 0.25, 0.001])
+
+    def test_stalled_loop_catches_up(self) -> None:
+        """A 4 s animation finishes after 4 s of wall time however few frames ran."""
+        finished_at = []
+        state = {"elapsed": 0.0}
+
+        def animate(dt):
+            state["elapsed"] += dt
+            if state["elapsed"] >= 4.0:
+                finished_at.append(self.clock.now)
+                return False
+            return True
+
+        start = self.clock.now
+        self.scheduler.add(animate)
+        for step in (0.016, 1.5, 0.016, 2.6, 0.016):  # two long stalls
+            self.clock.now += step
+            self.scheduler.tick()
+        self.assertEqual(len(finished_at), 1)
+        self.assertAlmostEqual(finished_at[0] - start, 4.132)
+        self.assertFalse(self.scheduler.running)
+
+    def test_stops_when_empty(self) -> None:
+        frames = []
+        self.scheduler.add(lambda dt: frames.append(dt) or len(frames) < 3)
+        self.assertTrue(self.scheduler.running)
+        for _ in range(5):
+            self.clock.now += 0.016
+            self.scheduler.tick()
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertFalse(self.scheduler.running)
+
+    def test_remove_and_failing_callback(self) -> None:
+        seen = []
+
+        def broken(dt):
+            raise RuntimeError("Internal C++ object already deleted")
+
+        self.scheduler.add(broken)
+        self.scheduler.add(seen.append)
+        self.clock.now += 0.016
+        self.assertEqual(self.scheduler.tick(), 2)
+        self.assertNotIn(broken, self.scheduler)
+        self.assertTrue(self.scheduler.remove(seen.append))
+        self.assertFalse(self.scheduler.remove(seen.append))
+        self.assertFalse(self.scheduler.running)
+        self.assertEqual(len(seen), 1)
+
+    def test_first_frame_measured_from_registration(self) -> None:
+        seen = []
+        self.scheduler.add(lambda dt: True)
+        self.clock.now += 10.0
+        self.scheduler.add(seen.append)
+        self.clock.now += 0.016
+        self.scheduler.tick()
+        self.assertAlmostEqual(seen[0], 0.016)
+
+
+if __name__ == '__main__':
+    unittest.main()
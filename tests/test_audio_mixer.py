@@ -0,0 +1,108 @@
+"""
+Tests for the polyphonic software mixer (audio_mixer.py), rendered headless.
+"""
+
+import array
+import unittest
+
+from audio_mixer import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    SAMPLE_MAX,
+    RingBuffer,
+    SoftwareMixer,
+    pcm_to_samples,
+    samples_to_pcm,
+    soft_clip,
+)
+
+
+def tone(values) -> bytes:
+    return samples_to_pcm(array.array('h', values))
+
+
+def render(mixer: SoftwareMixer, frames: int) -> list:
+    return pcm_to_samples(mixer.render(frames)).tolist()
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Wrap-around reads and writes."""
+
+    def test_wraps_around(self) -> None:
+        ring = RingBuffer(4)
+        self.assertEqual(ring.write(array.array('h', [1, 2, 3])), 3)
+        self.assertEqual(ring.read(2).tolist(), [1, 2])
+        self.assertEqual(ring.write(array.array('h', [4, 5, 6, 7])), 3)
+        self.assertEqual(ring.available, 4)
+        self.assertEqual(ring.read(10).tolist(), [3, 4, 5, 6])
+        self.assertEqual(ring.available, 0)
+
+
+class TestSoftwareMixer(unittest.TestCase):
+    """Mixing math, voice stealing and clipping."""
+
+    def test_overlapping_sounds_are_summed_with_gain(self) -> None:
+        mixer = SoftwareMixer(block_frames=4)
+        mixer.play(tone([100] * 6), gain=0.5)
+        mixer.play(tone([1000, -1000, 1000]))
+        self.assertEqual(mixer.active_voices, 2)
+        self.assertEqual(render(mixer, 8), [1050, -950, 1050, 50, 50, 50, 0, 0])
+        self.assertTrue(mixer.idle)
+
+    def test_reads_span_blocks_and_silence_when_idle(self) -> None:
+        mixer = SoftwareMixer(block_frames=3)
+        self.assertEqual(render(mixer, 4), [0, 0, 0, 0])
+        mixer.play(tone(range(1, 8)))
+        self.assertEqual(render(mixer, 2), [1, 2])
+        self.assertEqual(render(mixer, 4), [3, 4, 5, 6])
+        self.assertEqual(render(mixer, 3), [7, 0, 0])
+        self.assertEqual(len(mixer.read(7)), 6)  # whole samples only
+
+    def test_voice_stealing_by_priority(self) -> None:
+        mixer = SoftwareMixer(max_voices=2, block_frames=4)
+        low = mixer.play(tone([1] * 4), priority=PRIORITY_LOW)
+        high = mixer.play(tone([10] * 4), priority=PRIORITY_HIGH)
+        # Steals the low-priority voice
+        normal = mixer.play(tone([100] * 4), priority=PRIORITY_NORMAL)
+        self.assertIsNotNone(normal)
+        self.assertFalse(mixer.stop_voice(low))
+        # Every active voice now outranks a low-priority sound
+        self.assertIsNone(mixer.play(tone([5] * 4), priority=PRIORITY_LOW))
+        self.assertEqual(mixer.stats(), {"active": 2, "stolen": 1, "rejected": 1})
+        self.assertEqual(render(mixer, 4), [110] * 4)
+        self.assertIsNotNone(high)
+
+    def test_equal_priority_steals_oldest(self) -> None:
+        mixer = SoftwareMixer(max_voices=2, block_frames=2)
+        first = mixer.play(tone([1, 1]))
+        mixer.play(tone([2, 2]))
+        mixer.play(tone([4, 4]))
+        self.assertFalse(mixer.stop_voice(first))
+        self.assertEqual(render(mixer, 2), [6, 6])
+
+    def test_soft_clipping(self) -> None:
+        self.assertEqual(soft_clip(1000.0, 0.8), 1000.0)
+        self.assertLess(soft_clip(60000.0, 0.8), SAMPLE_MAX)
+        self.assertGreater(soft_clip(60000.0, 0.8), soft_clip(30000.0, 0.8))
+        self.assertEqual(soft_clip(-60000.0, 0.8), -soft_clip(60000.0, 0.8))
+
+        mixer = SoftwareMixer(block_frames=2)
+        for _ in range(4):
+            mixer.play(tone([30000, -30000]))
+        out = render(mixer, 2)
+        self.assertLessEqual(out[0], SAMPLE_MAX)
+        self.assertGreater(out[0], int(0.8 * SAMPLE_MAX))
+        self.assertEqual(out[1], -out[0])
+
+    def test_stop_all_discards_mixed_samples(self) -> None:
+        mixer = SoftwareMixer(block_frames=8)
+        mixer.play(tone([7] * 8))
+        render(mixer, 2)
+        mixer.stop_all()
+        self.assertTrue(mixer.idle)
+        self.assertEqual(render(mixer, 3), [0, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Tests for the content-addressed backup store (backup_store.py) and the
+core_logic backup helpers built on it.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import core_logic
+from backup_store import BackupStore, split_chunks
+from core_logic import (
+    BlockerCore,
+    create_auto_backup,
+    get_available_backups,
+    restore_auto_backup,
+)
+
+
+def make_config(n_items: int, marker: str = "") -> bytes:
+    config = {
+        "adhd_buster": {
+            "inventory": [
+                {"name": f"Item {i}", "rarity": "Rare", "power": i, "slot": "Helmet"}
+                for i in range(n_items)
+            ],
+        },
+        "marker": marker,
+    }
+    return json.dumps(config, indent=2).encode("utf-8")
+
+
+class TestChunking(unittest.TestCase):
+    """Tests for content-defined chunking."""
+
+    def test_chunks_reassemble(self) -> None:
+        data = make_config(500)
+        self.assertEqual(b"".join(split_chunks(data)), data)
+        self.assertGreater(len(split_chunks(data)), 1)
+
+    def test_local_edit_keeps_most_chunks(self) -> None:
+        before = split_chunks(make_config(500))
+        data = make_config(500).replace(b'"Item 250"', b'"Renamed item 250"')
+        after = split_chunks(data)
+        shared = set(before) & set(after)
+        self.assertGreaterEqual(len(shared), len(after) - 2)
+
+
+class TestBackupStore(unittest.TestCase):
+    """Tests for snapshot storage, listing, pruning and restore."""
+
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir)
+
+    def test_roundtrip(self) -> None:
+        store = BackupStore(self.test_dir)
+        data = make_config(200)
+        snapshot_id = store.add_snapshot(data)
+        self.assertEqual(store.read_snapshot(snapshot_id), data)
+        # A fresh instance reads everything back from the manifest
+        self.assertEqual(BackupStore(self.test_dir).read_snapshot(snapshot_id), data)
+
+    def test_deduplicates_and_compresses(self) -> None:
+        store = BackupStore(self.test_dir)
+        data = make_config(500)
+        store.add_snapshot(data)
+        objects_after_first = len(list(store.objects_dir.rglob("*")))
+        for i in range(10):
+            store.add_snapshot(data.replace(b'"Item 7"', f'"Item {i}x"'.encode()))
+        objects_after_many = len(list(store.objects_dir.rglob("*")))
+        self.assertLessEqual(objects_after_many - objects_after_first, 20)
+        stored = sum(p.stat().st_size for p in store.objects_dir.rglob("*") if p.is_file())
+        self.assertLess(stored, len(data) * 11 / 5)
+
+    def test_same_second_snapshots_get_unique_ids(self) -> None:
+        store = BackupStore(self.test_dir)
+        when = datetime(2024, 5, 1, 12, 0, 0)
+        first = store.add_snapshot(b"a\n", created=when)
+        second = store.add_snapshot(b"b\n", created=when)
+        self.assertNotEqual(first, second)
+
+    def test_prune_keeps_newest_and_collects_chunks(self) -> None:
+        store = BackupStore(self.test_dir)
+        base = datetime(2024, 1, 1)
+        ids = [
+            store.add_snapshot(f"unique payload {i}\n".encode(), created=base + timedelta(hours=i))
+            for i in range(6)
+        ]
+        removed = store.prune(2)
+        self.assertEqual(removed, 4)
+        self.assertEqual([s["id"] for s in store.list_snapshots()], [ids[5], ids[4]])
+        remaining_files = [p for p in store.objects_dir.rglob("*") if p.is_file()]
+        self.assertEqual(len(remaining_files), 2)
+
+    def test_prune_by_prefix(self) -> None:
+        store = BackupStore(self.test_dir)
+        base = datetime(2024, 1, 1)
+        for i in range(3):
+            store.add_snapshot(b"auto\n", prefix="auto", created=base + timedelta(hours=i))
+            store.add_snapshot(b"levelup\n", prefix="levelup", created=base + timedelta(hours=i))
+        store.prune(1, prefix="auto")
+        self.assertEqual(len(store.list_snapshots("auto")), 1)
+        self.assertEqual(len(store.list_snapshots("levelup")), 3)
+
+    def test_corrupted_object_detected(self) -> None:
+        store = BackupStore(self.test_dir)
+        snapshot_id = store.add_snapshot(b"x" * 10 + b"\n")
+        digest = store.get_snapshot(snapshot_id)["chunks"][0]
+        import zlib
+        store._object_path(digest).write_bytes(zlib.compress(b"tampered\n"))
+        with self.assertRaises(ValueError):
+            store.read_snapshot(snapshot_id)
+
+    def test_legacy_backups_imported(self) -> None:
+        legacy = self.test_dir / "auto_config_20240101_120000.json"
+        legacy.write_bytes(make_config(5))
+        backups = get_available_backups(self.test_dir)
+        self.assertEqual(len(backups), 1)
+        self.assertFalse(legacy.exists())
+        store = BackupStore(self.test_dir)
+        self.assertEqual(store.read_snapshot(backups[0]["id"]), make_config(5))
+
+
+class TestAutoBackupHelpers(unittest.TestCase):
+    """Tests for create/list/restore helpers and BlockerCore integration."""
+
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.backup_dir = self.test_dir / "backups"
+        self.backup_dir.mkdir()
+        self.config_path = self.test_dir / "config.json"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir)
+
+    def test_create_prunes_to_max(self) -> None:
+        self.config_path.write_bytes(make_config(3))
+        with patch.object(core_logic, "MAX_AUTO_BACKUPS", 3):
+            for _ in range(5):
+                self.assertIsNotNone(create_auto_backup(self.config_path, self.backup_dir))
+        self.assertEqual(len(get_available_backups(self.backup_dir)), 3)
+
+    def test_create_missing_config(self) -> None:
+        self.assertIsNone(create_auto_backup(self.config_path, self.backup_dir))
+
+    def test_restore_writes_original(self) -> None:
+        self.config_path.write_bytes(make_config(10, "v1"))
+        snapshot_id = create_auto_backup(self.config_path, self.backup_dir)
+        self.config_path.write_bytes(make_config(10, "v2"))
+        self.assertTrue(restore_auto_backup(self.backup_dir, snapshot_id, self.config_path))
+        self.assertEqual(self.config_path.read_bytes(), make_config(10, "v1"))
+        self.assertFalse(restore_auto_backup(self.backup_dir, "missing", self.config_path))
+
+    def test_export_streams_backups(self) -> None:
+        with patch('core_logic.CONFIG_PATH', self.config_path), \
+                patch('core_logic.STATS_PATH', self.test_dir / "stats.json"), \
+                patch('core_logic.GOALS_PATH', self.test_dir / "goals.json"), \
+                patch('core_logic.APP_DIR', self.test_dir):
+            core = BlockerCore()
+            core.password_hash = "secret"
+            core.save_config(create_backup=True)
+            core.save_config(create_backup=True)
+            export_path = self.test_dir / "export.zip"
+            result = core.export_all_data(export_path)
+            self.assertTrue(result["success"])
+            with zipfile.ZipFile(export_path) as zf:
+                names = zf.namelist()
+                backup_names = [n for n in names if n.startswith("backups/")]
+                self.assertEqual(len(backup_names), 2)
+                exported = json.loads(zf.read("config.json"))
+                self.assertNotIn("password_hash", exported)
+                backup = json.loads(zf.read(backup_names[0]))
+                self.assertIn("blacklist", backup)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for the benchmark suite (benchmarks/run_suite.py, benchmarks/synthetic_profiles.py).
+
+Timings use a tiny --min-time; only the plumbing is checked here.
+"""
+
+import json
+import random
+
+import pytest
+
+from benchmarks import run_suite
+from benchmarks.run_suite import MEMORY_NOISE_KIB, compare, measure
+from benchmarks.synthetic_profiles import PROFILE_SIZES, build_profile
+
+
+def results(**cases):
+    return {"results": {key: {"ops_per_sec": ops, "peak_kib": kib} for key, (ops, kib) in cases.items()}}
+
+
+class TestProfiles:
+    def test_profiles_are_reproducible(self):
+        first = json.dumps(build_profile("small"), sort_keys=True)
+        assert first == json.dumps(build_profile("small"), sort_keys=True)
+        assert first != json.dumps(build_profile("small", seed=7), sort_keys=True)
+
+    def test_build_leaves_global_random_alone(self):
+        random.seed(3)
+        expected = random.random()
+        random.seed(3)
+        build_profile("small")
+        assert random.random() == expected
+
+    def test_whale_profile(self):
+        from city import CellStatus
+        from city.city_buildings import CITY_BUILDINGS
+        from entitidex.entity_pools import get_all_entity_ids
+
+        profile = build_profile("whale")
+        adhd_buster = profile["adhd_buster"]
+        assert len(adhd_buster["inventory"]) == 500
+        assert sorted(adhd_buster["entitidex"]["collected_entity_ids"]) == sorted(get_all_entity_ids())
+        cells = [cell for row in adhd_buster["city"]["grid"] for cell in row if cell]
+        assert {cell["building_id"] for cell in cells} == set(CITY_BUILDINGS)
+        assert all(cell["status"] == CellStatus.COMPLETE.value for cell in cells)
+        assert all(cell["level"] == CITY_BUILDINGS[cell["building_id"]]["max_level"] for cell in cells)
+        assert len(profile["stats"]["daily_stats"]) == PROFILE_SIZES["whale"]["days"] == 3 * 365
+        assert len(profile["config"]["weight_entries"]) == 3 * 365
+
+
+class TestCompare:
+    def test_slowdown_beyond_threshold_fails(self):
+        baseline = results(**{"a[small]": (1000, 10), "b[small]": (1000, 10)})
+        current = results(**{"a[small]": (700, 10), "b[small]": (900, 10)})
+        regressions = compare(current, baseline, threshold=20)
+        assert [(r["case"], r["metric"]) for r in regressions] == [("a[small]", "ops_per_sec")]
+        assert regressions[0]["change_pct"] == -30.0
+        assert compare(current, baseline, threshold=35) == []
+
+    def test_memory_growth_beyond_noise(self):
+        baseline = results(**{"big[whale]": (10, 1000), "tiny[small]": (10, 1)})
+        current = results(**{"big[whale]": (10, 1500), "tiny[small]": (10, 1 + MEMORY_NOISE_KIB)})
+        regressions = compare(current, baseline, threshold=25)
+        assert [(r["case"], r["metric"]) for r in regressions] == [("big[whale]", "peak_kib")]
+
+    def test_new_and_removed_cases_are_skipped(self):
+        assert compare(results(**{"new[small]": (1, 1)}), results(**{"old[small]": (1000, 1)})) == []
+
+
+class TestRunner:
+    def test_measure(self):
+        result = measure(lambda: [0] * 1000, min_time=0.01, repeats=2)
+        assert result["ops_per_sec"] > 0
+        assert result["calls"] >= 2
+        assert result["peak_kib"] > 0
+
+    def test_unknown_case(self):
+        with pytest.raises(ValueError):
+            run_suite.run_suite(profiles=["small"], cases=["no_such_function"])
+
+    def test_baseline_round_trip(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        args = ["--profiles", "small", "--only", "get_city_bonuses,BlockerCore.save_config",
+                "--min-time", "0.01", "--repeats", "1", "--baseline", str(baseline)]
+        assert run_suite.main(args + ["--save-baseline"]) == 0
+        saved = json.loads(baseline.read_text(encoding="utf-8"))
+        assert set(saved["results"]) == {"get_city_bonuses[small]", "BlockerCore.save_config[small]"}
+
+        # A baseline far faster than anything achievable makes the run fail
+        for result in saved["results"].values():
+            result["ops_per_sec"] *= 1000
+        baseline.write_text(json.dumps(saved), encoding="utf-8")
+        assert run_suite.main(args + ["--threshold", "50"]) == 1
+        assert "regression" in capsys.readouterr().out
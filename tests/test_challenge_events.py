@@ -0,0 +1,188 @@
+"""
+Tests for the domain event bus and incremental challenge progress (challenge_events.py).
+"""
+
+import copy
+import random
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from challenge_events import (
+    DOMAIN_EVENTS,
+    ENTITY_CAUGHT,
+    ITEM_MERGED,
+    SESSION_COMPLETED,
+    WATER_LOGGED,
+    ChallengeTracker,
+    EventBus,
+    expand_event,
+)
+from gamification import CHALLENGE_TEMPLATES, update_challenge_progress
+
+# Challenges for the event kinds no shipped template uses yet
+FIXTURE_TEMPLATES = {
+    "test_water": {"type": "daily", "requirement": {"type": "water_logs", "count": 6}, "xp_reward": 10},
+    "test_merge": {"type": "daily", "requirement": {"type": "merges", "count": 1}, "xp_reward": 10},
+    "test_catch": {"type": "weekly", "requirement": {"type": "entity_catches", "count": 1}, "xp_reward": 10},
+}
+
+
+def make_state(rng: random.Random) -> dict:
+    """Current-period challenge lists with one challenge per template (and fixture), random targets."""
+    now = datetime.now()
+    daily, weekly = [], []
+    for template_id, template in {**CHALLENGE_TEMPLATES, **FIXTURE_TEMPLATES}.items():
+        challenge = copy.deepcopy(template)
+        if challenge["requirement"]["type"] != "log_all":
+            challenge["requirement"]["count"] = rng.randint(1, 40)
+        challenge.update(id=template_id, template_id=template_id, progress=0,
+                         completed=False, claimed=False)
+        (daily if template["type"] == "daily" else weekly).append(challenge)
+    return {
+        "daily_challenges": daily,
+        "daily_challenges_date": now.strftime("%Y-%m-%d"),
+        "weekly_challenges": weekly,
+        "weekly_challenges_start": (now - timedelta(days=now.weekday())).strftime("%Y-%m-%d"),
+        "login_streak": rng.randint(0, 8),
+    }
+
+
+def random_event(rng: random.Random) -> tuple:
+    event = rng.choice(DOMAIN_EVENTS)
+    if event == SESSION_COMPLETED:
+        return event, {"minutes": rng.choice([0, 5, 25, 50, 90]), "hour": rng.randrange(24)}
+    return event, {"amount": rng.choice([1, 1, 2])}
+
+
+def progress_view(state: dict) -> list:
+    return [
+        (c["id"], c["progress"], c["completed"], tuple(c.get("logs_today", ())))
+        for c in state["daily_challenges"] + state["weekly_challenges"]
+    ]
+
+
+class TestEventBus(unittest.TestCase):
+    """Publish/subscribe basics."""
+
+    def test_subscribe_publish_unsubscribe(self) -> None:
+        bus = EventBus()
+        seen = []
+        unsubscribe = bus.subscribe(WATER_LOGGED, lambda **payload: seen.append(payload))
+        self.assertEqual(bus.publish(WATER_LOGGED, amount=1), 1)
+        self.assertEqual(bus.publish(ITEM_MERGED), 0)
+        unsubscribe()
+        bus.publish(WATER_LOGGED)
+        self.assertEqual(seen, [{"amount": 1}])
+
+    def test_failing_handler_does_not_block_others(self) -> None:
+        bus = EventBus()
+        seen = []
+        bus.subscribe(ENTITY_CAUGHT, lambda **payload: 1 / 0)
+        bus.subscribe(ENTITY_CAUGHT, lambda **payload: seen.append(True))
+        self.assertEqual(bus.publish(ENTITY_CAUGHT), 2)
+        self.assertEqual(seen, [True])
+
+    def test_session_expansion(self) -> None:
+        self.assertEqual(expand_event(SESSION_COMPLETED, {"minutes": 25, "hour": 7}),
+                         [("session", 1), ("focus_minutes", 25), ("early_session", 1)])
+        self.assertEqual(expand_event(SESSION_COMPLETED, {"minutes": 0, "hour": 23}),
+                         [("session", 1), ("night_session", 1)])
+        self.assertEqual(expand_event("unknown", {}), [])
+
+
+class TestIncrementalMatchesFullScan(unittest.TestCase):
+    """The subscribed index gives the same progress as scanning every challenge."""
+
+    def test_random_event_sequences_agree(self) -> None:
+        for seed in range(150):
+            rng = random.Random(seed)
+            incremental = make_state(rng)
+            full = copy.deepcopy(incremental)
+            bus = EventBus()
+            ChallengeTracker(lambda: incremental, bus)
+            for _ in range(rng.randint(1, 60)):
+                if rng.random() < 0.2:
+                    # A login mid-week moves the streak without an event of its own
+                    streak = rng.randint(0, 10)
+                    incremental["login_streak"] = full["login_streak"] = streak
+                event, payload = random_event(rng)
+                bus.publish(event, **payload)
+                for event_type, amount in expand_event(event, payload):
+                    update_challenge_progress(full, event_type, amount)
+                self.assertEqual(progress_view(incremental), progress_view(full), f"seed {seed}")
+
+    def test_streak_change_between_events_is_picked_up(self) -> None:
+        state = make_state(random.Random(4))
+        streak = next(c for c in state["weekly_challenges"]
+                      if c["requirement"]["type"] == "login_streak")
+        streak["requirement"]["count"] = 7
+        state["login_streak"] = 3
+        tracker = ChallengeTracker(lambda: state)
+        tracker.handle(WATER_LOGGED)
+        self.assertEqual(streak["progress"], 3)
+
+        state["login_streak"] = 7  # Logged in on a later day of the same week
+        completed = tracker.handle(ITEM_MERGED)
+        self.assertIn(streak, completed)
+        self.assertTrue(streak["completed"])
+
+    def test_completions_are_reported_once(self) -> None:
+        state = make_state(random.Random(1))
+        merge = next(c for c in state["daily_challenges"] if c["template_id"] == "test_merge")
+        merge["requirement"]["count"] = 3
+        completed = []
+        tracker = ChallengeTracker(lambda: state, listener=completed.extend)
+        for _ in range(20):
+            tracker.handle(ITEM_MERGED)
+        self.assertEqual([c for c in completed if c is merge], [merge])
+        self.assertEqual(merge["progress"], 3)
+
+    def test_new_profile_rebuilds_index(self) -> None:
+        states = [make_state(random.Random(2)), make_state(random.Random(3))]
+        current = {"state": states[0]}
+        tracker = ChallengeTracker(lambda: current["state"])
+        tracker.handle(WATER_LOGGED)
+        current["state"] = states[1]
+        tracker.handle(WATER_LOGGED)
+        water = [next(c for c in s["daily_challenges"] if c["template_id"] == "test_water")
+                 for s in states]
+        self.assertEqual([c["progress"] for c in water], [1, 1])
+
+
+class TestGameStatePublishes(unittest.TestCase):
+    """GameStateManager mutations publish domain events."""
+
+    def test_merge_moves_challenge_and_saves(self) -> None:
+        from game_state import GameStateManager
+        blocker = Mock()
+        blocker.adhd_buster = make_state(random.Random(4))
+        blocker.adhd_buster.update(inventory=[{"item_id": "a"}, {"item_id": "b"}], equipped={})
+        game_state = GameStateManager(blocker)
+        completed = []
+        game_state.challenge_completed.connect(completed.append)
+
+        self.assertTrue(game_state.merge_items(["a", "b"], {"name": "Merged"}))
+        merge = next(c for c in blocker.adhd_buster["daily_challenges"]
+                     if c["template_id"] == "test_merge")
+        self.assertEqual(merge["progress"], 1)
+        self.assertEqual(completed, [merge] if merge["completed"] else [])
+        blocker.save_config.assert_called()
+
+    def test_failed_merge_does_not_count(self) -> None:
+        from game_state import GameStateManager
+        blocker = Mock()
+        blocker.adhd_buster = make_state(random.Random(5))
+        items = [{"item_id": "a"}, {"item_id": "b"}]
+        blocker.adhd_buster.update(inventory=list(items), equipped={})
+        game_state = GameStateManager(blocker)
+
+        self.assertTrue(game_state.perform_merge(items, None, success=False))
+        self.assertEqual(blocker.adhd_buster["inventory"], [])
+        merge = next(c for c in blocker.adhd_buster["daily_challenges"]
+                     if c["template_id"] == "test_merge")
+        self.assertEqual(merge["progress"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
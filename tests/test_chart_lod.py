@@ -0,0 +1,62 @@
+"""
+Tests for the chart level-of-detail helpers (chart_lod.py).
+"""
+
+import random
+import unittest
+
+from chart_lod import minmax_downsample, nearest_index
+
+
+class TestMinMaxDownsample(unittest.TestCase):
+    """Bucketed min/max reduction keeps extremes and order."""
+
+    def test_short_series_untouched(self) -> None:
+        xs = list(range(10))
+        self.assertEqual(minmax_downsample(xs, xs, 10), xs)
+        self.assertEqual(minmax_downsample([], [], 10), [])
+
+    def test_reduces_and_keeps_extremes(self) -> None:
+        rng = random.Random(7)
+        xs = list(range(5000))
+        ys = [rng.gauss(80, 3) for _ in xs]
+        ys[1234] = 200.0  # spike
+        ys[3210] = -50.0  # dip
+        kept = minmax_downsample(xs, ys, 400)
+        self.assertLessEqual(len(kept), 402)
+        self.assertEqual(kept, sorted(set(kept)))
+        self.assertEqual((kept[0], kept[-1]), (0, 4999))
+        self.assertIn(1234, kept)
+        self.assertIn(3210, kept)
+
+    def test_every_column_keeps_its_min_and_max(self) -> None:
+        rng = random.Random(3)
+        xs = sorted(rng.uniform(0, 100) for _ in range(1000))
+        ys = [rng.random() for _ in xs]
+        kept = set(minmax_downsample(xs, ys, 20))
+        for column in range(10):
+            members = [i for i in range(1, 999) if min(9, int((xs[i] - xs[0]) * 10 / (xs[-1] - xs[0]))) == column]
+            if members:
+                self.assertIn(min(members, key=ys.__getitem__), kept)
+                self.assertIn(max(members, key=ys.__getitem__), kept)
+
+    def test_single_x_value(self) -> None:
+        ys = [3, 1, 4, 1, 5, 9, 2, 6]
+        self.assertEqual(minmax_downsample([0] * 8, ys, 4), [0, 1, 5, 7])
+
+
+class TestNearestIndex(unittest.TestCase):
+    """Bisect hover lookup."""
+
+    def test_nearest(self) -> None:
+        xs = [0, 3, 10, 11]
+        self.assertEqual(nearest_index(xs, -5), 0)
+        self.assertEqual(nearest_index(xs, 1.4), 0)
+        self.assertEqual(nearest_index(xs, 1.6), 1)
+        self.assertEqual(nearest_index(xs, 10.6), 3)
+        self.assertEqual(nearest_index(xs, 50), 3)
+        self.assertEqual(nearest_index([], 1), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
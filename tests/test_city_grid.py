@@ -0,0 +1,75 @@
+"""
+Tests for diff-based CityGrid updates (city_tab.py).
+
+A refresh must only touch cells whose displayed state changed.
+"""
+
+import copy
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from city import CellStatus, get_city_data  # noqa: E402
+from city_tab import CityGrid  # noqa: E402
+
+
+@pytest.fixture
+def adhd_buster():
+    data = {"total_xp": 5000, "coins": 1000}
+    city = get_city_data(data)
+    city["grid"][0][0] = {
+        "building_id": "goldmine",
+        "status": CellStatus.COMPLETE.value,
+        "level": 2,
+        "construction_progress": {},
+    }
+    city["grid"][0][1] = {
+        "building_id": "forge",
+        "status": CellStatus.BUILDING.value,
+        "level": 1,
+        "construction_progress": {"water": 5, "materials": 10, "activity": 5, "focus": 5},
+    }
+    return data
+
+
+def render_counts(grid):
+    return [cell.render_count for cell in grid.iter_cells()]
+
+
+class TestCityGridDiff:
+    """Cells skip all widget work when their fingerprint is unchanged."""
+
+    def test_noop_refresh_touches_zero_cells(self, qapp, adhd_buster):
+        grid = CityGrid()
+        first = grid.update_grid(get_city_data(adhd_buster), adhd_buster)
+        assert first > 0
+        counts = render_counts(grid)
+
+        # Same state, and an equal deep copy, change nothing
+        assert grid.update_grid(get_city_data(adhd_buster), adhd_buster) == 0
+        assert grid.update_grid(copy.deepcopy(get_city_data(adhd_buster)), adhd_buster) == 0
+        assert render_counts(grid) == counts
+
+    def test_only_changed_cell_is_updated(self, qapp, adhd_buster):
+        grid = CityGrid()
+        city = get_city_data(adhd_buster)
+        grid.update_grid(city, adhd_buster)
+        counts = render_counts(grid)
+
+        city["grid"][0][1]["construction_progress"]["activity"] += 20
+        assert grid.update_grid(city, adhd_buster) == 1
+        after = render_counts(grid)
+        assert after[1] == counts[1] + 1
+        assert after[:1] + after[2:] == counts[:1] + counts[2:]
+        assert grid.cells[0][1].progress_bar.value() > 0
+
+    def test_invisible_state_changes_are_ignored(self, qapp, adhd_buster):
+        grid = CityGrid()
+        city = get_city_data(adhd_buster)
+        grid.update_grid(city, adhd_buster)
+        counts = render_counts(grid)
+
+        city["grid"][0][0]["last_collected"] = "2026-01-01T00:00:00"
+        assert grid.update_grid(city, adhd_buster) == 0
+        assert render_counts(grid) == counts
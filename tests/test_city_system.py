@@ -55,6 +55,10 @@ from city import (
     BUILDING_SYNERGIES,
     calculate_building_synergy_bonus,
     get_all_synergy_bonuses,
+    
+    # Effects engine
+    get_city_effects,
+    invalidate_city_effects,
 )
 
 
@@ -606,6 +610,92 @@ class TestSynergies:
         assert all(v <= 0.5 for v in bonuses.values())
 
 
+# ============================================================================
+# EFFECTS ENGINE TESTS
+# ============================================================================
+
+def _fake_matches(entity_id):
+    """Deterministic entity -> synergy building matches for engine tests."""
+    if entity_id.startswith("miner"):
+        return frozenset({"goldmine"})
+    if entity_id.startswith("legend"):
+        return frozenset({"wonder", "library"})
+    return frozenset()
+
+
+class TestCityEffectsEngine:
+    """Test the cached, compiled city effects engine."""
+    
+    def test_repeated_lookups_reuse_engine(self, adhd_buster_with_buildings):
+        first = get_city_effects(adhd_buster_with_buildings)
+        assert get_city_effects(adhd_buster_with_buildings) is first
+        assert get_city_bonuses(adhd_buster_with_buildings) == first.bonuses
+    
+    def test_returned_bonuses_are_copies(self, adhd_buster_with_buildings):
+        bonuses = get_city_bonuses(adhd_buster_with_buildings)
+        bonuses["exercise_coins"] = 999
+        assert get_city_bonuses(adhd_buster_with_buildings)["exercise_coins"] != 999
+    
+    def test_per_effect_table(self, adhd_buster_with_buildings):
+        effects = get_city_effects(adhd_buster_with_buildings)
+        assert [b for b, _, _ in effects.by_effect["activity_triggered_income"]] == ["goldmine"]
+        # Forge is still under construction
+        assert "multi" not in effects.by_effect
+    
+    def test_placement_invalidates(self, adhd_buster_with_buildings):
+        before = get_city_effects(adhd_buster_with_buildings)
+        assert place_building(adhd_buster_with_buildings, 0, 5, "library") is True
+        assert get_city_effects(adhd_buster_with_buildings) is not before
+    
+    def test_removal_updates_bonuses(self, adhd_buster_with_buildings):
+        assert get_city_bonuses(adhd_buster_with_buildings)["exercise_coins"] > 0
+        remove_building(adhd_buster_with_buildings, 0, 0)
+        assert get_city_bonuses(adhd_buster_with_buildings)["exercise_coins"] == 0
+    
+    def test_direct_grid_write_is_detected(self, adhd_buster_with_buildings):
+        get_city_bonuses(adhd_buster_with_buildings)
+        cell = get_city_data(adhd_buster_with_buildings)["grid"][0][1]
+        cell["status"] = CellStatus.COMPLETE.value
+        assert get_city_bonuses(adhd_buster_with_buildings)["merge_success_bonus"] > 0
+    
+    def test_explicit_invalidate(self, adhd_buster_with_buildings):
+        before = get_city_effects(adhd_buster_with_buildings)
+        invalidate_city_effects(adhd_buster_with_buildings)
+        assert get_city_effects(adhd_buster_with_buildings) is not before
+    
+    def test_synergy_from_precomputed_matches(self, adhd_buster_with_buildings):
+        city = get_city_data(adhd_buster_with_buildings)
+        city["grid"][0][2] = {"building_id": "wonder", "status": CellStatus.COMPLETE.value, "level": 1}
+        adhd_buster_with_buildings["entitidex"] = {
+            "collected_entity_ids": ["miner_1", "miner_2", "legend_1", "nobody"],
+            "exceptional_entities": {"miner_2": {}},
+        }
+        with patch("city.city_effects.get_entity_synergy_matches", side_effect=_fake_matches):
+            invalidate_city_effects(adhd_buster_with_buildings)
+            goldmine = calculate_building_synergy_bonus("goldmine", adhd_buster_with_buildings)
+            synergy = get_all_synergy_bonuses(adhd_buster_with_buildings)
+        
+        goldmine_def = BUILDING_SYNERGIES["goldmine"]
+        wonder_def = BUILDING_SYNERGIES["wonder"]
+        assert goldmine["bonus_percent"] == pytest.approx(goldmine_def.normal_bonus + goldmine_def.exceptional_bonus)
+        assert len(goldmine["contributors"]) == 2
+        # Wonder boosts every key; goldmine adds to coins_per_hour on top
+        assert synergy["xp_bonus"] == pytest.approx(wonder_def.normal_bonus)
+        assert synergy["coins_per_hour"] == pytest.approx(
+            wonder_def.normal_bonus + goldmine["bonus_percent"])
+    
+    def test_entitidex_change_recomputes(self, adhd_buster_with_buildings):
+        adhd_buster_with_buildings["entitidex"] = {"collected_entity_ids": ["miner_1"]}
+        with patch("city.city_effects.get_entity_synergy_matches", side_effect=_fake_matches):
+            invalidate_city_effects(adhd_buster_with_buildings)
+            first = calculate_building_synergy_bonus("goldmine", adhd_buster_with_buildings)
+            # Saving progress replaces the entitidex dict
+            adhd_buster_with_buildings["entitidex"] = {"collected_entity_ids": ["miner_1", "miner_2"]}
+            second = calculate_building_synergy_bonus("goldmine", adhd_buster_with_buildings)
+        assert len(first["contributors"]) == 1
+        assert len(second["contributors"]) == 2
+
+
 # ============================================================================
 # ACTIVITY-TRIGGERED INCOME TESTS
 # ============================================================================
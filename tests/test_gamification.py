@@ -9,6 +9,7 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from productivity_ai import ProductivityAnalyzer, GamificationEngine, FocusGoals
 
 
@@ -110,6 +111,55 @@ class TestGamificationEngine(unittest.TestCase):
         self.assertIn("dedicated", achievements)
         self.assertIn("week_warrior", achievements)
 
+    def test_shared_stats_without_disk_reads(self) -> None:
+        """Engine over an in-memory stats dict sees updates and saves atomically."""
+        stats = {"sessions_completed": 0}
+        engine = GamificationEngine(str(self.stats_path), stats=stats)
+        self.assertFalse(engine.check_achievements()["first_session"]["unlocked"])
+        self.assertFalse(self.stats_path.exists())
+
+        stats["sessions_completed"] = 1
+        progress = engine.check_achievements()
+        self.assertTrue(progress["first_session"]["unlocked"])
+        self.assertEqual(stats["achievements_unlocked"], ["first_session"])
+        with open(self.stats_path) as f:
+            self.assertEqual(json.load(f)["achievements_unlocked"], ["first_session"])
+        self.assertEqual(os.listdir(self.test_dir), ["stats.json"])  # no temp files left
+
+    def test_only_changed_counters_are_evaluated(self) -> None:
+        """Requirements run only for achievements whose input counters changed."""
+        stats = {"sessions_completed": 3, "night_sessions": 9}
+        engine = GamificationEngine(str(self.stats_path), stats=stats)
+        engine.check_achievements()
+
+        evaluated = []
+
+        def counting(ach_id, requirement):
+            def wrapper(s):
+                evaluated.append(ach_id)
+                return requirement(s)
+            return wrapper
+
+        patched = {ach_id: {**ach, "requirement": counting(ach_id, ach["requirement"])}
+                   for ach_id, ach in GamificationEngine.ACHIEVEMENTS.items()}
+        with patch.dict(GamificationEngine.ACHIEVEMENTS, patched):
+            engine.check_achievements()
+            self.assertEqual(evaluated, [])
+            stats["night_sessions"] = 10
+            progress = engine.check_achievements()
+        self.assertEqual(evaluated, ["night_owl"])
+        self.assertTrue(progress["night_owl"]["unlocked"])
+
+    def test_progress_uses_structured_targets(self) -> None:
+        """get_progress covers every locked achievement using the precomputed targets."""
+        engine = GamificationEngine(str(self.stats_path),
+                                    stats={"sessions_completed": 5, "total_focus_time": 30000})
+        progress = {p["id"]: p["progress"] for p in engine.get_progress()}
+        self.assertEqual(progress["dedicated"], 50)
+        self.assertEqual(progress["marathon"], 50)
+        self.assertEqual(len(progress), len(GamificationEngine.ACHIEVEMENTS))
+        self.assertEqual(set(GamificationEngine.ACHIEVEMENT_TARGETS), set(GamificationEngine.ACHIEVEMENTS))
+
 
 class TestFocusGoals(unittest.TestCase):
     """Tests for the FocusGoals class."""
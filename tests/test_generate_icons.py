@@ -0,0 +1,72 @@
+"""
+Tests for the icon build (generate_icons.py).
+
+Masters are rendered without supersampling to keep the builds quick.
+"""
+
+import pytest
+from PIL import Image, ImageDraw
+
+import generate_icons
+from generate_icons import (
+    APP_ICON_SIZES, STAMP_FILE, TRAY_ICON_SIZES, TRAY_PNG_SIZE, draw_thick_line, save_icons,
+)
+
+
+def build(output_dir, **kwargs):
+    kwargs.setdefault("supersample", 1)
+    kwargs.setdefault("workers", 1)
+    return save_icons(output_dir, **kwargs)
+
+
+class TestIconBuild:
+    def test_ico_contains_every_size(self, tmp_path):
+        build(tmp_path, workers=2)  # Through the process pool
+        expected = {
+            "app.ico": APP_ICON_SIZES,
+            "tray_ready.ico": TRAY_ICON_SIZES,
+            "tray_blocking.ico": TRAY_ICON_SIZES,
+        }
+        for filename, sizes in expected.items():
+            with Image.open(tmp_path / filename) as ico:
+                assert sorted(ico.info["sizes"]) == [(s, s) for s in sizes]
+                for size in sizes:
+                    ico.size = (size, size)
+                    assert ico.convert("RGBA").getbbox() is not None  # Not blank
+        for filename in ("tray_ready.png", "tray_blocking.png"):
+            with Image.open(tmp_path / filename) as png:
+                assert png.size == (TRAY_PNG_SIZE, TRAY_PNG_SIZE)
+
+    def test_unchanged_sets_are_skipped(self, tmp_path):
+        assert len(build(tmp_path)) == 5
+        assert (tmp_path / STAMP_FILE).exists()
+        assert build(tmp_path) == []
+
+        # A missing output rebuilds just its set
+        (tmp_path / "tray_ready.png").unlink()
+        assert sorted(p.name for p in build(tmp_path)) == ["tray_ready.ico", "tray_ready.png"]
+
+        # Different parameters or force rebuild everything
+        assert len(build(tmp_path, hinting=False)) == 5
+        assert len(build(tmp_path, hinting=False, force=True)) == 5
+
+    def test_hash_tracks_parameters(self):
+        base = generate_icons.icon_set_hash("app", supersample=1)
+        assert base == generate_icons.icon_set_hash("app", supersample=1)
+        assert base != generate_icons.icon_set_hash("app", supersample=2)
+        assert base != generate_icons.icon_set_hash("tray_ready", supersample=1)
+
+
+class TestThickLine:
+    @pytest.mark.parametrize("end", [(80, 20), (20, 80), (80, 80), (50, 50)])
+    def test_stroke_is_a_stadium(self, end):
+        img = Image.new("L", (100, 100), 0)
+        draw_thick_line(ImageDraw.Draw(img), 50, 50, *end, 10, 255)
+        mid = ((50 + end[0]) // 2, (50 + end[1]) // 2)
+        assert img.getpixel(mid) == 255
+        assert img.getpixel(end) == 255
+        assert img.getpixel((50, 50)) == 255
+        # Nothing beyond the rounded caps
+        left, top, right, bottom = img.getbbox()
+        assert left >= min(50, end[0]) - 6 and right <= max(50, end[0]) + 6
+        assert top >= min(50, end[1]) - 6 and bottom <= max(50, end[1]) + 6
@@ -0,0 +1,123 @@
+"""
+Tests for the precompiled hotkey matcher (hotkey_matcher.py), driven by
+synthetic key events - no pynput or display needed.
+"""
+
+import unittest
+from types import SimpleNamespace
+
+from hotkey_matcher import (
+    MOD_ALT,
+    MOD_CTRL,
+    MOD_SHIFT,
+    HotkeyMatcher,
+    parse_sequence,
+    pynput_key_name,
+)
+
+
+def tap(matcher, *keys, now=0.0):
+    """Press keys in order (modifiers first), then release them. Returns the actions fired."""
+    fired = [matcher.press(key, now=now) for key in keys]
+    for key in reversed(keys):
+        matcher.release(key)
+    return [action for action in fired if action is not None]
+
+
+class TestParsing(unittest.TestCase):
+    """Key sequence strings compile to (modifier bitmask, key) steps."""
+
+    def test_single_and_chord(self) -> None:
+        self.assertEqual(parse_sequence("Ctrl+Shift+H"), ((MOD_CTRL | MOD_SHIFT, "h"),))
+        self.assertEqual(parse_sequence("Ctrl+K, B"), ((MOD_CTRL, "k"), (0, "b")))
+        self.assertEqual(parse_sequence("Meta+F11"), ((MOD_ALT, "f11"),))
+        self.assertEqual(parse_sequence("PgDown"), ((0, "page_down"),))
+
+    def test_rejects_unsupported(self) -> None:
+        for bad in ("", "Ctrl", "Ctrl+Foo", "A+B", "Ctrl+K, B, C"):
+            self.assertIsNone(parse_sequence(bad), bad)
+
+
+class TestMatcher(unittest.TestCase):
+    """Matching, chords and modifier tracking."""
+
+    def setUp(self) -> None:
+        self.matcher = HotkeyMatcher()
+
+    def test_multiple_bindings(self) -> None:
+        self.assertTrue(self.matcher.bind("Ctrl+F11", "toggle"))
+        self.assertTrue(self.matcher.bind("Ctrl+Shift+H", "hide"))
+        self.assertTrue(self.matcher.bind("F9", "start"))
+        self.assertEqual(self.matcher.binding_count, 3)
+        self.assertEqual(tap(self.matcher, "ctrl_l", "f11"), ["toggle"])
+        self.assertEqual(tap(self.matcher, "ctrl_r", "shift", "h"), ["hide"])
+        self.assertEqual(tap(self.matcher, "f9"), ["start"])
+
+    def test_modifiers_must_match_exactly(self) -> None:
+        self.matcher.bind("Ctrl+F11", "toggle")
+        self.assertEqual(tap(self.matcher, "f11"), [])
+        self.assertEqual(tap(self.matcher, "ctrl_l", "shift_l", "f11"), [])
+
+    def test_left_and_right_modifiers_tracked_separately(self) -> None:
+        self.matcher.bind("Ctrl+F11", "toggle")
+        self.matcher.press("ctrl_l")
+        self.matcher.press("ctrl_r")
+        self.matcher.release("ctrl_l")
+        self.assertEqual(self.matcher.modifiers, MOD_CTRL)
+        self.assertEqual(self.matcher.press("f11"), "toggle")
+
+    def test_auto_repeat_fires_once(self) -> None:
+        self.matcher.bind("Ctrl+F11", "toggle")
+        self.matcher.press("ctrl_l")
+        fired = [self.matcher.press("f11") for _ in range(5)]
+        self.assertEqual(fired, ["toggle", None, None, None, None])
+        self.matcher.release("f11")
+        self.assertEqual(self.matcher.press("f11"), "toggle")
+
+    def test_chord(self) -> None:
+        self.matcher.bind("Ctrl+K, B", "blocker")
+        self.matcher.bind("Ctrl+K, Ctrl+S", "stats")
+        self.assertEqual(tap(self.matcher, "ctrl_l", "k", now=10.0), [])
+        self.assertTrue(self.matcher.chord_pending)
+        self.assertEqual(tap(self.matcher, "b", now=10.5), ["blocker"])
+        self.assertFalse(self.matcher.chord_pending)
+        # Holding Ctrl through both steps
+        self.assertEqual(tap(self.matcher, "ctrl_l", "k", "s", now=20.0), ["stats"])
+
+    def test_chord_timeouts_are_per_binding(self) -> None:
+        self.matcher.bind("Ctrl+K, B", "quick", timeout=0.5)
+        self.matcher.bind("Ctrl+K, C", "slow", timeout=3.0)
+        tap(self.matcher, "ctrl_l", "k", now=0.0)
+        self.assertEqual(tap(self.matcher, "b", now=1.0), [])
+        tap(self.matcher, "ctrl_l", "k", now=5.0)
+        self.assertEqual(tap(self.matcher, "c", now=7.0), ["slow"])
+
+    def test_wrong_second_step_cancels_and_matches_alone(self) -> None:
+        self.matcher.bind("Ctrl+K, B", "chord")
+        self.matcher.bind("F9", "start")
+        tap(self.matcher, "ctrl_l", "k")
+        self.assertEqual(tap(self.matcher, "f9"), ["start"])
+        self.assertEqual(tap(self.matcher, "b"), [])
+
+    def test_conflicting_bindings_rejected(self) -> None:
+        self.assertTrue(self.matcher.bind("Ctrl+K", "single"))
+        self.assertFalse(self.matcher.bind("Ctrl+K, B", "chord"))
+        self.assertTrue(self.matcher.unbind("Ctrl+K"))
+        self.assertTrue(self.matcher.bind("Ctrl+K, B", "chord"))
+        self.assertFalse(self.matcher.bind("Ctrl+K", "single"))
+
+
+class TestPynputKeyName(unittest.TestCase):
+    """pynput Key/KeyCode objects are normalized without importing pynput."""
+
+    def test_names(self) -> None:
+        self.assertEqual(pynput_key_name(SimpleNamespace(name="ctrl_l")), "ctrl_l")
+        self.assertEqual(pynput_key_name(SimpleNamespace(name="f11")), "f11")
+        # Ctrl+K on Windows: control character, but the virtual-key code is 'K'
+        self.assertEqual(pynput_key_name(SimpleNamespace(char="\x0b", vk=0x4B)), "k")
+        self.assertEqual(pynput_key_name(SimpleNamespace(char="B", vk=None)), "b")
+        self.assertIsNone(pynput_key_name(SimpleNamespace(char=None, vk=None)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,10 @@ import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
-from productivity_ai import ProductivityAnalyzer, GamificationEngine, FocusGoals
+from productivity_ai import (
+    ProductivityAnalyzer, GamificationEngine, FocusGoals, StatsAggregates,
+    benchmark_analyzer, make_synthetic_stats,
+)
 
 
 class TestProductivityAnalyzerExtended:
@@ -405,3 +408,64 @@ class TestProductivityAnalyzerEdgeCases:
         hours = analyzer.get_peak_productivity_hours()
         
         assert isinstance(hours, dict)
+
+
+class TestStatsAggregates:
+    """Incremental aggregates match a full recomputation."""
+
+    @staticmethod
+    def snapshot(agg):
+        return (agg.hourly_totals, agg.hourly_days, agg.weekday_totals,
+                agg.day_count, agg.window(7), agg.window(30))
+
+    def test_incremental_matches_rebuild(self):
+        stats = make_synthetic_stats(days=90, seed=3)
+        daily = stats["daily_stats"]
+        analyzer = ProductivityAnalyzer("unused.json", stats=stats)
+
+        dates = sorted(daily)
+        daily[dates[-1]]["focus_time"] += 600
+        daily[dates[-1]]["hourly"]["9"] = daily[dates[-1]]["hourly"].get("9", 0) + 600
+        analyzer.on_stats_changed(stats, dates[-1])
+        del daily[dates[0]]
+        analyzer.on_stats_changed(stats, dates[0])
+        daily["2026-01-01"] = {"focus_time": 1200, "sessions": 1, "hourly": {"23": 1200}}
+        analyzer.on_stats_changed(stats, "2026-01-01")
+        daily["garbage"] = "not a dict"
+        analyzer.on_stats_changed(stats, "garbage")
+
+        fresh = StatsAggregates()
+        fresh.rebuild(daily)
+        assert self.snapshot(analyzer.aggregates) == self.snapshot(fresh)
+        assert analyzer.get_peak_productivity_hours()["23"] == {"count": 1, "total_time": 1200}
+
+    def test_shared_stats_and_replacement(self, tmp_path):
+        stats = {"daily_stats": {"2024-01-01": {"focus_time": 3600, "hourly": {"10": 3600}}}}
+        analyzer = ProductivityAnalyzer(tmp_path / "missing.json", stats=stats)
+        assert analyzer.stats is stats
+        assert analyzer.aggregates.peak_hour() == 10
+        assert any(r["category"] == "timing" for r in analyzer.get_recommendations())
+
+        replacement = {"daily_stats": {}}
+        analyzer.on_stats_changed(replacement)
+        assert analyzer.stats is replacement
+        assert analyzer.aggregates.day_count == 0
+        assert analyzer.aggregates.peak_hour() is None
+
+    def test_blocker_notifies_listeners(self, tmp_path):
+        from core_logic import BlockerCore
+        with patch('core_logic.CONFIG_PATH', tmp_path / "config.json"), \
+                patch('core_logic.STATS_PATH', tmp_path / "stats.json"):
+            core = BlockerCore()
+            analyzer = ProductivityAnalyzer(core.stats_path, stats=core.stats)
+            core.add_stats_listener(analyzer.on_stats_changed)
+            core.update_stats(1800)
+            core.update_stats(1200)
+        assert analyzer.aggregates.day_count == 1
+        assert sum(analyzer.aggregates.hourly_totals) == 3000
+        assert analyzer.aggregates.rolling_mean(7) == 3000
+
+    def test_benchmark_runs(self):
+        result = benchmark_analyzer(days=3 * 365, queries=3)
+        assert result["days"] == 1095
+        assert result["incremental_ms"] < result["full_pass_ms"]
@@ -0,0 +1,100 @@
+"""
+Tests for the cached daily timeline rings (progress_ring.py).
+"""
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+QtGui = pytest.importorskip("PySide6.QtGui")
+
+from progress_ring import (  # noqa: E402
+    ARC_RESOLUTION, ChapterRingWidget, EntitiesRingWidget, EyeRingWidget, FocusRingWidget,
+    WaterRingWidget, XPRingWidget,
+)
+
+
+def count_updates(ring):
+    calls = []
+    ring.update = lambda *args: calls.append(args)
+    return calls
+
+
+def render(ring):
+    image = QtGui.QImage(ring.width(), ring.height(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    ring.render(image)
+    return image
+
+
+class TestRepaintGating:
+    def test_unchanged_and_sub_threshold_values_skip_repaint(self, qapp):
+        ring = FocusRingWidget()
+        updates = count_updates(ring)
+        ring.set_progress(5400, 14400)
+        assert len(updates) == 1
+
+        ring.set_progress(5400, 14400)
+        # Under one arc step, same "1h 30m" label
+        ring.set_progress(5400 + 14400 // ARC_RESOLUTION // 4, 14400)
+        assert len(updates) == 1
+
+        ring.set_progress(5400 + 14400 // ARC_RESOLUTION * 2, 14400)  # Arc moved
+        assert len(updates) == 2
+        ring.set_progress(9000, 14400)  # Arc and label
+        assert len(updates) == 3
+
+    def test_label_or_colour_change_repaints(self, qapp):
+        eye = EyeRingWidget()
+        updates = count_updates(eye)
+        eye.set_progress(4, 20)
+        eye.set_progress(5, 1000)  # Arc below threshold, but count and category change
+        assert len(updates) == 2
+
+        entities = EntitiesRingWidget()
+        updates = count_updates(entities)
+        entities.set_progress(3, 0, 45)
+        entities.set_progress(2, 1, 45)  # Same total, different split and colour
+        assert len(updates) == 2
+
+    @pytest.mark.parametrize("ring_class, args", [
+        (WaterRingWidget, (3, 8)),
+        (ChapterRingWidget, (3, 45, 7, False)),
+        (XPRingWidget, (5, 300, 1000, 5000)),
+    ])
+    def test_repeated_ticks_are_free(self, qapp, ring_class, args):
+        ring = ring_class()
+        updates = count_updates(ring)
+        for _ in range(5):
+            ring.set_progress(*args)
+        assert len(updates) == 1
+
+
+class TestStaticLayer:
+    def test_layer_is_reused_until_labels_or_size_change(self, qapp):
+        ring = WaterRingWidget()
+        ring.resize(70, 70)
+        ring.set_progress(2, 8)
+        first = render(ring)
+        render(ring)
+        assert (ring.paint_count, ring.layer_renders) == (2, 1)
+
+        ring.set_progress(3, 8)  # Label changes
+        second = render(ring)
+        assert ring.layer_renders == 2
+        assert first != second
+
+        ring.resize(80, 80)
+        render(ring)
+        assert ring.layer_renders == 3
+
+    def test_arc_is_drawn_over_the_layer(self, qapp):
+        ring = FocusRingWidget()
+        ring.resize(70, 70)
+        ring.set_progress(0, 100)
+        empty = render(ring)
+        ring.set_progress(25, 100)  # Quarter circle from 12 to 3 o'clock
+        quarter = render(ring)
+        assert ring.layer_renders == 1  # "0m" both times: only the arc was redrawn
+        top_right = quarter.pixelColor(55, 15)
+        assert top_right != empty.pixelColor(55, 15)
+        assert top_right.blue() > top_right.green()  # Indigo arc
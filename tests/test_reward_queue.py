@@ -0,0 +1,168 @@
+"""
+Tests for the reward presentation queue (reward_queue.py).
+"""
+
+import unittest
+
+from reward_queue import (
+    DIARY, ITEM_DROP, LEVEL_UP, LOTTERY, XP_GAINED, RewardEvent, RewardQueue, merge_events,
+)
+
+
+class ManualLoop:
+    """Scheduler that runs callbacks only when the test says so."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, fn):
+        self.calls.append(fn)
+
+    def run(self):
+        while self.calls:
+            self.calls.pop(0)()
+
+
+def item_drop(name, **payload):
+    payload.setdefault("items", [{"name": name, "slot": "Helmet"}])
+    return RewardEvent(ITEM_DROP, payload)
+
+
+class TestMergeEvents(unittest.TestCase):
+    def test_item_drops_become_one_card(self):
+        first = item_drop("Cap", coins=10, title="💧 Hydration Reward!", source_label="Glass #5",
+                          equipped={"Helmet": {"name": "Old"}}, auto_equipped_slots=["Helmet"],
+                          entity_perk_contributors=[{"entity_id": "owl"}])
+        second = item_drop("Boots", coins=5, title="💧 Hydration Streak Bonus!", source_label="Streak",
+                           equipped={"Helmet": {"name": "Cap"}, "Boots": None},
+                           equipped_after={"Helmet": {"name": "Cap"}},
+                           auto_equipped_slots=["Helmet", "Boots"],
+                           entity_perk_contributors=[{"entity_id": "owl"}, {"entity_id": "fox"}])
+        merged = merge_events(first, second)
+        payload = merged.payload
+        self.assertEqual(merged.merged, 2)
+        self.assertEqual([i["name"] for i in payload["items"]], ["Cap", "Boots"])
+        self.assertEqual(payload["coins"], 15)
+        self.assertEqual(payload["equipped"], {"Helmet": {"name": "Old"}, "Boots": None})
+        self.assertEqual(payload["equipped_after"], {"Helmet": {"name": "Cap"}})
+        self.assertEqual(payload["auto_equipped_slots"], ["Helmet", "Boots"])
+        self.assertEqual([c["entity_id"] for c in payload["entity_perk_contributors"]], ["owl", "fox"])
+        self.assertEqual(payload["source_label"], "Glass #5 • Streak")
+        self.assertEqual(payload["title"], "🎁 Rewards!")
+        # Inputs are left alone
+        self.assertEqual(len(first.payload["items"]), 1)
+
+    def test_xp_folds_into_level_up_either_way(self):
+        level_up = RewardEvent(LEVEL_UP, {"old_level": 3, "new_level": 4, "unlocks": ["A"]})
+        xp = RewardEvent(XP_GAINED, {"xp": 120})
+        for merged in (merge_events(xp, level_up), merge_events(level_up, xp)):
+            self.assertEqual(merged.kind, LEVEL_UP)
+            self.assertEqual(merged.payload["xp_earned"], 120)
+            self.assertEqual(merged.payload["new_level"], 4)
+
+        later = RewardEvent(LEVEL_UP, {"old_level": 4, "new_level": 6, "unlocks": ["B"], "xp_earned": 30})
+        span = merge_events(merge_events(level_up, xp), later)
+        self.assertEqual((span.payload["old_level"], span.payload["new_level"]), (3, 6))
+        self.assertEqual(span.payload["unlocks"], ["A", "B"])
+        self.assertEqual(span.payload["xp_earned"], 150)
+        self.assertEqual(span.merged, 3)
+
+    def test_unrelated_kinds_stay_apart(self):
+        self.assertIsNone(merge_events(RewardEvent(LOTTERY), item_drop("Cap")))
+        self.assertIsNone(merge_events(RewardEvent(DIARY), RewardEvent(DIARY)))
+
+
+class TestRewardQueue(unittest.TestCase):
+    def setUp(self):
+        self.loop = ManualLoop()
+        self.queue = RewardQueue(schedule=self.loop)
+        self.shown = []
+        self.open = []
+
+        def present(event, done):
+            self.shown.append(event)
+            self.open.append(done)
+
+        for kind in (LOTTERY, LEVEL_UP, ITEM_DROP, DIARY):
+            self.queue.register(kind, present)
+
+    def close_current(self):
+        self.open.pop(0)()
+        self.loop.run()
+
+    def test_presents_one_at_a_time_in_order(self):
+        self.queue.push(RewardEvent(LOTTERY))
+        self.queue.push(RewardEvent(DIARY))
+        self.assertEqual(self.shown, [])  # Nothing until the loop runs
+
+        self.loop.run()
+        self.assertEqual([e.kind for e in self.shown], [LOTTERY])
+        self.assertEqual([e.kind for e in self.queue.pending], [DIARY])
+
+        self.close_current()
+        self.assertEqual([e.kind for e in self.shown], [LOTTERY, DIARY])
+        self.close_current()
+        self.assertTrue(self.queue.is_idle())
+
+    def test_session_burst_is_coalesced(self):
+        self.queue.push(RewardEvent(LOTTERY))
+        self.queue.push(RewardEvent(XP_GAINED, {"xp": 80}))
+        self.queue.push(RewardEvent(LEVEL_UP, {"old_level": 1, "new_level": 2}))
+        self.queue.push(item_drop("Cap", coins=10))
+        self.queue.push(item_drop("Boots", coins=5))
+        self.queue.push(RewardEvent(DIARY))
+        self.assertEqual([e.kind for e in self.queue.pending], [LOTTERY, LEVEL_UP, ITEM_DROP, DIARY])
+
+        self.loop.run()
+        for _ in range(4):
+            self.close_current()
+        self.assertEqual([e.kind for e in self.shown], [LOTTERY, LEVEL_UP, ITEM_DROP, DIARY])
+        self.assertEqual(self.shown[1].payload["xp_earned"], 80)
+        self.assertEqual(len(self.shown[2].payload["items"]), 2)
+        self.assertEqual((self.queue.pushed, self.queue.presented), (6, 4))
+
+    def test_event_on_screen_does_not_absorb_new_ones(self):
+        self.queue.push(item_drop("Cap"))
+        self.loop.run()
+        self.queue.push(item_drop("Boots"))
+        self.queue.push(item_drop("Ring"))
+        self.assertEqual(len(self.queue.current.payload["items"]), 1)
+        self.assertEqual(len(self.queue.pending), 1)
+        self.close_current()
+        self.assertEqual([i["name"] for i in self.shown[1].payload["items"]], ["Boots", "Ring"])
+
+    def test_done_is_idempotent(self):
+        self.queue.push(RewardEvent(LOTTERY))
+        self.queue.push(RewardEvent(DIARY))
+        self.loop.run()
+        done = self.open.pop(0)
+        done()
+        done()  # e.g. finished and destroyed both firing
+        self.loop.run()
+        self.assertEqual(len(self.shown), 2)
+        self.assertIsNotNone(self.queue.current)
+
+    def test_unpresented_and_failing_events_do_not_stall(self):
+        def broken(event, done):
+            raise RuntimeError("no display")
+
+        self.queue.register(LOTTERY, broken)
+        self.queue.push(RewardEvent(XP_GAINED, {"xp": 5}))  # No presenter
+        self.queue.push(RewardEvent(LOTTERY))
+        self.queue.push(RewardEvent(DIARY))
+        with self.assertLogs("reward_queue", level="ERROR"):
+            self.loop.run()
+        self.assertEqual([e.kind for e in self.shown], [DIARY])
+
+    def test_immediate_scheduler(self):
+        queue = RewardQueue()
+        seen = []
+        queue.register(DIARY, lambda event, done: (seen.append(event), done()))
+        queue.push(RewardEvent(DIARY))
+        queue.push(RewardEvent(DIARY))
+        self.assertEqual(len(seen), 2)
+        self.assertTrue(queue.is_idle())
+
+
+if __name__ == '__main__':
+    unittest.main()
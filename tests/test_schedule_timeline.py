@@ -0,0 +1,203 @@
+"""
+Tests for the compiled schedule timeline (schedule_timeline.py) and its
+integration with BlockerCore.
+"""
+
+import random
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from core_logic import BlockerCore
+from schedule_timeline import MINUTES_PER_WEEK, ScheduleTimeline
+
+# 2024-01-01 is a Monday
+MONDAY = datetime(2024, 1, 1)
+
+
+def at(day: int, hhmm: str, second: int = 0) -> datetime:
+    hours, minutes = map(int, hhmm.split(":"))
+    return MONDAY + timedelta(days=day, hours=hours, minutes=minutes, seconds=second)
+
+
+def legacy_is_active(schedules, now: datetime) -> bool:
+    """Reference implementation: the original per-call string comparison."""
+    current_day = now.weekday()
+    yesterday = (current_day - 1) % 7
+    current_time = now.strftime("%H:%M")
+    for schedule in schedules:
+        if not schedule.get('enabled', True):
+            continue
+        start = schedule.get('start_time', '00:00')
+        end = schedule.get('end_time', '23:59')
+        days = schedule.get('days', [])
+        if start <= end:
+            if current_day in days and start <= current_time <= end:
+                return True
+        else:
+            if current_day in days and current_time >= start:
+                return True
+            if yesterday in days and current_time <= end:
+                return True
+    return False
+
+
+class TestScheduleTimeline(unittest.TestCase):
+    """Tests for interval compilation, lookup and transitions."""
+
+    def test_empty_timeline(self) -> None:
+        timeline = ScheduleTimeline([])
+        self.assertFalse(timeline.is_active(at(0, "12:00")))
+        self.assertIsNone(timeline.next_transition(at(0, "12:00")))
+
+    def test_same_day_schedule_inclusive_end(self) -> None:
+        timeline = ScheduleTimeline([{"days": [0], "start_time": "09:00", "end_time": "17:00"}])
+        self.assertFalse(timeline.is_active(at(0, "08:59", 59)))
+        self.assertTrue(timeline.is_active(at(0, "09:00")))
+        self.assertTrue(timeline.is_active(at(0, "17:00", 30)))
+        self.assertFalse(timeline.is_active(at(0, "17:01")))
+        self.assertFalse(timeline.is_active(at(1, "12:00")))
+
+    def test_overnight_schedule(self) -> None:
+        timeline = ScheduleTimeline([{"days": [4], "start_time": "22:00", "end_time": "06:00"}])
+        self.assertTrue(timeline.is_active(at(4, "23:30")))
+        self.assertTrue(timeline.is_active(at(5, "05:59")))
+        self.assertFalse(timeline.is_active(at(5, "06:01")))
+        self.assertFalse(timeline.is_active(at(4, "06:00")))
+
+    def test_sunday_overnight_wraps_to_monday(self) -> None:
+        timeline = ScheduleTimeline([{"days": [6], "start_time": "22:00", "end_time": "02:00"}])
+        self.assertTrue(timeline.is_active(at(0, "01:00")))
+        self.assertTrue(timeline.is_active(at(6, "23:00")))
+        when, becomes_active = timeline.next_transition(at(6, "23:00"))
+        self.assertFalse(becomes_active)
+        self.assertEqual(when, at(7, "02:01"))
+
+    def test_overlapping_schedules_are_merged(self) -> None:
+        timeline = ScheduleTimeline([
+            {"days": [0], "start_time": "09:00", "end_time": "12:00"},
+            {"days": [0], "start_time": "11:00", "end_time": "14:00"},
+            {"days": [0], "start_time": "14:01", "end_time": "15:00"},
+        ])
+        self.assertEqual(len(timeline.intervals), 1)
+        when, becomes_active = timeline.next_transition(at(0, "10:00"))
+        self.assertFalse(becomes_active)
+        self.assertEqual(when, at(0, "15:01"))
+
+    def test_disabled_schedules_ignored(self) -> None:
+        timeline = ScheduleTimeline([
+            {"days": [0], "start_time": "09:00", "end_time": "17:00", "enabled": False},
+        ])
+        self.assertFalse(timeline.is_active(at(0, "12:00")))
+        self.assertIsNone(timeline.next_transition(at(0, "12:00")))
+
+    def test_next_start_transition(self) -> None:
+        timeline = ScheduleTimeline([{"days": [2], "start_time": "09:00", "end_time": "10:00"}])
+        when, becomes_active = timeline.next_transition(at(0, "12:00"))
+        self.assertTrue(becomes_active)
+        self.assertEqual(when, at(2, "09:00"))
+        # After the last interval of the week, wrap to next week's first start
+        when, becomes_active = timeline.next_transition(at(3, "12:00"))
+        self.assertTrue(becomes_active)
+        self.assertEqual(when, at(9, "09:00"))
+
+    def test_full_week_has_no_transition(self) -> None:
+        timeline = ScheduleTimeline([
+            {"days": list(range(7)), "start_time": "00:00", "end_time": "23:59"},
+        ])
+        self.assertEqual(timeline.intervals, [(0, MINUTES_PER_WEEK)])
+        self.assertTrue(timeline.is_active(at(3, "03:03")))
+        self.assertIsNone(timeline.next_transition(at(3, "03:03")))
+
+    def test_injected_clock(self) -> None:
+        now = [at(0, "08:00")]
+        timeline = ScheduleTimeline(
+            [{"days": [0], "start_time": "09:00", "end_time": "17:00"}],
+            clock=lambda: now[0],
+        )
+        self.assertFalse(timeline.is_active())
+        self.assertEqual(timeline.seconds_until_next_transition(), 3600)
+        now[0] = at(0, "09:30")
+        self.assertTrue(timeline.is_active())
+
+    def test_matches_legacy_evaluation(self) -> None:
+        rng = random.Random(1234)
+        for _ in range(50):
+            schedules = []
+            for _ in range(rng.randint(1, 4)):
+                schedules.append({
+                    "days": rng.sample(range(7), rng.randint(1, 7)),
+                    "start_time": f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+                    "end_time": f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+                    "enabled": rng.random() > 0.2,
+                })
+            timeline = ScheduleTimeline(schedules)
+            for _ in range(100):
+                now = MONDAY + timedelta(minutes=rng.randrange(MINUTES_PER_WEEK))
+                self.assertEqual(timeline.is_active(now), legacy_is_active(schedules, now),
+                                 f"{schedules} at {now}")
+
+    def test_transition_flips_state(self) -> None:
+        rng = random.Random(99)
+        for _ in range(30):
+            schedules = [{
+                "days": rng.sample(range(7), rng.randint(1, 6)),
+                "start_time": f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+                "end_time": f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+            }]
+            timeline = ScheduleTimeline(schedules)
+            now = MONDAY + timedelta(minutes=rng.randrange(MINUTES_PER_WEEK))
+            transition = timeline.next_transition(now)
+            if transition is None:
+                continue
+            when, becomes_active = transition
+            self.assertGreater(when, now)
+            self.assertEqual(timeline.is_active(when), becomes_active)
+            self.assertEqual(timeline.is_active(when - timedelta(seconds=1)), not becomes_active)
+
+
+class TestBlockerCoreScheduleRecompile(unittest.TestCase):
+    """BlockerCore keeps its compiled timeline in sync with schedule edits."""
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.mkdtemp()
+        self.config_patcher = patch('core_logic.CONFIG_PATH', Path(self.test_dir) / "config.json")
+        self.stats_patcher = patch('core_logic.STATS_PATH', Path(self.test_dir) / "stats.json")
+        self.config_patcher.start()
+        self.stats_patcher.start()
+
+    def tearDown(self) -> None:
+        self.config_patcher.stop()
+        self.stats_patcher.stop()
+        shutil.rmtree(self.test_dir)
+
+    def test_add_toggle_remove_recompile(self) -> None:
+        core = BlockerCore()
+        now = at(0, "10:00")
+        self.assertFalse(core.is_scheduled_block_time(now))
+
+        schedule_id = core.add_schedule([0], "09:00", "17:00")
+        self.assertTrue(core.is_scheduled_block_time(now))
+        self.assertEqual(core.next_schedule_transition(now), (at(0, "17:01"), False))
+
+        core.toggle_schedule(schedule_id)
+        self.assertFalse(core.is_scheduled_block_time(now))
+        core.toggle_schedule(schedule_id)
+        self.assertTrue(core.is_scheduled_block_time(now))
+
+        core.remove_schedule(schedule_id)
+        self.assertFalse(core.is_scheduled_block_time(now))
+        self.assertIsNone(core.next_schedule_transition(now))
+
+    def test_loaded_schedules_are_compiled(self) -> None:
+        core = BlockerCore()
+        core.add_schedule([2], "22:00", "06:00")
+        reloaded = BlockerCore()
+        self.assertTrue(reloaded.is_scheduled_block_time(at(3, "05:00")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Tests for the session write-ahead journal (session_journal.py).
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from session_journal import (
+    ACTION_CLEANUP,
+    ACTION_CREDIT,
+    ACTION_NONE,
+    ACTION_RESUME,
+    SessionJournal,
+    decode_line,
+    encode_record,
+    read_records,
+    replay,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class JournalTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.path = self.test_dir / ".session_journal.log"
+        self.clock = FakeClock()
+        self.journal = SessionJournal(self.path, clock=self.clock)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir)
+
+    def run_session(self, minutes: int, blocked: bool = True) -> None:
+        """Start a 25-minute session and checkpoint every 30 s for `minutes`."""
+        self.journal.start("s1", 25 * 60, "normal")
+        if blocked:
+            self.journal.block(12)
+        for elapsed in range(30, minutes * 60 + 1, 30):
+            self.clock.now += 30
+            self.journal.checkpoint(elapsed)
+
+
+class TestRecordFormat(unittest.TestCase):
+    """Checksummed lines."""
+
+    def test_round_trip_and_checksum(self) -> None:
+        line = encode_record({"seq": 0, "ev": "start", "t": 1.5})
+        self.assertEqual(decode_line(line)["ev"], "start")
+        tampered = line.replace(b'"start"', b'"stort"')
+        self.assertIsNone(decode_line(tampered))
+        self.assertIsNone(decode_line(line[:-1]))  # no newline: torn write
+
+
+class TestReplay(JournalTestCase):
+    """Recovery decisions."""
+
+    def test_open_window_resumes(self) -> None:
+        self.run_session(minutes=10)
+        plan = self.journal.recover(now=self.clock.now + 5)
+        self.assertEqual(plan.action, ACTION_RESUME)
+        self.assertEqual(plan.elapsed, 600)
+        self.assertEqual(plan.remaining, 15 * 60 - 5)
+        self.assertTrue(plan.blocks_active)
+        self.assertFalse(plan.needs_unblock)
+
+    def test_expired_window_credits_partial_time(self) -> None:
+        self.run_session(minutes=10)
+        plan = self.journal.recover(now=self.clock.now + 3600)
+        self.assertEqual(plan.action, ACTION_CREDIT)
+        self.assertEqual(plan.elapsed, 600)
+        self.assertTrue(plan.needs_unblock)
+
+    def test_short_session_only_cleans_up(self) -> None:
+        self.run_session(minutes=1)
+        plan = self.journal.recover(now=self.clock.now + 3600)
+        self.assertEqual(plan.action, ACTION_CLEANUP)
+
+        self.journal.start("s2", 60, "normal")  # light mode: never blocked
+        self.assertEqual(self.journal.recover(now=self.clock.now + 3600).action, ACTION_NONE)
+
+    def test_clean_completion_compacts(self) -> None:
+        self.run_session(minutes=25)
+        self.journal.complete(1500)
+        self.assertEqual(self.journal.recover().action, ACTION_CLEANUP)
+        self.journal.unblock()
+        self.assertEqual(self.path.read_bytes(), b"")
+        self.assertEqual(self.journal.recover().action, ACTION_NONE)
+
+    def test_no_start_means_nothing_to_do(self) -> None:
+        self.assertEqual(replay([]).action, ACTION_NONE)
+        self.assertEqual(replay([{"seq": 0, "ev": "checkpoint", "elapsed": 90}]).action, ACTION_NONE)
+
+
+class TestDamagedTails(JournalTestCase):
+    """Replay keeps the valid prefix of a damaged journal."""
+
+    def test_truncated_tail(self) -> None:
+        self.run_session(minutes=5)
+        data = self.path.read_bytes()
+        self.path.write_bytes(data[:-7])  # power lost mid-write of the last checkpoint
+        records, dropped = read_records(self.path)
+        self.assertTrue(dropped)
+        self.assertEqual(records[-1]["elapsed"], 270)
+        plan = self.journal.recover(now=self.clock.now + 3600)
+        self.assertEqual(plan.action, ACTION_CREDIT)
+        self.assertEqual(plan.elapsed, 270)
+        self.assertTrue(plan.tail_dropped)
+
+    def test_corrupted_record_ends_the_log(self) -> None:
+        self.run_session(minutes=5)
+        lines = self.path.read_bytes().splitlines(keepends=True)
+        lines[4] = lines[4].replace(b'"elapsed":90', b'"elapsed":99')  # bit rot
+        self.path.write_bytes(b"".join(lines))
+        records, dropped = read_records(self.path)
+        self.assertTrue(dropped)
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[-1]["elapsed"], 60)
+
+    def test_sequence_gap_ends_the_log(self) -> None:
+        self.run_session(minutes=3)
+        lines = self.path.read_bytes().splitlines(keepends=True)
+        del lines[3]
+        self.path.write_bytes(b"".join(lines))
+        records, dropped = read_records(self.path)
+        self.assertTrue(dropped)
+        self.assertEqual(len(records), 3)
+
+    def test_append_after_torn_tail_starts_a_new_line(self) -> None:
+        self.run_session(minutes=2)
+        self.path.write_bytes(self.path.read_bytes()[:-3])
+        # A new process appending to the damaged file
+        journal = SessionJournal(self.path, clock=self.clock)
+        journal._session_id = "s1"
+        journal._seq = 99
+        journal.checkpoint(150)
+        lines = self.path.read_bytes().splitlines(keepends=True)
+        self.assertIsNone(decode_line(lines[-2]))
+        self.assertEqual(decode_line(lines[-1])["elapsed"], 150)
+
+    def test_garbage_file(self) -> None:
+        self.path.write_bytes(b"\x00\xff not a journal\n")
+        plan = self.journal.recover()
+        self.assertEqual(plan.action, ACTION_NONE)
+        self.assertTrue(plan.tail_dropped)
+
+
+class TestBlockerCoreRecovery(unittest.TestCase):
+    """BlockerCore journals light-mode sessions and credits them after a crash."""
+
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.patchers = [
+            patch('core_logic.CONFIG_PATH', self.test_dir / "config.json"),
+            patch('core_logic.STATS_PATH', self.test_dir / "stats.json"),
+            patch('core_logic.SESSION_STATE_PATH', self.test_dir / ".session_state.json"),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        shutil.rmtree(self.test_dir)
+
+    def make_core(self):
+        from core_logic import BlockerCore, EnforcementMode
+        core = BlockerCore()
+        core.enforcement_mode = EnforcementMode.LIGHT
+        core.blacklist = ["example.com"]
+        return core
+
+    def test_crashed_session_is_credited(self) -> None:
+        core = self.make_core()
+        self.assertTrue(core.block_sites(duration_seconds=1500, started_at=0)[0])
+        core.journal_checkpoint(600)
+        # Crash: no unblock, no stats update. The planned window is long over.
+        restarted = self.make_core()
+        orphaned = restarted.check_orphaned_session()
+        self.assertEqual(orphaned["recovery"].action, ACTION_CREDIT)
+        before = restarted.stats["total_focus_time"]
+        self.assertEqual(restarted.credit_orphaned_session(), 600)
+        self.assertEqual(restarted.stats["total_focus_time"], before + 600)
+        self.assertIsNone(self.make_core().check_orphaned_session())
+
+    def test_clean_session_leaves_nothing_to_recover(self) -> None:
+        core = self.make_core()
+        core.block_sites(duration_seconds=1500)
+        core.journal_checkpoint(600)
+        core.update_stats(600, completed=True)
+        core.unblock_sites(force=True)
+        self.assertIsNone(self.make_core().check_orphaned_session())
+
+
+if __name__ == '__main__':
+    unittest.main()
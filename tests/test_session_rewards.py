@@ -0,0 +1,234 @@
+"""
+Tests for the session reward pipeline (session_rewards.py) and
+GameStateManager.apply_session_rewards.
+"""
+
+import copy
+import random
+import pytest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_rewards import (
+    SessionFlags,
+    apply_ledger,
+    compute_session_reward_ledger,
+    compute_session_rewards,
+    get_streak_coin_bonus,
+)
+
+
+def make_adhd_buster():
+    return {
+        "inventory": [],
+        "equipped": {},
+        "coins": 100,
+        "hero": {"xp": 0, "level": 1},
+        "active_story": "warrior",
+    }
+
+
+class TestComputeSessionRewards:
+    """Reward computation is pure and matches the documented rules."""
+
+    def test_too_short_session_is_ineligible(self):
+        plan = compute_session_rewards(make_adhd_buster(), 4, streak=10)
+        assert plan.eligible is False
+        assert plan.coins == 0 and plan.xp == 0 and plan.item is None
+
+    def test_dry_run_matches_real_run_without_rolling_item(self):
+        adhd_buster = make_adhd_buster()
+        rng = Mock()
+        rng.random.return_value = 0.0
+        preview = compute_session_rewards(adhd_buster, 60, streak=7, dry_run=True, rng=rng)
+        rng.random.assert_not_called()
+        assert preview.item is None
+        assert preview.item_drop_chance == 1.0
+
+        real = compute_session_rewards(adhd_buster, 60, streak=7, rng=random.Random(1))
+        assert real.item is not None
+        assert (real.coins, real.xp) == (preview.coins, preview.xp)
+        # Computing never awards anything
+        assert adhd_buster["inventory"] == [] and adhd_buster["coins"] == 100
+        assert "total_xp" not in adhd_buster
+
+    def test_short_session_penalty(self):
+        full = compute_session_rewards(make_adhd_buster(), 20, dry_run=True)
+        short = compute_session_rewards(make_adhd_buster(), 19, dry_run=True)
+        assert short.is_short_session and not full.is_short_session
+        assert short.item_drop_chance == 0.25
+        assert short.xp < full.xp
+        rng = Mock()
+        rng.random.return_value = 0.5
+        assert compute_session_rewards(make_adhd_buster(), 10, rng=rng).item is None
+
+    def test_strategic_and_streak_coins(self):
+        base = compute_session_rewards(make_adhd_buster(), 60, dry_run=True)
+        strategic = compute_session_rewards(make_adhd_buster(), 60, strategic=True, dry_run=True)
+        assert strategic.coins == int(base.coins * 2.5)
+        streak = compute_session_rewards(make_adhd_buster(), 60, streak=30, dry_run=True)
+        assert streak.streak_bonus == get_streak_coin_bonus(30) == 100
+        assert streak.coins == base.coins + 100
+
+    def test_perks_are_read_once(self):
+        with patch("gamification.get_entity_coin_perks",
+                   return_value={"coin_flat": 5, "coin_percent": 0}) as coin_perks:
+            plan = compute_session_rewards(make_adhd_buster(), 60, dry_run=True)
+        coin_perks.assert_called_once()
+        assert plan.entity_coin_bonus == 5
+        assert "snapshot" in plan.timings and "coins" in plan.timings and "xp" in plan.timings
+
+
+class TestApplySessionRewards:
+    """A plan is applied in one batch with a single save."""
+
+    @pytest.fixture
+    def mock_blocker(self):
+        blocker = Mock()
+        blocker.adhd_buster = make_adhd_buster()
+        blocker.save_config = Mock()
+        return blocker
+
+    @pytest.fixture
+    def game_state(self, mock_blocker):
+        from game_state import GameStateManager, reset_game_state
+        reset_game_state()
+        return GameStateManager(mock_blocker)
+
+    def test_single_save_and_consolidated_signals(self, game_state, mock_blocker):
+        plan = compute_session_rewards(mock_blocker.adhd_buster, 60, rng=random.Random(3))
+        coin_signals = []
+        game_state.coins_changed.connect(coin_signals.append)
+
+        result = game_state.apply_session_rewards(plan, create_backup=True)
+
+        mock_blocker.save_config.assert_called_once_with(create_backup=True)
+        assert coin_signals == [100 + plan.coins]
+        assert result["coin_total"] == 100 + plan.coins
+        assert result["xp_earned"] == plan.xp
+        assert mock_blocker.adhd_buster["total_xp"] == plan.xp
+        assert len(mock_blocker.adhd_buster["inventory"]) == 1
+        assert mock_blocker.adhd_buster["equipped"][plan.item["slot"]]
+        assert result["diary_entry"] is not None
+        assert len(mock_blocker.adhd_buster["diary"]) == 1
+        assert "apply" in plan.timings
+
+    def test_diary_written_once_per_day(self, game_state, mock_blocker):
+        for seed in range(2):
+            plan = compute_session_rewards(mock_blocker.adhd_buster, 30, rng=random.Random(seed))
+            game_state.apply_session_rewards(plan)
+        assert len(mock_blocker.adhd_buster["diary"]) == 1
+        assert mock_blocker.save_config.call_count == 2
+
+    def test_dry_run_plan_is_not_applied(self, game_state, mock_blocker):
+        plan = compute_session_rewards(mock_blocker.adhd_buster, 60, dry_run=True)
+        assert game_state.apply_session_rewards(plan) == {}
+        assert mock_blocker.adhd_buster["coins"] == 100
+        mock_blocker.save_config.assert_not_called()
+
+    def test_nested_batch_defers_save(self, game_state, mock_blocker):
+        plan = compute_session_rewards(mock_blocker.adhd_buster, 45, rng=random.Random(0))
+        with game_state.batch():
+            game_state.add_coins(10)
+            game_state.apply_session_rewards(plan, create_backup=True)
+            mock_blocker.save_config.assert_not_called()
+        mock_blocker.save_config.assert_called_once_with(create_backup=True)
+
+
+def make_random_profile(rng):
+    """A hero with random coins, XP, lucky gear and completed city buildings."""
+    adhd_buster = make_adhd_buster()
+    adhd_buster["coins"] = rng.randint(0, 5000)
+    adhd_buster["total_xp"] = rng.randint(0, 50000)
+    if rng.random() < 0.5:
+        adhd_buster["equipped"]["Helmet"] = {
+            "name": "Lucky Cap", "slot": "Helmet", "rarity": "Rare", "power": 10,
+            "lucky_options": {"xp_bonus": rng.choice([0, 5, 10, 25])},
+        }
+    if rng.random() < 0.7:
+        from city import get_city_data
+        grid = get_city_data(adhd_buster)["grid"]
+        buildings = rng.sample(["royal_mint", "library", "wonder", "market"], rng.randint(1, 4))
+        for col, building_id in enumerate(buildings):
+            grid[0][col] = {"building_id": building_id, "status": "complete",
+                            "level": 1 if building_id == "wonder" else rng.randint(1, 3)}
+    return adhd_buster
+
+
+class TestSessionRewardLedger:
+    """The previewed ledger is exactly what gets applied."""
+
+    def test_applied_deltas_equal_previewed_ledger(self):
+        from game_state import GameStateManager, reset_game_state
+        for seed in range(60):
+            rng = random.Random(seed)
+            blocker = Mock()
+            blocker.adhd_buster = make_random_profile(rng)
+            stats = {"streak_days": rng.choice([0, 2, 3, 8, 15, 40])}
+            minutes = rng.choice([3, 5, 12, 19, 20, 25, 45, 60, 90, 180])
+            flags = SessionFlags(strategic=rng.random() < 0.3, perfect=rng.random() < 0.5)
+            perks = {"coin_flat": rng.choice([0, 0, 3, 10]), "coin_percent": rng.choice([0, 0, 5, 20])}
+            qol = {"perfect_session_bonus": rng.choice([0, 10, 25])}
+            with patch("gamification.get_entity_coin_perks", return_value=perks), \
+                 patch("gamification.get_entity_qol_perks", return_value=qol):
+                ledger = compute_session_reward_ledger(blocker.adhd_buster, stats, minutes, flags,
+                                                       rng=random.Random(seed))
+            shown = (ledger.coins, ledger.xp, ledger.lines, copy.deepcopy(ledger.item))
+
+            reset_game_state()
+            game_state = GameStateManager(blocker)
+            coins_before = blocker.adhd_buster["coins"]
+            xp_before = blocker.adhd_buster["total_xp"]
+            inventory_before = len(blocker.adhd_buster["inventory"])
+            result = apply_ledger(game_state, ledger)
+
+            if not ledger.eligible:
+                assert minutes < 5 and result == {} and ledger.lines == ()
+                continue
+            assert blocker.adhd_buster["coins"] - coins_before == ledger.coins, f"seed {seed}"
+            assert blocker.adhd_buster["total_xp"] - xp_before == ledger.xp, f"seed {seed}"
+            assert len(blocker.adhd_buster["inventory"]) - inventory_before == (1 if ledger.item else 0)
+            assert (result["coins_earned"], result["xp_earned"]) == (ledger.coins, ledger.xp)
+            assert sum(line.amount for line in ledger.lines) == ledger.coins + ledger.xp
+            # Applying never changes what was shown
+            assert (ledger.coins, ledger.xp, ledger.lines, ledger.item) == shown
+            blocker.save_config.assert_called_once()
+
+    def test_ledger_is_itemized_and_immutable(self):
+        adhd_buster = make_adhd_buster()
+        from city import get_city_data
+        get_city_data(adhd_buster)["grid"][0][0] = {"building_id": "royal_mint", "status": "complete", "level": 1}
+        ledger = compute_session_reward_ledger(adhd_buster, {"streak_days": 7}, 60, dry_run=True)
+        sources = {line.source for line in ledger.lines}
+        assert {"session", "streak", "city_mint"} <= sources
+        assert ledger.total("coins", "streak") == get_streak_coin_bonus(7)
+        assert ledger.city_mint_coins == 11  # Royal Mint L1: 5 + 2 * 3
+        with pytest.raises(Exception):
+            ledger.lines[0].amount = 1
+        with pytest.raises(Exception):
+            ledger.eligible = False
+
+    def test_mint_income_is_recorded_once(self):
+        from city import get_city_data
+        from game_state import GameStateManager, reset_game_state
+        blocker = Mock()
+        blocker.adhd_buster = make_adhd_buster()
+        city = get_city_data(blocker.adhd_buster)
+        city["grid"][0][0] = {"building_id": "royal_mint", "status": "complete", "level": 1}
+        ledger = compute_session_reward_ledger(blocker.adhd_buster, {}, 60, rng=random.Random(1))
+        reset_game_state()
+        apply_ledger(GameStateManager(blocker), ledger)
+        assert city["total_coins_generated"] == ledger.city_mint_coins == 11
+        assert city["focus_sessions_rewarded"] == 1
+
+    def test_dry_run_ledger_cannot_be_applied(self):
+        blocker = Mock()
+        blocker.adhd_buster = make_adhd_buster()
+        ledger = compute_session_reward_ledger(blocker.adhd_buster, {}, 60, dry_run=True)
+        from game_state import GameStateManager
+        assert apply_ledger(GameStateManager(blocker), ledger) == {}
+        assert blocker.adhd_buster["coins"] == 100
@@ -0,0 +1,109 @@
+"""
+Tests for the startup profiler and background preloader (startup_profiler.py).
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from startup_profiler import (
+    REPORT_ENV_VAR,
+    BackgroundPreloader,
+    StartupProfiler,
+    write_report_if_requested,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Phase and mark recording."""
+
+    def test_phases_and_marks(self) -> None:
+        clock = FakeClock()
+        profiler = StartupProfiler(clock=clock)
+        clock.now += 0.5
+        with profiler.phase("load"):
+            clock.now += 0.25
+        profiler.mark("first_paint")
+        clock.now += 1.0
+        profiler.mark("first_paint")  # first occurrence wins
+
+        report = profiler.report()
+        self.assertEqual(len(report["phases"]), 1)
+        phase = report["phases"][0]
+        self.assertEqual(phase["name"], "load")
+        self.assertAlmostEqual(phase["start"], 0.5)
+        self.assertAlmostEqual(phase["duration"], 0.25)
+        self.assertEqual(phase["thread"], threading.current_thread().name)
+        self.assertAlmostEqual(report["marks"]["first_paint"], 0.75)
+        self.assertIn("load", profiler.format_report())
+
+    def test_phase_recorded_on_exception(self) -> None:
+        profiler = StartupProfiler()
+        with self.assertRaises(RuntimeError):
+            with profiler.phase("broken"):
+                raise RuntimeError("boom")
+        self.assertEqual([p["name"] for p in profiler.report()["phases"]], ["broken"])
+
+
+class TestReportOutput(unittest.TestCase):
+    """Report dumping via the environment variable."""
+
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir)
+
+    def test_write_report_if_requested(self) -> None:
+        profiler = StartupProfiler()
+        with profiler.phase("x"):
+            pass
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(REPORT_ENV_VAR, None)
+            self.assertIsNone(write_report_if_requested(profiler))
+        target = self.test_dir / "report.json"
+        with patch.dict(os.environ, {REPORT_ENV_VAR: str(target)}):
+            self.assertEqual(write_report_if_requested(profiler), target)
+        data = json.loads(target.read_text(encoding="utf-8"))
+        self.assertEqual(data["phases"][0]["name"], "x")
+
+
+class TestBackgroundPreloader(unittest.TestCase):
+    """Imports and warmers run on the worker thread and are timed."""
+
+    def test_imports_and_warms_on_worker_thread(self) -> None:
+        profiler = StartupProfiler()
+        warm_threads = []
+        preloader = BackgroundPreloader(
+            modules=["colorsys", "definitely_not_a_module_xyz"],
+            warmers=[("record", lambda: warm_threads.append(threading.current_thread().name)),
+                     ("fail", lambda: 1 / 0)],
+            profiler=profiler,
+        ).start()
+        self.assertTrue(preloader.wait(10))
+        self.assertTrue(preloader.done)
+        self.assertIn("colorsys", sys.modules)
+        self.assertEqual(warm_threads, ["startup-preload"])
+        self.assertIn("definitely_not_a_module_xyz", preloader.errors)
+        self.assertIn("fail", preloader.errors)
+        names = [p["name"] for p in profiler.report()["phases"]]
+        self.assertEqual(names, ["preload:colorsys", "preload:definitely_not_a_module_xyz",
+                                 "warm:record", "warm:fail"])
+
+
+if __name__ == '__main__':
+    unittest.main()
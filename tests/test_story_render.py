@@ -0,0 +1,134 @@
+"""
+Tests for compiled story templates and the rendered chapter cache (story_render.py).
+"""
+
+import random
+import unittest
+
+from gamification import (
+    STORY_DATA, chapter_render_key, compile_story_template, ensure_hero_structure,
+    get_chapter_content, get_story_progress, make_story_decision, render_story_template,
+)
+from story_render import ChapterRenderCache, markdown_to_html
+
+
+def make_hero(story_id: str = "warrior", max_power: int = 2000) -> dict:
+    adhd_buster = {}
+    ensure_hero_structure(adhd_buster)
+    adhd_buster["active_story"] = story_id
+    adhd_buster["max_power_reached"] = max_power
+    return adhd_buster
+
+
+def equip(adhd_buster: dict, slot: str, name: str, power: int = 10) -> None:
+    adhd_buster["equipped"][slot] = {"name": name, "slot": slot, "power": power, "rarity": "Common"}
+
+
+class TestStoryTemplates(unittest.TestCase):
+    """Compiled templates personalise like the chained str.replace they replace."""
+
+    def test_compile_and_render(self) -> None:
+        segments = compile_story_template("Your {helmet} gleams. {current_power} power! {unknown}")
+        self.assertEqual(segments[1::2], ("helmet", "current_power"))
+        text = render_story_template(segments, {"helmet": "**Cap**", "current_power": "42"})
+        self.assertEqual(text, "Your **Cap** gleams. 42 power! {unknown}")
+        self.assertIs(compile_story_template("Your {helmet} gleams. {current_power} power! {unknown}"), segments)
+
+    def test_matches_replace_for_every_chapter(self) -> None:
+        replacements = {key: f"<{key}>" for key in
+                        ("helmet", "weapon", "chestplate", "shield", "gauntlets",
+                         "boots", "cloak", "amulet", "current_power")}
+        for data in STORY_DATA.values():
+            for chapter in data["chapters"]:
+                texts = [chapter.get("content", "")]
+                texts += list(chapter.get("content_variations", {}).values())
+                texts += [e["content"] for e in (chapter.get("endings") or {}).values()]
+                for text in texts:
+                    expected = text
+                    for key, value in replacements.items():
+                        expected = expected.replace("{" + key + "}", value)
+                    self.assertEqual(render_story_template(compile_story_template(text), replacements), expected)
+
+
+class TestStoryProgressCache(unittest.TestCase):
+    """Cached chapter index still tracks unlocks and decisions."""
+
+    def test_progress_follows_decisions_and_power(self) -> None:
+        hero = make_hero(max_power=0)
+        progress = get_story_progress(hero, power=60)
+        self.assertEqual(progress["unlocked_chapters"], [1, 2])
+        self.assertEqual(progress["power_to_next"], 60)
+        self.assertFalse(progress["chapters"][1]["decision_made"])
+
+        self.assertTrue(make_story_decision(hero, 2, "B")["success"])
+        progress = get_story_progress(hero, power=60)
+        self.assertTrue(progress["chapters"][1]["decision_made"])
+        self.assertEqual(progress["decisions_made"], 1)
+
+        progress["chapters"][0]["title"] = "mutated"
+        self.assertNotEqual(get_story_progress(hero, power=60)["chapters"][0]["title"], "mutated")
+
+
+class TestChapterRenderCache(unittest.TestCase):
+    """Renders are reused until something the chapter shows changes."""
+
+    def setUp(self) -> None:
+        self.cache = ChapterRenderCache()
+
+    def test_hit_and_gear_invalidation(self) -> None:
+        hero = make_hero()
+        equip(hero, "Cloak", "Cloak of Dawn")
+        data, html = self.cache.get(1, hero, power=100)
+        self.assertEqual(html, markdown_to_html(get_chapter_content(1, hero, power=100)["content"]))
+        self.assertEqual(self.cache.get(1, hero, power=100)[1], html)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        equip(hero, "Boots", "Swift Boots")  # Chapter 1 never mentions boots
+        self.assertEqual(self.cache.get(1, hero, power=100)[1], html)
+        self.assertEqual(self.cache.misses, 1)
+
+        equip(hero, "Cloak", "Cloak of Dusk")
+        self.assertNotEqual(self.cache.get(1, hero, power=100)[1], html)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_power_only_keys_chapters_that_print_it(self) -> None:
+        hero = make_hero("wanderer")
+        self.assertIsNone(chapter_render_key(1, hero, power=100)[4])
+        self.assertEqual(chapter_render_key(1, hero, power=100), chapter_render_key(1, hero, power=900))
+        self.assertEqual(chapter_render_key(4, hero, power=100)[4], 100)
+        self.assertNotEqual(self.cache.get(4, hero, power=100)[1], self.cache.get(4, hero, power=900)[1])
+
+    def test_decision_and_locked_chapters(self) -> None:
+        hero = make_hero(max_power=0)
+        before = self.cache.get(2, hero, power=60)
+        self.assertTrue(before[0]["has_decision"])
+        make_story_decision(hero, 2, "A")
+        after = self.cache.get(2, hero, power=60)
+        self.assertFalse(after[0]["has_decision"])
+        self.assertNotEqual(before[1], after[1])
+
+        self.assertFalse(self.cache.get(7, hero, power=60)[0]["unlocked"])
+        self.assertIsNone(self.cache.get(9, hero, power=60))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_matches_uncached_render(self) -> None:
+        rng = random.Random(11)
+        for _ in range(40):
+            hero = make_hero(rng.choice(list(STORY_DATA)), rng.choice([0, 300, 2000]))
+            for chapter_num in (2, 4, 6):
+                if rng.random() < 0.6:
+                    make_story_decision(hero, chapter_num, rng.choice("AB"))
+            for slot in ("Helmet", "Weapon", "Cloak"):
+                if rng.random() < 0.5:
+                    equip(hero, slot, rng.choice(["Iron", "Glass", "Moon"]))
+            power = rng.randint(0, 2000)
+            for chapter_num in list(range(1, 8)) * 2:
+                expected = get_chapter_content(chapter_num, hero, power)
+                data, html = self.cache.get(chapter_num, hero, power)
+                self.assertEqual(data, expected)
+                self.assertEqual(html, markdown_to_html(expected["content"]))
+        self.assertGreater(self.cache.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
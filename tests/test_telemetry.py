@@ -0,0 +1,147 @@
+"""
+Tests for the performance telemetry (telemetry.py, telemetry_panel.py).
+"""
+
+import json
+import threading
+
+import pytest
+
+import telemetry
+from telemetry import Histogram, Telemetry, span, timed
+
+
+@pytest.fixture
+def fresh():
+    """The process-wide registry, emptied and enabled for the test."""
+    was_enabled = telemetry.is_enabled()
+    telemetry.reset()
+    telemetry.set_enabled(True)
+    yield telemetry.get_telemetry()
+    telemetry.reset()
+    telemetry.set_enabled(was_enabled)
+
+
+class TestHistogram:
+    def test_percentiles_over_a_partial_window(self):
+        hist = Histogram("x", window=8)
+        for ms in (5, 1, 4, 2, 3):
+            hist.add(ms / 1000)
+        summary = hist.summary()
+        assert summary["count"] == 5
+        assert summary["p50_ms"] == pytest.approx(3)
+        assert summary["p95_ms"] == pytest.approx(5)
+        assert summary["max_ms"] == pytest.approx(5)
+        assert summary["mean_ms"] == pytest.approx(3)
+        assert summary["last_ms"] == pytest.approx(3)
+
+    def test_ring_buffer_keeps_the_latest_samples(self):
+        hist = Histogram("x", window=4)
+        for s in (100, 1, 2, 3, 4, 5):
+            hist.add(s)
+        assert hist.window() == [2, 3, 4, 5]
+        assert hist.percentile(95) == 5
+        # Lifetime figures still include the evicted outlier
+        assert (hist.count, hist.max, hist.total) == (6, 100, 115)
+
+    def test_empty(self):
+        assert Histogram("x").summary()["p95_ms"] == 0.0
+
+
+class TestRecording:
+    def test_timed_and_span_record_under_their_names(self, fresh):
+        @timed("unit.work")
+        def work(x):
+            return x * 2
+
+        assert work(21) == 42
+        assert work.__name__ == "work"
+        with span("unit.block"):
+            pass
+        with span("unit.block"):
+            pass
+        metrics = telemetry.snapshot()["metrics"]
+        assert metrics["unit.work"]["count"] == 1
+        assert metrics["unit.block"]["count"] == 2
+
+    def test_exceptions_are_timed_and_propagate(self, fresh):
+        @timed("unit.fails")
+        def fails():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fails()
+        with pytest.raises(KeyError):
+            with span("unit.fails_block"):
+                raise KeyError("k")
+        metrics = telemetry.snapshot()["metrics"]
+        assert metrics["unit.fails"]["count"] == 1
+        assert metrics["unit.fails_block"]["count"] == 1
+
+    def test_disabled_records_nothing(self, fresh):
+        @timed("unit.off")
+        def work():
+            return "ok"
+
+        telemetry.set_enabled(False)
+        assert work() == "ok"
+        with span("unit.off_block") as s:
+            assert s is span("another")  # The shared no-op
+        assert telemetry.snapshot()["metrics"] == {}
+
+    def test_concurrent_records_are_all_counted(self):
+        registry = Telemetry(window=16)
+
+        def hammer():
+            for _ in range(2000):
+                registry.record("poll", 0.001)
+
+        threads = [threading.Thread(target=hammer) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert registry.histogram("poll").count == 8000
+
+    def test_fake_clock_and_dump(self, tmp_path):
+        ticks = iter([0.0, 0.25])
+        registry = Telemetry(clock=lambda: next(ticks))
+        with telemetry._Span(registry, "save_config"):
+            pass
+        path = tmp_path / "snapshot.json"
+        registry.dump(path, extra={"startup": {"total": 1.5}})
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["metrics"]["save_config"]["max_ms"] == pytest.approx(250)
+        assert data["startup"] == {"total": 1.5}
+
+
+class TestInstrumentedFunctions:
+    def test_gamification_hot_paths_are_timed(self, fresh):
+        from gamification import calculate_character_power, get_all_perk_bonuses
+
+        calculate_character_power({})
+        get_all_perk_bonuses({})
+        metrics = telemetry.snapshot()["metrics"]
+        assert metrics["calculate_character_power"]["count"] >= 1
+        assert metrics["get_all_perk_bonuses"]["count"] >= 1
+
+
+class TestPerformancePanel:
+    def test_table_and_export(self, qapp, fresh, tmp_path):
+        from telemetry_panel import PerformancePanel
+
+        fresh.record("save_config", 0.004)
+        fresh.record("block_sites", 0.010)
+        panel = PerformancePanel(extra=lambda: {"startup": {"phases": []}})
+        panel.refresh()
+        assert panel.table.rowCount() == 2
+        assert panel.table.item(0, 0).text() == "block_sites"
+        assert panel.table.item(0, 2).text() == "10.00"
+
+        path = panel.export_snapshot(str(tmp_path / "perf.json"))
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert set(data["metrics"]) == {"block_sites", "save_config"}
+        assert data["startup"] == {"phases": []}
+
+        panel.enabled_check.setChecked(False)
+        assert not telemetry.is_enabled()
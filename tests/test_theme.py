@@ -0,0 +1,55 @@
+"""
+Tests for the application-level stylesheet (theme.py).
+
+State changes go through object names and dynamic properties; a widget is
+only re-polished when its state actually changed.
+"""
+
+import pytest
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from theme import APP_STYLESHEET, RARITY_COLORS, install_app_stylesheet, set_style_state  # noqa: E402
+
+
+class TestInstallAppStylesheet:
+    def test_install_is_idempotent(self, qapp):
+        assert install_app_stylesheet(qapp)
+        sheet = qapp.styleSheet()
+        assert APP_STYLESHEET in sheet
+        assert install_app_stylesheet()
+        assert qapp.styleSheet() == sheet
+
+    def test_rules_cover_every_rarity(self):
+        for rarity in RARITY_COLORS:
+            assert f'QComboBox#heroSlotCombo[rarity="{rarity}"]' in APP_STYLESHEET
+            assert f'QLabel#lotteryReadout[tone="{rarity}"]' in APP_STYLESHEET
+
+
+class TestSetStyleState:
+    def test_repolishes_only_on_change(self, qapp):
+        label = QtWidgets.QLabel()
+        assert set_style_state(label, "lotteryReadout", tone="win")
+        assert label.objectName() == "lotteryReadout"
+        assert label.property("tone") == "win"
+
+        # Animation ticks repeat the same state; those must be free
+        assert not set_style_state(label, "lotteryReadout", tone="win")
+        assert set_style_state(label, "lotteryReadout", tone="lose")
+        assert set_style_state(label, "lotteryRollValue", tone="lose")
+
+    def test_clears_widget_stylesheet(self, qapp):
+        label = QtWidgets.QLabel()
+        label.setStyleSheet("color: red;")
+        assert set_style_state(label, "mergeCostLabel", discounted=False)
+        assert label.styleSheet() == ""
+        assert not set_style_state(label, "mergeCostLabel", discounted=False)
+
+    def test_state_selects_rule(self, qapp):
+        combo = QtWidgets.QComboBox()
+        set_style_state(combo, "heroSlotCombo", rarity="Epic")
+        epic = combo.palette().color(combo.foregroundRole()).name()
+        set_style_state(combo, "heroSlotCombo", rarity="")
+        empty = combo.palette().color(combo.foregroundRole()).name()
+        assert epic == RARITY_COLORS["Epic"]
+        assert empty == "#ffffff"
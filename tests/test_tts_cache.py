@@ -0,0 +1,144 @@
+"""
+Tests for the persistent TTS phrase cache (tts_cache.py).
+"""
+
+import array
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from tts_cache import PhraseCache, PhraseSynthesizer, model_cache_id, resample_pcm16
+
+
+class FakeChunk:
+    def __init__(self, data: bytes) -> None:
+        self.audio_int16_bytes = data
+
+
+class FakeVoice:
+    """Stands in for PiperVoice: counts calls and takes a while to synthesize."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls = []
+
+    def synthesize(self, text):
+        self.calls.append(text)
+        time.sleep(self.delay)
+        samples = array.array('h', [len(text), -len(text), 7])
+        if sys.byteorder != 'little':
+            samples.byteswap()
+        yield FakeChunk(samples.tobytes())
+
+
+def pcm_to_list(pcm: bytes) -> list:
+    samples = array.array('h')
+    samples.frombytes(pcm)
+    if sys.byteorder != 'little':
+        samples.byteswap()
+    return samples.tolist()
+
+
+def list_to_pcm(values) -> bytes:
+    samples = array.array('h', values)
+    if sys.byteorder != 'little':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+class TestResample(unittest.TestCase):
+    """Nearest-neighbour resampling."""
+
+    def test_integer_ratio_repeats_samples(self) -> None:
+        out = resample_pcm16(list_to_pcm([1, -2, 300]), 22050, 44100)
+        self.assertEqual(pcm_to_list(out), [1, 1, -2, -2, 300, 300])
+
+    def test_non_integer_ratio_and_identity(self) -> None:
+        pcm = list_to_pcm([10, 20, 30, 40])
+        self.assertEqual(pcm_to_list(resample_pcm16(pcm, 16000, 24000)), [10, 10, 20, 30, 30, 40])
+        self.assertIs(resample_pcm16(pcm, 44100, 44100), pcm)
+
+
+class TestPhraseSynthesizer(unittest.TestCase):
+    """Cached phrases never reach the voice."""
+
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir)
+
+    def make_synth(self, voice: FakeVoice) -> PhraseSynthesizer:
+        return PhraseSynthesizer(voice, "model:1", 22050, PhraseCache(self.test_dir), output_rate=44100)
+
+    def test_cached_phrase_skips_piper_and_is_faster(self) -> None:
+        voice = FakeVoice(delay=0.05)
+        synth = self.make_synth(voice)
+
+        start = time.perf_counter()
+        first = synth.synthesize("Close eyes.")
+        first_latency = time.perf_counter() - start
+
+        start = time.perf_counter()
+        second = synth.synthesize("Close eyes.")
+        second_latency = time.perf_counter() - start
+
+        self.assertEqual(first, second)
+        self.assertEqual(voice.calls, ["Close eyes."])
+        self.assertLess(second_latency, first_latency)
+        self.assertEqual(pcm_to_list(first), [11, 11, -11, -11, 7, 7])
+
+    def test_cache_persists_across_instances(self) -> None:
+        self.make_synth(FakeVoice(delay=0)).synthesize("Open.")
+        voice = FakeVoice(delay=0)
+        synth = self.make_synth(voice)
+        self.assertIsNotNone(synth.cached("Open."))
+        synth.synthesize("Open.")
+        self.assertEqual(voice.calls, [])
+        # A different model or output rate is a different entry
+        other = PhraseSynthesizer(voice, "model:2", 22050, PhraseCache(self.test_dir))
+        self.assertIsNone(other.cached("Open."))
+
+    def test_prewarm_only_synthesizes_missing_phrases(self) -> None:
+        voice = FakeVoice(delay=0)
+        synth = self.make_synth(voice)
+        synth.synthesize("Open.")
+        self.assertEqual(synth.prewarm(["Open.", "Close eyes.", "Inhale deeply."]), 2)
+        self.assertEqual(voice.calls, ["Open.", "Close eyes.", "Inhale deeply."])
+        self.assertEqual(synth.prewarm(["Exhale slowly."], should_stop=lambda: True), 0)
+
+
+class TestPhraseCache(unittest.TestCase):
+    """On-disk layout and size cap."""
+
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir)
+
+    def test_oldest_entries_evicted_over_limit(self) -> None:
+        cache = PhraseCache(self.test_dir, max_bytes=250)
+        for i in range(3):
+            cache.put("m", f"phrase {i}", 44100, bytes(100))
+            path = cache._path(cache.key("m", f"phrase {i}", 44100))
+            stamp = 1_000_000 + i
+            os.utime(path, (stamp, stamp))
+        cache.put("m", "phrase 3", 44100, bytes(100))
+        remaining = sorted(p.name for p in self.test_dir.glob("*/*.pcm"))
+        self.assertEqual(len(remaining), 2)
+        self.assertFalse(cache._path(cache.key("m", "phrase 0", 44100)).exists())
+        self.assertFalse(cache._path(cache.key("m", "phrase 1", 44100)).exists())
+
+    def test_model_cache_id_includes_size(self) -> None:
+        model = self.test_dir / "voice.onnx"
+        model.write_bytes(b"abc")
+        self.assertEqual(model_cache_id(model), "voice.onnx:3")
+
+
+if __name__ == '__main__':
+    unittest.main()
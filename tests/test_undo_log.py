@@ -0,0 +1,164 @@
+"""
+Tests for the GameStateManager undo/redo log (undo_log.py).
+"""
+
+import copy
+import json
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from undo_log import TRACKED_KEYS, ListChange, UndoLog
+
+
+def make_item(n, slot="Helmet", rarity="Common"):
+    return {
+        "item_id": f"id-{n}",
+        "name": f"Item {n}",
+        "slot": slot,
+        "rarity": rarity,
+        "power": 10 + n,
+        "obtained_at": f"2026-01-0{n % 9 + 1}T10:00:00",
+        "lucky_options": {"coin_discount": n, "xp_bonus": [n, n + 1]},
+    }
+
+
+def dump(state):
+    """Serialized undoable state (saving also rebuilds derived keys like story_heroes)."""
+    tracked = {key: state[key] for key in TRACKED_KEYS if key in state}
+    return json.dumps(tracked, sort_keys=False).encode("utf-8")
+
+
+@pytest.fixture
+def blocker():
+    blocker = Mock()
+    blocker.adhd_buster = {
+        "inventory": [make_item(n) for n in range(8)],
+        "equipped": {},
+        "coins": 100,
+        "hero": {"xp": 0, "level": 1},
+    }
+    blocker.save_config = Mock()
+    return blocker
+
+
+@pytest.fixture
+def game_state(blocker):
+    from game_state import GameStateManager, reset_game_state
+    reset_game_state()
+    return GameStateManager(blocker)
+
+
+class TestUndoLog:
+    """The log on plain dicts, without Qt."""
+
+    def test_list_diff_stores_only_changed_items(self):
+        old = [make_item(n) for n in range(100)]
+        new = [item for i, item in enumerate(old) if i not in (3, 50)] + [make_item(200)]
+        change = ListChange.diff("inventory", old, new)
+        assert change.size() == 3
+        assert [i for i, _ in change.removed] == [3, 50]
+        assert [i for i, _ in change.added] == [98]
+
+    def test_nested_transactions_record_once(self):
+        state = {"coins": 1}
+        log = UndoLog()
+        log.begin(state, "outer")
+        log.begin(state, "inner")
+        state["coins"] = 2
+        assert log.end() is None
+        txn = log.end()
+        assert txn.label == "outer, inner"
+        log.undo(state)
+        assert state == {"coins": 1}
+        log.redo(state)
+        assert state == {"coins": 2}
+
+    def test_bounded_to_last_n(self):
+        state = {"coins": 0}
+        log = UndoLog(max_transactions=3)
+        for n in range(1, 6):
+            log.begin(state)
+            state["coins"] = n
+            log.end()
+        while log.undo(state):
+            pass
+        assert state["coins"] == 2
+
+    def test_replaced_state_clears_history(self):
+        state = {"coins": 0}
+        log = UndoLog()
+        log.begin(state)
+        state["coins"] = 5
+        log.end()
+        assert log.undo({"coins": 5}) is None
+        assert not log.can_undo()
+
+
+class TestGameStateUndo:
+    """Undo/redo through GameStateManager."""
+
+    def test_merge_undo_restores_identical_items(self, game_state, blocker):
+        before = dump(blocker.adhd_buster)
+        sources = copy.deepcopy(blocker.adhd_buster["inventory"][1:6:2])
+        result = make_item(99, rarity="Rare")
+
+        assert game_state.perform_merge(sources, result, success=True)
+        assert len(blocker.adhd_buster["inventory"]) == 6
+        after = dump(blocker.adhd_buster)
+
+        assert game_state.undo_label() == "merge"
+        assert game_state.undo()
+        assert dump(blocker.adhd_buster) == before
+
+        assert game_state.redo()
+        assert dump(blocker.adhd_buster) == after
+        assert game_state.undo()
+        assert dump(blocker.adhd_buster) == before
+
+    def test_batch_is_one_transaction(self, game_state, blocker):
+        before = dump(blocker.adhd_buster)
+        with game_state.batch():
+            game_state.bulk_sell_items(["id-0", "id-1"], 40)
+            game_state.equip_item("Helmet", make_item(2))
+            game_state.add_xp(50)
+        assert game_state.undo()
+        assert dump(blocker.adhd_buster) == before
+        assert not game_state.can_undo()
+
+    def test_new_mutation_clears_redo(self, game_state):
+        game_state.add_coins(10)
+        game_state.undo()
+        assert game_state.can_redo()
+        game_state.spend_coins(5)
+        assert not game_state.can_redo()
+
+    def test_signals_emitted(self, game_state, blocker):
+        history = []
+        coins = []
+        inventory = []
+        game_state.history_changed.connect(lambda u, r: history.append((u, r)))
+        game_state.coins_changed.connect(coins.append)
+        game_state.inventory_changed.connect(lambda: inventory.append(True))
+
+        game_state.sell_item("id-4", 25)
+        assert history[-1] == (True, False)
+        inventory.clear()
+
+        game_state.undo()
+        assert history[-1] == (False, True)
+        assert coins[-1] == 100
+        assert inventory
+        blocker.save_config.assert_called()
+
+        game_state.redo()
+        assert history[-1] == (True, False)
+        assert coins[-1] == 125
+
+    def test_no_op_is_not_recorded(self, game_state):
+        assert not game_state.remove_item("missing")
+        assert not game_state.can_undo()
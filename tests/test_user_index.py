@@ -0,0 +1,136 @@
+"""
+Tests for the users.json profile index kept by UserManager.
+"""
+
+import json
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from user_manager import UserManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return UserManager(tmp_path)
+
+
+def read_index(manager):
+    with open(manager.users_config_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def bump_mtime(path):
+    """Make sure the directory mtime differs even on coarse-resolution filesystems."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+
+class TestIndexTransactions:
+    """create, rename and delete keep users.json in step with the directories."""
+
+    def test_create_writes_entry(self, manager):
+        assert manager.create_user("Alice")
+        entry = read_index(manager)["users"]["Alice"]
+        assert entry["display_name"] == "Alice"
+        assert entry["summary"] == {"level": 1, "focus_hours": 0.0, "avatar": ""}
+
+    def test_rename_keeps_summary_and_last_user(self, manager):
+        manager.create_user("Alice")
+        manager.update_user("Alice", summary={"level": 7, "focus_hours": 12.5})
+        manager.save_last_user("Alice")
+
+        assert manager.rename_user("Alice", "Alicia")
+        users = read_index(manager)["users"]
+        assert "Alice" not in users
+        assert users["Alicia"]["summary"]["level"] == 7
+        assert users["Alicia"]["last_active"] is not None
+        assert (manager.users_dir / "Alicia").is_dir()
+        assert manager.get_last_user() == "Alicia"
+
+    def test_rename_rejects_existing_target(self, manager):
+        manager.create_user("Alice")
+        manager.create_user("Bob")
+        assert not manager.rename_user("Alice", "Bob")
+        assert set(read_index(manager)["users"]) == {"Alice", "Bob"}
+
+    def test_delete_removes_entry(self, manager):
+        manager.create_user("Alice")
+        manager.create_user("Bob")
+        assert manager.delete_user("Alice")
+        assert list(read_index(manager)["users"]) == ["Bob"]
+
+    def test_failed_index_write_rolls_back_create(self, manager):
+        manager.create_user("Alice")
+        with patch("user_manager.os.replace", side_effect=OSError("disk full")):
+            assert not manager.create_user("Bob")
+        assert not (manager.users_dir / "Bob").exists()
+        assert manager.get_users() == ["Alice"]
+
+    def test_failed_index_write_rolls_back_rename(self, manager):
+        manager.create_user("Alice")
+        with patch("user_manager.os.replace", side_effect=OSError("disk full")):
+            assert not manager.rename_user("Alice", "Alicia")
+        assert (manager.users_dir / "Alice").is_dir()
+        assert not (manager.users_dir / "Alicia").exists()
+        assert manager.get_users() == ["Alice"]
+
+
+class TestIndexRepair:
+    """Directories added or removed outside the app are picked up."""
+
+    def test_directory_added_behind_the_app(self, manager):
+        manager.create_user("Alice")
+        (manager.users_dir / "Zed").mkdir()
+        bump_mtime(manager.users_dir)
+        assert manager.get_users() == ["Alice", "Zed"]
+        assert "Zed" in read_index(manager)["users"]
+
+    def test_directory_removed_behind_the_app(self, manager):
+        manager.create_user("Alice")
+        manager.create_user("Bob")
+        manager.update_user("Alice", summary={"level": 3})
+        shutil.rmtree(manager.users_dir / "Bob")
+        bump_mtime(manager.users_dir)
+        assert manager.get_users() == ["Alice"]
+        # Surviving entries keep their summary
+        assert read_index(manager)["users"]["Alice"]["summary"]["level"] == 3
+
+    def test_corrupt_index_is_rebuilt(self, manager):
+        manager.create_user("Alice")
+        manager.users_config_path.write_text("{not json", encoding="utf-8")
+        assert manager.get_users() == ["Alice"]
+        assert read_index(manager)["version"] == 1
+
+    def test_picker_reads_index_without_user_configs(self, manager):
+        manager.create_user("Alice")
+        manager.update_user("Alice", summary={"level": 4, "focus_hours": 2.0, "avatar": "📚"})
+        opened = []
+        real_open = open
+
+        def tracking_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return real_open(path, *args, **kwargs)
+
+        with patch("builtins.open", tracking_open):
+            index = UserManager(manager.base_dir).get_index()
+        assert index["Alice"]["summary"]["avatar"] == "📚"
+        assert opened == [str(manager.users_config_path)]
+
+
+class TestProfileSummary:
+    """BlockerCore records its summary in the index."""
+
+    def test_record_profile_summary(self, tmp_path):
+        from core_logic import BlockerCore
+        with patch("core_logic.APP_DIR", tmp_path):
+            UserManager(tmp_path).create_user("Alice")
+            core = BlockerCore(username="Alice")
+            core.stats["total_focus_time"] = 5400
+            core.record_profile_summary()
+        summary = UserManager(tmp_path).get_user_info("Alice")["summary"]
+        assert summary["focus_hours"] == 1.5
+        assert summary["level"] == 1
+        assert summary["avatar"]
@@ -0,0 +1,193 @@
+"""
+Application-level stylesheet for widgets whose look follows their state.
+
+Every setStyleSheet() call makes Qt parse the CSS and re-polish the widget
+and everything below it. Refresh loops that rebuild labels and animation
+ticks that recolour a readout were doing that many times a second. Here the
+rules are parsed once, for the whole application, keyed on object names and
+dynamic properties:
+
+    lbl.setObjectName("heroSetBonus")               # fresh widget: just name it
+    set_style_state(label, "lotteryReadout", tone="win")   # live widget: property + re-polish
+
+A widget's own stylesheet always wins over the application one, whatever the
+selector specificity, so set_style_state() clears it before the role rules
+can apply.
+"""
+
+from typing import Optional
+
+from PySide6 import QtWidgets
+
+# Item rarity colours, as in gamification.ITEM_RARITIES
+RARITY_COLORS = {
+    "Common": "#9e9e9e",
+    "Uncommon": "#4caf50",
+    "Rare": "#2196f3",
+    "Epic": "#9c27b0",
+    "Legendary": "#ff9800",
+}
+
+WIN_COLOR = "#4caf50"
+LOSE_COLOR = "#f44336"
+
+_BASE_STYLESHEET = """
+/* Lottery roll readouts; tone is "win", "lose" or a rarity */
+QLabel#lotteryRollValue {
+    font-size: 28px;
+    font-weight: bold;
+    color: #fff;
+    font-family: 'Consolas', 'Monaco', monospace;
+}
+QLabel#lotteryReadout {
+    font-size: 14px;
+}
+
+/* Hero tab: equipment slots; rarity is the equipped item's, "" when empty */
+QComboBox#heroSlotCombo {
+    color: #ffffff;
+}
+
+/* Hero tab: set bonuses */
+QLabel#heroSetBonus {
+    color: #4caf50;
+    font-size: 11px;
+    padding: 2px 0;
+}
+QLabel#heroSetItems {
+    color: #888;
+    font-size: 10px;
+    padding-left: 15px;
+}
+QLabel#heroPotentialSet {
+    color: #2196f3;
+    font-size: 11px;
+    padding: 2px 0;
+}
+QLabel#heroPotentialSet[partial="true"] {
+    color: #ff9800;
+}
+QLabel#heroTip {
+    color: #888;
+    font-style: italic;
+    font-size: 10px;
+}
+QLabel#heroTip[spaced="true"] {
+    padding-top: 4px;
+}
+
+/* Hero tab: passive gear bonuses */
+QLabel#heroGearBonus {
+    color: #8b5cf6;
+    font-size: 11px;
+    padding: 2px 0;
+}
+QLabel#heroGearBonusSummary {
+    color: #a78bfa;
+    font-size: 11px;
+    padding: 4px;
+    background: rgba(139,92,246,0.1);
+    border-radius: 4px;
+}
+
+/* Hero tab: entity patron cards (the card rules also reach their labels) */
+QFrame#heroPatronCard, QFrame#heroPatronCard QLabel {
+    background-color: #2a2a2a;
+    border: 1px solid #444;
+    border-radius: 6px;
+    padding: 4px;
+}
+QFrame#heroPatronCard:hover, QFrame#heroPatronCard QLabel:hover {
+    border-color: #e65100;
+    background-color: #333;
+}
+QFrame#heroPatronCard[exceptional="true"], QFrame#heroPatronCard[exceptional="true"] QLabel {
+    border: 1px solid #555;
+}
+QFrame#heroPatronCard[exceptional="true"]:hover, QFrame#heroPatronCard[exceptional="true"] QLabel:hover {
+    border-color: #666;
+}
+QLabel#heroPatronName {
+    color: #ccc;
+    font-size: 10px;
+}
+QLabel#heroPatronName[exceptional="true"] {
+    color: #ffd700;
+    font-weight: bold;
+}
+QLabel#heroPatronPower {
+    color: #e65100;
+    font-size: 12px;
+}
+
+/* Hero tab: merge cost line */
+QLabel#mergeCostLabel {
+    color: #d32f2f;
+    font-size: 10px;
+}
+QLabel#mergeCostLabel[discounted="true"] {
+    color: #4caf50;
+}
+"""
+
+
+def _state_rules() -> str:
+    """Rules generated from the colour tables."""
+    rules = []
+    for role in ("lotteryRollValue", "lotteryReadout"):
+        rules.append(f'QLabel#{role}[tone="win"] {{ color: {WIN_COLOR}; }}')
+        rules.append(f'QLabel#{role}[tone="lose"] {{ color: {LOSE_COLOR}; }}')
+        for rarity, color in RARITY_COLORS.items():
+            rules.append(f'QLabel#{role}[tone="{rarity}"] {{ color: {color}; }}')
+    for rarity, color in RARITY_COLORS.items():
+        rules.append(f'QComboBox#heroSlotCombo[rarity="{rarity}"] {{ color: {color}; font-weight: bold; }}')
+    return "\n".join(rules)
+
+
+APP_STYLESHEET = _BASE_STYLESHEET + _state_rules() + "\n"
+
+_INSTALLED_PROPERTY = "appStylesheetInstalled"
+
+
+def install_app_stylesheet(app: Optional[QtWidgets.QApplication] = None) -> bool:
+    """
+    Add APP_STYLESHEET to the application's stylesheet once.
+
+    Returns False when there is no application yet. Safe to call repeatedly;
+    only the first call parses anything.
+    """
+    app = app or QtWidgets.QApplication.instance()
+    if app is None:
+        return False
+    if not app.property(_INSTALLED_PROPERTY):
+        app.setProperty(_INSTALLED_PROPERTY, True)
+        app.setStyleSheet((app.styleSheet() or "") + APP_STYLESHEET)
+    return True
+
+
+def set_style_state(widget: QtWidgets.QWidget, role: str, **properties) -> bool:
+    """
+    Style widget through the application rules for role, with the given state.
+
+    Sets the object name and dynamic properties and re-polishes the widget
+    only when one of them changed. Any stylesheet set directly on the widget
+    is dropped, since it would override the role rules. Returns True if the
+    widget was re-polished.
+    """
+    install_app_stylesheet()
+    changed = False
+    if widget.objectName() != role:
+        widget.setObjectName(role)
+        changed = True
+    if widget.styleSheet():
+        widget.setStyleSheet("")
+        changed = True
+    for name, value in properties.items():
+        if widget.property(name) != value:
+            widget.setProperty(name, value)
+            changed = True
+    if changed:
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+    return changed
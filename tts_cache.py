@@ -0,0 +1,204 @@
+"""
+Persistent phrase cache for Piper text-to-speech.
+
+The eye routine speaks the same handful of fixed phrases over and over.
+Synthesizing them takes far longer than playing them, so the final PCM
+(already resampled to the playback rate) is stored content-addressed under
+the user data directory, keyed by sha256 of (voice model, text, rate).
+A repeated phrase is then a dictionary lookup or a single file read.
+
+Resampling from the voice rate to the playback rate uses strided array
+assignment, which runs in C, instead of a per-sample Python loop.
+"""
+
+import array
+import hashlib
+import logging
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+CACHE_SUFFIX = ".pcm"
+MAX_CACHE_BYTES = 16 * 1024 * 1024  # on-disk cap; oldest phrases are evicted first
+
+
+def resample_pcm16(pcm: bytes, src_rate: int, dst_rate: int) -> bytes:
+    """
+    Resample mono signed 16-bit PCM by sample repetition (nearest neighbour).
+
+    Integer ratios (22050 -> 44100) write the source into each of the
+    `ratio` interleaved positions with one slice assignment per position.
+    Other ratios fall back to an index map.
+    """
+    if src_rate == dst_rate or not pcm:
+        return pcm
+    samples = array.array('h')
+    samples.frombytes(pcm[:len(pcm) - len(pcm) % 2])
+    if sys.byteorder != 'little':
+        samples.byteswap()
+
+    if dst_rate % src_rate == 0:
+        ratio = dst_rate // src_rate
+        out = array.array('h', bytes(2 * ratio * len(samples)))
+        for offset in range(ratio):
+            out[offset::ratio] = samples
+    else:
+        n_out = len(samples) * dst_rate // src_rate
+        out = array.array('h', (samples[i * src_rate // dst_rate] for i in range(n_out)))
+
+    if sys.byteorder != 'little':
+        out.byteswap()
+    return out.tobytes()
+
+
+class PhraseCache:
+    """Content-addressed PCM store with an in-memory front."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = MAX_CACHE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._memory: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model_id: str, text: str, rate: int) -> str:
+        material = f"{CACHE_VERSION}\0{model_id}\0{rate}\0{text}".encode("utf-8")
+        return hashlib.sha256(material).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / (key + CACHE_SUFFIX)
+
+    def get(self, model_id: str, text: str, rate: int) -> Optional[bytes]:
+        """Return cached PCM, or None."""
+        key = self.key(model_id, text, rate)
+        with self._lock:
+            pcm = self._memory.get(key)
+        if pcm is not None:
+            return pcm
+        path = self._path(key)
+        try:
+            pcm = path.read_bytes()
+        except OSError:
+            return None
+        with self._lock:
+            self._memory[key] = pcm
+        return pcm
+
+    def put(self, model_id: str, text: str, rate: int, pcm: bytes) -> None:
+        """Store PCM in memory and on disk (atomically), then enforce the size cap."""
+        key = self.key(model_id, text, rate)
+        with self._lock:
+            self._memory[key] = pcm
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=path.parent)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(pcm)
+                os.replace(temp_path, path)
+            except Exception:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+            self._enforce_limit()
+        except OSError as e:
+            logger.warning(f"Could not write TTS cache entry: {e}")
+
+    def _enforce_limit(self) -> None:
+        files = []
+        total = 0
+        for path in self.cache_dir.glob(f"*/*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Drop all cached phrases."""
+        with self._lock:
+            self._memory.clear()
+        for path in self.cache_dir.glob(f"*/*{CACHE_SUFFIX}"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+class PhraseSynthesizer:
+    """
+    Piper voice plus phrase cache: returns playback-rate PCM for a phrase.
+
+    `voice` is a loaded PiperVoice (anything whose synthesize(text) yields
+    chunks with an audio_int16_bytes attribute). Calls into the voice are
+    serialized with `lock` because espeak-ng has global state.
+    """
+
+    def __init__(self, voice, model_id: str, voice_rate: int, cache: PhraseCache,
+                 output_rate: int = 44100, lock: Optional[threading.Lock] = None):
+        self.voice = voice
+        self.model_id = model_id
+        self.voice_rate = voice_rate
+        self.output_rate = output_rate
+        self.cache = cache
+        self.lock = lock or threading.Lock()
+
+    def cached(self, text: str) -> Optional[bytes]:
+        """Cached PCM for text, or None (never calls the voice)."""
+        return self.cache.get(self.model_id, text, self.output_rate)
+
+    def synthesize(self, text: str) -> bytes:
+        """PCM for text at output_rate, from the cache when possible."""
+        pcm = self.cached(text)
+        if pcm is not None:
+            return pcm
+        with self.lock:
+            chunks = [chunk.audio_int16_bytes for chunk in self.voice.synthesize(text)]
+        if not chunks:
+            return b''
+        pcm = resample_pcm16(b''.join(chunks), self.voice_rate, self.output_rate)
+        self.cache.put(self.model_id, text, self.output_rate, pcm)
+        return pcm
+
+    def prewarm(self, phrases: Iterable[str],
+                should_stop: Optional[Callable[[], bool]] = None) -> int:
+        """Synthesize any uncached phrases. Returns the number newly synthesized."""
+        count = 0
+        for text in phrases:
+            if should_stop and should_stop():
+                break
+            if self.cached(text) is not None:
+                continue
+            try:
+                if self.synthesize(text):
+                    count += 1
+            except Exception as e:
+                logger.warning(f"TTS pre-warm failed for {text!r}: {e}")
+        return count
+
+
+def model_cache_id(model_path: Path) -> str:
+    """Identify a voice model by file name and size, so a replaced model misses the cache."""
+    try:
+        size = Path(model_path).stat().st_size
+    except OSError:
+        size = 0
+    return f"{Path(model_path).name}:{size}"
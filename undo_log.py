@@ -0,0 +1,358 @@
+"""
+Undo/redo log for GameStateManager mutations.
+
+Every mutation the state manager performs (equip, salvage, merge, bulk
+remove, awards, ...) runs inside a transaction. When the outermost
+transaction ends, the log diffs the tracked keys of adhd_buster against a
+cheap pointer-level view taken when it began and keeps only what changed:
+
+- lists (inventory, diary): the removed items with their indices (deep
+  copied, so undo restores them exactly) and the added items with theirs
+- dicts (equipped, hero): the old and new value of each changed key
+- scalars (coins, total_xp, ...): the old and new value
+
+A merge of five items therefore costs five item dicts in the log, not a
+copy of the 500-item inventory. Batches (begin_batch/end_batch) nest into
+the enclosing transaction, so a batch is undone as one step.
+
+Only the keys in TRACKED_KEYS are covered. City state is not: effort
+resources flow into constructions in real time and are not reversible.
+
+The log has no Qt dependency; GameStateManager owns the signals.
+"""
+
+import copy
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TRANSACTIONS = 50
+
+# adhd_buster keys written by GameStateManager mutations
+TRACKED_KEYS = (
+    "inventory", "equipped", "coins", "materials", "scrap",
+    "luck_bonus", "total_collected", "total_xp", "hero",
+    "selected_story", "diary",
+)
+
+
+class _Missing:
+    """Marks a key that was absent (distinct from a None value)."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __copy__(self) -> '_Missing':
+        return self
+
+    def __deepcopy__(self, memo) -> '_Missing':
+        return self
+
+
+MISSING = _Missing()
+
+
+def _capture(value: Any) -> Any:
+    """Pointer-level view of a value: containers are copied one level deep."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _changed(old: Any, new: Any) -> bool:
+    return old is not new and (type(old) is not type(new) or old != new)
+
+
+def _find(items: list, target: dict) -> Optional[int]:
+    """Index of target in items: by identity, else by item_id."""
+    for i, item in enumerate(items):
+        if item is target:
+            return i
+    item_id = target.get("item_id") if isinstance(target, dict) else None
+    if item_id:
+        for i, item in enumerate(items):
+            if isinstance(item, dict) and item.get("item_id") == item_id:
+                return i
+    return None
+
+
+class ListChange:
+    """Items removed from and added to a list, with their positions."""
+
+    def __init__(self, key: str, removed: List[Tuple[int, Any]], added: List[Tuple[int, Any]]):
+        self.key = key
+        self.removed = removed  # (index in the old list, pristine copy)
+        self.added = added      # (index in the new list, item)
+        self._restored: List[Any] = []  # objects re-inserted by the last revert
+
+    @classmethod
+    def diff(cls, key: str, old: list, new: list) -> Optional['ListChange']:
+        old_ids = {id(item) for item in old}
+        new_ids = {id(item) for item in new}
+        kept_old = [item for item in old if id(item) in new_ids]
+        kept_new = [item for item in new if id(item) in old_ids]
+        if any(a is not b for a, b in zip(kept_old, kept_new)):
+            # Kept items were reordered: record the whole list as replaced
+            removed = list(enumerate(copy.deepcopy(old)))
+            added = list(enumerate(new))
+        else:
+            removed = [(i, copy.deepcopy(item)) for i, item in enumerate(old)
+                       if id(item) not in new_ids]
+            added = [(i, item) for i, item in enumerate(new) if id(item) not in old_ids]
+        if not removed and not added:
+            return None
+        return cls(key, removed, added)
+
+    def _swap(self, state: dict, take_out: List[Any], put_back: List[Tuple[int, Any]]) -> List[Any]:
+        items = state.get(self.key)
+        if not isinstance(items, list):
+            items = []
+            state[self.key] = items
+        for target in take_out:
+            idx = _find(items, target)
+            if idx is not None:
+                items.pop(idx)
+        inserted = []
+        for idx, item in put_back:
+            items.insert(min(idx, len(items)), item)
+            inserted.append(item)
+        return inserted
+
+    def revert(self, state: dict) -> None:
+        restored = [(i, copy.deepcopy(item)) for i, item in self.removed]
+        self._restored = self._swap(state, [item for _, item in self.added], restored)
+
+    def apply(self, state: dict) -> None:
+        self._swap(state, self._restored, self.added)
+        self._restored = []
+
+    def size(self) -> int:
+        return len(self.removed) + len(self.added)
+
+
+class DictChange:
+    """Old and new values of the changed keys of a nested dict."""
+
+    def __init__(self, key: str, entries: Dict[str, Tuple[Any, Any]]):
+        self.key = key
+        self.entries = entries
+
+    @classmethod
+    def diff(cls, key: str, old: dict, new: dict) -> Optional['DictChange']:
+        entries = {}
+        for sub in old.keys() | new.keys():
+            before = old.get(sub, MISSING)
+            after = new.get(sub, MISSING)
+            if _changed(before, after):
+                entries[sub] = (copy.deepcopy(before), after)
+        return cls(key, entries) if entries else None
+
+    def _set(self, state: dict, which: int) -> None:
+        target = state.get(self.key)
+        if not isinstance(target, dict):
+            target = {}
+            state[self.key] = target
+        for sub, values in self.entries.items():
+            value = values[which]
+            if value is MISSING:
+                target.pop(sub, None)
+            else:
+                target[sub] = copy.deepcopy(value)
+
+    def revert(self, state: dict) -> None:
+        self._set(state, 0)
+
+    def apply(self, state: dict) -> None:
+        self._set(state, 1)
+
+    def size(self) -> int:
+        return len(self.entries)
+
+
+class ValueChange:
+    """Old and new value of a top-level key."""
+
+    def __init__(self, key: str, old: Any, new: Any):
+        self.key = key
+        self.old = old
+        self.new = new
+
+    def _set(self, state: dict, value: Any) -> None:
+        if value is MISSING:
+            state.pop(self.key, None)
+        else:
+            state[self.key] = copy.deepcopy(value)
+
+    def revert(self, state: dict) -> None:
+        self._set(state, self.old)
+
+    def apply(self, state: dict) -> None:
+        self._set(state, self.new)
+
+    def size(self) -> int:
+        return 1
+
+
+def diff_value(key: str, old: Any, new: Any):
+    """Compact change record for one tracked key, or None if unchanged."""
+    if isinstance(old, list) and isinstance(new, list):
+        return ListChange.diff(key, old, new)
+    if isinstance(old, dict) and isinstance(new, dict):
+        return DictChange.diff(key, old, new)
+    if _changed(old, new):
+        return ValueChange(key, copy.deepcopy(old), new)
+    return None
+
+
+class Transaction:
+    """One undoable step: the change records of a mutation or batch."""
+
+    def __init__(self, labels: List[str], changes: list):
+        self.labels = labels
+        self.changes = changes
+
+    @property
+    def label(self) -> str:
+        return ", ".join(self.labels) or "change"
+
+    @property
+    def keys(self) -> set:
+        return {change.key for change in self.changes}
+
+    def changed_slots(self) -> List[str]:
+        """Equipment slots touched by this transaction."""
+        for change in self.changes:
+            if change.key == "equipped" and isinstance(change, DictChange):
+                return sorted(change.entries)
+        return []
+
+    def revert(self, state: dict) -> None:
+        for change in reversed(self.changes):
+            change.revert(state)
+
+    def apply(self, state: dict) -> None:
+        for change in self.changes:
+            change.apply(state)
+
+    def size(self) -> int:
+        return sum(change.size() for change in self.changes)
+
+
+class UndoLog:
+    """
+    Bounded undo/redo stacks of transactions over one state dict.
+
+    begin()/end() nest; only the outermost pair captures and records.
+    """
+
+    def __init__(self, max_transactions: int = DEFAULT_MAX_TRANSACTIONS,
+                 tracked_keys: Tuple[str, ...] = TRACKED_KEYS):
+        self.tracked_keys = tracked_keys
+        self._undo: Deque[Transaction] = deque(maxlen=max_transactions)
+        self._redo: List[Transaction] = []
+        self._depth = 0
+        self._state: Optional[dict] = None
+        self._before: Dict[str, Any] = {}
+        self._labels: List[str] = []
+        self._suspended = False
+
+    @property
+    def max_transactions(self) -> int:
+        return self._undo.maxlen
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._depth > 0
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo_label(self) -> Optional[str]:
+        return self._undo[-1].label if self._undo else None
+
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1].label if self._redo else None
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    # === Recording ===
+
+    def begin(self, state: dict, label: str = "") -> None:
+        """Open a (possibly nested) transaction over state."""
+        if self._suspended:
+            return
+        if self._depth == 0:
+            if state is not self._state:
+                # A different adhd_buster (user switch, reload): old diffs no longer apply
+                self.clear()
+                self._state = state
+            self._before = {key: _capture(state.get(key, MISSING)) for key in self.tracked_keys}
+            self._labels = []
+        if label and label not in self._labels:
+            self._labels.append(label)
+        self._depth += 1
+
+    def end(self) -> Optional[Transaction]:
+        """Close a transaction. The outermost end records and returns it."""
+        if self._suspended:
+            return None
+        if self._depth <= 0:
+            logger.warning("UndoLog.end called without matching begin")
+            return None
+        self._depth -= 1
+        if self._depth > 0:
+            return None
+
+        state = self._state
+        changes = []
+        for key in self.tracked_keys:
+            change = diff_value(key, self._before.get(key, MISSING), state.get(key, MISSING))
+            if change is not None:
+                changes.append(change)
+        self._before = {}
+        if not changes:
+            return None
+        txn = Transaction(self._labels, changes)
+        self._undo.append(txn)
+        self._redo.clear()
+        return txn
+
+    # === Replay ===
+
+    def _replay(self, state: dict, source, target: list, forward: bool) -> Optional[Transaction]:
+        if self._depth > 0:
+            logger.warning("Cannot undo/redo while a transaction is open")
+            return None
+        if not source:
+            return None
+        if state is not self._state:
+            self.clear()
+            return None
+        txn = source.pop()
+        self._suspended = True
+        try:
+            if forward:
+                txn.apply(state)
+            else:
+                txn.revert(state)
+        finally:
+            self._suspended = False
+        target.append(txn)
+        return txn
+
+    def undo(self, state: dict) -> Optional[Transaction]:
+        """Revert the latest transaction. Returns it, or None if nothing was undone."""
+        return self._replay(state, self._undo, self._redo, forward=False)
+
+    def redo(self, state: dict) -> Optional[Transaction]:
+        """Re-apply the latest undone transaction."""
+        return self._replay(state, self._redo, self._undo, forward=True)
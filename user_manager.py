@@ -2,15 +2,33 @@ import os
 import shutil
 import json
 import logging
+import tempfile
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 # Industry standard: Use logging module for better observability
 _logger = logging.getLogger(__name__)
 
+INDEX_VERSION = 1
+
+
+def _default_summary() -> Dict[str, Any]:
+    return {"level": 1, "focus_hours": 0.0, "avatar": ""}
 
 
 class UserManager:
+    """
+    Manages user profiles under <base_dir>/users/.
+
+    users.json is an index of the profiles: display name, last-active time
+    and a small summary (level, total focus hours, avatar) per user, so the
+    profile picker never opens a per-user config. It is rewritten atomically
+    together with every create, rename and delete. If a profile directory is
+    added or removed behind the app's back, the change in the users
+    directory's mtime triggers a rescan that repairs the index.
+    """
+
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
         self.users_dir = self.base_dir / "users"
@@ -36,16 +54,124 @@ class UserManager:
 
     def get_users(self) -> List[str]:
         """Return a list of user names."""
+        # Sort case-insensitively for better UX
+        return sorted(self.get_index(), key=lambda s: s.lower())
+
+    # === User index ===
+
+    def _scan_user_dirs(self) -> Optional[List[str]]:
+        """Names of the profile directories, or None if the users folder can't be read."""
         if not self.users_dir.exists() or not self.users_dir.is_dir():
             return []
-
-        # List subdirectories in users folder
         try:
-            users = [d.name for d in self.users_dir.iterdir() if d.is_dir()]
-            # Sort case-insensitively for better UX
-            return sorted(users, key=lambda s: s.lower())
+            return [d.name for d in self.users_dir.iterdir() if d.is_dir()]
         except (OSError, PermissionError):
-            return []
+            return None
+
+    def _users_dir_mtime(self) -> int:
+        try:
+            return self.users_dir.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _load_index(self) -> Dict[str, Any]:
+        try:
+            with open(self.users_config_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if isinstance(index, dict) and isinstance(index.get("users"), dict) \
+                    and index.get("version") == INDEX_VERSION:
+                return index
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            pass
+        return {"version": INDEX_VERSION, "users_dir_mtime": None, "users": {}}
+
+    def _write_index(self, index: Dict[str, Any]) -> bool:
+        """Atomically write the index. Returns False (index unchanged on disk) on failure."""
+        index["users_dir_mtime"] = self._users_dir_mtime()
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp', prefix='users_', dir=self.base_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.users_config_path)
+        except (OSError, TypeError, ValueError) as e:
+            _logger.error(f"Failed to write user index: {e}")
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            return False
+        return True
+
+    def _new_entry(self, name: str) -> Dict[str, Any]:
+        return {"display_name": name, "last_active": None, "summary": _default_summary()}
+
+    def repair_index(self) -> Dict[str, Any]:
+        """
+        Reconcile the index with the profile directories on disk.
+
+        Entries for missing directories are dropped, unknown directories get
+        a fresh entry. Existing summaries are kept.
+        """
+        index = self._load_index()
+        names = self._scan_user_dirs()
+        if names is None:
+            return index
+        users = index["users"]
+        changed = False
+        for name in list(users):
+            if name not in names:
+                del users[name]
+                changed = True
+        for name in names:
+            entry = users.get(name)
+            if not isinstance(entry, dict):
+                users[name] = self._new_entry(name)
+                changed = True
+        if changed:
+            _logger.info("User index repaired from profile directories")
+        if self.users_dir.is_dir() and (changed or index.get("users_dir_mtime") != self._users_dir_mtime()):
+            self._write_index(index)
+        return index
+
+    def _read_index(self) -> Dict[str, Any]:
+        """
+        Load users.json, repairing it first if the users directory changed.
+
+        Only stats the users directory; the index is rebuilt from the
+        directory listing when its mtime differs from the one recorded at
+        the last write. The file is re-read on every call because several
+        UserManager instances (picker, BlockerCore) may update it.
+        """
+        index = self._load_index()
+        if index.get("users_dir_mtime") != self._users_dir_mtime():
+            index = self.repair_index()
+        return index
+
+    def get_index(self) -> Dict[str, Dict[str, Any]]:
+        """Profile entries keyed by user name, read from users.json."""
+        return self._read_index()["users"]
+
+    def get_user_info(self, username: str) -> Optional[Dict[str, Any]]:
+        """Index entry (display_name, last_active, summary) for a user, or None."""
+        return self.get_index().get(self._sanitize_username(username))
+
+    def update_user(self, username: str, summary: Optional[Dict[str, Any]] = None,
+                    touch: bool = False) -> bool:
+        """Merge summary fields into a user's index entry and optionally mark it active now."""
+        clean_name = self._sanitize_username(username)
+        index = self._read_index()
+        entry = index["users"].get(clean_name)
+        if entry is None:
+            return False
+        if summary:
+            entry.setdefault("summary", _default_summary()).update(summary)
+        if touch:
+            entry["last_active"] = datetime.now().isoformat(timespec="seconds")
+        return self._write_index(index)
 
     def user_exists(self, username: str) -> bool:
         """Check if user exists, using sanitized name."""
@@ -69,6 +195,8 @@ class UserManager:
         if user_path.exists():
             return False
 
+        index = self._read_index()
+        users = index["users"]
         try:
             user_path.mkdir(parents=True)
         except OSError:
@@ -76,6 +204,54 @@ class UserManager:
         
         # Create default config if needed, or copy template
         # For now, just creating the directory is enough, app logic handles missing config
+        users[clean_name] = self._new_entry(clean_name)
+        if not self._write_index(index):
+            # Keep directory and index consistent: undo the create
+            del users[clean_name]
+            try:
+                user_path.rmdir()
+            except OSError:
+                pass
+            return False
+        return True
+
+    def rename_user(self, old_name: str, new_name: str) -> bool:
+        """Rename a profile directory and its index entry (and .last_user if it pointed there)."""
+        old_clean = self._sanitize_username(old_name)
+        new_clean = self._sanitize_username(new_name)
+        if not old_clean or not new_clean or old_clean == new_clean:
+            return False
+        old_path = self.users_dir / old_clean
+        new_path = self.users_dir / new_clean
+        if not old_path.is_dir() or new_path.exists():
+            return False
+
+        index = self._read_index()
+        users = index["users"]
+        try:
+            os.rename(old_path, new_path)
+        except OSError:
+            return False
+
+        entry = users.pop(old_clean, None) or self._new_entry(new_clean)
+        entry["display_name"] = new_clean
+        users[new_clean] = entry
+        if not self._write_index(index):
+            # Roll back so the index on disk still matches the directories
+            users.pop(new_clean, None)
+            users[old_clean] = entry
+            entry["display_name"] = old_clean
+            try:
+                os.rename(new_path, old_path)
+            except OSError:
+                pass
+            return False
+
+        try:
+            if self.last_user_file.read_text(encoding='utf-8').strip() == old_clean:
+                self.save_last_user(new_clean)
+        except OSError:
+            pass
         return True
 
     def delete_user(self, username: str) -> bool:
@@ -95,11 +271,15 @@ class UserManager:
         except ValueError:
             return False  # Path escapes users_dir
             
+        index = self._read_index()
         try:
             shutil.rmtree(user_path)
-            return True
         except (OSError, PermissionError):
             return False
+        # If this write fails the mtime check repairs the index on next read
+        index["users"].pop(clean_name, None)
+        self._write_index(index)
+        return True
 
     def migrate_if_needed(self):
         """Migrate root files to 'Default' user if users directory implies first run with new system."""
@@ -179,6 +359,8 @@ class UserManager:
             # Atomic replace
             os.replace(temp_file, self.last_user_file)
             
+            self.update_user(clean_name, touch=True)
+            
         except Exception as e:
             _logger.error(f"Failed to save last user: {e}")  # Industry standard: Use logging
             # Attempt cleanup
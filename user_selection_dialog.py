@@ -17,9 +17,11 @@ _logger = logging.getLogger(__name__)
 class UserSelectionDialog(StyledDialog):
     """Styled dialog for selecting or creating user profiles."""
     
-    def __init__(self, user_manager: UserManager, parent=None):
+    def __init__(self, user_manager: UserManager, parent=None, current_user: Optional[str] = None):
         self.user_manager = user_manager
         self.selected_user: Optional[str] = None
+        # Profile currently loaded by the app (its directory can't be renamed)
+        self.current_user = current_user
         
         super().__init__(
             parent=parent,
@@ -50,6 +52,10 @@ class UserSelectionDialog(StyledDialog):
         new_btn.clicked.connect(self.create_new_user)
         mgmt_layout.addWidget(new_btn)
         
+        rename_btn = QtWidgets.QPushButton("✏️ Rename")
+        rename_btn.clicked.connect(self.rename_user)
+        mgmt_layout.addWidget(rename_btn)
+        
         del_btn = QtWidgets.QPushButton("🗑️ Delete")
         del_btn.setObjectName("dangerButton")
         del_btn.clicked.connect(self.delete_user)
@@ -65,16 +71,45 @@ class UserSelectionDialog(StyledDialog):
             ("Start", "primary", self.accept_selection),
         ])
 
+    @staticmethod
+    def _format_entry(username: str, info: dict) -> str:
+        """List text for a profile, from its user index entry."""
+        summary = info.get("summary") or {}
+        avatar = summary.get("avatar") or "👤"
+        text = f"{avatar} {info.get('display_name') or username}"
+        level = summary.get("level", 1)
+        hours = summary.get("focus_hours", 0)
+        if level > 1 or hours:
+            text += f"  —  Lv {level} · {hours:g}h focused"
+        return text
+
     def refresh_user_list(self):
+        # Rendered from the user index alone; no per-user config is opened
         self.user_list.clear()
-        users = self.user_manager.get_users()
-        for user in users:
-            self.user_list.addItem(user)
+        index = self.user_manager.get_index()
+        for user in sorted(index, key=lambda s: s.lower()):
+            item = QtWidgets.QListWidgetItem(self._format_entry(user, index[user]))
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, user)
+            last_active = index[user].get("last_active")
+            if last_active:
+                item.setToolTip(f"Last active: {last_active.replace('T', ' ')}")
+            self.user_list.addItem(item)
         
         # Auto-select first user if list is not empty
         if self.user_list.count() > 0:
             self.user_list.setCurrentRow(0)
 
+    def _select_user(self, username: str):
+        for row in range(self.user_list.count()):
+            item = self.user_list.item(row)
+            if item.data(QtCore.Qt.ItemDataRole.UserRole) == username:
+                self.user_list.setCurrentItem(item)
+                return
+
+    @staticmethod
+    def _item_user(item: QtWidgets.QListWidgetItem) -> str:
+        return item.data(QtCore.Qt.ItemDataRole.UserRole) or item.text()
+
     def create_new_user(self):
         name, ok = StyledInputDialog.get_text(
             self, 
@@ -101,9 +136,7 @@ class UserSelectionDialog(StyledDialog):
                 _logger.info(f"Created new user profile: {name}")  # Industry standard: Audit log
                 self.refresh_user_list()
                 # Select the new user
-                items = self.user_list.findItems(clean_name, QtCore.Qt.MatchFlag.MatchExactly)
-                if items:
-                    self.user_list.setCurrentItem(items[0])
+                self._select_user(clean_name)
             else:
                 StyledMessageBox.warning(
                     self, 
@@ -112,12 +145,59 @@ class UserSelectionDialog(StyledDialog):
                     "Name might be invalid or already taken."
                 )
 
+    def rename_user(self):
+        current_item = self.user_list.currentItem()
+        if not current_item:
+            return
+        
+        username = self._item_user(current_item)
+        if username == self.current_user:
+            StyledMessageBox.warning(
+                self,
+                "Profile In Use",
+                "You can't rename the profile that is currently loaded.",
+                "Switch to another profile first."
+            )
+            return
+        
+        name, ok = StyledInputDialog.get_text(
+            self,
+            "Rename Profile",
+            f"New name for '{username}':",
+            default=username,
+            icon="✏️"
+        )
+        if not ok or not name or not name.strip():
+            return
+        
+        clean_name = self.user_manager.sanitize_username(name.strip())
+        if not clean_name:
+            StyledMessageBox.warning(
+                self,
+                "Invalid Name",
+                "Name contains invalid characters.",
+                "Allowed: A-Z, 0-9, space, -, _"
+            )
+            return
+        
+        if self.user_manager.rename_user(username, clean_name):
+            _logger.info(f"Renamed user profile: {username} -> {clean_name}")  # Industry standard: Audit log
+            self.refresh_user_list()
+            self._select_user(clean_name)
+        else:
+            StyledMessageBox.warning(
+                self,
+                "Error",
+                "Could not rename user.",
+                "Name might be invalid or already taken."
+            )
+
     def delete_user(self):
         current_item = self.user_list.currentItem()
         if not current_item:
             return
             
-        username = current_item.text()
+        username = self._item_user(current_item)
         
         result = StyledMessageBox.question(
             self, 
@@ -137,7 +217,7 @@ class UserSelectionDialog(StyledDialog):
     def accept_selection(self):
         current_item = self.user_list.currentItem()
         if current_item:
-            self.selected_user = current_item.text()
+            self.selected_user = self._item_user(current_item)
             _logger.info(f"User selected profile: {self.selected_user}")
             self.accept()
         elif self.user_list.count() == 0: